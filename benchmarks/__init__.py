@@ -0,0 +1,7 @@
+"""
+Benchmarks Package
+
+This package contains performance benchmarks for the LangGraph Introduction
+course. Each bench_*.py module can be run with ``python -m benchmarks.<name>``
+and compares its results against the stored baselines in baselines.json.
+"""
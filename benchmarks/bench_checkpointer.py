@@ -0,0 +1,161 @@
+"""
+Checkpointer Benchmarks
+
+Runs a CONVERSATION_TURNS-turn conversation through an agent-memory graph
+with a SqliteCheckpointer on disk, once storing a full snapshot of every
+channel per checkpoint and committing each task's writes separately, and
+once with delta storage and per-superstep write batching. Reports
+checkpoints per second and bytes stored per checkpoint, then times loading
+the latest checkpoint of threads with short and long histories.
+
+Every turn has a fan-out superstep of two parallel tasks, and the state
+carries a PROFILE_BYTES user profile written once and never changed, as
+long-term memory typically is.
+
+Usage:
+    python -m benchmarks.bench_checkpointer
+    python -m benchmarks.bench_checkpointer --save-baseline
+"""
+
+import importlib
+import itertools
+import sys
+import tempfile
+from pathlib import Path
+from typing import TypedDict
+
+from langgraph.graph import END, START, StateGraph
+
+from benchmarks.harness import BenchmarkResult, measure, run_suite
+
+checkpointer = importlib.import_module(
+    "src.modules.introduction.lessons.lesson-7-agent-memory.checkpointer"
+)
+
+
+SUITE = "checkpointer"
+
+# Turns per timed conversation
+CONVERSATION_TURNS = 20
+
+# Size of the long-term profile carried in the state
+PROFILE_BYTES = 8192
+
+# History lengths (in turns) for the latest-checkpoint load benchmark
+HISTORY_TURNS = (10, 500)
+
+
+class MemoryState(TypedDict, total=False):
+    question: str
+    answer: str
+    profile: dict
+    recalled: str
+    searched: str
+    turns: int
+
+
+def _build_graph() -> StateGraph:
+    def recall(state: MemoryState) -> dict:
+        return {"recalled": f"profile facts for {state['question']}"}
+
+    def search(state: MemoryState) -> dict:
+        return {"searched": f"search results for {state['question']}"}
+
+    def respond(state: MemoryState) -> dict:
+        return {
+            "answer": f"{state['recalled']} / {state['searched']}",
+            "turns": state.get("turns", 0) + 1,
+        }
+
+    graph = StateGraph(MemoryState)
+    graph.add_node("recall", recall)
+    graph.add_node("search", search)
+    graph.add_node("respond", respond)
+    graph.add_edge(START, "recall")
+    graph.add_edge(START, "search")
+    graph.add_edge(["recall", "search"], "respond")
+    graph.add_edge("respond", END)
+    return graph
+
+
+def _converse(app, thread_id: str, turns: int) -> None:
+    config = {"configurable": {"thread_id": thread_id}}
+    profile = {"notes": "x" * PROFILE_BYTES}
+    app.invoke({"question": "turn 0", "profile": profile}, config)
+    for turn in range(1, turns):
+        app.invoke({"question": f"turn {turn}"}, config)
+
+
+def run_benchmarks(iterations: int) -> list[BenchmarkResult]:
+    """
+    Compare full-snapshot and delta checkpointing, and time latest loads.
+
+    Args:
+        iterations: Scales the number of timed conversations
+
+    Returns:
+        list: One result per configuration
+    """
+    calls = max(5, iterations // 20)
+    graph = _build_graph()
+    results = []
+    storage = {}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        configurations = [
+            ("snapshot", dict(store_deltas=False, batch_writes=False)),
+            ("delta_batched", dict(store_deltas=True, batch_writes=True)),
+        ]
+        for name, options in configurations:
+            saver = checkpointer.SqliteCheckpointer(
+                Path(tmp) / f"{name}.sqlite3", **options
+            )
+            app = graph.compile(checkpointer=saver)
+            threads = (f"thread-{i}" for i in itertools.count())
+            results.append(
+                measure(
+                    f"conversation[{name}]",
+                    lambda: _converse(app, next(threads), CONVERSATION_TURNS),
+                    calls,
+                    warmup=1,
+                    alloc_repeats=1,
+                )
+            )
+            storage[name] = saver.stats()
+            saver.close()
+
+        saver = checkpointer.SqliteCheckpointer(Path(tmp) / "history.sqlite3")
+        app = graph.compile(checkpointer=saver)
+        for turns in HISTORY_TURNS:
+            _converse(app, f"history-{turns}", turns)
+            config = {"configurable": {"thread_id": f"history-{turns}"}}
+            results.append(
+                measure(
+                    f"load_latest[{turns} turns]",
+                    lambda: saver.get_tuple(config),
+                    iterations,
+                    alloc_repeats=1,
+                )
+            )
+        saver.close()
+
+    checkpoints_per_conversation = storage["snapshot"].checkpoints / (calls + 1)
+    print(
+        f"Checkpointing ({CONVERSATION_TURNS}-turn conversations, "
+        f"{PROFILE_BYTES:,}-byte profile):"
+    )
+    for result in results[:2]:
+        name = result.name[len("conversation[") : -1]
+        stats = storage[name]
+        rate = checkpoints_per_conversation / (result.p50_us / 1e6)
+        print(
+            f"  {name:<14} {rate:>9,.0f} checkpoints/s  "
+            f"{stats.payload_bytes / stats.checkpoints:>9,.0f} bytes/checkpoint  "
+            f"{stats.commits / stats.checkpoints:.2f} commits/checkpoint"
+        )
+    print()
+    return results
+
+
+if __name__ == "__main__":
+    sys.exit(run_suite(SUITE, run_benchmarks))
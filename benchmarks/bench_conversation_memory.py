@@ -0,0 +1,122 @@
+"""
+Conversation Memory Benchmarks
+
+Compares the per-turn cost of keeping conversation history in a list (the
+messages-state pattern: copy the list to append, then pick out system
+messages and the last MAX_MESSAGES and count their tokens) with
+ConversationMemory, for conversations that already have HISTORY_LENGTHS
+messages. Each timed call appends TURNS_PER_CALL messages and builds the
+model context after each one.
+
+Usage:
+    python -m benchmarks.bench_conversation_memory
+    python -m benchmarks.bench_conversation_memory --save-baseline
+"""
+
+import importlib
+import sys
+
+from benchmarks.harness import BenchmarkResult, measure, run_suite
+
+conversation_memory = importlib.import_module(
+    "src.modules.introduction.lessons.lesson-7-agent-memory.conversation_memory"
+)
+
+
+SUITE = "conversation_memory"
+
+# Messages already in the conversation before timing starts
+HISTORY_LENGTHS = (100, 1_000, 10_000)
+
+# Messages appended per timed call
+TURNS_PER_CALL = 100
+
+# Recent messages sent to the model each turn
+MAX_MESSAGES = 10
+
+SYSTEM = {"role": "system", "content": "You are a helpful assistant."}
+
+
+def _message(i: int) -> dict:
+    return {
+        "role": "user" if i % 2 == 0 else "assistant",
+        "content": f"message number {i} " * 8,
+    }
+
+
+def _list_turns(history: dict, start: int) -> None:
+    count = conversation_memory.estimate_tokens
+    for i in range(start, start + TURNS_PER_CALL):
+        messages = history["messages"] + [_message(i)]
+        system = [m for m in messages if m["role"] == "system"]
+        context = system + messages[-MAX_MESSAGES:]
+        sum(count(m["content"]) for m in context)
+        history["messages"] = messages
+
+
+def _memory_turns(memory, start: int) -> None:
+    for i in range(start, start + TURNS_PER_CALL):
+        memory.append(_message(i))
+        memory.messages()
+        memory.token_count
+
+
+def _truncating_summarizer(summary: str, evicted: list) -> str:
+    return (summary + " " + " ".join(m["content"] for m in evicted))[-400:]
+
+
+def run_benchmarks(iterations: int) -> list[BenchmarkResult]:
+    """
+    Time list-based and deque-based history at several conversation lengths.
+
+    Args:
+        iterations: Scales the number of timed calls
+
+    Returns:
+        list: One result per history length and structure
+    """
+    calls = max(5, iterations // 10)
+    results = []
+    for length in HISTORY_LENGTHS:
+        history = {"messages": [SYSTEM] + [_message(i) for i in range(length)]}
+        memory = conversation_memory.ConversationMemory(MAX_MESSAGES)
+        summarized = conversation_memory.ConversationMemory(
+            MAX_MESSAGES, summarizer=_truncating_summarizer
+        )
+        for target in (memory, summarized):
+            target.extend(history["messages"])
+            target.wait()
+        results += [
+            measure(
+                f"list[{length}]",
+                lambda: _list_turns(history, length),
+                calls,
+                warmup=1,
+                alloc_repeats=1,
+            ),
+            measure(
+                f"memory[{length}]",
+                lambda: _memory_turns(memory, length),
+                calls,
+                warmup=1,
+                alloc_repeats=1,
+            ),
+            measure(
+                f"memory_summarized[{length}]",
+                lambda: (_memory_turns(summarized, length), summarized.wait()),
+                calls,
+                warmup=1,
+                alloc_repeats=1,
+            ),
+        ]
+        summarized.close()
+
+    print(f"Microseconds per turn ({MAX_MESSAGES} recent messages in context):")
+    for result in results:
+        print(f"  {result.name:<28} {result.p50_us / TURNS_PER_CALL:>10.2f} us")
+    print()
+    return results
+
+
+if __name__ == "__main__":
+    sys.exit(run_suite(SUITE, run_benchmarks))
@@ -0,0 +1,77 @@
+"""
+Fused Chain Benchmarks
+
+Compares a CHAIN_LENGTH-node linear chain built as one graph node per step
+with the same chain built by build_chain(), which fuses all of its pure
+steps into one node. Both are timed with invoke() and with stream() in
+"custom" mode, where the fused chain still emits one event per sub-step.
+
+Usage:
+    python -m benchmarks.bench_fused_chain
+    python -m benchmarks.bench_fused_chain --save-baseline
+"""
+
+import operator
+import sys
+from typing import Annotated, TypedDict
+
+from benchmarks.harness import BenchmarkResult, measure, run_suite
+from src.modules.introduction.graphs.fused_chain import build_chain
+
+SUITE = "fused_chain"
+
+# Steps in the benchmarked chain
+CHAIN_LENGTH = 20
+
+
+class ChainState(TypedDict):
+    """State for the benchmarked chain."""
+
+    value: int
+    trace: Annotated[list, operator.add]
+
+
+def _make_step(i: int):
+    def step(state: ChainState) -> dict:
+        return {"value": state["value"] + i, "trace": [i]}
+
+    step.__name__ = f"step_{i}"
+    return step
+
+
+def run_benchmarks(iterations: int) -> list[BenchmarkResult]:
+    """
+    Time unfused and fused chains with invoke() and stream().
+
+    Args:
+        iterations: Timed calls per benchmark
+
+    Returns:
+        list: One result per chain and call
+    """
+    steps = [_make_step(i) for i in range(CHAIN_LENGTH)]
+    state = {"value": 0, "trace": []}
+    apps = {
+        "unfused": build_chain(steps, ChainState, fuse=False).compile(),
+        "fused": build_chain(steps, ChainState).compile(),
+        "fused_no_events": build_chain(steps, ChainState, emit_events=False).compile(),
+    }
+    results = []
+    for label, app in apps.items():
+        results.append(
+            measure(
+                f"{label}[{CHAIN_LENGTH}].invoke", lambda: app.invoke(state), iterations
+            )
+        )
+        results.append(
+            measure(
+                f"{label}[{CHAIN_LENGTH}].stream_custom",
+                lambda: list(app.stream(state, stream_mode="custom")),
+                iterations,
+            )
+        )
+    return results
+
+
+if __name__ == "__main__":
+    sys.exit(run_suite(SUITE, run_benchmarks))
@@ -0,0 +1,99 @@
+"""
+Graph Overhead Benchmarks
+
+Times StateGraph construction, compile(), invoke() and stream() for the
+Lesson 2 simple graph and for synthetic graphs with N nodes and E edges.
+
+Usage:
+    python -m benchmarks.bench_graph_overhead
+    python -m benchmarks.bench_graph_overhead --save-baseline
+    python -m benchmarks.bench_graph_overhead --check
+"""
+
+import sys
+
+from benchmarks.harness import BenchmarkResult, measure, run_suite
+from src.modules.introduction.graphs.synthetic import build_dag
+from src.modules.introduction.lessons.lesson_2_simple_graph.simple_graph import (
+    build_simple_graph,
+)
+
+SUITE = "graph_overhead"
+
+# (nodes, edges) shapes of the synthetic graphs
+SYNTHETIC_SHAPES = [(5, 4), (20, 19), (20, 40), (100, 99)]
+
+
+def run_benchmarks(iterations: int) -> list[BenchmarkResult]:
+    """
+    Run the construction, compile, invoke and stream benchmarks.
+
+    Args:
+        iterations: Timed calls per benchmark
+
+    Returns:
+        list: One result per benchmark
+    """
+    results = []
+
+    simple_app = build_simple_graph().compile()
+    simple_state = {"message": "Hello there!", "response": ""}
+    results.append(measure("simple_graph.construct", build_simple_graph, iterations))
+    results.append(
+        measure(
+            "simple_graph.compile", lambda: build_simple_graph().compile(), iterations
+        )
+    )
+    results.append(
+        measure(
+            "simple_graph.invoke", lambda: simple_app.invoke(simple_state), iterations
+        )
+    )
+    results.append(
+        measure(
+            "simple_graph.stream",
+            lambda: list(simple_app.stream(simple_state)),
+            iterations,
+        )
+    )
+
+    for num_nodes, num_edges in SYNTHETIC_SHAPES:
+        prefix = f"synthetic[n={num_nodes},e={num_edges}]"
+        # Fewer iterations for the larger graphs keeps the suite quick
+        shape_iterations = (
+            max(10, iterations * 5 // num_nodes) if num_nodes > 5 else iterations
+        )
+        app = build_dag(num_nodes, num_edges).compile()
+
+        results.append(
+            measure(
+                f"{prefix}.construct",
+                lambda: build_dag(num_nodes, num_edges),
+                shape_iterations,
+            )
+        )
+        results.append(
+            measure(
+                f"{prefix}.compile",
+                lambda: build_dag(num_nodes, num_edges).compile(),
+                shape_iterations,
+            )
+        )
+        results.append(
+            measure(
+                f"{prefix}.invoke", lambda: app.invoke({"count": 0}), shape_iterations
+            )
+        )
+        results.append(
+            measure(
+                f"{prefix}.stream",
+                lambda: list(app.stream({"count": 0})),
+                shape_iterations,
+            )
+        )
+
+    return results
+
+
+if __name__ == "__main__":
+    sys.exit(run_suite(SUITE, run_benchmarks))
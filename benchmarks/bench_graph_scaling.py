@@ -0,0 +1,85 @@
+"""
+Graph Scaling Benchmarks
+
+Sweeps the size of each synthetic graph shape (see graphs.synthetic) and
+reports compile time, invoke latency and peak memory per size, followed by
+a table of invoke cost per executed node, where scaling cliffs show up as
+a per-node cost that grows with N.
+
+Usage:
+    python -m benchmarks.bench_graph_scaling
+    python -m benchmarks.bench_graph_scaling --save-baseline
+"""
+
+import sys
+
+from benchmarks.harness import BenchmarkResult, measure, run_suite
+from src.modules.introduction.graphs.synthetic import (
+    build_synthetic,
+    expected_count,
+    recursion_limit,
+)
+
+SUITE = "graph_scaling"
+
+# Sizes swept per shape (tree sizes are depths: 2**(n + 1) - 1 nodes)
+SWEEPS = {
+    "linear": (10, 50, 200),
+    "fan_out": (10, 50, 200),
+    "tree": (2, 5, 8),
+    "agent_loop": (10, 50, 200),
+}
+
+
+def run_benchmarks(iterations: int) -> list[BenchmarkResult]:
+    """
+    Time compile() and invoke() for every shape and size in SWEEPS.
+
+    Args:
+        iterations: Timed calls for the smallest graphs; larger graphs
+            get proportionally fewer
+
+    Returns:
+        list: A compile and an invoke result per shape and size
+    """
+    results = []
+    rows = []
+    for shape, sizes in SWEEPS.items():
+        for n in sizes:
+            graph = build_synthetic(shape, n)
+            app = graph.compile()
+            config = {"recursion_limit": recursion_limit(shape, n)}
+            executed = expected_count(shape, n)
+            nodes = len(graph.nodes)
+            # Fewer iterations for the larger graphs keeps the suite quick
+            calls = max(5, iterations * 10 // max(nodes, executed, 10))
+
+            compiled = measure(
+                f"{shape}[{n}].compile", graph.compile, calls, warmup=1, alloc_repeats=1
+            )
+            invoked = measure(
+                f"{shape}[{n}].invoke",
+                lambda: app.invoke({"count": 0}, config),
+                calls,
+                warmup=1,
+                alloc_repeats=1,
+            )
+            results += [compiled, invoked]
+            rows.append((shape, n, nodes, executed, compiled, invoked))
+
+    print(
+        f"{'shape':<12}{'N':>6}{'nodes':>8}{'runs':>7}{'compile ms':>13}"
+        f"{'invoke ms':>12}{'us/run':>9}{'peak KiB':>11}"
+    )
+    for shape, n, nodes, executed, compiled, invoked in rows:
+        print(
+            f"{shape:<12}{n:>6}{nodes:>8}{executed:>7}{compiled.p50_us / 1000:>13.2f}"
+            f"{invoked.p50_us / 1000:>12.2f}{invoked.p50_us / executed:>9.1f}"
+            f"{invoked.peak_alloc_kib:>11.1f}"
+        )
+    print()
+    return results
+
+
+if __name__ == "__main__":
+    sys.exit(run_suite(SUITE, run_benchmarks))
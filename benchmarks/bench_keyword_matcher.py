@@ -0,0 +1,105 @@
+"""
+Keyword Matcher Benchmarks
+
+Times keyword-based message classification with a growing number of
+routing keywords: the per-keyword `keyword in text` scan used by the
+knowledge-base routers against the single-pass KeywordMatcher. Each timed
+call classifies MESSAGE_COUNT messages.
+
+Usage:
+    python -m benchmarks.bench_keyword_matcher
+    python -m benchmarks.bench_keyword_matcher --save-baseline
+"""
+
+import random
+import string
+import sys
+
+from benchmarks.harness import BenchmarkResult, measure, run_suite
+from src.modules.introduction.utils.keyword_matcher import KeywordMatcher
+
+SUITE = "keyword_matcher"
+
+# Keyword counts swept by the benchmark
+KEYWORD_COUNTS = [10, 100, 1000]
+
+# Labels the keywords are spread over
+LABEL_COUNT = 8
+
+# Messages classified per timed call
+MESSAGE_COUNT = 200
+
+
+def _keywords(count: int, rng: random.Random) -> dict[str, str]:
+    keywords: dict[str, str] = {}
+    while len(keywords) < count:
+        word = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 9)))
+        keywords[word] = f"label_{len(keywords) % LABEL_COUNT}"
+    return keywords
+
+
+def _messages(keywords: dict[str, str], rng: random.Random) -> list[str]:
+    filler = "please take a look at my account when you have a moment thanks".split()
+    words = list(keywords)
+    messages = []
+    for _ in range(MESSAGE_COUNT):
+        parts = rng.choices(filler, k=20) + rng.choices(words, k=rng.randint(0, 2))
+        rng.shuffle(parts)
+        messages.append(" ".join(parts).capitalize())
+    return messages
+
+
+def run_benchmarks(iterations: int) -> list[BenchmarkResult]:
+    """
+    Compare naive and single-pass keyword classification.
+
+    Args:
+        iterations: Scales the number of timed calls
+
+    Returns:
+        list: One result per keyword count and method
+    """
+    calls = max(5, iterations // 20)
+    rng = random.Random(0)
+    results = []
+    for count in KEYWORD_COUNTS:
+        keywords = _keywords(count, rng)
+        messages = _messages(keywords, rng)
+        items = list(keywords.items())
+        matcher = KeywordMatcher(keywords)
+
+        def naive() -> list[set]:
+            labelled = []
+            for message in messages:
+                lowered = message.lower()
+                labelled.append(
+                    {label for keyword, label in items if keyword in lowered}
+                )
+            return labelled
+
+        def single_pass() -> list[set]:
+            return [matcher.labels(message) for message in messages]
+
+        assert naive() == single_pass()
+        results.append(
+            measure(f"naive[keywords={count}]", naive, calls, warmup=1, alloc_repeats=1)
+        )
+        results.append(
+            measure(
+                f"matcher[keywords={count}]",
+                single_pass,
+                calls,
+                warmup=1,
+                alloc_repeats=1,
+            )
+        )
+
+    print(f"Microseconds per message ({MESSAGE_COUNT} messages per call):")
+    for result in results:
+        print(f"  {result.name:<28} {result.p50_us / MESSAGE_COUNT:>8.2f} us")
+    print()
+    return results
+
+
+if __name__ == "__main__":
+    sys.exit(run_suite(SUITE, run_benchmarks))
@@ -0,0 +1,116 @@
+"""
+Map-Reduce Benchmarks
+
+Times a map-reduce graph over ITEMS items at several max_parallelism
+settings, for an I/O-bound map function (sleeps, sync and async) and a
+CPU-bound one (pure Python arithmetic, on LangGraph's threads and on a
+process pool), then prints the speedup of each setting over
+max_parallelism=1.
+
+Threads only help the I/O-bound case: CPU-bound Python holds the GIL, so
+it needs the process pool and more than one core to speed up.
+
+Usage:
+    python -m benchmarks.bench_map_reduce
+    python -m benchmarks.bench_map_reduce --save-baseline
+"""
+
+import asyncio
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from benchmarks.harness import BenchmarkResult, measure, run_suite
+from src.modules.introduction.graphs.map_reduce import create_map_reduce
+
+SUITE = "map_reduce"
+
+# Items mapped per invoke
+ITEMS = 32
+
+# max_parallelism settings compared
+PARALLELISM = (1, 4, 16)
+
+# Simulated I/O latency per item, in seconds
+IO_LATENCY = 0.005
+
+# Loop iterations of CPU work per item
+CPU_WORK = 20_000
+
+
+def io_task(item: int) -> int:
+    time.sleep(IO_LATENCY)
+    return item
+
+
+async def aio_task(item: int) -> int:
+    await asyncio.sleep(IO_LATENCY)
+    return item
+
+
+def cpu_task(item: int) -> int:
+    total = 0
+    for i in range(CPU_WORK):
+        total += i * i % 7
+    return total + item
+
+
+def run_benchmarks(iterations: int) -> list[BenchmarkResult]:
+    """
+    Time map-reduce invokes per workload and max_parallelism.
+
+    Args:
+        iterations: Scales the number of timed calls
+
+    Returns:
+        list: One result per workload and max_parallelism
+    """
+    calls = max(5, iterations // 10)
+    state = {"items": list(range(ITEMS))}
+    results = []
+    with ProcessPoolExecutor(max(PARALLELISM)) as pool:
+        workloads = {
+            "io_threads": lambda p: create_map_reduce(
+                io_task, max_parallelism=p
+            ).invoke,
+            "io_async": lambda p: (
+                lambda s, app=create_map_reduce(
+                    aio_task, max_parallelism=p
+                ): asyncio.run(app.ainvoke(s))
+            ),
+            "cpu_threads": lambda p: create_map_reduce(
+                cpu_task, max_parallelism=p
+            ).invoke,
+            "cpu_processes": lambda p: create_map_reduce(
+                cpu_task, max_parallelism=p, pool=pool
+            ).invoke,
+        }
+        rows = []
+        for workload, make in workloads.items():
+            timings = []
+            for parallelism in PARALLELISM:
+                run = make(parallelism)
+                result = measure(
+                    f"{workload}[p={parallelism}]",
+                    lambda: run(state),
+                    calls,
+                    warmup=1,
+                    alloc_repeats=1,
+                )
+                results.append(result)
+                timings.append(result.p50_us)
+            rows.append((workload, timings))
+
+    print(f"Speedup over max_parallelism=1 ({ITEMS} items, {os.cpu_count()} CPUs):")
+    print(f"  {'workload':<16}" + "".join(f"{'p=' + str(p):>10}" for p in PARALLELISM))
+    for workload, timings in rows:
+        print(
+            f"  {workload:<16}" + "".join(f"{timings[0] / t:>9.2f}x" for t in timings)
+        )
+    print()
+    return results
+
+
+if __name__ == "__main__":
+    sys.exit(run_suite(SUITE, run_benchmarks))
@@ -0,0 +1,142 @@
+"""
+Micro-Batching Benchmarks
+
+Runs CONCURRENT_RUNS concurrent graph invocations against a fake model with
+a fixed per-call latency and an endpoint that serves at most
+ENDPOINT_CONCURRENCY calls at once, with and without a MicroBatcher in
+front of it. Each timed call is one full wave of concurrent runs.
+
+Usage:
+    python -m benchmarks.bench_microbatch
+    python -m benchmarks.bench_microbatch --save-baseline
+"""
+
+import asyncio
+import sys
+import threading
+
+from langgraph.graph import StateGraph
+
+from benchmarks.harness import BenchmarkResult, measure, run_suite
+from src.modules.introduction.lessons.lesson_2_simple_graph.simple_graph import (
+    GraphState,
+)
+from src.modules.introduction.nodes.microbatch import MicroBatcher, batched_node
+from src.modules.introduction.utils.fake_llm import FakeLLM
+
+SUITE = "microbatch"
+
+# Concurrent graph runs per timed call
+CONCURRENT_RUNS = 256
+
+# Fixed latency of every fake model call, batched or not
+CALL_LATENCY = 0.005
+
+# Calls the fake endpoint serves at once
+ENDPOINT_CONCURRENCY = 4
+
+
+def _compile(node) -> object:
+    graph = StateGraph(GraphState)
+    graph.add_node("call_llm", node)
+    graph.set_entry_point("call_llm")
+    graph.set_finish_point("call_llm")
+    return graph.compile()
+
+
+def _wave(app, messages: list[str]) -> None:
+    async def run() -> None:
+        await asyncio.gather(
+            *(app.ainvoke({"message": m, "response": ""}) for m in messages)
+        )
+
+    asyncio.run(run())
+
+
+def run_benchmarks(iterations: int) -> list[BenchmarkResult]:
+    """
+    Compare unbatched and micro-batched LLM nodes under concurrent load.
+
+    Args:
+        iterations: Scales the number of timed waves
+
+    Returns:
+        list: One result per configuration
+    """
+    waves = max(3, iterations // 40)
+    messages = [f"message {i}" for i in range(CONCURRENT_RUNS)]
+    results = []
+
+    unbatched_llm = FakeLLM(latency=CALL_LATENCY)
+    # Semaphores bind to the running loop, so each wave gets a fresh one
+    holder = {}
+
+    async def unbatched_node(state: GraphState) -> dict:
+        async with holder["limit"]:
+            return {"response": await unbatched_llm.agenerate(state["message"])}
+
+    unbatched_app = _compile(unbatched_node)
+
+    def unbatched_wave() -> None:
+        async def run() -> None:
+            holder["limit"] = asyncio.Semaphore(ENDPOINT_CONCURRENCY)
+            await asyncio.gather(
+                *(
+                    unbatched_app.ainvoke({"message": m, "response": ""})
+                    for m in messages
+                )
+            )
+
+        asyncio.run(run())
+
+    results.append(
+        measure(
+            f"unbatched[{CONCURRENT_RUNS}]",
+            unbatched_wave,
+            waves,
+            warmup=1,
+            alloc_repeats=1,
+        )
+    )
+    unbatched_calls = unbatched_llm.calls
+
+    summary = [(results[-1], unbatched_calls)]
+    for batch_size, max_wait in [(32, 0.005), (64, 0.002)]:
+        llm = FakeLLM(latency=CALL_LATENCY)
+        with MicroBatcher(
+            llm.generate_batch,
+            batch_size,
+            max_wait,
+            max_concurrency=ENDPOINT_CONCURRENCY,
+        ) as batcher:
+            app = _compile(batched_node(batcher, is_async=True))
+            results.append(
+                measure(
+                    f"batched[{CONCURRENT_RUNS},size={batch_size},"
+                    f"wait={max_wait * 1000:g}ms]",
+                    lambda: _wave(app, messages),
+                    waves,
+                    warmup=1,
+                    alloc_repeats=1,
+                )
+            )
+            summary.append((results[-1], batcher.stats().batches))
+
+    # Every configuration ran waves timed + 1 warmup + 1 traced wave
+    total_waves = waves + 2
+    print(
+        f"Per-request wall time ({CONCURRENT_RUNS} concurrent runs, "
+        f"{CALL_LATENCY * 1000:g}ms per call, "
+        f"{ENDPOINT_CONCURRENCY} concurrent calls):"
+    )
+    for result, calls in summary:
+        print(
+            f"  {result.name:<40} {result.p50_us / CONCURRENT_RUNS:>8.1f} us/request, "
+            f"{calls / total_waves:.0f} model calls/wave"
+        )
+    print()
+    return results
+
+
+if __name__ == "__main__":
+    sys.exit(run_suite(SUITE, run_benchmarks))
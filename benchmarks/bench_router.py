@@ -0,0 +1,140 @@
+"""
+Router Benchmarks
+
+Compares rule-by-rule routing (what an if/elif chain does) with compiled
+decision-table routers, routing ROUTED_STATES states per timed call one at a
+time and in a single batch, and reports decisions per second. The email and
+message routers have three rules; the ticket router has one rule per
+product and tier.
+
+Usage:
+    python -m benchmarks.bench_router
+    python -m benchmarks.bench_router --save-baseline
+"""
+
+import importlib
+import random
+import sys
+
+from benchmarks.harness import BenchmarkResult, measure, run_suite
+
+router_engine = importlib.import_module(
+    "src.modules.introduction.lessons.lesson-5-router.router_engine"
+)
+routers = importlib.import_module(
+    "src.modules.introduction.lessons.lesson-5-router.routers"
+)
+
+
+SUITE = "router"
+
+# States routed per timed call
+ROUTED_STATES = 10_000
+
+# Products in the large ticket rule set (three rules per product)
+TICKET_PRODUCTS = 60
+
+
+def _email_states(count: int) -> list[dict]:
+    rng = random.Random(0)
+    return [
+        {
+            "spam_score": rng.randint(0, 4),
+            "priority": rng.choice(["high", "normal", "normal", "normal"]),
+            "classification": rng.choice(["sales", "support", "hr", "general"]),
+        }
+        for _ in range(count)
+    ]
+
+
+def _message_states(count: int) -> list[dict]:
+    messages = [
+        "Hello there!",
+        "Help me with something",
+        "This is a regular message",
+        "",
+        "hey you",
+    ]
+    return [{"message": messages[i % len(messages)]} for i in range(count)]
+
+
+def _ticket_states(count: int) -> list[dict]:
+    rng = random.Random(1)
+    return [
+        {
+            "product": f"product_{rng.randrange(TICKET_PRODUCTS + 5)}",
+            "tier": rng.choice(["free", "pro", "enterprise"]),
+            "severity": rng.randint(1, 10),
+        }
+        for _ in range(count)
+    ]
+
+
+def run_benchmarks(iterations: int) -> list[BenchmarkResult]:
+    """
+    Time naive, compiled and batch routing.
+
+    Args:
+        iterations: Scales the number of timed calls
+
+    Returns:
+        list: One result per router and mode
+    """
+    calls = max(5, iterations // 20)
+    ticket_rules = routers.build_ticket_rules(TICKET_PRODUCTS)
+    cases = [
+        (
+            "email",
+            routers.route_email,
+            routers.EMAIL_ROUTER,
+            _email_states(ROUTED_STATES),
+        ),
+        (
+            "message",
+            routers.route_message,
+            routers.MESSAGE_ROUTER,
+            _message_states(ROUTED_STATES),
+        ),
+        (
+            f"ticket[{len(ticket_rules)} rules]",
+            router_engine.naive_router(ticket_rules, "triage"),
+            router_engine.compile_router(ticket_rules, "triage"),
+            _ticket_states(ROUTED_STATES),
+        ),
+    ]
+
+    results = []
+    for name, naive, compiled, states in cases:
+        results += [
+            measure(
+                f"{name}.naive",
+                lambda: [naive(s) for s in states],
+                calls,
+                warmup=1,
+                alloc_repeats=1,
+            ),
+            measure(
+                f"{name}.compiled",
+                lambda: [compiled(s) for s in states],
+                calls,
+                warmup=1,
+                alloc_repeats=1,
+            ),
+            measure(
+                f"{name}.compiled_batch",
+                lambda: compiled.route_many(states),
+                calls,
+                warmup=1,
+                alloc_repeats=1,
+            ),
+        ]
+
+    print(f"Decisions per second ({ROUTED_STATES:,} states per call):")
+    for result in results:
+        print(f"  {result.name:<36} {ROUTED_STATES / (result.p50_us / 1e6):>14,.0f}")
+    print()
+    return results
+
+
+if __name__ == "__main__":
+    sys.exit(run_suite(SUITE, run_benchmarks))
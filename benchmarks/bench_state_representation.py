@@ -0,0 +1,107 @@
+"""
+State Representation Benchmarks
+
+Compares the dict-based GraphState with the slotted CompactGraphState and
+the struct-of-arrays BatchGraphState: memory per state (peak allocation of
+building STATE_COUNT states) and per-message invoke latency.
+
+Usage:
+    python -m benchmarks.bench_state_representation
+    python -m benchmarks.bench_state_representation --save-baseline
+"""
+
+import sys
+
+from benchmarks.harness import BenchmarkResult, measure, run_suite
+from src.modules.introduction.lessons.lesson_2_simple_graph.simple_graph import (
+    CompactGraphState,
+    create_batch_graph,
+    create_compact_graph,
+    create_simple_graph,
+)
+
+SUITE = "state_representation"
+
+# Number of states built for the memory comparison
+STATE_COUNT = 10_000
+
+# Messages per invoke for the struct-of-arrays graph
+BATCH_SIZE = 1_000
+
+MESSAGES = ["Hello there!", "Help me with something", "This is a regular message", ""]
+
+
+def _messages(count: int) -> list[str]:
+    return [MESSAGES[i % len(MESSAGES)] for i in range(count)]
+
+
+def run_benchmarks(iterations: int) -> list[BenchmarkResult]:
+    """
+    Run the memory and throughput comparisons.
+
+    Args:
+        iterations: Timed calls per benchmark
+
+    Returns:
+        list: One result per benchmark
+    """
+    messages = _messages(STATE_COUNT)
+    memory_iterations = max(5, iterations // 20)
+
+    results = [
+        measure(
+            f"memory.dict[{STATE_COUNT}]",
+            lambda: [{"message": m, "response": ""} for m in messages],
+            memory_iterations,
+        ),
+        measure(
+            f"memory.slotted[{STATE_COUNT}]",
+            lambda: [CompactGraphState(m) for m in messages],
+            memory_iterations,
+        ),
+        measure(
+            f"memory.columns[{STATE_COUNT}]",
+            lambda: {"messages": list(messages), "responses": [""] * len(messages)},
+            memory_iterations,
+        ),
+    ]
+
+    dict_app = create_simple_graph()
+    compact_app = create_compact_graph()
+    batch_app = create_batch_graph()
+    batch_messages = _messages(BATCH_SIZE)
+
+    results += [
+        measure(
+            "invoke.dict",
+            lambda: dict_app.invoke({"message": "Hello there!", "response": ""}),
+            iterations,
+        ),
+        measure(
+            "invoke.slotted_delta",
+            lambda: compact_app.invoke(CompactGraphState("Hello there!")),
+            iterations,
+        ),
+        measure(
+            f"invoke.columns[{BATCH_SIZE}]",
+            lambda: batch_app.invoke({"messages": batch_messages, "responses": []}),
+            max(10, iterations // 10),
+        ),
+    ]
+
+    print("Bytes per state:")
+    for result in results[:3]:
+        print(
+            f"  {result.name:<30} {result.peak_alloc_kib * 1024 / STATE_COUNT:>8.1f} B"
+        )
+    print("Microseconds per message (p50):")
+    for result in results[3:5]:
+        print(f"  {result.name:<30} {result.p50_us:>8.1f} us")
+    print(f"  {results[5].name:<30} {results[5].p50_us / BATCH_SIZE:>8.1f} us")
+    print()
+
+    return results
+
+
+if __name__ == "__main__":
+    sys.exit(run_suite(SUITE, run_benchmarks))
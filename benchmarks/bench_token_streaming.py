@@ -0,0 +1,99 @@
+"""
+Token Streaming Benchmarks
+
+Measures time-to-first-token (TTFT) of the Lesson 4 streaming chain against
+the time to the full response, using a fake streaming model with a fixed
+delay before the first token and between tokens.
+
+Usage:
+    python -m benchmarks.bench_token_streaming
+    python -m benchmarks.bench_token_streaming --save-baseline
+"""
+
+import asyncio
+import importlib
+import sys
+
+from benchmarks.harness import BenchmarkResult, measure, run_suite
+from src.modules.introduction.utils.fake_llm import FakeLLM
+
+streaming_chain = importlib.import_module(
+    "src.modules.introduction.lessons.lesson-4-chain.streaming_chain"
+)
+
+
+SUITE = "token_streaming"
+
+# Fake model delay before the first token (prefill and network round trip)
+FIRST_TOKEN_LATENCY = 0.02
+
+# Fake model delay between tokens
+TOKEN_LATENCY = 0.002
+
+STATE = {"message": "Hello there! Tell me about LangGraph streaming."}
+
+
+def _first_token(app) -> str:
+    with streaming_chain.TokenStream(app, STATE) as tokens:
+        return next(iter(tokens))
+
+
+def _afirst_token(app) -> str:
+    async def run() -> str:
+        async with streaming_chain.AsyncTokenStream(app, STATE) as tokens:
+            async for token in tokens:
+                return token
+
+    return asyncio.run(run())
+
+
+def run_benchmarks(iterations: int) -> list[BenchmarkResult]:
+    """
+    Compare time-to-first-token with time-to-full-response.
+
+    Args:
+        iterations: Scales the number of timed calls
+
+    Returns:
+        list: One result per benchmark
+    """
+    calls = max(10, iterations // 10)
+    llm = FakeLLM(latency=FIRST_TOKEN_LATENCY)
+    app = streaming_chain.create_streaming_chain(llm, token_latency=TOKEN_LATENCY)
+    async_app = streaming_chain.create_streaming_chain(
+        llm, is_async=True, token_latency=TOKEN_LATENCY
+    )
+    tokens = len(list(llm.stream(app.invoke(STATE)["prompt"])))
+
+    results = [
+        measure(
+            "invoke.full_response",
+            lambda: app.invoke(STATE),
+            calls,
+            warmup=2,
+            alloc_repeats=2,
+        ),
+        measure(
+            "stream.ttft", lambda: _first_token(app), calls, warmup=2, alloc_repeats=2
+        ),
+        measure(
+            "astream.ttft",
+            lambda: _afirst_token(async_app),
+            calls,
+            warmup=2,
+            alloc_repeats=2,
+        ),
+    ]
+
+    print(
+        f"Fake model: {FIRST_TOKEN_LATENCY * 1000:g}ms to first token, "
+        f"{TOKEN_LATENCY * 1000:g}ms per token, {tokens} tokens"
+    )
+    for result in results:
+        print(f"  {result.name:<24} {result.p50_us / 1000:>8.2f} ms (p50)")
+    print()
+    return results
+
+
+if __name__ == "__main__":
+    sys.exit(run_suite(SUITE, run_benchmarks))
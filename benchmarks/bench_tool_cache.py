@@ -0,0 +1,118 @@
+"""
+Tool Cache Benchmarks
+
+Replays ReAct-style agent loops: CONVERSATIONS conversations of TURNS turns,
+each turn making CALLS_PER_TURN tool calls drawn from a skewed pool of
+QUERY_POOL queries (a few popular lookups, a long tail of rare ones), against
+fake tools that sleep TOOL_LATENCY seconds. Each timed call replays every
+conversation with a fresh, empty cache, so hits come only from repetition
+within and across the conversations.
+
+Usage:
+    python -m benchmarks.bench_tool_cache
+    python -m benchmarks.bench_tool_cache --save-baseline
+"""
+
+import importlib
+import random
+import sys
+import time
+
+from benchmarks.harness import BenchmarkResult, measure, run_suite
+
+tool_cache = importlib.import_module(
+    "src.modules.introduction.lessons.lesson-6-agent.tool_cache"
+)
+tool_executor = importlib.import_module(
+    "src.modules.introduction.lessons.lesson-6-agent.tool_executor"
+)
+
+
+SUITE = "tool_cache"
+
+# Conversations replayed per timed call
+CONVERSATIONS = 10
+
+# Tool-calling turns per conversation
+TURNS = 4
+
+# Tool calls per turn
+CALLS_PER_TURN = 2
+
+# Distinct queries the agents draw from
+QUERY_POOL = 40
+
+# Latency of every fake tool call in seconds
+TOOL_LATENCY = 0.002
+
+
+def search(query: str) -> str:
+    time.sleep(TOOL_LATENCY)
+    return f"results for {query}"
+
+
+def _turns() -> list[list[dict]]:
+    rng = random.Random(3)
+    weights = [1 / (rank + 1) for rank in range(QUERY_POOL)]
+    turns = []
+    for conversation in range(CONVERSATIONS):
+        for turn in range(TURNS):
+            queries = rng.choices(range(QUERY_POOL), weights, k=CALLS_PER_TURN)
+            turns.append(
+                [
+                    {
+                        "name": "search",
+                        "args": {"query": f"topic {q}"},
+                        "id": f"{conversation}-{turn}-{i}",
+                    }
+                    for i, q in enumerate(queries)
+                ]
+            )
+    return turns
+
+
+def run_benchmarks(iterations: int) -> list[BenchmarkResult]:
+    """
+    Time agent loops with and without the tool cache.
+
+    Args:
+        iterations: Scales the number of timed replays
+
+    Returns:
+        list: One result per configuration
+    """
+    replays = max(3, iterations // 40)
+    turns = _turns()
+    caches = []
+
+    def replay(use_cache: bool) -> None:
+        cache = tool_cache.ToolCache() if use_cache else None
+        with tool_executor.ToolExecutor([search], cache=cache) as executor:
+            for calls in turns:
+                executor.run(calls)
+        if cache is not None:
+            caches.append(cache)
+
+    results = [
+        measure("uncached", lambda: replay(False), replays, warmup=1, alloc_repeats=1),
+        measure("cached", lambda: replay(True), replays, warmup=1, alloc_repeats=1),
+    ]
+
+    stats = caches[-1].total_stats()
+    calls = CONVERSATIONS * TURNS * CALLS_PER_TURN
+    print(
+        f"Agent loops ({calls} tool calls over {QUERY_POOL} queries, "
+        f"{TOOL_LATENCY * 1000:.0f} ms each):"
+    )
+    print(
+        f"  hit rate            {stats.hit_rate:.0%} "
+        f"({stats.hits} hits, {stats.misses} misses)"
+    )
+    for result in results:
+        print(f"  {result.name:<18} {result.p50_us / 1000:>8.1f} ms per replay")
+    print()
+    return results
+
+
+if __name__ == "__main__":
+    sys.exit(run_suite(SUITE, run_benchmarks))
@@ -0,0 +1,137 @@
+"""
+Tool Executor Benchmarks
+
+Times one agent turn of TOOL_CALLS tool calls against local fake tools that
+sleep for TOOL_LATENCIES seconds (cycled across the calls), run one after
+another, on thread pools of several sizes, and as coroutines on asyncio.
+Each timed call is one turn; the wall-clock time is what the agent waits
+before its next model call.
+
+Usage:
+    python -m benchmarks.bench_tool_executor
+    python -m benchmarks.bench_tool_executor --save-baseline
+"""
+
+import asyncio
+import importlib
+import sys
+import time
+
+from benchmarks.harness import BenchmarkResult, measure, run_suite
+
+tool_executor = importlib.import_module(
+    "src.modules.introduction.lessons.lesson-6-agent.tool_executor"
+)
+
+
+SUITE = "tool_executor"
+
+# Tool calls the model requests in one turn
+TOOL_CALLS = 8
+
+# Latency of each fake tool in seconds
+TOOL_LATENCIES = (0.002, 0.005, 0.010, 0.020)
+
+# Thread pool sizes to compare
+POOL_SIZES = (2, 8)
+
+
+def _sync_tools() -> dict:
+    def make(latency: float):
+        def tool(query: str) -> str:
+            time.sleep(latency)
+            return f"{query} done"
+
+        return tool
+
+    return {f"tool_{i}": make(latency) for i, latency in enumerate(TOOL_LATENCIES)}
+
+
+def _async_tools() -> dict:
+    def make(latency: float):
+        async def tool(query: str) -> str:
+            await asyncio.sleep(latency)
+            return f"{query} done"
+
+        return tool
+
+    return {f"tool_{i}": make(latency) for i, latency in enumerate(TOOL_LATENCIES)}
+
+
+def _calls() -> list[dict]:
+    return [
+        {
+            "name": f"tool_{i % len(TOOL_LATENCIES)}",
+            "args": {"query": f"q{i}"},
+            "id": f"call_{i}",
+        }
+        for i in range(TOOL_CALLS)
+    ]
+
+
+def _sequential(tools: dict, calls: list[dict]) -> list:
+    return [tools[call["name"]](**call["args"]) for call in calls]
+
+
+def run_benchmarks(iterations: int) -> list[BenchmarkResult]:
+    """
+    Time sequential, thread-pool and asyncio tool execution per turn.
+
+    Args:
+        iterations: Scales the number of timed turns
+
+    Returns:
+        list: One result per execution strategy
+    """
+    turns = max(5, iterations // 10)
+    calls = _calls()
+    sync_tools = _sync_tools()
+    results = [
+        measure(
+            "sequential",
+            lambda: _sequential(sync_tools, calls),
+            turns,
+            warmup=1,
+            alloc_repeats=1,
+        )
+    ]
+
+    for size in POOL_SIZES:
+        with tool_executor.ToolExecutor(sync_tools, max_workers=size) as executor:
+            results.append(
+                measure(
+                    f"threads[{size}]",
+                    lambda: executor.run(calls),
+                    turns,
+                    warmup=1,
+                    alloc_repeats=1,
+                )
+            )
+
+    executor = tool_executor.ToolExecutor(_async_tools(), max_workers=TOOL_CALLS)
+    results.append(
+        measure(
+            "asyncio",
+            lambda: asyncio.run(executor.arun(calls)),
+            turns,
+            warmup=1,
+            alloc_repeats=1,
+        )
+    )
+
+    ideal = max(TOOL_LATENCIES) * 1000
+    total = (
+        sum(TOOL_LATENCIES[i % len(TOOL_LATENCIES)] for i in range(TOOL_CALLS)) * 1000
+    )
+    print(
+        f"Wall-clock per turn ({TOOL_CALLS} calls; "
+        f"slowest tool {ideal:.0f} ms, sum {total:.0f} ms):"
+    )
+    for result in results:
+        print(f"  {result.name:<12} {result.p50_us / 1000:>8.1f} ms")
+    print()
+    return results
+
+
+if __name__ == "__main__":
+    sys.exit(run_suite(SUITE, run_benchmarks))
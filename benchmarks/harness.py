@@ -0,0 +1,285 @@
+"""
+Benchmark Harness
+
+Small timing harness shared by the benchmark modules. It measures the
+latency distribution of a callable (p50/p95/p99), the memory it allocates
+per call (via tracemalloc), and compares results against stored baselines
+so regressions can be caught.
+"""
+
+import argparse
+import gc
+import json
+import statistics
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+# Baselines live next to the benchmark modules
+BASELINE_PATH = Path(__file__).with_name("baselines.json")
+
+# Allowed slowdown (as a fraction) before a result counts as a regression
+DEFAULT_TOLERANCE = 0.5
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    Result of benchmarking a single callable.
+
+    Attributes:
+        name: Benchmark name, unique within a suite
+        iterations: Number of timed calls
+        mean_us: Mean latency in microseconds
+        p50_us: Median latency in microseconds
+        p95_us: 95th percentile latency in microseconds
+        p99_us: 99th percentile latency in microseconds
+        peak_alloc_kib: Peak traced memory allocated during one call, in KiB
+        alloc_blocks: Memory blocks still allocated after one call
+    """
+
+    name: str
+    iterations: int
+    mean_us: float
+    p50_us: float
+    p95_us: float
+    p99_us: float
+    peak_alloc_kib: float
+    alloc_blocks: int
+
+    def format(self) -> str:
+        """Format the result as a single report line."""
+        return (
+            f"{self.name:<40} p50={self.p50_us:>10.1f}us p95={self.p95_us:>10.1f}us "
+            f"p99={self.p99_us:>10.1f}us peak={self.peak_alloc_kib:>9.1f}KiB"
+        )
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """
+    Return the pct-th percentile of samples using linear interpolation.
+
+    Args:
+        samples: Non-empty list of measurements
+        pct: Percentile between 0 and 100
+
+    Returns:
+        float: The interpolated percentile
+    """
+    if not samples:
+        raise ValueError("percentile() requires at least one sample")
+    ordered = sorted(samples)
+    position = (len(ordered) - 1) * pct / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def measure_allocations(func: Callable[[], Any], repeats: int = 5) -> tuple[float, int]:
+    """
+    Measure the memory allocated by a callable with tracemalloc.
+
+    Args:
+        func: Callable to measure
+        repeats: Number of traced calls; the maximum is reported
+
+    Returns:
+        tuple: (peak KiB allocated during a call, blocks left allocated after it)
+    """
+    peak = 0
+    blocks = 0
+    for _ in range(repeats):
+        gc.collect()
+        tracemalloc.start()
+        try:
+            before = tracemalloc.take_snapshot()
+            func()
+            _, call_peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+        peak = max(peak, call_peak)
+        blocks = max(
+            blocks,
+            sum(stat.count_diff for stat in after.compare_to(before, "filename")),
+        )
+    return peak / 1024, blocks
+
+
+def measure(
+    name: str,
+    func: Callable[[], Any],
+    iterations: int = 200,
+    warmup: int = 10,
+    alloc_repeats: int = 5,
+) -> BenchmarkResult:
+    """
+    Time a callable and measure its allocations.
+
+    Timing runs without tracemalloc so tracing does not skew latencies;
+    allocations are measured in a separate traced pass.
+
+    Args:
+        name: Benchmark name
+        func: Zero-argument callable to benchmark
+        iterations: Number of timed calls
+        warmup: Number of untimed calls made first
+        alloc_repeats: Number of traced calls used for allocation stats
+
+    Returns:
+        BenchmarkResult: Latency percentiles and allocation stats
+    """
+    for _ in range(warmup):
+        func()
+
+    samples = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(iterations):
+            start = time.perf_counter_ns()
+            func()
+            samples.append((time.perf_counter_ns() - start) / 1000)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    peak_kib, blocks = measure_allocations(func, alloc_repeats)
+
+    return BenchmarkResult(
+        name=name,
+        iterations=iterations,
+        mean_us=statistics.fmean(samples),
+        p50_us=percentile(samples, 50),
+        p95_us=percentile(samples, 95),
+        p99_us=percentile(samples, 99),
+        peak_alloc_kib=peak_kib,
+        alloc_blocks=blocks,
+    )
+
+
+def load_baselines(path: Path = BASELINE_PATH) -> dict[str, dict[str, dict[str, Any]]]:
+    """
+    Load stored baselines, keyed by suite then benchmark name.
+
+    Args:
+        path: Baseline file
+
+    Returns:
+        dict: Baselines, empty if the file does not exist
+    """
+    if not path.exists():
+        return {}
+    with path.open() as fp:
+        return json.load(fp)
+
+
+def save_baselines(
+    suite: str, results: Iterable[BenchmarkResult], path: Path = BASELINE_PATH
+) -> None:
+    """
+    Store results as the new baseline for a suite, keeping other suites.
+
+    Args:
+        suite: Suite name
+        results: Results to store
+        path: Baseline file
+    """
+    baselines = load_baselines(path)
+    baselines[suite] = {result.name: asdict(result) for result in results}
+    with path.open("w") as fp:
+        json.dump(baselines, fp, indent=2, sort_keys=True)
+        fp.write("\n")
+
+
+def find_regressions(
+    results: Iterable[BenchmarkResult],
+    baseline: dict[str, dict[str, Any]],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> list[str]:
+    """
+    Compare results with a suite baseline.
+
+    A benchmark regresses when its p50 latency or peak allocation exceeds the
+    baseline by more than tolerance. Benchmarks without a baseline are skipped.
+
+    Args:
+        results: Fresh results
+        baseline: Stored results for the same suite
+        tolerance: Allowed relative increase, e.g. 0.5 for +50%
+
+    Returns:
+        list: Human-readable descriptions of each regression
+    """
+    regressions = []
+    for result in results:
+        previous = baseline.get(result.name)
+        if previous is None:
+            continue
+        for metric in ("p50_us", "peak_alloc_kib"):
+            old, new = previous[metric], getattr(result, metric)
+            if old > 0 and new > old * (1 + tolerance):
+                regressions.append(
+                    f"{result.name}: {metric} {old:.1f} -> {new:.1f} "
+                    f"(+{(new / old - 1):.0%})"
+                )
+    return regressions
+
+
+def run_suite(
+    suite: str,
+    benchmarks: Callable[[int], list[BenchmarkResult]],
+    argv: Optional[list[str]] = None,
+) -> int:
+    """
+    Command-line driver shared by the benchmark modules.
+
+    Args:
+        suite: Suite name used as the baseline key
+        benchmarks: Callable taking an iteration count and returning results
+        argv: Command-line arguments (defaults to sys.argv)
+
+    Returns:
+        int: Process exit code, 1 if --check found regressions
+    """
+    parser = argparse.ArgumentParser(description=f"Run the {suite} benchmarks")
+    parser.add_argument(
+        "--iterations", type=int, default=200, help="timed calls per benchmark"
+    )
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="store results as the new baseline"
+    )
+    parser.add_argument(
+        "--check", action="store_true", help="exit non-zero on regressions"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="allowed relative slowdown",
+    )
+    args = parser.parse_args(argv)
+
+    print(f"📊 {suite} benchmarks")
+    print("=" * 60)
+    results = benchmarks(args.iterations)
+    for result in results:
+        print(result.format())
+
+    if args.save_baseline:
+        save_baselines(suite, results)
+        print(f"\n💾 Baseline saved to {BASELINE_PATH}")
+        return 0
+
+    regressions = find_regressions(
+        results, load_baselines().get(suite, {}), args.tolerance
+    )
+    if regressions:
+        print("\n⚠️  Regressions against baseline:")
+        for regression in regressions:
+            print(f"  - {regression}")
+    else:
+        print("\n✅ No regressions against baseline")
+    return 1 if regressions and args.check else 0
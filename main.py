@@ -1,6 +1,282 @@
-def main():
-    print("Hello from langgraph-intro!")
+"""
+LangGraph Introduction - Command Line Runner
+
+Runs any graph registered in studio_config.json over JSONL input from a
+file or stdin and writes the final states as JSONL.
+
+Examples:
+    python main.py --list
+    echo '"Hello there!"' | python main.py
+    python main.py --graph simple_graph -i messages.jsonl -o out.jsonl \\
+        --mode process --workers 8 --batch-size 256
+    python main.py -i messages.jsonl -o out.jsonl --profile run.pstats --node-timings
+"""
+
+import argparse
+import asyncio
+import cProfile
+import importlib
+import io
+import pstats
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Any, Optional
+
+from src.modules.introduction.utils.jsonl_pipeline import (
+    DEFAULT_BATCH_SIZE,
+    PipelineStats,
+    micro_batches,
+    read_jsonl,
+    run_jsonl_pipeline,
+    write_jsonl,
+)
+
+DEFAULT_CONFIG = Path(__file__).resolve().parent / "studio_config.json"
+
+# Compiled graph owned by a process pool worker (one per process)
+_worker_app = None
+
+
+def load_graph(config: Path, graph: str, profiler: Any = None) -> Any:
+    """
+    Compile a graph registered in a Studio config.
+
+    Args:
+        config: Path to studio_config.json
+        graph: Graph name
+        profiler: NodeProfiler to instrument every node with, if any
+
+    Returns:
+        Compiled graph application
+    """
+    studio = importlib.import_module(
+        "src.modules.introduction.lessons.lesson-3-langgraph-studio"
+    )
+    node_wrapper = None
+    if profiler is not None:
+        node_wrapper = profiler.instrument
+    return studio.GraphImporter(config, node_wrapper=node_wrapper).compile(graph)
+
+
+def _init_worker(config: Path, graph: str) -> None:
+    """Compile the graph once in each process pool worker."""
+    global _worker_app
+    _worker_app = load_graph(config, graph)
+
+
+def _invoke_in_worker(batch: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Invoke a micro-batch with the worker's compiled graph."""
+    return [_worker_app.invoke(state) for state in batch]
+
+
+async def run_async(
+    app: Any, input_stream: Any, output_stream: Any, batch_size: int, concurrency: int
+) -> PipelineStats:
+    """
+    Stream JSONL through the graph with concurrent ainvoke calls per micro-batch.
+
+    Args:
+        app: Compiled graph application
+        input_stream: JSONL text lines
+        output_stream: Text stream for the resulting states
+        batch_size: States per micro-batch
+        concurrency: Maximum concurrent ainvoke calls
+
+    Returns:
+        PipelineStats: Counts and timing for the run
+    """
+    from src.modules.introduction.lessons.lesson_2_simple_graph.simple_graph import (
+        ainvoke_many,
+    )
+
+    loop = asyncio.get_running_loop()
+    stats = PipelineStats()
+    start = loop.time()
+    for batch in micro_batches(read_jsonl(input_stream), batch_size):
+        results = await ainvoke_many(batch, app=app, concurrency=concurrency)
+        stats.records += write_jsonl(results, output_stream)
+        stats.batches += 1
+        output_stream.flush()
+    stats.seconds = loop.time() - start
+    return stats
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
+    parser = argparse.ArgumentParser(
+        description="Run a registered LangGraph graph over JSONL input."
+    )
+    parser.add_argument(
+        "--config", type=Path, default=DEFAULT_CONFIG, help="Studio config file"
+    )
+    parser.add_argument(
+        "--graph", default="simple_graph", help="graph name in the config"
+    )
+    parser.add_argument(
+        "--list", action="store_true", help="list registered graphs and exit"
+    )
+    parser.add_argument(
+        "-i", "--input", default="-", help="JSONL input file (default: stdin)"
+    )
+    parser.add_argument(
+        "-o", "--output", default="-", help="JSONL output file (default: stdout)"
+    )
+    parser.add_argument(
+        "--mode",
+        choices=["thread", "process", "async"],
+        default="thread",
+        help="execution mode",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="worker threads/processes, or concurrent calls in async mode",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="states per micro-batch",
+    )
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        help="write cProfile stats to this file (covers the main thread only; "
+        "use --node-timings for time spent in worker threads)",
+    )
+    parser.add_argument(
+        "--node-timings", action="store_true", help="print a per-node timing summary"
+    )
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Command-line entry point.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv)
+
+    Returns:
+        int: Process exit code
+    """
+    args = build_parser().parse_args(argv)
+    log = sys.stderr
+
+    if args.list:
+        studio = importlib.import_module(
+            "src.modules.introduction.lessons.lesson-3-langgraph-studio"
+        )
+        importer = studio.GraphImporter(args.config)
+        for name in importer.graph_names():
+            print(f"{name}: {importer.descriptor(name).get('description', '')}")
+        return 0
+
+    if args.workers < 1:
+        print("--workers must be at least 1", file=log)
+        return 2
+
+    profiler = None
+    if args.node_timings:
+        if args.mode == "process":
+            print(
+                "⚠️  --node-timings is not supported with --mode process; ignoring",
+                file=log,
+            )
+        else:
+            from src.modules.introduction.nodes.instrumentation import NodeProfiler
+
+            profiler = NodeProfiler()
+            profiler.enable()
+
+    try:
+        app = load_graph(args.config, args.graph, profiler)
+    except (KeyError, LookupError, ValueError) as e:
+        print(f"❌ Cannot load graph '{args.graph}': {e}", file=log)
+        return 1
+
+    profile = cProfile.Profile() if args.profile else None
+
+    with ExitStack() as stack:
+        try:
+            input_stream = (
+                sys.stdin
+                if args.input == "-"
+                else stack.enter_context(open(args.input, encoding="utf-8"))
+            )
+            output_stream = (
+                sys.stdout
+                if args.output == "-"
+                else stack.enter_context(open(args.output, "w", encoding="utf-8"))
+            )
+        except OSError as e:
+            print(f"❌ Cannot open {e.filename}: {e.strerror}", file=log)
+            return 1
+
+        if profile is not None:
+            profile.enable()
+        try:
+            if args.mode == "async":
+                stats = asyncio.run(
+                    run_async(
+                        app, input_stream, output_stream, args.batch_size, args.workers
+                    )
+                )
+            elif args.mode == "process":
+                executor = stack.enter_context(
+                    ProcessPoolExecutor(
+                        max_workers=args.workers,
+                        initializer=_init_worker,
+                        initargs=(args.config, args.graph),
+                    )
+                )
+                stats = run_jsonl_pipeline(
+                    input_stream,
+                    output_stream,
+                    batch_size=args.batch_size,
+                    max_workers=args.workers,
+                    executor=executor,
+                    process_batch=_invoke_in_worker,
+                )
+            else:
+                stats = run_jsonl_pipeline(
+                    input_stream,
+                    output_stream,
+                    app=app,
+                    batch_size=args.batch_size,
+                    max_workers=args.workers,
+                )
+        except ValueError as e:
+            print(f"❌ Invalid input: {e}", file=log)
+            return 1
+        finally:
+            if profile is not None:
+                profile.disable()
+
+    print(
+        f"✅ {stats.records} records in {stats.batches} batches, {stats.seconds:.2f}s "
+        f"({stats.throughput:,.0f} records/s, "
+        f"mode={args.mode}, workers={args.workers})",
+        file=log,
+    )
+
+    if profile is not None:
+        profile.dump_stats(args.profile)
+        report = io.StringIO()
+        pstats.Stats(profile, stream=report).sort_stats("cumulative").print_stats(15)
+        print(f"\n📊 cProfile stats written to {args.profile}", file=log)
+        print(report.getvalue(), file=log)
+
+    if profiler is not None:
+        profiler.disable()
+        print("\n⏱️  Per-node timings", file=log)
+        print(profiler.format_summary(), file=log)
+
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
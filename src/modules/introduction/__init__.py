@@ -9,4 +9,27 @@ This module covers the fundamentals of LangGraph through 7 lessons:
 5. Lesson 5: Router
 6. Lesson 6: Agent
 7. Lesson 7: Agent Memory
-""" 
\ No newline at end of file
+
+Heavy dependencies (langgraph, langchain, google.generativeai) are only
+imported when one of the re-exported attributes below is first used.
+"""
+
+from src.modules.introduction.utils.lazy import lazy_exports
+
+__getattr__, __dir__, __all__ = lazy_exports(
+    __name__,
+    {
+        # Subpackages
+        "graphs": ".graphs",
+        "lessons": ".lessons",
+        "nodes": ".nodes",
+        "utils": ".utils",
+        # Lesson 2: Simple Graph
+        "GraphState": ".lessons.lesson_2_simple_graph.simple_graph:GraphState",
+        "create_simple_graph": ".lessons.lesson_2_simple_graph.simple_graph:create_simple_graph",
+        "build_simple_graph": ".lessons.lesson_2_simple_graph.simple_graph:build_simple_graph",
+        # Shared graph and node helpers
+        "compile_cached": ".graphs.cache:compile_cached",
+        "instrument": ".nodes.instrumentation:instrument",
+    },
+)
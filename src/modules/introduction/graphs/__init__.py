@@ -3,4 +3,26 @@ Graphs Package
 
 This package contains reusable graph implementations and patterns
 for LangGraph applications.
-""" 
\ No newline at end of file
+"""
+
+from src.modules.introduction.utils.lazy import lazy_exports
+
+__getattr__, __dir__, __all__ = lazy_exports(
+    __name__,
+    {
+        "CompiledGraphCache": ".cache:CompiledGraphCache",
+        "compile_cached": ".cache:compile_cached",
+        "get_default_cache": ".cache:get_default_cache",
+        "graph_fingerprint": ".cache:graph_fingerprint",
+        "ChainStep": ".fused_chain:ChainStep",
+        "build_chain": ".fused_chain:build_chain",
+        "fuse_steps": ".fused_chain:fuse_steps",
+        "state_reducers": ".fused_chain:state_reducers",
+        "SyntheticState": ".synthetic:SyntheticState",
+        "build_synthetic": ".synthetic:build_synthetic",
+        "build_map_reduce": ".map_reduce:build_map_reduce",
+        "create_map_reduce": ".map_reduce:create_map_reduce",
+        "concat_lists": ".map_reduce:concat_lists",
+        "merge_dicts": ".map_reduce:merge_dicts",
+    },
+)
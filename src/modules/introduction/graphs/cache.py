@@ -0,0 +1,342 @@
+"""
+Compiled Graph Cache
+
+This module provides a process-wide registry of compiled LangGraph
+applications. Graphs are keyed by a structural fingerprint of their state
+schema, nodes, edges and compile options, so building the same graph twice
+only pays the compile cost once.
+
+Example:
+    from src.modules.introduction.graphs.cache import compile_cached
+    from src.modules.introduction.lessons.lesson_2_simple_graph.simple_graph import (
+        build_simple_graph,
+    )
+
+    app = compile_cached(build_simple_graph())
+"""
+
+import dataclasses
+import functools
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, NamedTuple, Optional, Union, get_type_hints
+
+from langgraph.graph import StateGraph
+
+# Default number of compiled applications kept by the process-wide cache
+DEFAULT_MAXSIZE = 128
+
+
+class CacheInfo(NamedTuple):
+    """Statistics reported by CompiledGraphCache.info()."""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+def _describe_argument(value: Any) -> str:
+    """Describe a functools.partial argument: scalars by value, others by identity."""
+    if value is None or isinstance(value, (bool, int, float, str, bytes)):
+        return f"{type(value).__name__}:{value!r}"
+    if callable(value):
+        return _describe_callable(value)
+    return f"{type(value).__qualname__}@{id(value):x}"
+
+
+def _describe_callable(obj: Any) -> str:
+    """
+    Describe a node or router callable for fingerprinting.
+
+    Functions are identified by their qualified name and object id. The id
+    keeps closures with the same name apart, and the cached application holds
+    a reference to the callable so the id cannot be reused while the entry
+    is alive. functools.partial objects are described by their function
+    and bound arguments.
+
+    Args:
+        obj: Function, RunnableCallable or other runnable
+
+    Returns:
+        str: Stable description of the callable within this process
+    """
+    if isinstance(obj, functools.partial):
+        args = ",".join(_describe_argument(arg) for arg in obj.args)
+        keywords = ",".join(
+            f"{key}={_describe_argument(obj.keywords[key])}"
+            for key in sorted(obj.keywords)
+        )
+        return f"partial({_describe_callable(obj.func)};{args};{keywords})"
+    # Unwrap LangGraph's RunnableCallable to the user function(s)
+    func = getattr(obj, "func", None)
+    afunc = getattr(obj, "afunc", None)
+    if func is not None or afunc is not None:
+        return f"{_describe_callable(func)}|{_describe_callable(afunc)}"
+    if obj is None:
+        return "-"
+    module = getattr(obj, "__module__", type(obj).__module__)
+    name = getattr(obj, "__qualname__", type(obj).__qualname__)
+    return f"{module}.{name}@{id(obj):x}"
+
+
+def _describe_schema(schema: Any) -> str:
+    """
+    Describe a state schema by name and field annotations.
+
+    Args:
+        schema: TypedDict, dataclass or other state schema class
+
+    Returns:
+        str: Description of the schema
+    """
+    try:
+        hints = get_type_hints(schema, include_extras=True)
+    except Exception:
+        hints = getattr(schema, "__annotations__", {})
+    fields = ",".join(f"{name}:{hint!r}" for name, hint in sorted(hints.items()))
+    return f"{schema.__module__}.{schema.__qualname__}({fields})"
+
+
+def _describe_value(value: Any) -> str:
+    """
+    Describe a compile option such as a checkpointer or interrupt list.
+
+    Args:
+        value: Compile keyword argument value
+
+    Returns:
+        str: Description of the value
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return repr(value)
+    if isinstance(value, (list, tuple)):
+        return repr(sorted(map(str, value)))
+    return f"{type(value).__qualname__}@{id(value):x}"
+
+
+def _describe_field(value: Any) -> str:
+    """Describe one policy field: functions by identity, other values by repr."""
+    if callable(value) and not isinstance(value, type):
+        return _describe_callable(value)
+    return repr(value)
+
+
+def _describe_policy(policy: Any) -> str:
+    """
+    Describe a node's retry or cache policy (or a sequence of them).
+
+    Args:
+        policy: RetryPolicy, CachePolicy, a sequence of them, or None
+
+    Returns:
+        str: Description of the policy's fields
+    """
+    if policy is None:
+        return "-"
+    if isinstance(policy, (list, tuple)) and not hasattr(policy, "_fields"):
+        return "[" + ";".join(_describe_policy(item) for item in policy) + "]"
+    if hasattr(policy, "_fields"):
+        items = policy._asdict().items()
+    elif dataclasses.is_dataclass(policy):
+        items = (
+            (field.name, getattr(policy, field.name))
+            for field in dataclasses.fields(policy)
+        )
+    else:
+        return _describe_value(policy)
+    fields = ",".join(f"{key}={_describe_field(value)}" for key, value in items)
+    return f"{type(policy).__qualname__}({fields})"
+
+
+def graph_fingerprint(graph: StateGraph, **compile_kwargs: Any) -> str:
+    """
+    Compute a structural fingerprint of an uncompiled graph.
+
+    Two graphs built from the same schema, node callables and node options
+    (input schema, retry and cache policies, defer, declared ends), edges
+    and conditional edges, and compiled with the same options, share a
+    fingerprint.
+
+    Args:
+        graph: The uncompiled StateGraph
+        **compile_kwargs: Options that will be passed to graph.compile()
+
+    Returns:
+        str: Hex digest identifying the graph definition
+    """
+    parts = [
+        "schema:" + _describe_schema(graph.state_schema),
+        "input:" + _describe_schema(graph.input_schema),
+        "output:" + _describe_schema(graph.output_schema),
+    ]
+
+    for name in sorted(graph.nodes):
+        spec = graph.nodes[name]
+        parts.append(f"node:{name}={_describe_callable(spec.runnable)}")
+        schema = _describe_schema(spec.input_schema) if spec.input_schema else "-"
+        ends = sorted(spec.ends.items()) if isinstance(spec.ends, dict) else spec.ends
+        parts.append(
+            f"node_options:{name}=input:{schema}"
+            f"|retry:{_describe_policy(spec.retry_policy)}"
+            f"|cache:{_describe_policy(spec.cache_policy)}"
+            f"|defer:{spec.defer}|ends:{ends}"
+        )
+
+    for start, end in sorted(graph.edges):
+        parts.append(f"edge:{start}->{end}")
+
+    for starts, end in sorted(graph.waiting_edges):
+        parts.append(f"join:{','.join(starts)}->{end}")
+
+    for start in sorted(graph.branches):
+        for name, branch in sorted(graph.branches[start].items()):
+            ends = sorted(branch.ends.items()) if branch.ends else None
+            parts.append(
+                f"branch:{start}:{name}={_describe_callable(branch.path)}->{ends}"
+            )
+
+    for key in sorted(compile_kwargs):
+        parts.append(f"compile:{key}={_describe_value(compile_kwargs[key])}")
+
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+class CompiledGraphCache:
+    """
+    Thread-safe LRU cache of compiled graph applications.
+
+    Attributes:
+        maxsize: Maximum number of compiled applications to keep
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get_or_compile(self, graph: StateGraph, **compile_kwargs: Any) -> Any:
+        """
+        Return the cached application for a graph, compiling it on a miss.
+
+        Args:
+            graph: The uncompiled StateGraph
+            **compile_kwargs: Options passed to graph.compile() on a miss
+
+        Returns:
+            Compiled graph application
+        """
+        key = graph_fingerprint(graph, **compile_kwargs)
+
+        with self._lock:
+            app = self._entries.get(key)
+            if app is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return app
+            self._misses += 1
+
+        # Compile outside the lock so slow compiles do not block hits
+        app = graph.compile(**compile_kwargs)
+
+        with self._lock:
+            # Another thread may have compiled the same graph meanwhile
+            existing = self._entries.get(key)
+            if existing is not None:
+                self._entries.move_to_end(key)
+                return existing
+            self._entries[key] = app
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+        return app
+
+    def invalidate(
+        self, target: Union[str, StateGraph, None] = None, **compile_kwargs: Any
+    ) -> bool:
+        """
+        Drop cached applications.
+
+        Args:
+            target: Fingerprint or graph to drop; None clears the whole cache
+            **compile_kwargs: Compile options used with target when it is a graph
+
+        Returns:
+            bool: True if at least one entry was removed
+        """
+        with self._lock:
+            if target is None:
+                removed = bool(self._entries)
+                self._entries.clear()
+                return removed
+            key = (
+                target
+                if isinstance(target, str)
+                else graph_fingerprint(target, **compile_kwargs)
+            )
+            return self._entries.pop(key, None) is not None
+
+    def info(self) -> CacheInfo:
+        """
+        Return hit, miss and eviction statistics.
+
+        Returns:
+            CacheInfo: Current cache statistics
+        """
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self.maxsize,
+                len(self._entries),
+            )
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+# Process-wide cache shared by compile_cached()
+_default_cache = CompiledGraphCache()
+
+
+def get_default_cache() -> CompiledGraphCache:
+    """
+    Return the process-wide compiled graph cache.
+
+    Returns:
+        CompiledGraphCache: The shared cache instance
+    """
+    return _default_cache
+
+
+def compile_cached(
+    graph: StateGraph, cache: Optional[CompiledGraphCache] = None, **compile_kwargs: Any
+) -> Any:
+    """
+    Compile a graph, reusing a previously compiled identical graph if possible.
+
+    Args:
+        graph: The uncompiled StateGraph
+        cache: Cache to use (defaults to the process-wide cache)
+        **compile_kwargs: Options passed to graph.compile() on a miss
+
+    Returns:
+        Compiled graph application
+    """
+    return (cache if cache is not None else _default_cache).get_or_compile(
+        graph, **compile_kwargs
+    )
@@ -0,0 +1,200 @@
+"""
+Fused Chains
+
+Builds linear chains of nodes in which runs of consecutive pure nodes are
+fused into a single graph node. In an ordinary StateGraph every hop is its
+own superstep, with task scheduling, channel writes and a state merge;
+a fused node runs its sub-steps as plain function calls on a local copy of
+the state and hands LangGraph one combined update.
+
+Nodes that are not pure (they call a streaming model, interrupt, or must
+be retried and checkpointed on their own) stay separate graph nodes and
+act as fusion boundaries. A node is treated as impure if it is wrapped in
+ChainStep(pure=False) or has a false `pure` attribute (as set by
+nodes.memoize.memoize_node(pure=False)).
+
+When the graph is streamed with stream_mode="custom", every fused sub-step
+still emits an event:
+
+    {"fused_node": "clean..summarize", "step": "tokenize", "update": {...}}
+
+Example:
+    from src.modules.introduction.graphs.fused_chain import ChainStep, build_chain
+
+    graph = build_chain(
+        [clean, tokenize, ChainStep("llm", call_llm, pure=False), format_reply],
+        ChainState,
+    )
+    app = graph.compile()
+"""
+
+import inspect
+import typing
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Optional, Union
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.config import get_stream_writer
+from langgraph.graph import END, START, StateGraph
+
+
+@dataclass(frozen=True)
+class ChainStep:
+    """
+    One step of a chain.
+
+    Attributes:
+        name: Node name
+        func: Node function taking the state (and optionally a config)
+        pure: Whether the step may be fused with its neighbours
+    """
+
+    name: str
+    func: Callable[..., Any]
+    pure: bool = True
+
+
+def _as_step(step: Union[ChainStep, tuple[str, Callable], Callable]) -> ChainStep:
+    if isinstance(step, ChainStep):
+        return step
+    if isinstance(step, tuple):
+        name, func = step
+        return ChainStep(name, func, getattr(func, "pure", True))
+    return ChainStep(step.__name__, step, getattr(step, "pure", True))
+
+
+def state_reducers(state_schema: Any) -> dict[str, Callable[[Any, Any], Any]]:
+    """
+    Return the reducer of every Annotated[..., reducer] field in a state schema.
+
+    Args:
+        state_schema: TypedDict (or other annotated class) used as graph state
+
+    Returns:
+        dict: Field name -> reducer
+    """
+    reducers = {}
+    for field, hint in typing.get_type_hints(state_schema, include_extras=True).items():
+        if typing.get_origin(hint) is typing.Annotated:
+            reducer = next(
+                (m for m in reversed(hint.__metadata__) if callable(m)), None
+            )
+            if reducer is not None:
+                reducers[field] = reducer
+    return reducers
+
+
+def _takes_config(func: Callable) -> bool:
+    try:
+        return "config" in inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+def fuse_steps(
+    steps: list[ChainStep],
+    reducers: dict[str, Callable[[Any, Any], Any]],
+    name: Optional[str] = None,
+    emit_events: bool = True,
+) -> Callable[[Any, RunnableConfig], dict[str, Any]]:
+    """
+    Combine pure steps into one node function.
+
+    Each sub-step sees the state as updated by the steps before it. Plain
+    fields take their last written value; reducer fields have their
+    updates combined with the reducer, which must therefore be associative
+    (operator.add and add_messages are).
+
+    Args:
+        steps: Steps to run in order
+        reducers: Reducers of the state's Annotated fields (see state_reducers())
+        name: Name reported in sub-step events
+        emit_events: Write a custom stream event after each sub-step
+
+    Returns:
+        Node function returning the combined update
+    """
+    name = name or f"{steps[0].name}..{steps[-1].name}"
+    plan = [(step.name, step.func, _takes_config(step.func)) for step in steps]
+
+    def fused(state: Any, config: RunnableConfig) -> dict[str, Any]:
+        local = dict(state)
+        combined: dict[str, Any] = {}
+        writer = get_stream_writer() if emit_events else None
+        for step_name, func, takes_config in plan:
+            try:
+                update = func(local, config) if takes_config else func(local)
+            except Exception as e:
+                e.add_note(f"in fused step {step_name!r} of {name!r}")
+                raise
+            if not update:
+                continue
+            for field, value in update.items():
+                reducer = reducers.get(field)
+                if reducer is None:
+                    local[field] = combined[field] = value
+                else:
+                    local[field] = (
+                        reducer(local[field], value) if field in local else value
+                    )
+                    combined[field] = (
+                        reducer(combined[field], value) if field in combined else value
+                    )
+            if writer is not None:
+                writer({"fused_node": name, "step": step_name, "update": update})
+        return combined
+
+    fused.__name__ = name
+    fused.fused_steps = [step.name for step in steps]
+    return fused
+
+
+def build_chain(
+    steps: Iterable[Union[ChainStep, tuple[str, Callable], Callable]],
+    state_schema: Any,
+    fuse: bool = True,
+    emit_events: bool = True,
+) -> StateGraph:
+    """
+    Build a linear chain, fusing runs of consecutive pure steps.
+
+    Args:
+        steps: Steps in order: ChainStep objects, (name, func) pairs, or
+            functions (named after __name__)
+        state_schema: Graph state class
+        fuse: Fuse pure steps; False adds every step as its own node
+        emit_events: Emit per-sub-step custom stream events from fused nodes
+
+    Returns:
+        StateGraph: The uncompiled chain
+    """
+    steps = [_as_step(step) for step in steps]
+    if not steps:
+        raise ValueError("A chain needs at least one step")
+    names = [step.name for step in steps]
+    duplicates = {n for n in names if names.count(n) > 1}
+    if duplicates:
+        raise ValueError(f"Duplicate step names: {sorted(duplicates)}")
+
+    # Group consecutive pure steps; impure steps stand alone
+    groups: list[list[ChainStep]] = []
+    for step in steps:
+        if fuse and step.pure and groups and groups[-1][-1].pure:
+            groups[-1].append(step)
+        else:
+            groups.append([step])
+
+    reducers = state_reducers(state_schema)
+    graph = StateGraph(state_schema)
+    previous = START
+    for group in groups:
+        if len(group) == 1:
+            node_name, node = group[0].name, group[0].func
+        else:
+            node = fuse_steps(group, reducers, emit_events=emit_events)
+            node_name = node.__name__
+        graph.add_node(node_name, node)
+        graph.add_edge(previous, node_name)
+        previous = node_name
+    graph.add_edge(previous, END)
+    return graph
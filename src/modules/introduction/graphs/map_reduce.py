@@ -0,0 +1,270 @@
+"""
+Map-Reduce Graphs
+
+Builds a fan-out/fan-in graph that splits a list in the state into shards,
+maps every item in parallel branches (one Send per shard), and merges the
+shard results with a reducer:
+
+    START -> split -> map (x shards, in parallel) -> reduce -> END
+
+- Reducers: "concat" (list concatenation) and "merge" (deep dict merge),
+  as in the list_concatenator/dict_merger examples of the reducers
+  knowledge-base page, or any associative function of two results.
+- Parallelism: at most max_parallelism shards, so at most that many
+  branches run at once; items within a shard are mapped one after another.
+  Sync map functions run on LangGraph's thread pool, coroutine functions
+  on the event loop (use ainvoke), and CPU-bound sync functions can be
+  sent to a process pool with pool=ProcessPoolExecutor().
+- Ordering: shard results are merged in item order, whatever order the
+  branches finish in.
+
+Example:
+    from src.modules.introduction.graphs.map_reduce import create_map_reduce
+
+    app = create_map_reduce(summarize, input_key="documents", output_key="summaries")
+    app.invoke({"documents": docs})["summaries"]
+"""
+
+import asyncio
+import functools
+import inspect
+from concurrent.futures import Executor
+from typing import Annotated, Any, Callable, Iterable, Optional, TypedDict, Union
+
+from langgraph.graph import END, START, StateGraph
+from langgraph.types import Send
+
+# Default maximum number of shards mapped at once
+DEFAULT_MAX_PARALLELISM = 8
+
+
+def concat_lists(left: list, right: list) -> list:
+    """Reducer concatenating two lists."""
+    return left + right
+
+
+def merge_dicts(left: dict, right: dict) -> dict:
+    """Reducer deep-merging two dicts; other values from the right win."""
+    result = dict(left)
+    for key, value in right.items():
+        if isinstance(result.get(key), dict) and isinstance(value, dict):
+            result[key] = merge_dicts(result[key], value)
+        else:
+            result[key] = value
+    return result
+
+
+def _collect_list(results: Iterable[Any]) -> list:
+    return list(results)
+
+
+def _collect_dict(results: Iterable[dict]) -> dict:
+    merged: dict = {}
+    for result in results:
+        _merge_into(merged, result)
+    return merged
+
+
+def _merge_into(target: dict, source: dict) -> None:
+    # In-place deep merge; nested dicts from source are copied, not shared
+    for key, value in source.items():
+        if isinstance(value, dict):
+            if not isinstance(target.get(key), dict):
+                target[key] = {}
+            _merge_into(target[key], value)
+        else:
+            target[key] = value
+
+
+# Built-in reducers: name -> (reducer combining shards, one-pass shard
+# builder, empty result)
+REDUCERS: dict[
+    str,
+    tuple[Callable[[Any, Any], Any], Callable[[Iterable[Any]], Any], Callable[[], Any]],
+] = {
+    "concat": (concat_lists, _collect_list, list),
+    "merge": (merge_dicts, _collect_dict, dict),
+}
+
+
+def _collect_shards(left: list, right: Optional[list]) -> list:
+    # Writing None clears the shard results left by a previous run
+    return [] if right is None else left + right
+
+
+def split_shards(items: list, max_shards: int, min_shard_size: int = 1) -> list[list]:
+    """
+    Split items into at most max_shards contiguous shards of near-equal size.
+
+    Args:
+        items: Items to split
+        max_shards: Maximum number of shards
+        min_shard_size: Smallest shard worth a branch of its own
+
+    Returns:
+        list: Shards in item order (empty if there are no items)
+    """
+    if not items:
+        return []
+    count = max(1, min(max_shards, len(items) // max(1, min_shard_size)))
+    size, extra = divmod(len(items), count)
+    shards, start = [], 0
+    for i in range(count):
+        end = start + size + (1 if i < extra else 0)
+        shards.append(items[start:end])
+        start = end
+    return shards
+
+
+def _map_shard(
+    map_fn: Callable[[Any], Any], collect: Callable[[Iterable[Any]], Any], shard: list
+) -> Any:
+    return collect(map_fn(item) for item in shard)
+
+
+def _fold(reducer: Callable[[Any, Any], Any]) -> Callable[[Iterable[Any]], Any]:
+    """Build a shard builder that folds results with a custom reducer."""
+    return functools.partial(functools.reduce, reducer)
+
+
+def build_map_reduce(
+    map_fn: Callable[[Any], Any],
+    input_key: str = "items",
+    output_key: str = "results",
+    reducer: Union[str, Callable[[Any, Any], Any]] = "concat",
+    initial: Any = None,
+    max_parallelism: int = DEFAULT_MAX_PARALLELISM,
+    min_shard_size: int = 1,
+    pool: Optional[Executor] = None,
+) -> StateGraph:
+    """
+    Build a map-reduce graph over the list in state[input_key].
+
+    With reducer="concat", map_fn returns one output item per input item;
+    with "merge", it returns a dict per item. A custom reducer is applied
+    directly to map_fn's results, so map_fn must return values of the
+    output type (for example numbers with operator.add).
+
+    Args:
+        map_fn: Function (or coroutine function) applied to each item
+        input_key: State field holding the input list
+        output_key: State field receiving the merged result
+        reducer: "concat", "merge", or a function merging two results
+        initial: Result for an empty input list with a custom reducer
+        max_parallelism: Maximum number of shards, and so of parallel branches
+        min_shard_size: Smallest shard worth a branch of its own; raise it
+            when map_fn is cheap
+        pool: Executor for sync map functions (e.g. a ProcessPoolExecutor
+            for CPU-bound work; map_fn and reducer must then be picklable)
+
+    Returns:
+        StateGraph: The uncompiled graph
+    """
+    if max_parallelism < 1:
+        raise ValueError(f"max_parallelism must be at least 1, got {max_parallelism}")
+    if isinstance(reducer, str):
+        try:
+            reduce_fn, collect, empty = REDUCERS[reducer]
+        except KeyError:
+            raise ValueError(
+                f"Unknown reducer {reducer!r}; expected one of {sorted(REDUCERS)}"
+            ) from None
+    else:
+        reduce_fn, collect, empty = reducer, _fold(reducer), (lambda: initial)
+    is_async = inspect.iscoroutinefunction(map_fn)
+    if is_async and pool is not None:
+        raise ValueError("pool is only used for sync map functions")
+
+    shards_key = f"_{output_key}_shards"
+    state_schema = TypedDict(
+        "MapReduceState",
+        {
+            input_key: list,
+            output_key: Any,
+            shards_key: Annotated[list, _collect_shards],
+        },
+        total=False,
+    )
+    output_schema = TypedDict(
+        "MapReduceOutput", {input_key: list, output_key: Any}, total=False
+    )
+
+    class ShardState(TypedDict):
+        """Input of one map branch."""
+
+        index: int
+        shard: list
+
+    def split(state: dict) -> dict:
+        return {shards_key: None}
+
+    def fan_out(state: dict) -> list[Send]:
+        shards = split_shards(
+            state.get(input_key) or [], max_parallelism, min_shard_size
+        )
+        return [
+            Send("map", {"index": i, "shard": shard}) for i, shard in enumerate(shards)
+        ] or ["reduce"]
+
+    if is_async:
+
+        async def map_node(state: ShardState) -> dict:
+            partial = collect([await map_fn(item) for item in state["shard"]])
+            return {shards_key: [(state["index"], partial)]}
+
+    elif pool is not None:
+
+        def map_node(state: ShardState) -> dict:
+            partial = pool.submit(_map_shard, map_fn, collect, state["shard"]).result()
+            return {shards_key: [(state["index"], partial)]}
+
+    else:
+
+        def map_node(state: ShardState) -> dict:
+            return {
+                shards_key: [
+                    (state["index"], _map_shard(map_fn, collect, state["shard"]))
+                ]
+            }
+
+    def reduce(state: dict) -> dict:
+        partials = [
+            partial
+            for _, partial in sorted(
+                state.get(shards_key) or [], key=lambda pair: pair[0]
+            )
+        ]
+        result = functools.reduce(reduce_fn, partials) if partials else empty()
+        return {output_key: result, shards_key: None}
+
+    graph = StateGraph(state_schema, output_schema=output_schema)
+    graph.add_node("split", split)
+    graph.add_node("map", map_node, input_schema=ShardState)
+    graph.add_node("reduce", reduce)
+    graph.add_edge(START, "split")
+    graph.add_conditional_edges("split", fan_out, ["map", "reduce"])
+    graph.add_edge("map", "reduce")
+    graph.add_edge("reduce", END)
+    return graph
+
+
+def create_map_reduce(map_fn: Callable[[Any], Any], **options: Any) -> Any:
+    """
+    Build and compile a map-reduce graph.
+
+    The compiled graph runs with max_concurrency set to max_parallelism, so
+    LangGraph's thread pool can run every shard at once.
+
+    Args:
+        map_fn: Function (or coroutine function) applied to each item
+        **options: Options for build_map_reduce()
+
+    Returns:
+        Compiled graph application
+    """
+    max_parallelism = options.get("max_parallelism", DEFAULT_MAX_PARALLELISM)
+    return (
+        build_map_reduce(map_fn, **options)
+        .compile()
+        .with_config(max_concurrency=max_parallelism)
+    )
@@ -0,0 +1,272 @@
+"""
+Synthetic Graphs
+
+Generators for parameterized StateGraphs, used to measure how compile
+time, invoke latency and memory scale with the size of a graph:
+
+- linear: a chain of n nodes
+- fan_out: one node fanning out to n parallel workers that join again
+- tree: a binary tree of conditional routers n levels deep, in the style
+  of the Lesson 2 decide_mood router (2**(n + 1) - 1 nodes)
+- agent_loop: an agent/tools cycle that runs for n turns
+- dag: a chain of n nodes plus forward skip edges; build_dag() also takes
+  an explicit edge count
+
+Every node adds 1 to the "count" field, so a run's count is the number of
+node executions. Tree routers pick a branch from the bits of "route", so
+runs are deterministic.
+
+Example:
+    from src.modules.introduction.graphs.synthetic import build_synthetic, recursion_limit
+
+    graph = build_synthetic("agent_loop", 50)
+    app = graph.compile()
+    app.invoke({"count": 0}, {"recursion_limit": recursion_limit("agent_loop", 50)})
+"""
+
+import operator
+from typing import Annotated, Callable, Optional, TypedDict
+
+from langgraph.graph import END, START, StateGraph
+
+
+class SyntheticState(TypedDict, total=False):
+    """
+    State for synthetic graphs.
+
+    Attributes:
+        count: Node executions; parallel writes are summed
+        turns: Agent turns taken in an agent loop
+        route: Branch choices for tree routers, one bit per level
+    """
+
+    count: Annotated[int, operator.add]
+    turns: Annotated[int, operator.add]
+    route: int
+
+
+def _increment(state: SyntheticState) -> dict:
+    return {"count": 1}
+
+
+def _agent(state: SyntheticState) -> dict:
+    return {"count": 1, "turns": 1}
+
+
+def build_linear(n: int) -> StateGraph:
+    """
+    Build a chain of n nodes.
+
+    Args:
+        n: Number of nodes
+
+    Returns:
+        StateGraph: The uncompiled graph
+    """
+    if n < 1:
+        raise ValueError(f"a linear graph needs at least 1 node, got {n}")
+    graph = StateGraph(SyntheticState)
+    previous = START
+    for i in range(n):
+        graph.add_node(f"node_{i}", _increment)
+        graph.add_edge(previous, f"node_{i}")
+        previous = f"node_{i}"
+    graph.add_edge(previous, END)
+    return graph
+
+
+def build_fan_out(n: int) -> StateGraph:
+    """
+    Build a source node fanning out to n parallel workers, joined by one node.
+
+    The join node waits for every worker, so it runs once per invoke.
+
+    Args:
+        n: Number of parallel workers
+
+    Returns:
+        StateGraph: The uncompiled graph (n + 2 nodes)
+    """
+    if n < 1:
+        raise ValueError(f"a fan-out graph needs at least 1 worker, got {n}")
+    graph = StateGraph(SyntheticState)
+    workers = [f"worker_{i}" for i in range(n)]
+    graph.add_node("source", _increment)
+    graph.add_node("join", _increment)
+    graph.add_edge(START, "source")
+    for worker in workers:
+        graph.add_node(worker, _increment)
+        graph.add_edge("source", worker)
+    graph.add_edge(workers, "join")
+    graph.add_edge("join", END)
+    return graph
+
+
+def _tree_router(depth: int, left: str, right: str) -> Callable[[SyntheticState], str]:
+    def decide(state: SyntheticState) -> str:
+        return right if state.get("route", 0) >> depth & 1 else left
+
+    return decide
+
+
+def build_tree(n: int) -> StateGraph:
+    """
+    Build a binary tree of conditional routers n levels deep.
+
+    Each inner node routes to one of its two children; leaves go to END.
+    One invoke therefore runs n + 1 of the 2**(n + 1) - 1 nodes.
+
+    Args:
+        n: Depth of the tree (0 is a single node)
+
+    Returns:
+        StateGraph: The uncompiled graph
+    """
+    if n < 0:
+        raise ValueError(f"tree depth cannot be negative, got {n}")
+    graph = StateGraph(SyntheticState)
+    graph.add_edge(START, "node")
+    level = ["node"]
+    for depth in range(n + 1):
+        children = []
+        for name in level:
+            graph.add_node(name, _increment)
+            if depth == n:
+                graph.add_edge(name, END)
+                continue
+            left, right = f"{name}_0", f"{name}_1"
+            graph.add_conditional_edges(
+                name, _tree_router(depth, left, right), [left, right]
+            )
+            children += [left, right]
+        level = children
+    return graph
+
+
+def build_agent_loop(n: int) -> StateGraph:
+    """
+    Build an agent/tools cycle that runs for n turns.
+
+    The agent node routes to the tools node until it has taken n turns;
+    the tools node always routes back to the agent. Invoke with a
+    recursion limit of at least recursion_limit("agent_loop", n).
+
+    Args:
+        n: Number of agent turns
+
+    Returns:
+        StateGraph: The uncompiled graph
+    """
+    if n < 1:
+        raise ValueError(f"an agent loop needs at least 1 turn, got {n}")
+
+    def should_continue(state: SyntheticState) -> str:
+        return "tools" if state.get("turns", 0) < n else END
+
+    graph = StateGraph(SyntheticState)
+    graph.add_node("agent", _agent)
+    graph.add_node("tools", _increment)
+    graph.add_edge(START, "agent")
+    graph.add_conditional_edges("agent", should_continue, ["tools", END])
+    graph.add_edge("tools", "agent")
+    return graph
+
+
+def build_dag(n: int, edges: Optional[int] = None) -> StateGraph:
+    """
+    Build a DAG with n nodes and the given number of edges between them.
+
+    The nodes form a linear chain (n - 1 edges); any further edges are
+    forward skip edges (node_i -> node_{i+2}, then node_i -> node_{i+3},
+    and so on), which fan out into parallel branches. By default every
+    node_i -> node_{i+2} skip edge is added, giving 2 * n - 3 edges.
+
+    Args:
+        n: Number of nodes
+        edges: Number of node-to-node edges, at least n - 1
+
+    Returns:
+        StateGraph: The uncompiled graph
+    """
+    if n < 1:
+        raise ValueError(f"a DAG needs at least 1 node, got {n}")
+    if edges is None:
+        edges = max(n - 1, 2 * n - 3)
+    if edges < n - 1:
+        raise ValueError(f"need at least {n - 1} edges to connect {n} nodes")
+
+    graph = StateGraph(SyntheticState)
+    names = [f"node_{i}" for i in range(n)]
+    for name in names:
+        graph.add_node(name, _increment)
+
+    pairs = [(names[i], names[i + 1]) for i in range(n - 1)]
+    skip = 2
+    while len(pairs) < edges and skip < n:
+        for i in range(n - skip):
+            if len(pairs) == edges:
+                break
+            pairs.append((names[i], names[i + skip]))
+        skip += 1
+    if len(pairs) < edges:
+        raise ValueError(f"a DAG with {n} nodes cannot have {edges} edges")
+
+    graph.add_edge(START, names[0])
+    for start, end in pairs:
+        graph.add_edge(start, end)
+    graph.add_edge(names[-1], END)
+    return graph
+
+
+# Generators by shape name
+SHAPES: dict[str, Callable[[int], StateGraph]] = {
+    "linear": build_linear,
+    "fan_out": build_fan_out,
+    "tree": build_tree,
+    "agent_loop": build_agent_loop,
+    "dag": build_dag,
+}
+
+
+def build_synthetic(shape: str, n: int) -> StateGraph:
+    """
+    Build a synthetic graph of the given shape and size.
+
+    Args:
+        shape: One of SHAPES
+        n: Size parameter of the shape
+
+    Returns:
+        StateGraph: The uncompiled graph
+    """
+    try:
+        build = SHAPES[shape]
+    except KeyError:
+        raise ValueError(
+            f"Unknown shape {shape!r}; expected one of {sorted(SHAPES)}"
+        ) from None
+    return build(n)
+
+
+def expected_count(shape: str, n: int) -> int:
+    """Return the number of node executions in one invoke of a synthetic graph."""
+    return {
+        "linear": n,
+        "fan_out": n + 2,
+        "tree": n + 1,
+        "agent_loop": 2 * n - 1,
+        # node_i is reached by paths of i // 2 + 1 different lengths, and
+        # runs once in each of those supersteps
+        "dag": sum(i // 2 + 1 for i in range(n)),
+    }[shape]
+
+
+def recursion_limit(shape: str, n: int) -> int:
+    """Return a recursion limit (supersteps) large enough for one invoke."""
+    return {
+        "linear": n,
+        "fan_out": 3,
+        "tree": n + 1,
+        "agent_loop": 2 * n - 1,
+        "dag": n,
+    }[shape] + 1
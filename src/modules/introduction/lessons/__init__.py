@@ -3,4 +3,20 @@ Lessons Package
 
 This package contains all the lesson implementations for the LangGraph Introduction course.
 Each lesson demonstrates different concepts and features of LangGraph.
-""" 
\ No newline at end of file
+"""
+
+from src.modules.introduction.utils.lazy import lazy_exports
+
+# Importable aliases for the lesson packages (several directory names contain
+# hyphens and cannot be written in an import statement)
+__getattr__, __dir__, __all__ = lazy_exports(
+    __name__,
+    {
+        "simple_graph": ".lesson_2_simple_graph.simple_graph",
+        "studio": ".lesson-3-langgraph-studio",
+        "chain": ".lesson-4-chain",
+        "router": ".lesson-5-router",
+        "agent": ".lesson-6-agent",
+        "agent_memory": ".lesson-7-agent-memory",
+    },
+)
@@ -6,14 +6,14 @@ enabling visual graph development while maintaining production-ready
 code deployment.
 """
 
-from .studio_integration import StudioIntegration
-from .studio_setup import StudioSetup
-from .graph_importer import GraphImporter
-from .graph_exporter import GraphExporter
+from src.modules.introduction.utils.lazy import lazy_exports
 
-__all__ = [
-    "StudioIntegration",
-    "StudioSetup", 
-    "GraphImporter",
-    "GraphExporter"
-] 
\ No newline at end of file
+__getattr__, __dir__, __all__ = lazy_exports(
+    __name__,
+    {
+        "StudioIntegration": ".studio_integration:StudioIntegration",
+        "StudioSetup": ".studio_setup:StudioSetup",
+        "GraphImporter": ".graph_importer:GraphImporter",
+        "GraphExporter": ".graph_exporter:GraphExporter",
+    },
+)
@@ -0,0 +1,210 @@
+"""
+Graph Exporter
+
+Turns StateGraph definitions (or compiled applications) back into
+studio_config.json descriptors, the inverse of GraphImporter.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Literal, Optional, Union, get_args, get_origin, get_type_hints
+
+from langgraph.graph import END, START, StateGraph
+
+from .graph_importer import DEFAULT_CONFIG_PATH
+
+
+def _unwrap(runnable: Any) -> Any:
+    """Return the function behind a node or router runnable."""
+    return (
+        getattr(runnable, "func", None) or getattr(runnable, "afunc", None) or runnable
+    )
+
+
+def _callable_name(runnable: Any) -> str:
+    """Return the function name behind a node or router runnable."""
+    func = _unwrap(runnable)
+    return getattr(func, "__name__", type(func).__name__)
+
+
+def _import_path(runnable: Any) -> Optional[str]:
+    """Return the "module:attribute" path of a node or router, if it has one."""
+    func = _unwrap(runnable)
+    module = getattr(func, "__module__", None)
+    qualname = getattr(func, "__qualname__", None)
+    if not module or not qualname or "<" in qualname:
+        return None
+    return f"{module}:{qualname}"
+
+
+def _annotated_targets(runnable: Any) -> Optional[set[str]]:
+    """Return the targets a router declares via a Literal return annotation."""
+    try:
+        hint = get_type_hints(_unwrap(runnable)).get("return")
+    except Exception:
+        return None
+    if get_origin(hint) is Literal:
+        return set(get_args(hint))
+    return None
+
+
+class GraphExporter:
+    """
+    Exports graph definitions to the studio_config.json descriptor format.
+    """
+
+    def __init__(self, config_path: Union[str, Path] = DEFAULT_CONFIG_PATH):
+        self.config_path = Path(config_path)
+
+    def export(self, graph: Any, name: str, description: str = "") -> dict[str, Any]:
+        """
+        Build the descriptor for a graph.
+
+        Conditional edges leaving the entry point without an explicit target
+        list use the short form (just the router name), matching the
+        hand-written descriptors in studio_config.json.
+
+        Args:
+            graph: StateGraph or compiled application
+            name: Graph name to export under
+            description: Human-readable description
+
+        Returns:
+            dict: The graph descriptor
+
+        Raises:
+            ValueError: If the graph has no single entry point
+        """
+        builder: StateGraph = getattr(graph, "builder", graph)
+
+        entry_points = [end for start, end in builder.edges if start == START]
+        if len(entry_points) != 1:
+            raise ValueError(
+                f"Graph '{name}' must have exactly one entry point, "
+                f"found {entry_points}"
+            )
+        entry_point = entry_points[0]
+
+        nodes = list(builder.nodes)
+        finish_points = [start for start, end in builder.edges if end == END]
+        edges = sorted(
+            [start, end]
+            for start, end in builder.edges
+            if start != START and end != END
+        )
+
+        conditional_edges: list[Any] = []
+        for source, branches in builder.branches.items():
+            for branch in branches.values():
+                router = _callable_name(branch.path)
+                # LangGraph fills in ends from a Literal return annotation, so
+                # those targets do not need to be spelled out in the descriptor
+                implicit = branch.ends is None or (
+                    all(key == value for key, value in branch.ends.items())
+                    and set(branch.ends) == _annotated_targets(branch.path)
+                )
+                if implicit and source == entry_point:
+                    conditional_edges.append(router)
+                    continue
+                edge: dict[str, Any] = {"source": source, "router": router}
+                if branch.ends is not None:
+                    edge["targets"] = sorted(set(branch.ends.values()))
+                conditional_edges.append(edge)
+
+        descriptor: dict[str, Any] = {
+            "name": name,
+            "description": description,
+            "state_schema": builder.state_schema.__name__,
+            "entry_point": entry_point,
+            "finish_points": sorted(finish_points, key=nodes.index),
+            "nodes": nodes,
+            "conditional_edges": conditional_edges,
+        }
+        if edges:
+            descriptor["edges"] = edges
+        return descriptor
+
+    def export_nodes(self, graph: Any) -> dict[str, str]:
+        """
+        Build the "nodes" map entries for a graph's nodes and routers.
+
+        Every node name, and every router's function name, is mapped to the
+        "module:attribute" path of its function, so graphs whose functions
+        are not registered under the node name still round-trip. Lambdas
+        and nested functions have no import path and are left out.
+
+        Args:
+            graph: StateGraph or compiled application
+
+        Returns:
+            dict: Mapping of name to "module:attribute"
+        """
+        builder: StateGraph = getattr(graph, "builder", graph)
+        named = [(name, node.runnable) for name, node in builder.nodes.items()]
+        named += [
+            (_callable_name(branch.path), branch.path)
+            for branches in builder.branches.values()
+            for branch in branches.values()
+        ]
+        paths = {}
+        for name, runnable in named:
+            path = _import_path(runnable)
+            if path is not None:
+                paths[name] = path
+        return paths
+
+    def export_schema(self, graph: Any) -> dict[str, Any]:
+        """
+        Build the state_schemas entry for a graph's state schema.
+
+        Args:
+            graph: StateGraph or compiled application
+
+        Returns:
+            dict: Mapping of schema name to its field list
+        """
+        schema = getattr(graph, "builder", graph).state_schema
+        return {schema.__name__: {"fields": list(get_type_hints(schema))}}
+
+    def write(
+        self,
+        graph: Any,
+        name: str,
+        description: str = "",
+        path: Optional[Union[str, Path]] = None,
+    ) -> dict[str, Any]:
+        """
+        Export a graph and merge it into a Studio config file.
+
+        The graph's schema and the import paths of its functions (see
+        export_nodes()) are merged in as well. Other graphs and settings in
+        the file are preserved. The file is created if it does not exist.
+
+        Args:
+            graph: StateGraph or compiled application
+            name: Graph name to export under
+            description: Human-readable description
+            path: Config file (defaults to the exporter's config_path)
+
+        Returns:
+            dict: The exported descriptor
+        """
+        target = Path(path) if path is not None else self.config_path
+        config: dict[str, Any] = {
+            "graphs": {},
+            "state_schemas": {},
+            "nodes": {},
+            "edges": {},
+        }
+        if target.exists():
+            with target.open() as fp:
+                config.update(json.load(fp))
+
+        descriptor = self.export(graph, name, description)
+        config.setdefault("graphs", {})[name] = descriptor
+        config.setdefault("state_schemas", {}).update(self.export_schema(graph))
+        config.setdefault("nodes", {}).update(self.export_nodes(graph))
+
+        with target.open("w") as fp:
+            json.dump(config, fp, indent=2)
+        return descriptor
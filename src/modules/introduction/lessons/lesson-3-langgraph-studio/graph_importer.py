@@ -0,0 +1,405 @@
+"""
+Graph Importer
+
+Turns the graph descriptors in studio_config.json into compiled LangGraph
+applications.
+
+Descriptors are parsed lazily: loading the config only hashes each
+descriptor, and a graph is parsed, built and compiled the first time it is
+requested. Reloading the config only recompiles graphs whose descriptor hash
+changed.
+
+Descriptor format:
+    {
+        "name": "notebook_graph",
+        "state_schema": "GraphState",
+        "entry_point": "node_1",
+        "finish_points": ["node_2", "node_3"],
+        "nodes": ["node_1", "node_2", "node_3"],
+        "edges": [["node_a", "node_b"]],          # optional
+        "conditional_edges": [
+            "decide_mood",                        # router from the entry point
+            {"source": "node_1", "router": "decide_mood",
+             "targets": ["node_2", "node_3"]}     # explicit form
+        ]
+    }
+"""
+
+import functools
+import hashlib
+import importlib
+import json
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional, TypedDict, Union
+
+from langgraph.graph import END, START, StateGraph
+
+from src.modules.introduction.graphs.cache import compile_cached
+
+from .studio_nodes import DEFAULT_REGISTRY
+
+# studio_config.json lives at the project root
+DEFAULT_CONFIG_PATH = Path(__file__).resolve().parents[5] / "studio_config.json"
+
+
+@dataclass(frozen=True)
+class ConditionalEdgeSpec:
+    """
+    A conditional edge in a graph descriptor.
+
+    Attributes:
+        source: Node the router runs after
+        router: Name of the routing function
+        targets: Allowed destinations, or None to let the router return any node
+    """
+
+    source: str
+    router: str
+    targets: Optional[tuple[str, ...]] = None
+
+
+@dataclass(frozen=True)
+class GraphSpec:
+    """
+    Parsed graph descriptor.
+
+    Attributes:
+        name: Graph name
+        description: Human-readable description
+        state_schema: Name of the state schema
+        entry_point: Node where execution starts
+        finish_points: Nodes after which execution ends
+        nodes: Node names, in registration order
+        edges: Unconditional node-to-node edges
+        conditional_edges: Conditional edges with their routers
+    """
+
+    name: str
+    description: str
+    state_schema: str
+    entry_point: str
+    finish_points: tuple[str, ...]
+    nodes: tuple[str, ...]
+    edges: tuple[tuple[str, str], ...]
+    conditional_edges: tuple[ConditionalEdgeSpec, ...]
+
+    @classmethod
+    def from_descriptor(cls, descriptor: dict[str, Any]) -> "GraphSpec":
+        """
+        Parse and validate a graph descriptor.
+
+        Args:
+            descriptor: Graph entry from studio_config.json
+
+        Returns:
+            GraphSpec: The parsed descriptor
+
+        Raises:
+            ValueError: If required keys are missing or refer to unknown nodes
+        """
+        missing = [
+            key for key in ("name", "entry_point", "nodes") if key not in descriptor
+        ]
+        if missing:
+            raise ValueError(f"Graph descriptor is missing {', '.join(missing)}")
+
+        entry_point = descriptor["entry_point"]
+        conditional_edges = []
+        for edge in descriptor.get("conditional_edges", []):
+            if isinstance(edge, str):
+                conditional_edges.append(ConditionalEdgeSpec(entry_point, edge))
+            else:
+                targets = edge.get("targets")
+                conditional_edges.append(
+                    ConditionalEdgeSpec(
+                        edge.get("source", entry_point),
+                        edge["router"],
+                        tuple(targets) if targets is not None else None,
+                    )
+                )
+
+        spec = cls(
+            name=descriptor["name"],
+            description=descriptor.get("description", ""),
+            state_schema=descriptor.get("state_schema", "GraphState"),
+            entry_point=entry_point,
+            finish_points=tuple(descriptor.get("finish_points", [])),
+            nodes=tuple(descriptor["nodes"]),
+            edges=tuple((start, end) for start, end in descriptor.get("edges", [])),
+            conditional_edges=tuple(conditional_edges),
+        )
+
+        known = set(spec.nodes)
+        referenced = {
+            spec.entry_point,
+            *spec.finish_points,
+            *(n for edge in spec.edges for n in edge),
+        }
+        for edge in spec.conditional_edges:
+            referenced.add(edge.source)
+            referenced.update(edge.targets or ())
+        unknown = referenced - known - {START, END}
+        if unknown:
+            raise ValueError(
+                f"Graph '{spec.name}' references unknown nodes: {sorted(unknown)}"
+            )
+        return spec
+
+
+def descriptor_names(descriptor: dict[str, Any]) -> set[str]:
+    """Return the schema, node and router names a graph descriptor refers to."""
+    names = {descriptor.get("state_schema", "GraphState"), *descriptor.get("nodes", [])}
+    for edge in descriptor.get("conditional_edges", []):
+        names.add(edge if isinstance(edge, str) else edge["router"])
+    return names
+
+
+def descriptor_hash(
+    descriptor: dict[str, Any],
+    schema: Optional[dict[str, Any]] = None,
+    targets: Optional[dict[str, str]] = None,
+) -> str:
+    """
+    Hash a graph descriptor (and its state schema descriptor) canonically.
+
+    Args:
+        descriptor: Graph entry from studio_config.json
+        schema: Entry for the graph's state schema, if any
+        targets: Entries of the config's "nodes" map for the names the
+            graph uses, so pointing a name at another function counts as
+            a change
+
+    Returns:
+        str: Hex digest that changes whenever the descriptor changes
+    """
+    payload = json.dumps(
+        {"graph": descriptor, "schema": schema, "targets": targets or {}},
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class GraphImporter:
+    """
+    Loads graph descriptors from a Studio config and compiles them on demand.
+
+    Names used in descriptors (schemas, nodes and routers) are resolved from,
+    in order: the registry passed to the constructor, the config's top-level
+    "nodes" mapping of name to "module:attribute", and the built-in
+    DEFAULT_REGISTRY.
+
+    An optional node_wrapper is applied to every node function (not to
+    routers) when graphs are built, e.g. to instrument them.
+    """
+
+    def __init__(
+        self,
+        config_path: Union[str, Path] = DEFAULT_CONFIG_PATH,
+        registry: Optional[dict[str, Any]] = None,
+        node_wrapper: Optional[
+            Callable[[Callable[..., Any], str], Callable[..., Any]]
+        ] = None,
+    ):
+        self.config_path = Path(config_path)
+        self.registry = dict(registry or {})
+        self.node_wrapper = node_wrapper
+        self._lock = threading.RLock()
+        self._config: dict[str, Any] = {}
+        self._hashes: dict[str, str] = {}
+        self._specs: dict[str, tuple[str, GraphSpec]] = {}
+        self._compiled: dict[str, tuple[str, Any]] = {}
+        self._loaded = False
+
+    def load(self) -> set[str]:
+        """
+        Read the config file and hash every graph descriptor.
+
+        Compiled graphs whose descriptor changed (or disappeared) are dropped
+        and rebuilt on their next request; unchanged graphs are kept.
+
+        Returns:
+            set: Names of graphs that are new, changed or removed
+        """
+        with self.config_path.open() as fp:
+            config = json.load(fp)
+
+        schemas = config.get("state_schemas", {})
+        targets = config.get("nodes", {})
+        hashes = {
+            name: descriptor_hash(
+                descriptor,
+                schemas.get(descriptor.get("state_schema", "GraphState")),
+                {
+                    key: targets[key]
+                    for key in descriptor_names(descriptor)
+                    if key in targets
+                },
+            )
+            for name, descriptor in config.get("graphs", {}).items()
+        }
+
+        with self._lock:
+            changed = {
+                name
+                for name in hashes.keys() | self._hashes.keys()
+                if hashes.get(name) != self._hashes.get(name)
+            }
+            for name in changed:
+                self._specs.pop(name, None)
+                self._compiled.pop(name, None)
+            self._config = config
+            self._hashes = hashes
+            self._loaded = True
+        return changed
+
+    # Reloading is the same operation as the first load
+    reload = load
+
+    def _ensure_loaded(self) -> None:
+        if not self._loaded:
+            self.load()
+
+    def graph_names(self) -> list[str]:
+        """Return the names of the graphs in the config."""
+        self._ensure_loaded()
+        return list(self._hashes)
+
+    def descriptor(self, name: str) -> dict[str, Any]:
+        """
+        Return the raw descriptor of a graph.
+
+        Raises:
+            KeyError: If the graph is not in the config
+        """
+        self._ensure_loaded()
+        try:
+            return self._config["graphs"][name]
+        except KeyError:
+            raise KeyError(f"Unknown graph '{name}' in {self.config_path}") from None
+
+    def spec(self, name: str) -> GraphSpec:
+        """
+        Return the parsed descriptor of a graph, parsing it on first use.
+
+        Args:
+            name: Graph name
+
+        Returns:
+            GraphSpec: The parsed descriptor
+        """
+        with self._lock:
+            descriptor = self.descriptor(name)
+            current = self._hashes[name]
+            cached = self._specs.get(name)
+            if cached is not None and cached[0] == current:
+                return cached[1]
+            spec = GraphSpec.from_descriptor(descriptor)
+            self._specs[name] = (current, spec)
+            return spec
+
+    def resolve(self, name: str) -> Any:
+        """
+        Resolve a schema, node or router name to a Python object.
+
+        Args:
+            name: Name used in the config
+
+        Returns:
+            The resolved object
+
+        Raises:
+            LookupError: If the name cannot be resolved
+        """
+        if name in self.registry:
+            return self.registry[name]
+        target = self._config.get("nodes", {}).get(name)
+        if target:
+            module_name, _, attribute = target.partition(":")
+            return functools.reduce(
+                getattr, attribute.split("."), importlib.import_module(module_name)
+            )
+        if name in DEFAULT_REGISTRY:
+            return DEFAULT_REGISTRY[name]
+        raise LookupError(
+            f"Cannot resolve '{name}'; "
+            "add it to the registry or the config's 'nodes' map"
+        )
+
+    def _resolve_schema(self, name: str) -> Any:
+        """Resolve a state schema, synthesising a TypedDict from its fields."""
+        try:
+            return self.resolve(name)
+        except LookupError:
+            fields = self._config.get("state_schemas", {}).get(name, {}).get("fields")
+            if fields is None:
+                raise
+            return TypedDict(name, {field: Any for field in fields})
+
+    def build(self, name: str) -> StateGraph:
+        """
+        Build the uncompiled StateGraph for a graph descriptor.
+
+        Args:
+            name: Graph name
+
+        Returns:
+            StateGraph: The graph definition
+        """
+        spec = self.spec(name)
+        graph = StateGraph(self._resolve_schema(spec.state_schema))
+
+        for node in spec.nodes:
+            func = self.resolve(node)
+            if self.node_wrapper is not None:
+                func = self.node_wrapper(func, node)
+            graph.add_node(node, func)
+
+        graph.add_edge(START, spec.entry_point)
+        for start, end in spec.edges:
+            graph.add_edge(start, end)
+        for edge in spec.conditional_edges:
+            router = self.resolve(edge.router)
+            if edge.targets is None:
+                graph.add_conditional_edges(edge.source, router)
+            else:
+                graph.add_conditional_edges(edge.source, router, list(edge.targets))
+        for node in spec.finish_points:
+            graph.add_edge(node, END)
+
+        return graph
+
+    def compile(self, name: str, **compile_kwargs: Any) -> Any:
+        """
+        Return the compiled application for a graph.
+
+        The application is compiled once per descriptor hash and reused until
+        a reload changes that graph's descriptor. Compiles go through the
+        process-wide compiled graph cache, so importers of the same config
+        (or a descriptor change that leaves the graph itself unchanged)
+        reuse an already compiled application.
+
+        Args:
+            name: Graph name
+            **compile_kwargs: Options passed to StateGraph.compile()
+
+        Returns:
+            Compiled graph application
+        """
+        with self._lock:
+            self._ensure_loaded()
+            current = self._hashes.get(name)
+            cached = self._compiled.get(name)
+            if cached is not None and cached[0] == current and not compile_kwargs:
+                return cached[1]
+            app = compile_cached(self.build(name), **compile_kwargs)
+            if not compile_kwargs:
+                self._compiled[name] = (current, app)
+            return app
+
+    def compiled_names(self) -> list[str]:
+        """Return the names of graphs currently compiled and cached."""
+        with self._lock:
+            return list(self._compiled)
@@ -0,0 +1,83 @@
+"""
+Studio Integration
+
+Single entry point tying the Studio config to running code: load graphs by
+name, hot-reload the config, export code-built graphs back to it, and
+render graphs as Mermaid diagrams for Studio-style visualisation.
+"""
+
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from .graph_exporter import GraphExporter
+from .graph_importer import DEFAULT_CONFIG_PATH, GraphImporter
+
+
+class StudioIntegration:
+    """
+    Facade over GraphImporter and GraphExporter for one Studio config file.
+    """
+
+    def __init__(
+        self,
+        config_path: Union[str, Path] = DEFAULT_CONFIG_PATH,
+        registry: Optional[dict[str, Any]] = None,
+    ):
+        self.config_path = Path(config_path)
+        self.importer = GraphImporter(self.config_path, registry)
+        self.exporter = GraphExporter(self.config_path)
+
+    def graph_names(self) -> list[str]:
+        """Return the names of the graphs in the config."""
+        return self.importer.graph_names()
+
+    def get_graph(self, name: str) -> Any:
+        """
+        Return the compiled application for a graph in the config.
+
+        Args:
+            name: Graph name
+
+        Returns:
+            Compiled graph application
+        """
+        return self.importer.compile(name)
+
+    def reload(self) -> set[str]:
+        """
+        Re-read the config; only changed graphs will be recompiled.
+
+        Returns:
+            set: Names of graphs that were added, changed or removed
+        """
+        return self.importer.reload()
+
+    def export_graph(
+        self, graph: Any, name: str, description: str = ""
+    ) -> dict[str, Any]:
+        """
+        Write a code-built graph into the config and pick up the change.
+
+        Args:
+            graph: StateGraph or compiled application
+            name: Graph name to export under
+            description: Human-readable description
+
+        Returns:
+            dict: The exported descriptor
+        """
+        descriptor = self.exporter.write(graph, name, description)
+        self.importer.reload()
+        return descriptor
+
+    def visualize(self, name: str) -> str:
+        """
+        Render a graph from the config as a Mermaid diagram.
+
+        Args:
+            name: Graph name
+
+        Returns:
+            str: Mermaid source
+        """
+        return self.get_graph(name).get_graph().draw_mermaid()
@@ -0,0 +1,46 @@
+"""
+Studio Nodes
+
+Node and router functions referenced by name from studio_config.json.
+The notebook_graph nodes mirror the mood-routing example from the Lesson 2
+notebook, adapted to the message/response GraphState used by the config.
+"""
+
+import random
+from typing import Literal
+
+from src.modules.introduction.lessons.lesson_2_simple_graph.simple_graph import (
+    GraphState,
+    process_message,
+)
+
+
+def node_1(state: GraphState) -> dict:
+    """Start the mood sentence from the input message."""
+    return {"response": state.get("message", "") + " I am feeling"}
+
+
+def node_2(state: GraphState) -> dict:
+    """Finish the mood sentence on a good note."""
+    return {"response": state["response"] + " Good"}
+
+
+def node_3(state: GraphState) -> dict:
+    """Finish the mood sentence on a bad note."""
+    return {"response": state["response"] + " Worse"}
+
+
+def decide_mood(state: GraphState) -> Literal["node_2", "node_3"]:
+    """Route to node_2 or node_3 with equal probability."""
+    return "node_2" if random.random() < 0.5 else "node_3"
+
+
+# Names resolvable from studio_config.json without an explicit import path
+DEFAULT_REGISTRY = {
+    "GraphState": GraphState,
+    "process_message": process_message,
+    "node_1": node_1,
+    "node_2": node_2,
+    "node_3": node_3,
+    "decide_mood": decide_mood,
+}
@@ -0,0 +1,89 @@
+"""
+Studio Setup
+
+Prepares a project for LangGraph Studio: checks the environment variables
+the course needs and writes the langgraph.json file Studio reads to
+discover graphs.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Optional, Union
+
+from dotenv import load_dotenv
+
+# Variables required by the course lessons (see env.example)
+REQUIRED_ENV_VARS = ["GOOGLE_API_KEY"]
+
+# Variables only needed for LangSmith tracing
+OPTIONAL_ENV_VARS = ["LANGCHAIN_TRACING_V2", "LANGCHAIN_ENDPOINT", "LANGCHAIN_API_KEY"]
+
+
+class StudioSetup:
+    """
+    Environment checks and langgraph.json generation for LangGraph Studio.
+    """
+
+    def __init__(
+        self, project_root: Union[str, Path] = Path(__file__).resolve().parents[5]
+    ):
+        self.project_root = Path(project_root)
+
+    def check_environment(self, load_env_file: bool = True) -> dict[str, list[str]]:
+        """
+        Report which course environment variables are missing.
+
+        Args:
+            load_env_file: Load the project's .env file first
+
+        Returns:
+            dict: "missing_required" and "missing_optional" variable names
+        """
+        if load_env_file:
+            load_dotenv(self.project_root / ".env")
+        return {
+            "missing_required": [
+                var for var in REQUIRED_ENV_VARS if not os.getenv(var)
+            ],
+            "missing_optional": [
+                var for var in OPTIONAL_ENV_VARS if not os.getenv(var)
+            ],
+        }
+
+    def langgraph_config(
+        self, graphs: dict[str, str], env_file: Optional[str] = ".env"
+    ) -> dict:
+        """
+        Build the contents of langgraph.json.
+
+        Args:
+            graphs: Mapping of graph name to "path/to/module.py:attribute"
+            env_file: Environment file Studio should load, or None
+
+        Returns:
+            dict: The langgraph.json contents
+        """
+        config: dict = {"dependencies": ["."], "graphs": dict(graphs)}
+        if env_file:
+            config["env"] = env_file
+        return config
+
+    def write_langgraph_config(
+        self, graphs: dict[str, str], env_file: Optional[str] = ".env"
+    ) -> Path:
+        """
+        Write langgraph.json to the project root.
+
+        Args:
+            graphs: Mapping of graph name to "path/to/module.py:attribute"
+            env_file: Environment file Studio should load, or None
+
+        Returns:
+            Path: The written file
+        """
+        path = self.project_root / "langgraph.json"
+        with path.open("w") as fp:
+            json.dump(self.langgraph_config(graphs, env_file), fp, indent=2)
+            fp.write("\n")
+        return path
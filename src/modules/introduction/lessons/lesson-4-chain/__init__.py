@@ -2,4 +2,16 @@
 Lesson 4: Chain
 
 This lesson demonstrates chain patterns in LangGraph.
-""" 
\ No newline at end of file
+"""
+
+from src.modules.introduction.utils.lazy import lazy_exports
+
+__getattr__, __dir__, __all__ = lazy_exports(
+    __name__,
+    {
+        "ChainState": ".streaming_chain:ChainState",
+        "create_streaming_chain": ".streaming_chain:create_streaming_chain",
+        "TokenStream": ".streaming_chain:TokenStream",
+        "AsyncTokenStream": ".streaming_chain:AsyncTokenStream",
+    },
+)
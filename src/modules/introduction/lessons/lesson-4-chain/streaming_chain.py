@@ -0,0 +1,372 @@
+"""
+Streaming Chain
+
+A two-node chain (prompt preparation, then an LLM call) whose LLM node
+streams tokens incrementally through LangGraph's "custom" stream mode, so
+callers see the first token long before the full response is ready.
+
+TokenStream wraps app.stream() with a bounded buffer: the node may run at
+most max_buffered tokens ahead of the consumer before it blocks, and
+closing the stream (e.g. when a client disconnects) cancels the node at its
+next token instead of letting it generate the rest of the response.
+
+Example:
+    from src.modules.introduction.lessons.chain import TokenStream, create_streaming_chain
+    from src.modules.introduction.utils.fake_llm import FakeLLM
+
+    app = create_streaming_chain(FakeLLM())
+    with TokenStream(app, {"message": "Hello there!"}) as tokens:
+        for token in tokens:
+            print(token, end="", flush=True)
+    print()
+    print(tokens.final_state["response"])
+"""
+
+import asyncio
+import threading
+from typing import Any, AsyncIterator, Iterator, Optional, TypedDict
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.config import get_stream_writer
+from langgraph.graph import END, START, StateGraph
+
+# Default number of tokens the LLM node may run ahead of the consumer
+DEFAULT_MAX_BUFFERED = 64
+
+# Key under config["configurable"] holding the stream's flow control
+STREAM_CONTROL_KEY = "stream_control"
+
+
+class ChainState(TypedDict, total=False):
+    """
+    State for the streaming chain.
+
+    Attributes:
+        message: User message
+        prompt: Prompt sent to the model
+        response: Full model response
+    """
+
+    message: str
+    prompt: str
+    response: str
+
+
+class StreamCancelled(Exception):
+    """Raised inside the LLM node when its consumer has gone away."""
+
+
+class StreamControl:
+    """
+    Credit-based flow control between the LLM node and a TokenStream.
+
+    The node takes one credit per token it emits and the consumer returns a
+    credit per token it reads, so at most max_buffered tokens are queued.
+    """
+
+    def __init__(self, max_buffered: int = DEFAULT_MAX_BUFFERED):
+        if max_buffered < 1:
+            raise ValueError(f"max_buffered must be at least 1, got {max_buffered}")
+        self.max_buffered = max_buffered
+        self._credits = threading.Semaphore(max_buffered)
+        self._cancelled = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the consumer has cancelled the stream."""
+        return self._cancelled.is_set()
+
+    def acquire(self) -> None:
+        """
+        Wait for buffer space before emitting a token (called by the node).
+
+        Raises:
+            StreamCancelled: If the stream was cancelled
+        """
+        self._credits.acquire()
+        if self._cancelled.is_set():
+            raise StreamCancelled()
+
+    def release(self) -> None:
+        """Return buffer space after reading a token (called by the consumer)."""
+        self._credits.release()
+
+    def cancel(self) -> None:
+        """Cancel the stream and wake a node waiting for buffer space."""
+        self._cancelled.set()
+        self._credits.release(self.max_buffered)
+
+
+class AsyncStreamControl:
+    """asyncio version of StreamControl for astream() and async nodes."""
+
+    def __init__(self, max_buffered: int = DEFAULT_MAX_BUFFERED):
+        if max_buffered < 1:
+            raise ValueError(f"max_buffered must be at least 1, got {max_buffered}")
+        self.max_buffered = max_buffered
+        self._credits = asyncio.Semaphore(max_buffered)
+        self._cancelled = False
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the consumer has cancelled the stream."""
+        return self._cancelled
+
+    async def acquire(self) -> None:
+        """
+        Wait for buffer space before emitting a token.
+
+        Raises:
+            StreamCancelled: If the stream was cancelled
+        """
+        await self._credits.acquire()
+        if self._cancelled:
+            raise StreamCancelled()
+
+    def release(self) -> None:
+        """Return buffer space after reading a token."""
+        self._credits.release()
+
+    def cancel(self) -> None:
+        """Cancel the stream and wake a node waiting for buffer space."""
+        self._cancelled = True
+        for _ in range(self.max_buffered):
+            self._credits.release()
+
+
+def prepare_prompt(state: ChainState) -> dict[str, str]:
+    """
+    Build the model prompt from the user message.
+
+    Args:
+        state: Current chain state
+
+    Returns:
+        dict: Update with the prompt
+    """
+    return {"prompt": f"You are a helpful assistant. Reply to: {state['message']}"}
+
+
+def _control(config: Optional[RunnableConfig]) -> Any:
+    return ((config or {}).get("configurable") or {}).get(STREAM_CONTROL_KEY)
+
+
+def make_llm_node(llm: Any, node_name: str = "llm", **params: Any) -> Any:
+    """
+    Build a synchronous LLM node that streams tokens as it generates.
+
+    Each token is written to the graph's custom stream as
+    {"node": node_name, "token": token}; the node returns the full response.
+
+    Args:
+        llm: Model with a stream(prompt, **params) method, such as FakeLLM
+        node_name: Name reported with every token
+        **params: Generation parameters passed to the model
+
+    Returns:
+        Node function for a synchronous graph
+    """
+
+    def llm_node(state: ChainState, config: RunnableConfig) -> dict[str, str]:
+        writer = get_stream_writer()
+        control = _control(config)
+        tokens = llm.stream(state["prompt"], **params)
+        parts = []
+        try:
+            for token in tokens:
+                if control is not None:
+                    control.acquire()
+                parts.append(token)
+                writer({"node": node_name, "token": token})
+        finally:
+            close = getattr(tokens, "close", None)
+            if close is not None:
+                close()
+        return {"response": "".join(parts)}
+
+    return llm_node
+
+
+def make_async_llm_node(llm: Any, node_name: str = "llm", **params: Any) -> Any:
+    """
+    Build an async LLM node that streams tokens as it generates.
+
+    Args:
+        llm: Model with an astream(prompt, **params) async iterator
+        node_name: Name reported with every token
+        **params: Generation parameters passed to the model
+
+    Returns:
+        Coroutine node function for ainvoke/astream
+    """
+
+    async def allm_node(state: ChainState, config: RunnableConfig) -> dict[str, str]:
+        writer = get_stream_writer()
+        control = _control(config)
+        tokens = llm.astream(state["prompt"], **params)
+        parts = []
+        try:
+            async for token in tokens:
+                if control is not None:
+                    await control.acquire()
+                parts.append(token)
+                writer({"node": node_name, "token": token})
+        finally:
+            await tokens.aclose()
+        return {"response": "".join(parts)}
+
+    return allm_node
+
+
+def create_streaming_chain(
+    llm: Any = None, is_async: bool = False, **params: Any
+) -> Any:
+    """
+    Create and compile the prompt -> LLM chain.
+
+    Args:
+        llm: Streaming model (defaults to the offline FakeLLM)
+        is_async: Use an async LLM node, for ainvoke/astream and AsyncTokenStream
+        **params: Generation parameters passed to the model
+
+    Returns:
+        Compiled graph application
+    """
+    if llm is None:
+        from src.modules.introduction.utils.fake_llm import FakeLLM
+
+        llm = FakeLLM()
+
+    graph = StateGraph(ChainState)
+    graph.add_node("prepare_prompt", prepare_prompt)
+    graph.add_node(
+        "llm",
+        (
+            make_async_llm_node(llm, **params)
+            if is_async
+            else make_llm_node(llm, **params)
+        ),
+    )
+    graph.add_edge(START, "prepare_prompt")
+    graph.add_edge("prepare_prompt", "llm")
+    graph.add_edge("llm", END)
+    return graph.compile()
+
+
+def _with_control(config: Optional[dict[str, Any]], control: Any) -> dict[str, Any]:
+    config = dict(config or {})
+    config["configurable"] = {
+        **config.get("configurable", {}),
+        STREAM_CONTROL_KEY: control,
+    }
+    return config
+
+
+class TokenStream:
+    """
+    Iterate over the tokens a graph streams, with bounded buffering.
+
+    Attributes:
+        final_state: Final graph state once the stream is exhausted, else None
+        cancelled: Whether the stream was closed before the graph finished
+    """
+
+    def __init__(
+        self,
+        app: Any,
+        state: dict[str, Any],
+        config: Optional[dict[str, Any]] = None,
+        max_buffered: int = DEFAULT_MAX_BUFFERED,
+    ):
+        self.control = StreamControl(max_buffered)
+        self.final_state: Optional[dict[str, Any]] = None
+        self.cancelled = False
+        self._stream = app.stream(
+            state, _with_control(config, self.control), stream_mode=["custom", "values"]
+        )
+        self._done = False
+
+    def __iter__(self) -> Iterator[str]:
+        try:
+            for mode, chunk in self._stream:
+                if mode == "custom" and isinstance(chunk, dict) and "token" in chunk:
+                    self.control.release()
+                    yield chunk["token"]
+                elif mode == "values":
+                    self.final_state = chunk
+            self._done = True
+        finally:
+            if not self._done:
+                self.close()
+
+    def close(self) -> None:
+        """Stop consuming and cancel the LLM node at its next token."""
+        if not self._done:
+            self.cancelled = True
+            self._done = True
+            self.control.cancel()
+            try:
+                self._stream.close()
+            except StreamCancelled:
+                pass
+
+    def __enter__(self) -> "TokenStream":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class AsyncTokenStream:
+    """
+    Async version of TokenStream for graphs built with is_async=True.
+
+    Attributes:
+        final_state: Final graph state once the stream is exhausted, else None
+        cancelled: Whether the stream was closed before the graph finished
+    """
+
+    def __init__(
+        self,
+        app: Any,
+        state: dict[str, Any],
+        config: Optional[dict[str, Any]] = None,
+        max_buffered: int = DEFAULT_MAX_BUFFERED,
+    ):
+        self.control = AsyncStreamControl(max_buffered)
+        self.final_state: Optional[dict[str, Any]] = None
+        self.cancelled = False
+        self._stream = app.astream(
+            state, _with_control(config, self.control), stream_mode=["custom", "values"]
+        )
+        self._done = False
+
+    async def __aiter__(self) -> AsyncIterator[str]:
+        try:
+            async for mode, chunk in self._stream:
+                if mode == "custom" and isinstance(chunk, dict) and "token" in chunk:
+                    self.control.release()
+                    yield chunk["token"]
+                elif mode == "values":
+                    self.final_state = chunk
+            self._done = True
+        finally:
+            if not self._done:
+                await self.aclose()
+
+    async def aclose(self) -> None:
+        """Stop consuming and cancel the LLM node."""
+        if not self._done:
+            self.cancelled = True
+            self._done = True
+            self.control.cancel()
+            try:
+                await self._stream.aclose()
+            except StreamCancelled:
+                pass
+
+    async def __aenter__(self) -> "AsyncTokenStream":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
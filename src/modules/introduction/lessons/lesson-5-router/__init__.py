@@ -2,4 +2,21 @@
 Lesson 5: Router
 
 This lesson demonstrates routing patterns in LangGraph.
-""" 
\ No newline at end of file
+"""
+
+from src.modules.introduction.utils.lazy import lazy_exports
+
+__getattr__, __dir__, __all__ = lazy_exports(
+    __name__,
+    {
+        "Rule": ".router_engine:Rule",
+        "Range": ".router_engine:Range",
+        "Prefix": ".router_engine:Prefix",
+        "EMPTY": ".router_engine:EMPTY",
+        "CompiledRouter": ".router_engine:CompiledRouter",
+        "compile_router": ".router_engine:compile_router",
+        "EMAIL_ROUTER": ".routers:EMAIL_ROUTER",
+        "MESSAGE_ROUTER": ".routers:MESSAGE_ROUTER",
+        "create_email_routing_graph": ".routers:create_email_routing_graph",
+    },
+)
@@ -0,0 +1,590 @@
+"""
+Router Engine
+
+Compiles ordered routing rules into a precomputed decision table, instead
+of re-evaluating if/elif chains for every state.
+
+Each state field used by the rules becomes a feature that maps the field's
+value to a small integer:
+
+    exact values   dict lookup (value, or a set of values, in a Rule)
+    Range          bisect over every bound used by the rules
+    Prefix/EMPTY   walk of a character trie built from every prefix
+
+All combinations of feature indices are evaluated against the rules once, at
+compile time, so routing a state costs one index lookup per feature and one
+table lookup, however many rules there are. Rules keep if/elif semantics:
+the first matching rule wins, and the default applies when none match.
+
+Example:
+    router = compile_router([
+        Rule("spam", spam_score=Range(gt=2)),
+        Rule("high_priority", priority="high"),
+        Rule("normal_priority", classification={"sales", "support"}),
+    ], default="low_priority")
+
+    # Returns "high_priority"
+    router({"spam_score": 0, "priority": "high", "classification": "hr"})
+    graph.add_conditional_edges("analyze", router, router.targets)
+"""
+
+import math
+from bisect import bisect_left
+from collections.abc import Collection
+from dataclasses import dataclass, field
+from itertools import product
+from typing import Any, Callable, Iterable, Mapping, Optional, Sequence
+
+# Largest decision table compile_router() will build
+DEFAULT_MAX_TABLE_SIZE = 1 << 20
+
+# Values remembered per Range/Prefix field so repeats skip the bisect or trie walk
+MEMO_SIZE = 4096
+
+
+class _Empty:
+    """Condition matching a missing or empty text field."""
+
+    def __repr__(self) -> str:
+        return "EMPTY"
+
+
+# Condition for Prefix fields that matches missing or empty text
+EMPTY = _Empty()
+
+
+@dataclass(frozen=True)
+class Range:
+    """
+    Numeric interval condition; unset bounds are open-ended.
+
+    Attributes:
+        gt: Value must be greater than this
+        ge: Value must be greater than or equal to this
+        lt: Value must be less than this
+        le: Value must be less than or equal to this
+    """
+
+    gt: Optional[float] = None
+    ge: Optional[float] = None
+    lt: Optional[float] = None
+    le: Optional[float] = None
+
+    def contains(self, value: float) -> bool:
+        """Return whether value lies in the interval."""
+        return not (
+            (self.gt is not None and not value > self.gt)
+            or (self.ge is not None and not value >= self.ge)
+            or (self.lt is not None and not value < self.lt)
+            or (self.le is not None and not value <= self.le)
+        )
+
+    def bounds(self) -> list[float]:
+        """Return the bounds that are set."""
+        return [
+            bound for bound in (self.gt, self.ge, self.lt, self.le) if bound is not None
+        ]
+
+
+@dataclass(frozen=True)
+class Prefix:
+    """
+    Text prefix condition.
+
+    Attributes:
+        text: Prefix the field must start with
+        ignore_case: Compare case-insensitively
+    """
+
+    text: str
+    ignore_case: bool = True
+
+
+@dataclass(frozen=True, eq=False)
+class Rule:
+    """
+    A routing rule: route to target when every condition holds.
+
+    Conditions map a state field to an exact value, a set of values, a
+    Range, a Prefix (or a set of Prefixes), or EMPTY.
+    """
+
+    target: str
+    conditions: Mapping[str, Any] = field(default_factory=dict)
+
+    def __init__(
+        self, target: str, conditions: Optional[Mapping[str, Any]] = None, **fields: Any
+    ):
+        object.__setattr__(self, "target", target)
+        object.__setattr__(self, "conditions", {**(conditions or {}), **fields})
+
+
+class PrefixTrie:
+    """Character trie returning the longest stored prefix of a text."""
+
+    def __init__(self, prefixes: Iterable[str] = ()):
+        self._root: dict[str, Any] = {}
+        for prefix in prefixes:
+            self.add(prefix)
+
+    def add(self, prefix: str) -> None:
+        """Store a prefix."""
+        node = self._root
+        for char in prefix:
+            node = node.setdefault(char, {})
+        node[""] = prefix
+
+    def longest_prefix(self, text: str) -> Optional[str]:
+        """
+        Return the longest stored prefix of text.
+
+        Args:
+            text: Text to match
+
+        Returns:
+            str: The matched prefix, or None
+        """
+        node = self._root
+        match = node.get("")
+        for char in text:
+            node = node.get(char)
+            if node is None:
+                break
+            if "" in node:
+                match = node[""]
+        return match
+
+
+def _as_options(condition: Any) -> tuple[Any, ...]:
+    """Expand set-like conditions into their options."""
+    if isinstance(condition, Collection) and not isinstance(
+        condition, (str, bytes, Range, Prefix)
+    ):
+        return tuple(condition)
+    return (condition,)
+
+
+class _Feature:
+    """Maps one state field to an index in [0, size)."""
+
+    name: str
+    size: int
+
+    def index(self, value: Any) -> int:
+        raise NotImplementedError
+
+    def memoized(self) -> tuple[dict[Any, int], Callable[[Any], int]]:
+        """Return a memo of value -> index and an index function that fills it."""
+        memo: dict[Any, int] = {}
+        index = self.index
+
+        def index_and_remember(value: Any) -> int:
+            result = index(value)
+            if len(memo) < MEMO_SIZE:
+                try:
+                    memo[value] = result
+                except TypeError:
+                    pass
+            return result
+
+        return memo, index_and_remember
+
+    def matches(self, condition: Any, index: int) -> bool:
+        raise NotImplementedError
+
+
+class _ValueFeature(_Feature):
+    """Exact-value field: each value mentioned by a rule, then everything else."""
+
+    def __init__(self, name: str, values: list[Any]):
+        self.name = name
+        self.values = list(dict.fromkeys(values))
+        self.lookup = {value: i for i, value in enumerate(self.values)}
+        self.other = len(self.values)
+        self.size = self.other + 1
+
+    def index(self, value: Any) -> int:
+        try:
+            return self.lookup.get(value, self.other)
+        except TypeError:
+            return self.other
+
+    def matches(self, condition: Any, index: int) -> bool:
+        return index != self.other and any(
+            self.values[index] == option for option in _as_options(condition)
+        )
+
+
+class _RangeFeature(_Feature):
+    """
+    Numeric field split into buckets at every rule bound.
+
+    Bucket 2i is the open interval below bounds[i], bucket 2i + 1 is exactly
+    bounds[i], and the last bucket is missing or non-numeric values. As in
+    Python comparisons, booleans count as 0 and 1.
+    """
+
+    def __init__(self, name: str, bounds: list[float]):
+        self.name = name
+        self.bounds = sorted(set(bounds))
+        self.missing = 2 * len(self.bounds) + 1
+        self.size = self.missing + 1
+
+    def index(self, value: Any) -> int:
+        if not isinstance(value, (int, float)) or value != value:
+            return self.missing
+        i = bisect_left(self.bounds, value)
+        return 2 * i + 1 if i < len(self.bounds) and self.bounds[i] == value else 2 * i
+
+    def representative(self, index: int) -> float:
+        bounds = self.bounds
+        i, exact = divmod(index, 2)
+        if exact:
+            return bounds[i]
+        if not bounds:
+            return 0.0
+        if i == 0:
+            return bounds[0] - 1
+        if i == len(bounds):
+            return bounds[-1] + 1
+        return (bounds[i - 1] + bounds[i]) / 2
+
+    def matches(self, condition: Any, index: int) -> bool:
+        if index == self.missing:
+            return False
+        value = self.representative(index)
+        return any(option.contains(value) for option in _as_options(condition))
+
+
+class _PrefixFeature(_Feature):
+    """Text field matched against every rule prefix with one trie walk."""
+
+    def __init__(self, name: str, prefixes: list[Prefix]):
+        self.name = name
+        self.ignore_case = any(prefix.ignore_case for prefix in prefixes)
+        if self.ignore_case and not all(prefix.ignore_case for prefix in prefixes):
+            raise ValueError(
+                f"Field '{name}' mixes case-sensitive and case-insensitive prefixes"
+            )
+        texts = [
+            prefix.text.lower() if self.ignore_case else prefix.text
+            for prefix in prefixes
+        ]
+        self.prefixes = [text for text in dict.fromkeys(texts) if text]
+        self.trie = PrefixTrie(self.prefixes)
+        self.lookup = {prefix: i for i, prefix in enumerate(self.prefixes)}
+        # Past the prefixes: unmatched text, the empty string, other falsy
+        # values and everything else (EMPTY and Prefix("") split these)
+        self.text = len(self.prefixes)
+        self.blank = self.text + 1
+        self.empty = self.blank + 1
+        self.other = self.empty + 1
+        self.size = self.other + 1
+
+    def index(self, value: Any) -> int:
+        if not isinstance(value, str):
+            return self.other if value else self.empty
+        if not value:
+            return self.blank
+        match = self.trie.longest_prefix(value.lower() if self.ignore_case else value)
+        return self.text if match is None else self.lookup[match]
+
+    def matches(self, condition: Any, index: int) -> bool:
+        for option in _as_options(condition):
+            if option is EMPTY:
+                if index in (self.blank, self.empty):
+                    return True
+            elif option.text == "":
+                if index <= self.blank:
+                    return True
+            elif index < self.text:
+                text = option.text.lower() if self.ignore_case else option.text
+                # Texts whose longest match is this prefix start with every
+                # rule prefix that this prefix starts with, and no other
+                if self.prefixes[index].startswith(text):
+                    return True
+        return False
+
+
+def _build_feature(name: str, conditions: list[Any]) -> _Feature:
+    options = [option for condition in conditions for option in _as_options(condition)]
+    if all(isinstance(option, Range) for option in options):
+        return _RangeFeature(
+            name, [bound for option in options for bound in option.bounds()]
+        )
+    if all(isinstance(option, Prefix) or option is EMPTY for option in options):
+        return _PrefixFeature(
+            name, [option for option in options if isinstance(option, Prefix)]
+        )
+    if any(
+        isinstance(option, (Range, Prefix)) or option is EMPTY for option in options
+    ):
+        raise ValueError(
+            f"Field '{name}' mixes exact values with Range or Prefix conditions"
+        )
+    return _ValueFeature(name, options)
+
+
+class CompiledRouter:
+    """
+    A routing function backed by a precomputed decision table.
+
+    Instances are callable with a state, so they can be passed directly to
+    StateGraph.add_conditional_edges().
+
+    Attributes:
+        targets: Every target the router can return, for the edge's path map
+        table_size: Number of precomputed decisions
+    """
+
+    def __init__(self, features: list[_Feature], table: list[int], targets: list[str]):
+        self._fields = [feature.name for feature in features]
+        self._indexers = [feature.index for feature in features]
+        # Store target names directly so a decision is a single list index
+        self._decisions = [targets[i] for i in table]
+        # Mixed-radix strides turn per-feature indices into one table offset
+        strides = []
+        stride = 1
+        for feature in reversed(features):
+            strides.append(stride)
+            stride *= feature.size
+        self._strides = list(reversed(strides))
+        self._plan = list(zip(self._fields, self._indexers, self._strides))
+        self._fast = self._generate_fast_path(features)
+        self.targets = list(dict.fromkeys(targets))
+        self.table_size = len(table)
+
+    def _generate_fast_path(
+        self, features: list[_Feature]
+    ) -> Callable[[Callable[..., Any]], str]:
+        """
+        Generate a straight-line function computing the table offset.
+
+        Exact-value features are inlined as dict lookups; the others check a
+        memo of recently seen values before calling their index method. The
+        function takes a dict's get method.
+        """
+        namespace: dict[str, Any] = {"decisions": self._decisions}
+        terms = []
+        for i, (feature, stride) in enumerate(zip(features, self._strides)):
+            if isinstance(feature, _ValueFeature):
+                namespace[f"lookup_{i}"] = feature.lookup
+                term = f"lookup_{i}.get(get({feature.name!r}), {feature.other})"
+            else:
+                namespace[f"memo_{i}"], namespace[f"index_{i}"] = feature.memoized()
+                term = (
+                    f"(m if (m := memo_{i}.get(v := get({feature.name!r}))) is not None"
+                    f" else index_{i}(v))"
+                )
+            terms.append(term if stride == 1 else f"{term} * {stride}")
+        source = f"def route(get):\n    return decisions[{' + '.join(terms) or '0'}]\n"
+        exec(compile(source, "<compiled router>", "exec"), namespace)
+        return namespace["route"]
+
+    def _route_generic(self, get: Callable[..., Any]) -> str:
+        offset = 0
+        for name, index, stride in self._plan:
+            offset += index(get(name)) * stride
+        return self._decisions[offset]
+
+    def __call__(self, state: Any) -> str:
+        """Route a single state (a dict or an object with attributes)."""
+        if isinstance(state, dict):
+            try:
+                return self._fast(state.get)
+            except TypeError:
+                # An unhashable value; the generic path maps it to "other"
+                return self._route_generic(state.get)
+        return self._route_generic(lambda name: getattr(state, name, None))
+
+    def route_many(self, states: Sequence[Any]) -> list[str]:
+        """
+        Route many states at once.
+
+        Features are indexed column by column, which avoids most per-state
+        call overhead.
+
+        Args:
+            states: States to route
+
+        Returns:
+            list: Target for each state, in order
+        """
+        if not states:
+            return []
+        if all(isinstance(state, dict) for state in states):
+            fast = self._fast
+            try:
+                return [fast(state.get) for state in states]
+            except TypeError:
+                pass
+            columns = {
+                name: [state.get(name) for state in states] for name in self._fields
+            }
+        else:
+            columns = {
+                name: [getattr(state, name, None) for state in states]
+                for name in self._fields
+            }
+        return self.route_columns(columns, len(states))
+
+    def route_columns(
+        self, columns: Mapping[str, Sequence[Any]], count: Optional[int] = None
+    ) -> list[str]:
+        """
+        Route states given as columns of field values.
+
+        Args:
+            columns: Field name to the values of that field, one per state
+            count: Number of states (needed only if no routed field is present)
+
+        Returns:
+            list: Target for each state, in order
+        """
+        if count is None:
+            count = next((len(values) for values in columns.values()), 0)
+        offsets = [0] * count
+        for name, index, stride in self._plan:
+            values = columns.get(name)
+            if values is None:
+                missing = index(None) * stride
+                offsets = [offset + missing for offset in offsets]
+            else:
+                offsets = [
+                    offset + index(value) * stride
+                    for offset, value in zip(offsets, values)
+                ]
+        decisions = self._decisions
+        return [decisions[offset] for offset in offsets]
+
+
+def _condition_source(name: str, condition: Any, constants: list[Any]) -> str:
+    """Write one condition as a Python expression over the local get()."""
+    options = _as_options(condition)
+    constants.append(options)
+    ref = f"c[{len(constants) - 1}]"
+    value = f"get({name!r})"
+    if all(isinstance(option, Range) for option in options):
+        return (
+            f"(isinstance(v := {value}, (int, float))"
+            f" and any(r.contains(v) for r in {ref}))"
+        )
+    if all(isinstance(option, Prefix) or option is EMPTY for option in options):
+        tests = []
+        for option in options:
+            if option is EMPTY:
+                tests.append(f"not {value}")
+            elif option.ignore_case:
+                tests.append(
+                    f"(isinstance(v := {value}, str)"
+                    f" and v.lower().startswith({option.text.lower()!r}))"
+                )
+            else:
+                tests.append(
+                    f"(isinstance(v := {value}, str) and v.startswith({option.text!r}))"
+                )
+        return "(" + " or ".join(tests) + ")"
+    if len(options) == 1:
+        return f"{value} == {ref}[0]"
+    return f"{value} in {ref}"
+
+
+def naive_router(rules: Sequence[Rule], default: str) -> Callable[[Any], str]:
+    """
+    Build the if/elif chain equivalent to a rule set.
+
+    Every state is checked rule by rule, as a hand-written routing function
+    would; compile_router() precomputes the same decisions. Useful for
+    checking compiled routers and as a benchmark baseline.
+
+    Args:
+        rules: Rules in priority order (first match wins)
+        default: Target when no rule matches
+
+    Returns:
+        Routing function
+    """
+    constants: list[Any] = []
+    lines = [
+        "def route(state):",
+        "    get = state.get if isinstance(state, dict)"
+        " else (lambda name: getattr(state, name, None))",
+    ]
+    for rule in rules:
+        test = (
+            " and ".join(
+                _condition_source(name, condition, constants)
+                for name, condition in rule.conditions.items()
+            )
+            or "True"
+        )
+        lines.append(f"    if {test}:")
+        lines.append(f"        return {rule.target!r}")
+    lines.append(f"    return {default!r}")
+    namespace: dict[str, Any] = {"c": constants}
+    exec(compile("\n".join(lines) + "\n", "<naive router>", "exec"), namespace)
+    return namespace["route"]
+
+
+def compile_router(
+    rules: Sequence[Rule],
+    default: str,
+    max_table_size: int = DEFAULT_MAX_TABLE_SIZE,
+) -> CompiledRouter:
+    """
+    Compile ordered rules into a decision-table router.
+
+    Args:
+        rules: Rules in priority order (first match wins)
+        default: Target when no rule matches
+        max_table_size: Refuse to build larger tables
+
+    Returns:
+        CompiledRouter: The compiled router
+
+    Raises:
+        ValueError: If a field mixes condition kinds or the table is too large
+    """
+    conditions_by_field: dict[str, list[Any]] = {}
+    for rule in rules:
+        for name, condition in rule.conditions.items():
+            conditions_by_field.setdefault(name, []).append(condition)
+    features = [
+        _build_feature(name, conditions)
+        for name, conditions in conditions_by_field.items()
+    ]
+
+    size = math.prod(feature.size for feature in features)
+    if size > max_table_size:
+        raise ValueError(
+            f"Decision table would have {size:,} entries (limit {max_table_size:,}); "
+            "split the rules or reduce the number of distinct values"
+        )
+
+    targets = [rule.target for rule in rules] + [default]
+    # matches[r][f][i]: does rule r's condition on feature f hold at index i?
+    matches = [
+        [
+            (
+                None
+                if feature.name not in rule.conditions
+                else [
+                    feature.matches(rule.conditions[feature.name], i)
+                    for i in range(feature.size)
+                ]
+            )
+            for feature in features
+        ]
+        for rule in rules
+    ]
+
+    table = []
+    for indices in product(*(range(feature.size) for feature in features)):
+        for rule_index, rule_matches in enumerate(matches):
+            if all(m is None or m[index] for m, index in zip(rule_matches, indices)):
+                table.append(rule_index)
+                break
+        else:
+            table.append(len(rules))
+
+    return CompiledRouter(features, table, targets)
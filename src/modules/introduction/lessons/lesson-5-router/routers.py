@@ -0,0 +1,176 @@
+"""
+Example Routers
+
+The routing functions from the routing-workflows knowledge base entry and
+the Lesson 2 response logic, written once as plain if/elif functions and
+once as compiled decision-table routers. Both versions return the same
+target for every state; the benchmarks compare their throughput.
+"""
+
+from typing import Any, Literal, TypedDict
+
+from langgraph.graph import END, START, StateGraph
+
+from src.modules.introduction.utils.keyword_matcher import KeywordMatcher
+
+from .router_engine import EMPTY, Prefix, Range, Rule, compile_router
+
+
+class EmailState(TypedDict, total=False):
+    """
+    State for the email routing example.
+
+    Attributes:
+        subject: Email subject
+        email_content: Email body
+        spam_score: Number of spam indicators found
+        classification: Department classification
+        priority: "high" or "normal"
+        route: Queue the email was sent to
+    """
+
+    subject: str
+    email_content: str
+    spam_score: int
+    classification: str
+    priority: str
+    route: str
+
+
+def route_email(
+    state: EmailState,
+) -> Literal["spam", "high_priority", "normal_priority", "low_priority"]:
+    """Route an analysed email with an if/elif chain."""
+    if state["spam_score"] > 2:
+        return "spam"
+    elif state["priority"] == "high":
+        return "high_priority"
+    elif state["classification"] in ["sales", "support"]:
+        return "normal_priority"
+    else:
+        return "low_priority"
+
+
+def route_message(
+    state: dict[str, Any],
+) -> Literal["no_message", "greeting", "help", "general"]:
+    """Route a message by prefix with an if/elif chain, like generate_response()."""
+    message = state.get("message")
+    if not message:
+        return "no_message"
+    lowered = message.lower()
+    if lowered.startswith("hello"):
+        return "greeting"
+    if lowered.startswith("help"):
+        return "help"
+    return "general"
+
+
+def classify_request(
+    state: dict[str, Any],
+) -> Literal["technical", "billing", "general", "urgent"]:
+    """Classify a support request by scanning for each keyword group in turn."""
+    message = (state.get("message") or "").lower()
+    if not message:
+        return "general"
+
+    # Urgency detection
+    urgent_words = ["urgent", "emergency", "broken", "down"]
+    if any(word in message for word in urgent_words):
+        return "urgent"
+
+    # Request type classification
+    if any(word in message for word in ["error", "bug", "technical", "code"]):
+        return "technical"
+    elif any(word in message for word in ["bill", "payment", "charge", "refund"]):
+        return "billing"
+    else:
+        return "general"
+
+
+# Keywords for classify_request(), matched in a single pass
+REQUEST_KEYWORDS = KeywordMatcher(
+    {
+        **dict.fromkeys(["urgent", "emergency", "broken", "down"], "urgent"),
+        **dict.fromkeys(["error", "bug", "technical", "code"], "technical"),
+        **dict.fromkeys(["bill", "payment", "charge", "refund"], "billing"),
+    }
+)
+
+
+def classify_request_fast(
+    state: dict[str, Any],
+) -> Literal["technical", "billing", "general", "urgent"]:
+    """Single-pass equivalent of classify_request()."""
+    return REQUEST_KEYWORDS.classify(
+        state.get("message") or "", ["urgent", "technical", "billing"], "general"
+    )
+
+
+# Compiled equivalent of route_email()
+EMAIL_ROUTER = compile_router(
+    [
+        Rule("spam", spam_score=Range(gt=2)),
+        Rule("high_priority", priority="high"),
+        Rule("normal_priority", classification={"sales", "support"}),
+    ],
+    default="low_priority",
+)
+
+# Compiled equivalent of route_message()
+MESSAGE_ROUTER = compile_router(
+    [
+        Rule("no_message", message=EMPTY),
+        Rule("greeting", message=Prefix("hello")),
+        Rule("help", message=Prefix("help")),
+    ],
+    default="general",
+)
+
+
+def build_ticket_rules(products: int = 60) -> list[Rule]:
+    """
+    Build a large support-ticket rule set: one rule per product and tier.
+
+    Severe tickets go to the on-call queue first; every other ticket is
+    routed to the team that owns its product and plan tier.
+
+    Args:
+        products: Number of products in the catalog
+
+    Returns:
+        list: Rules in priority order
+    """
+    rules = [Rule("on_call", severity=Range(ge=9))]
+    for product in range(products):
+        for tier in ("free", "pro", "enterprise"):
+            rules.append(
+                Rule(
+                    f"team_{product % 12}_{tier}",
+                    product=f"product_{product}",
+                    tier=tier,
+                )
+            )
+    return rules
+
+
+def create_email_routing_graph(router: Any = EMAIL_ROUTER) -> Any:
+    """
+    Create and compile a graph that routes analysed emails to handler queues.
+
+    Args:
+        router: Routing function for the conditional edge
+
+    Returns:
+        Compiled graph application
+    """
+    graph = StateGraph(EmailState)
+    graph.add_node("analyze", lambda state: {})
+    for target in ("spam", "high_priority", "normal_priority", "low_priority"):
+        graph.add_node(target, lambda state, target=target: {"route": target})
+        graph.add_edge(target, END)
+    graph.add_edge(START, "analyze")
+    graph.add_conditional_edges(
+        "analyze", router, ["spam", "high_priority", "normal_priority", "low_priority"]
+    )
+    return graph.compile()
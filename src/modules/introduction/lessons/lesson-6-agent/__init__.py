@@ -2,4 +2,19 @@
 Lesson 6: Agent
 
 This lesson demonstrates agent patterns in LangGraph.
-""" 
\ No newline at end of file
+"""
+
+from src.modules.introduction.utils.lazy import lazy_exports
+
+__getattr__, __dir__, __all__ = lazy_exports(
+    __name__,
+    {
+        "ToolExecutor": ".tool_executor:ToolExecutor",
+        "ToolResult": ".tool_executor:ToolResult",
+        "tool_node": ".tool_executor:tool_node",
+        "create_tool_agent": ".tool_executor:create_tool_agent",
+        "ToolCache": ".tool_cache:ToolCache",
+        "ToolCacheStats": ".tool_cache:ToolCacheStats",
+        "side_effecting": ".tool_cache:side_effecting",
+    },
+)
@@ -0,0 +1,355 @@
+"""
+Tool Result Cache
+
+Caches tool results for agent loops, keyed on the tool name plus its
+canonicalized arguments, so a ReAct-style agent that asks for the same
+lookup again (later in the conversation, or for another user) gets the
+stored result instead of paying the tool's latency again.
+
+- Two tiers: an in-memory LRU (nodes.memoize.NodeCache) in front of an
+  optional SQLite table shared between processes.
+- Per-tool TTLs, with a default for tools that have none. Expired SQLite
+  rows are purged every purge_interval writes, and max_rows caps the table.
+- Side-effecting tools (sending an email, placing an order) are never
+  cached: list them in side_effecting or decorate them with
+  @side_effecting.
+- Per-tool hit, miss and bypass counters, exported by metrics().
+
+Example:
+    from src.modules.introduction.lessons import agent
+
+    @agent.side_effecting
+    def send_email(to: str, body: str) -> str: ...
+
+    cache = agent.ToolCache(
+        path="tool_cache.sqlite3", default_ttl=300, ttls={"get_weather": 60}
+    )
+    executor = agent.ToolExecutor([get_weather, send_email], cache=cache)
+    ...
+    print(cache.metrics())
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Callable, Iterable, Mapping, Optional, Union
+
+from src.modules.introduction.nodes.memoize import NodeCache
+
+# Default number of results held in memory
+DEFAULT_MAXSIZE = 1024
+
+# Default SQLite writes between purges of expired (and over-cap) rows
+DEFAULT_PURGE_INTERVAL = 256
+
+# Table for the SQLite tier
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tool_results (
+    key TEXT PRIMARY KEY,
+    tool TEXT NOT NULL,
+    value TEXT NOT NULL,
+    expires_at REAL
+);
+CREATE INDEX IF NOT EXISTS tool_results_expires_at ON tool_results (expires_at);
+"""
+
+
+def side_effecting(func: Callable) -> Callable:
+    """Mark a tool as side-effecting, so ToolCache never caches it."""
+    func.side_effecting = True
+    return func
+
+
+def _canonical(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return {str(key): _canonical(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item) for item in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted((_canonical(item) for item in value), key=repr)
+    return value
+
+
+def tool_call_key(name: str, args: Optional[Mapping[str, Any]]) -> str:
+    """
+    Compute the cache key of a tool call.
+
+    Arguments are canonicalized first: key order does not matter, tuples
+    equal lists, and sets are sorted.
+
+    Args:
+        name: Tool name
+        args: Tool arguments
+
+    Returns:
+        str: Hex SHA-256 digest
+    """
+    payload = json.dumps(
+        {"tool": name, "args": _canonical(args or {})},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class ToolCacheStats:
+    """
+    Counters for one tool (or all tools) in a ToolCache.
+
+    Attributes:
+        memory_hits: Lookups served from the in-memory tier
+        disk_hits: Lookups served from the SQLite tier
+        misses: Lookups that had to run the tool
+        writes: Results stored
+        bypassed: Calls to side-effecting tools, never cached
+    """
+
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    bypassed: int = 0
+
+    @property
+    def hits(self) -> int:
+        """Lookups served from either tier."""
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of cacheable lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ToolCache:
+    """
+    Two-tier tool result cache with per-tool TTLs.
+
+    Only successful results are stored. Results in the SQLite tier are
+    stored as JSON, so they must be JSON-serializable (others are kept in
+    memory only) and come back with JSON types (tuples as lists).
+
+    Attributes:
+        default_ttl: Seconds a result stays valid, or None for no expiry
+        ttls: Per-tool TTLs, overriding default_ttl
+        side_effecting: Names of tools that are never cached
+        path: SQLite file for the shared tier, or None for memory only
+        max_rows: Maximum rows in the SQLite tier, or None for no limit;
+            the oldest writes are dropped first
+        purge_interval: SQLite writes between purges of expired rows
+            (and rows over max_rows)
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path, None] = None,
+        maxsize: int = DEFAULT_MAXSIZE,
+        default_ttl: Optional[float] = None,
+        ttls: Optional[Mapping[str, Optional[float]]] = None,
+        side_effecting: Iterable[str] = (),
+        clock: Callable[[], float] = time.time,
+        max_rows: Optional[int] = None,
+        purge_interval: int = DEFAULT_PURGE_INTERVAL,
+    ):
+        if purge_interval < 1:
+            raise ValueError(f"purge_interval must be at least 1, got {purge_interval}")
+        self.default_ttl = default_ttl
+        self.max_rows = max_rows
+        self.purge_interval = purge_interval
+        self._writes_since_purge = 0
+        self.ttls = dict(ttls or {})
+        self.side_effecting = set(side_effecting)
+        self.path = Path(path) if path is not None else None
+        self._clock = clock
+        self._memory = NodeCache(maxsize, clock=clock)
+        self._stats: dict[str, ToolCacheStats] = {}
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            with self._conn:
+                self._conn.executescript(_SCHEMA)
+
+    def ttl_for(self, name: str) -> Optional[float]:
+        """Return the TTL for a tool's results."""
+        return self.ttls.get(name, self.default_ttl)
+
+    def is_cacheable(self, name: str, tool: Any = None) -> bool:
+        """Return whether a tool's results may be cached."""
+        return (
+            name not in self.side_effecting
+            and not getattr(tool, "side_effecting", False)
+            and self.ttl_for(name) != 0
+        )
+
+    def _count(self, name: str, counter: str) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(name, ToolCacheStats())
+            setattr(stats, counter, getattr(stats, counter) + 1)
+
+    def record_bypass(self, name: str) -> None:
+        """Count a call to a side-effecting tool."""
+        self._count(name, "bypassed")
+
+    def get(self, name: str, key: str) -> tuple[bool, Any]:
+        """
+        Look up a result, first in memory, then in SQLite.
+
+        Args:
+            name: Tool name
+            key: Key from tool_call_key()
+
+        Returns:
+            tuple: (found, value)
+        """
+        found, value = self._memory.get(key)
+        if found:
+            self._count(name, "memory_hits")
+            return True, value
+
+        if self._conn is not None:
+            now = self._clock()
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value, expires_at FROM tool_results"
+                    " WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                    (key, now),
+                ).fetchone()
+            if row is not None:
+                value = json.loads(row[0])
+                remaining = row[1] - now if row[1] is not None else None
+                self._memory.put(key, value, remaining)
+                self._count(name, "disk_hits")
+                return True, value
+
+        self._count(name, "misses")
+        return False, None
+
+    def put(self, name: str, key: str, value: Any) -> None:
+        """
+        Store a successful result in both tiers.
+
+        Args:
+            name: Tool name
+            key: Key from tool_call_key()
+            value: Tool result
+        """
+        ttl = self.ttl_for(name)
+        self._memory.put(key, value, ttl)
+        if self._conn is not None:
+            try:
+                data = json.dumps(value)
+            except (TypeError, ValueError):
+                data = None
+            if data is not None:
+                expires_at = self._clock() + ttl if ttl is not None else None
+                with self._lock, self._conn:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO tool_results VALUES (?, ?, ?, ?)",
+                        (key, name, data, expires_at),
+                    )
+                    self._writes_since_purge += 1
+                    purge = self._writes_since_purge >= self.purge_interval
+                if purge:
+                    self.purge()
+        self._count(name, "writes")
+
+    def purge(self) -> int:
+        """
+        Delete expired rows from the SQLite tier, then the oldest over max_rows.
+
+        put() calls this every purge_interval writes, so the shared table
+        stays bounded even when no process reads the expired entries again.
+
+        Returns:
+            int: Rows deleted
+        """
+        if self._conn is None:
+            return 0
+        with self._lock, self._conn:
+            self._writes_since_purge = 0
+            deleted = self._conn.execute(
+                "DELETE FROM tool_results WHERE expires_at <= ?", (self._clock(),)
+            ).rowcount
+            if self.max_rows is not None:
+                # INSERT OR REPLACE assigns a new rowid, so rowid order is write order
+                deleted += self._conn.execute(
+                    "DELETE FROM tool_results WHERE rowid IN (SELECT rowid FROM"
+                    " tool_results ORDER BY rowid DESC LIMIT -1 OFFSET ?)",
+                    (self.max_rows,),
+                ).rowcount
+        return deleted
+
+    def call(
+        self,
+        name: str,
+        args: Mapping[str, Any],
+        func: Callable[..., Any],
+        tool: Any = None,
+    ) -> Any:
+        """
+        Return a cached result for a tool call, running func(**args) on a miss.
+
+        Args:
+            name: Tool name
+            args: Tool arguments
+            func: Function that performs the call
+            tool: Tool object, checked for the side_effecting mark (defaults to func)
+
+        Returns:
+            The tool result
+        """
+        if not self.is_cacheable(name, tool if tool is not None else func):
+            self.record_bypass(name)
+            return func(**args)
+        key = tool_call_key(name, args)
+        found, value = self.get(name, key)
+        if found:
+            return value
+        value = func(**args)
+        self.put(name, key, value)
+        return value
+
+    def metrics(self) -> dict[str, ToolCacheStats]:
+        """Return a snapshot of the counters, per tool."""
+        with self._lock:
+            return {name: replace(stats) for name, stats in self._stats.items()}
+
+    def total_stats(self) -> ToolCacheStats:
+        """Return the counters summed over all tools."""
+        total = ToolCacheStats()
+        for stats in self.metrics().values():
+            for field in ("memory_hits", "disk_hits", "misses", "writes", "bypassed"):
+                setattr(total, field, getattr(total, field) + getattr(stats, field))
+        return total
+
+    def clear(self) -> None:
+        """Drop every cached result from both tiers; counters are kept."""
+        self._memory.clear()
+        if self._conn is not None:
+            with self._lock, self._conn:
+                self._conn.execute("DELETE FROM tool_results")
+
+    def close(self) -> None:
+        """Close the SQLite tier."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __enter__(self) -> "ToolCache":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -0,0 +1,392 @@
+"""
+Parallel Tool Executor
+
+Runs the independent tool calls from one model turn concurrently, so a turn
+takes as long as its slowest tool rather than the sum of all of them.
+
+- Bounded pool: sync tools run on a ThreadPoolExecutor with max_workers
+  threads; async tools run on the event loop, at most max_workers at once.
+- Timeouts: every call has a timeout (per tool, or a default), counted
+  from the start of the turn, including any wait for a free worker. A
+  call that misses it is reported as an error result; the rest of the
+  turn is not held up.
+- Ordering: results always come back in the order the model requested
+  the calls, whatever order they finish in.
+- Caching: with a ToolCache, cached results are returned without running
+  the tool, and identical cacheable calls in one turn run only once.
+
+Example:
+    from src.modules.introduction.lessons import agent
+
+    def get_weather(city: str) -> str:
+        return f"Sunny in {city}"
+
+    executor = agent.ToolExecutor(
+        [get_weather], max_workers=8, timeouts={"get_weather": 2.0}
+    )
+    app = agent.create_tool_agent(call_model, executor)
+    app.invoke({"messages": [HumanMessage("Weather in Paris and Rome?")]})
+"""
+
+import asyncio
+import inspect
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Mapping, Optional, Union
+
+from langchain_core.messages import ToolMessage
+from langgraph.graph import END, START, MessagesState, StateGraph
+
+from .tool_cache import ToolCache, tool_call_key
+
+# Default number of tool calls run at once
+DEFAULT_MAX_WORKERS = 8
+
+
+@dataclass
+class ToolResult:
+    """
+    Outcome of one tool call.
+
+    Attributes:
+        call_id: Tool call id from the model
+        name: Tool name
+        content: Tool output (None if the call failed)
+        error: Error description, or None on success
+        elapsed: Seconds from the start of the turn until the call finished or timed out
+        cached: Whether the result came from the cache
+    """
+
+    call_id: str
+    name: str
+    content: Any = None
+    error: Optional[str] = None
+    elapsed: float = 0.0
+    cached: bool = False
+
+    def to_message(self) -> ToolMessage:
+        """Convert the result into a ToolMessage answering its tool call."""
+        if self.error is not None:
+            return ToolMessage(
+                content=self.error,
+                tool_call_id=self.call_id,
+                name=self.name,
+                status="error",
+            )
+        content = (
+            self.content if isinstance(self.content, (str, list)) else str(self.content)
+        )
+        return ToolMessage(content=content, tool_call_id=self.call_id, name=self.name)
+
+
+def _tool_name(tool: Any) -> str:
+    return getattr(tool, "name", None) or tool.__name__
+
+
+def _call_fields(call: Any) -> tuple[str, str, dict[str, Any]]:
+    if isinstance(call, Mapping):
+        return call.get("id") or "", call["name"], call.get("args") or {}
+    return getattr(call, "id", "") or "", call.name, getattr(call, "args", {}) or {}
+
+
+class ToolExecutor:
+    """
+    Runs a turn's tool calls concurrently with timeouts and ordered results.
+
+    Tools are plain functions called with the model's arguments as keyword
+    arguments, coroutine functions, or LangChain tools (anything with a
+    name and invoke()/ainvoke()).
+
+    A sync tool that times out cannot be interrupted: its thread keeps
+    running until the tool returns, and counts against max_workers until
+    then.
+
+    Attributes:
+        tools: Tools by name
+        max_workers: Maximum tool calls run at once
+        default_timeout: Seconds allowed per call, unless overridden in timeouts
+        timeouts: Per-tool timeouts in seconds (None disables the timeout)
+        cache: Optional cache for tool results
+    """
+
+    def __init__(
+        self,
+        tools: Union[Mapping[str, Any], Iterable[Any]],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        default_timeout: Optional[float] = None,
+        timeouts: Optional[Mapping[str, Optional[float]]] = None,
+        cache: Optional[ToolCache] = None,
+    ):
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        self.tools = (
+            dict(tools)
+            if isinstance(tools, Mapping)
+            else {_tool_name(t): t for t in tools}
+        )
+        self.max_workers = max_workers
+        self.default_timeout = default_timeout
+        self.timeouts = dict(timeouts or {})
+        self.cache = cache
+        unknown = set(self.timeouts) - set(self.tools)
+        if unknown:
+            raise ValueError(f"Timeouts given for unknown tools: {sorted(unknown)}")
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def timeout_for(self, name: str) -> Optional[float]:
+        """Return the timeout for a tool."""
+        return self.timeouts.get(name, self.default_timeout)
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    self.max_workers, thread_name_prefix="tool"
+                )
+            return self._pool
+
+    def _cache_key(self, name: str, tool: Any, args: dict[str, Any]) -> Optional[str]:
+        """Return the call's cache key, or None if it must not be cached."""
+        if self.cache is None:
+            return None
+        if not self.cache.is_cacheable(name, tool):
+            self.cache.record_bypass(name)
+            return None
+        return tool_call_key(name, args)
+
+    def _invoke(self, tool: Any, args: dict[str, Any]) -> Any:
+        if hasattr(tool, "invoke"):
+            return tool.invoke(args)
+        if inspect.iscoroutinefunction(tool):
+            return asyncio.run(tool(**args))
+        return tool(**args)
+
+    async def _ainvoke(self, tool: Any, args: dict[str, Any]) -> Any:
+        if hasattr(tool, "ainvoke"):
+            return await tool.ainvoke(args)
+        if inspect.iscoroutinefunction(tool):
+            return await tool(**args)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_pool(), lambda: tool(**args))
+
+    async def _cache_io(self, method: Callable[..., Any], *args: Any) -> Any:
+        """Call a ToolCache method, off the event loop when it uses SQLite."""
+        if self.cache.path is None:
+            return method(*args)
+        return await asyncio.to_thread(method, *args)
+
+    def run(self, calls: Iterable[Any]) -> list[ToolResult]:
+        """
+        Run tool calls concurrently and wait for all of them.
+
+        Args:
+            calls: Tool calls as {"name", "args", "id"} dicts (LangChain's
+                AIMessage.tool_calls) or objects with those attributes
+
+        Returns:
+            list: One ToolResult per call, in call order
+        """
+        start = time.perf_counter()
+        pending = []
+        finished: dict[int, float] = {}
+        # Cache key -> (position, future) of the first identical call this turn
+        submitted: dict[str, tuple[int, Any]] = {}
+        results: list[Optional[ToolResult]] = []
+        for call in calls:
+            call_id, name, args = _call_fields(call)
+            tool = self.tools.get(name)
+            if tool is None:
+                results.append(
+                    ToolResult(call_id, name, error=f"Error: unknown tool {name!r}")
+                )
+                continue
+            key = self._cache_key(name, tool, args)
+            if key in submitted:
+                source, future = submitted[key]
+                pending.append((len(results), source, call_id, name, None, future))
+                results.append(None)
+                continue
+            if key is not None:
+                found, value = self.cache.get(name, key)
+                if found:
+                    results.append(
+                        ToolResult(call_id, name, content=value, cached=True)
+                    )
+                    continue
+            future = self._get_pool().submit(self._invoke, tool, args)
+            future.add_done_callback(
+                lambda _, position=len(results): finished.setdefault(
+                    position, time.perf_counter()
+                )
+            )
+            if key is not None:
+                submitted[key] = (len(results), future)
+            pending.append((len(results), len(results), call_id, name, key, future))
+            results.append(None)
+
+        for position, source, call_id, name, key, future in pending:
+            timeout = self.timeout_for(name)
+            remaining = (
+                None
+                if timeout is None
+                else max(0.0, start + timeout - time.perf_counter())
+            )
+            try:
+                content = future.result(remaining)
+            except FutureTimeout:
+                future.cancel()
+                result = ToolResult(
+                    call_id, name, error=f"Error: {name} timed out after {timeout}s"
+                )
+            except Exception as e:
+                result = ToolResult(call_id, name, error=f"Error: {e!r}")
+            else:
+                result = ToolResult(call_id, name, content=content)
+                if key is not None:
+                    self.cache.put(name, key, content)
+            result.elapsed = finished.get(source, time.perf_counter()) - start
+            results[position] = result
+        return results
+
+    async def arun(self, calls: Iterable[Any]) -> list[ToolResult]:
+        """
+        Async version of run(): coroutine tools run on the event loop, sync
+        tools on the thread pool.
+
+        Args:
+            calls: Tool calls, as for run()
+
+        Returns:
+            list: One ToolResult per call, in call order
+        """
+        start = time.perf_counter()
+        limit = asyncio.Semaphore(self.max_workers)
+        # Cache key -> task of the first identical call this turn
+        submitted: dict[str, asyncio.Task] = {}
+
+        async def execute(
+            name: str, tool: Any, args: dict[str, Any]
+        ) -> tuple[Any, Optional[str], float]:
+            async def invoke() -> Any:
+                async with limit:
+                    return await self._ainvoke(tool, args)
+
+            timeout = self.timeout_for(name)
+            try:
+                content, error = await asyncio.wait_for(invoke(), timeout), None
+            except asyncio.TimeoutError:
+                content, error = None, f"Error: {name} timed out after {timeout}s"
+            except Exception as e:
+                content, error = None, f"Error: {e!r}"
+            return content, error, time.perf_counter() - start
+
+        async def execute_cached(
+            name: str, tool: Any, args: dict[str, Any], key: str
+        ) -> tuple[Any, Optional[str], float, bool]:
+            found, value = await self._cache_io(self.cache.get, name, key)
+            if found:
+                return value, None, 0.0, True
+            content, error, elapsed = await execute(name, tool, args)
+            if error is None:
+                await self._cache_io(self.cache.put, name, key, content)
+            return content, error, elapsed, False
+
+        async def run_one(call: Any) -> ToolResult:
+            call_id, name, args = _call_fields(call)
+            tool = self.tools.get(name)
+            if tool is None:
+                return ToolResult(call_id, name, error=f"Error: unknown tool {name!r}")
+            key = self._cache_key(name, tool, args)
+            if key is None:
+                content, error, elapsed = await execute(name, tool, args)
+                return ToolResult(call_id, name, content, error, elapsed)
+            # Registered before the lookup awaits, so identical calls share it
+            task = submitted.get(key)
+            if task is None:
+                task = submitted[key] = asyncio.ensure_future(
+                    execute_cached(name, tool, args, key)
+                )
+            content, error, elapsed, cached = await task
+            return ToolResult(call_id, name, content, error, elapsed, cached)
+
+        return list(await asyncio.gather(*(run_one(call) for call in calls)))
+
+    def close(self) -> None:
+        """Shut down the thread pool, waiting for running tools to finish."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    def __enter__(self) -> "ToolExecutor":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def _tool_calls(state: MessagesState) -> list[Any]:
+    last = state["messages"][-1]
+    return getattr(last, "tool_calls", None) or []
+
+
+def tool_node(
+    executor: ToolExecutor, is_async: bool = False
+) -> Callable[[MessagesState], Any]:
+    """
+    Build a node that runs the last message's tool calls.
+
+    Args:
+        executor: Executor holding the tools
+        is_async: Build a coroutine node for ainvoke/astream
+
+    Returns:
+        Node function returning {"messages": [ToolMessage, ...]} in call order
+    """
+    if is_async:
+
+        async def arun_tools(state: MessagesState) -> dict[str, list[ToolMessage]]:
+            results = await executor.arun(_tool_calls(state))
+            return {"messages": [result.to_message() for result in results]}
+
+        return arun_tools
+
+    def run_tools(state: MessagesState) -> dict[str, list[ToolMessage]]:
+        results = executor.run(_tool_calls(state))
+        return {"messages": [result.to_message() for result in results]}
+
+    return run_tools
+
+
+def route_tools(state: MessagesState) -> str:
+    """Route to the tool node if the model requested tool calls, else finish."""
+    return "tools" if _tool_calls(state) else END
+
+
+def create_tool_agent(
+    call_model: Callable[[MessagesState], Any],
+    executor: ToolExecutor,
+    is_async: bool = False,
+) -> Any:
+    """
+    Create the agent loop: model -> tools -> model until no tool calls remain.
+
+    Args:
+        call_model: Node that calls the model and returns {"messages": [AIMessage]}
+        executor: Executor for the model's tool calls
+        is_async: Use an async tool node (call_model may then be async too)
+
+    Returns:
+        Compiled graph application
+    """
+    graph = StateGraph(MessagesState)
+    graph.add_node("agent", call_model)
+    graph.add_node("tools", tool_node(executor, is_async))
+    graph.add_edge(START, "agent")
+    graph.add_conditional_edges("agent", route_tools, ["tools", END])
+    graph.add_edge("tools", "agent")
+    return graph.compile()
@@ -2,4 +2,20 @@
 Lesson 7: Agent Memory
 
 This lesson demonstrates memory patterns in LangGraph agents.
-""" 
\ No newline at end of file
+"""
+
+from src.modules.introduction.utils.lazy import lazy_exports
+
+__getattr__, __dir__, __all__ = lazy_exports(
+    __name__,
+    {
+        "SqliteCheckpointer": ".checkpointer:SqliteCheckpointer",
+        "CheckpointerStats": ".checkpointer:CheckpointerStats",
+        "ConversationMemory": ".conversation_memory:ConversationMemory",
+        "MemoryStats": ".conversation_memory:MemoryStats",
+        "llm_summarizer": ".conversation_memory:llm_summarizer",
+        "create_memory_chat": ".conversation_memory:create_memory_chat",
+        "get_summary_pool": ".conversation_memory:get_summary_pool",
+        "close_summary_pool": ".conversation_memory:close_summary_pool",
+    },
+)
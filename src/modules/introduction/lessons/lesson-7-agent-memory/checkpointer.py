@@ -0,0 +1,568 @@
+"""
+SQLite Checkpointer
+
+A local LangGraph checkpointer that persists agent memory between runs in a
+SQLite database in WAL mode.
+
+- Deltas: each checkpoint stores only the channels that changed in its
+  superstep, keyed by (channel, version), with versions unique across
+  forks; unchanged channels are shared with earlier checkpoints instead of
+  being copied into every snapshot.
+- Write batching: the pending writes reported by each task during a
+  superstep are buffered and committed together with the superstep's
+  checkpoint in one transaction, instead of one commit per task.
+- O(1) latest load: a per-thread pointer to the newest checkpoint turns
+  "resume this conversation" into primary-key lookups, however long the
+  thread's history is.
+
+Example:
+    from src.modules.introduction.lessons import agent_memory
+
+    with agent_memory.SqliteCheckpointer("memory.sqlite3") as checkpointer:
+        app = graph.compile(checkpointer=checkpointer)
+        config = {"configurable": {"thread_id": "sam"}}
+        app.invoke({"messages": ["Hi, I'm Sam"]}, config)
+
+    # Later, in another process
+    with agent_memory.SqliteCheckpointer("memory.sqlite3") as checkpointer:
+        app = graph.compile(checkpointer=checkpointer)
+        print(app.get_state(config).values)
+"""
+
+import asyncio
+import random
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Iterator, Optional, Sequence, Union
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+)
+
+# Tables, created on first use
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL,
+    checkpoint_id TEXT NOT NULL,
+    parent_id TEXT,
+    type TEXT NOT NULL,
+    checkpoint BLOB NOT NULL,
+    metadata_type TEXT NOT NULL,
+    metadata BLOB NOT NULL,
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+);
+CREATE TABLE IF NOT EXISTS blobs (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL,
+    channel TEXT NOT NULL,
+    version TEXT NOT NULL,
+    type TEXT NOT NULL,
+    value BLOB NOT NULL,
+    PRIMARY KEY (thread_id, checkpoint_ns, channel, version)
+);
+CREATE TABLE IF NOT EXISTS writes (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL,
+    checkpoint_id TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    channel TEXT NOT NULL,
+    type TEXT NOT NULL,
+    value BLOB NOT NULL,
+    task_path TEXT NOT NULL,
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+);
+CREATE TABLE IF NOT EXISTS latest (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL,
+    checkpoint_id TEXT NOT NULL,
+    PRIMARY KEY (thread_id, checkpoint_ns)
+);
+"""
+
+# Serialized type marking a channel that was cleared in a superstep
+_EMPTY = "empty"
+
+
+@dataclass
+class CheckpointerStats:
+    """
+    Storage and write counters for a SqliteCheckpointer.
+
+    Attributes:
+        checkpoints: Checkpoint rows stored
+        blobs: Channel value rows stored
+        writes: Pending write rows stored
+        payload_bytes: Serialized bytes across checkpoints, blobs and writes
+        commits: Transactions committed by this instance
+    """
+
+    checkpoints: int = 0
+    blobs: int = 0
+    writes: int = 0
+    payload_bytes: int = 0
+    commits: int = 0
+
+
+class SqliteCheckpointer(BaseCheckpointSaver):
+    """
+    SQLite (WAL) checkpoint saver with delta storage and batched writes.
+
+    Pending writes are held in memory until the superstep's checkpoint is
+    saved, then committed with it. They are also flushed before any read,
+    when a run is interrupted or fails, and on flush()/close(), so resuming
+    always sees them; only a crash mid-superstep can lose them, in which
+    case the affected tasks simply run again.
+
+    Attributes:
+        path: Database file, or ":memory:"
+        store_deltas: Store changed channels only; False stores a full
+            snapshot of every channel in each checkpoint
+        batch_writes: Commit pending writes with the superstep's checkpoint;
+            False commits each task's writes immediately
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path] = ":memory:",
+        store_deltas: bool = True,
+        batch_writes: bool = True,
+        serde: Any = None,
+    ):
+        super().__init__(serde=serde)
+        self.path = str(path)
+        self.store_deltas = store_deltas
+        self.batch_writes = batch_writes
+        self._lock = threading.RLock()
+        self._pending: list[tuple] = []
+        self._commits = 0
+        self._conn = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None
+        )
+        if self.path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> "SqliteCheckpointer":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Flush buffered writes and close the database."""
+        with self._lock:
+            if self._conn is not None:
+                self.flush()
+                self._conn.close()
+                self._conn = None
+
+    # Writing
+
+    def _commit(self, statements: list[tuple[str, tuple]]) -> None:
+        conn = self._conn
+        conn.execute("BEGIN")
+        try:
+            for sql, params in statements:
+                conn.execute(sql, params)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        self._commits += 1
+
+    def get_next_version(self, current: Optional[str], channel: None) -> str:
+        """
+        Return a channel version that is unique across forks.
+
+        Blobs are keyed by channel version, so plain integer versions would
+        collide when a run forks from an older checkpoint and overwrite the
+        original branch's values. As in InMemorySaver, a random suffix keeps
+        them apart while the zero-padded counter keeps them ordered.
+
+        Args:
+            current: Current version of the channel
+            channel: Unused
+
+        Returns:
+            str: The next version
+        """
+        if current is None:
+            current_v = 0
+        elif isinstance(current, int):
+            current_v = current
+        else:
+            current_v = int(current.split(".")[0])
+        return f"{current_v + 1:032}.{random.random():016}"
+
+    def flush(self) -> None:
+        """Commit buffered pending writes."""
+        with self._lock:
+            if self._pending:
+                pending, self._pending = self._pending, []
+                self._commit(pending)
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """
+        Save a checkpoint, together with the writes buffered since the last one.
+
+        Args:
+            config: Config of the parent checkpoint
+            checkpoint: Checkpoint to save
+            metadata: Checkpoint metadata
+            new_versions: Channel versions that changed in this superstep
+
+        Returns:
+            RunnableConfig: Config pointing at the saved checkpoint
+        """
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = checkpoint["id"]
+
+        statements = []
+        stored = dict(checkpoint)
+        if self.store_deltas:
+            values = stored.pop("channel_values")
+            for channel, version in new_versions.items():
+                type_, value = (
+                    self.serde.dumps_typed(values[channel])
+                    if channel in values
+                    else (_EMPTY, b"")
+                )
+                statements.append(
+                    (
+                        "INSERT OR IGNORE INTO blobs VALUES (?, ?, ?, ?, ?, ?)",
+                        (thread_id, checkpoint_ns, channel, str(version), type_, value),
+                    )
+                )
+        type_, data = self.serde.dumps_typed(stored)
+        metadata_type, metadata_data = self.serde.dumps_typed(
+            get_checkpoint_metadata(config, metadata)
+        )
+        statements.append(
+            (
+                "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    thread_id,
+                    checkpoint_ns,
+                    checkpoint_id,
+                    config["configurable"].get("checkpoint_id"),
+                    type_,
+                    data,
+                    metadata_type,
+                    metadata_data,
+                ),
+            )
+        )
+        statements.append(
+            (
+                "INSERT OR REPLACE INTO latest VALUES (?, ?, ?)",
+                (thread_id, checkpoint_ns, checkpoint_id),
+            )
+        )
+
+        with self._lock:
+            pending, self._pending = self._pending, []
+            self._commit(pending + statements)
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint_id,
+            }
+        }
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """
+        Record a task's writes for the checkpoint in config.
+
+        Args:
+            config: Config of the checkpoint the task ran from
+            writes: (channel, value) pairs
+            task_id: Task identifier
+            task_path: Task path
+        """
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+
+        statements = []
+        special = False
+        for position, (channel, value) in enumerate(writes):
+            idx = WRITES_IDX_MAP.get(channel, position)
+            special = special or channel in WRITES_IDX_MAP
+            type_, data = self.serde.dumps_typed(value)
+            # Special writes (errors, interrupts) overwrite; regular writes
+            # are never replaced once stored
+            verb = "INSERT OR REPLACE" if idx < 0 else "INSERT OR IGNORE"
+            statements.append(
+                (
+                    f"{verb} INTO writes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        thread_id,
+                        checkpoint_ns,
+                        checkpoint_id,
+                        task_id,
+                        idx,
+                        channel,
+                        type_,
+                        data,
+                        task_path,
+                    ),
+                )
+            )
+
+        with self._lock:
+            self._pending.extend(statements)
+            # Errors and interrupts end the run without another checkpoint
+            if not self.batch_writes or special:
+                self.flush()
+
+    def delete_thread(self, thread_id: str) -> None:
+        """Delete every checkpoint, value and write for a thread."""
+        with self._lock:
+            self.flush()
+            self._commit(
+                [
+                    (f"DELETE FROM {table} WHERE thread_id = ?", (thread_id,))
+                    for table in ("checkpoints", "blobs", "writes", "latest")
+                ]
+            )
+
+    # Reading
+
+    def _load_tuple(
+        self, thread_id: str, checkpoint_ns: str, row: tuple
+    ) -> CheckpointTuple:
+        checkpoint_id, parent_id, type_, data, metadata_type, metadata_data = row
+        checkpoint = self.serde.loads_typed((type_, data))
+        if "channel_values" not in checkpoint:
+            checkpoint["channel_values"] = self._load_values(
+                thread_id, checkpoint_ns, checkpoint["channel_versions"]
+            )
+        writes = self._conn.execute(
+            "SELECT task_id, channel, type, value FROM writes"
+            " WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?"
+            " ORDER BY task_path, task_id, idx",
+            (thread_id, checkpoint_ns, checkpoint_id),
+        ).fetchall()
+        return CheckpointTuple(
+            config={
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": checkpoint_id,
+                }
+            },
+            checkpoint=checkpoint,
+            metadata=self.serde.loads_typed((metadata_type, metadata_data)),
+            parent_config=(
+                {
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": parent_id,
+                    }
+                }
+                if parent_id
+                else None
+            ),
+            pending_writes=[
+                (task, channel, self.serde.loads_typed((t, v)))
+                for task, channel, t, v in writes
+            ],
+        )
+
+    def _load_values(
+        self, thread_id: str, checkpoint_ns: str, versions: ChannelVersions
+    ) -> dict[str, Any]:
+        values = {}
+        for channel, version in versions.items():
+            row = self._conn.execute(
+                "SELECT type, value FROM blobs"
+                " WHERE thread_id = ? AND checkpoint_ns = ?"
+                " AND channel = ? AND version = ?",
+                (thread_id, checkpoint_ns, channel, str(version)),
+            ).fetchone()
+            if row is not None and row[0] != _EMPTY:
+                values[channel] = self.serde.loads_typed(row)
+        return values
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        """
+        Load a checkpoint: the one named in config, else the thread's latest.
+
+        Args:
+            config: Config with a thread_id and optionally a checkpoint_id
+
+        Returns:
+            CheckpointTuple: The checkpoint, or None if there is none
+        """
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        with self._lock:
+            self.flush()
+            checkpoint_id = get_checkpoint_id(config)
+            if checkpoint_id is None:
+                row = self._conn.execute(
+                    "SELECT checkpoint_id FROM latest"
+                    " WHERE thread_id = ? AND checkpoint_ns = ?",
+                    (thread_id, checkpoint_ns),
+                ).fetchone()
+                if row is None:
+                    return None
+                checkpoint_id = row[0]
+            row = self._conn.execute(
+                "SELECT checkpoint_id, parent_id, type, checkpoint,"
+                " metadata_type, metadata FROM checkpoints"
+                " WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                (thread_id, checkpoint_ns, checkpoint_id),
+            ).fetchone()
+            return (
+                self._load_tuple(thread_id, checkpoint_ns, row)
+                if row is not None
+                else None
+            )
+
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        """
+        List checkpoints, newest first.
+
+        Args:
+            config: Restrict to a thread (and namespace or checkpoint_id)
+            filter: Metadata fields that must match
+            before: Only checkpoints older than this one
+            limit: Maximum checkpoints to return
+
+        Yields:
+            CheckpointTuple: Matching checkpoints
+        """
+        clauses, params = [], []
+        configurable = (config or {}).get("configurable", {})
+        for key in ("thread_id", "checkpoint_ns", "checkpoint_id"):
+            if configurable.get(key) is not None:
+                clauses.append(f"{key} = ?")
+                params.append(configurable[key])
+        if before is not None and get_checkpoint_id(before):
+            clauses.append("checkpoint_id < ?")
+            params.append(get_checkpoint_id(before))
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        with self._lock:
+            self.flush()
+            rows = self._conn.execute(
+                "SELECT thread_id, checkpoint_ns, checkpoint_id, parent_id, type,"
+                f" checkpoint, metadata_type, metadata FROM checkpoints{where}"
+                " ORDER BY checkpoint_id DESC",
+                params,
+            ).fetchall()
+            results = []
+            for thread_id, checkpoint_ns, *row in rows:
+                if limit is not None and len(results) >= limit:
+                    break
+                if filter:
+                    metadata = self.serde.loads_typed((row[4], row[5]))
+                    if any(metadata.get(key) != value for key, value in filter.items()):
+                        continue
+                results.append(self._load_tuple(thread_id, checkpoint_ns, tuple(row)))
+        yield from results
+
+    def stats(self) -> CheckpointerStats:
+        """Return row counts, serialized payload size and commit count."""
+        with self._lock:
+            self.flush()
+            counts = [
+                self._conn.execute(
+                    f"SELECT COUNT(*), COALESCE(SUM({size}), 0) FROM {table}"
+                ).fetchone()
+                for table, size in (
+                    ("checkpoints", "LENGTH(checkpoint) + LENGTH(metadata)"),
+                    ("blobs", "LENGTH(value)"),
+                    ("writes", "LENGTH(value)"),
+                )
+            ]
+            return CheckpointerStats(
+                checkpoints=counts[0][0],
+                blobs=counts[1][0],
+                writes=counts[2][0],
+                payload_bytes=sum(size for _, size in counts),
+                commits=self._commits,
+            )
+
+    # Async API, run on the default executor
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        """Async version of get_tuple()."""
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        """Async version of list()."""
+        results = await asyncio.to_thread(
+            lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+        )
+        for result in results:
+            yield result
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Async version of put()."""
+        return await asyncio.to_thread(
+            self.put, config, checkpoint, metadata, new_versions
+        )
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """Async version of put_writes()."""
+        await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        """Async version of delete_thread()."""
+        await asyncio.to_thread(self.delete_thread, thread_id)
@@ -0,0 +1,625 @@
+"""
+Conversation Memory
+
+A bounded message history for long-running conversations. Recent messages
+live in a deque, so appending a turn and evicting the oldest are O(1); the
+token total is updated incrementally as messages enter and leave instead of
+being recounted; and evicted messages are folded into a running summary on
+a background thread. Per-turn cost and memory stay constant however long
+the conversation runs.
+
+This replaces the pattern of keeping every message in the graph state and
+re-slicing it each turn (messages[-max_messages:]), which copies and
+recounts the whole history on every call.
+
+Example:
+    from src.modules.introduction.lessons import agent_memory
+    from src.modules.introduction.utils.fake_llm import FakeLLM
+
+    memory = agent_memory.ConversationMemory(
+        max_messages=10,
+        max_tokens=2000,
+        summarizer=agent_memory.llm_summarizer(FakeLLM()),
+    )
+    memory.append({"role": "system", "content": "You are a helpful assistant."})
+    memory.append({"role": "user", "content": "Hi, I'm Sam"})
+    print(memory.render())
+    print(memory.stats())
+"""
+
+import hashlib
+import json
+import queue
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, TypedDict
+
+from langgraph.graph import END, START, StateGraph
+
+# Rough characters-per-token ratio used by the default token counter
+CHARS_PER_TOKEN = 4
+
+# Default evicted messages allowed to wait for summarization before append() blocks
+DEFAULT_MAX_PENDING = 64
+
+# Default token budget for the memory chat graph's context
+DEFAULT_CHAT_MAX_TOKENS = 2000
+
+# Threads in the process-wide summarizer pool used by memory chat graphs
+DEFAULT_SUMMARY_WORKERS = 2
+
+# Background summaries a memory chat graph keeps until a later turn uses them
+DEFAULT_SUMMARY_RESULTS = 1024
+
+# Summarizer signature: (previous summary, evicted messages) -> new summary
+Summarizer = Callable[[str, list[Any]], str]
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the tokens in a text from its length."""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def message_role(message: Any) -> str:
+    """Return a message's role: a dict's "role", a message's type, or "user"."""
+    if isinstance(message, dict):
+        return message.get("role", "user")
+    return getattr(message, "type", "user")
+
+
+def message_content(message: Any) -> str:
+    """Return a message's text content."""
+    if isinstance(message, dict):
+        return str(message.get("content", ""))
+    return str(getattr(message, "content", message))
+
+
+def llm_summarizer(llm: Any, max_words: int = 100) -> Summarizer:
+    """
+    Build a summarizer that asks a model to fold evicted messages into the summary.
+
+    Replies longer than max_words are truncated, so the summary stays
+    bounded even if the model ignores the instruction.
+
+    Args:
+        llm: Model with a generate(prompt) method, such as FakeLLM or LLMClient
+        max_words: Target summary length
+
+    Returns:
+        Summarizer: Function for ConversationMemory(summarizer=...)
+    """
+
+    def summarize(summary: str, evicted: list[Any]) -> str:
+        transcript = "\n".join(
+            f"{message_role(m)}: {message_content(m)}" for m in evicted
+        )
+        reply = llm.generate(
+            f"Update the conversation summary in at most {max_words} words.\n"
+            f"Current summary: {summary or '(none)'}\n"
+            f"New messages:\n{transcript}"
+        )
+        return " ".join(reply.split()[:max_words])
+
+    return summarize
+
+
+def summary_message(summary: str) -> dict[str, str]:
+    """Return the system message that carries a conversation summary."""
+    return {"role": "system", "content": f"Summary of earlier conversation: {summary}"}
+
+
+class MemorySnapshot(TypedDict):
+    """
+    Serializable state of a ConversationMemory, for storing in graph state.
+
+    Attributes:
+        system: Pinned system messages
+        summary: Summary of evicted messages
+        pending: Evicted messages not yet summarized
+        messages: Recent messages, oldest first
+    """
+
+    system: list[Any]
+    summary: str
+    pending: list[Any]
+    messages: list[Any]
+
+
+@dataclass
+class MemoryStats:
+    """
+    Counters for a ConversationMemory.
+
+    Attributes:
+        messages: Recent messages held
+        tokens: Tokens in system messages, summary and recent messages
+        evicted: Messages evicted so far
+        summarized: Evicted messages folded into the summary
+        pending: Evicted messages waiting for the summarizer
+    """
+
+    messages: int = 0
+    tokens: int = 0
+    evicted: int = 0
+    summarized: int = 0
+    pending: int = 0
+
+
+class ConversationMemory:
+    """
+    Bounded conversation history with incremental token counts and summaries.
+
+    System messages are pinned and never evicted. Other messages are kept
+    until there are more than max_messages or the token total exceeds
+    max_tokens; the oldest are then evicted and, if a summarizer is given,
+    summarized in the background. Without a summarizer evicted messages
+    are dropped.
+
+    Attributes:
+        max_messages: Maximum recent (non-system) messages kept
+        max_tokens: Token budget for system messages, summary and recent messages
+        max_pending: Evicted messages allowed to wait for the summarizer
+            before append() blocks, which bounds memory when the
+            summarizer is slower than the conversation
+        executor: Executor that runs background summaries, e.g. one pool
+            shared by many memories; without one, each memory starts its
+            own summarizer thread
+    """
+
+    def __init__(
+        self,
+        max_messages: int = 10,
+        max_tokens: Optional[int] = None,
+        summarizer: Optional[Summarizer] = None,
+        count_tokens: Callable[[str], int] = estimate_tokens,
+        background: bool = True,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        executor: Optional[Executor] = None,
+    ):
+        if max_messages < 1:
+            raise ValueError(f"max_messages must be at least 1, got {max_messages}")
+        self.max_messages = max_messages
+        self.max_tokens = max_tokens
+        self.max_pending = max_pending
+        self.summarizer = summarizer
+        self.count_tokens = count_tokens
+        self.background = background and summarizer is not None
+        self.executor = executor
+
+        self._lock = threading.Lock()
+        self._system: list[Any] = []
+        self._system_tokens = 0
+        # Recent messages as (message, tokens), oldest on the left
+        self._recent: deque[tuple[Any, int]] = deque()
+        self._recent_tokens = 0
+        self._summary = ""
+        self._summary_tokens = 0
+        self._evicted = 0
+        self._summarized = 0
+        # Evicted messages waiting for the summarizer, oldest on the left
+        self._pending: deque[Any] = deque()
+        self._pending_space = threading.Semaphore(max_pending)
+        self._wakeup: "queue.SimpleQueue[bool]" = queue.SimpleQueue()
+        self._idle = threading.Condition(self._lock)
+        self._summarizing = False
+        self._error: Optional[BaseException] = None
+        self._worker: Optional[threading.Thread] = None
+
+    # Writing
+
+    def append(self, message: Any) -> None:
+        """
+        Add a message, evicting the oldest recent messages if over budget.
+
+        Args:
+            message: A {"role", "content"} dict, a LangChain message or a string
+
+        Raises:
+            Exception: The summarizer's error, if the last background summary failed
+        """
+        tokens = self.count_tokens(message_content(message))
+        with self._lock:
+            self._raise_error()
+            if message_role(message) == "system":
+                self._system.append(message)
+                self._system_tokens += tokens
+            else:
+                self._recent.append((message, tokens))
+                self._recent_tokens += tokens
+            evicted = self._evict()
+        self._schedule(evicted)
+
+    def extend(self, messages: list[Any]) -> None:
+        """Append several messages in order."""
+        for message in messages:
+            self.append(message)
+
+    def _evict(self) -> list[Any]:
+        evicted = []
+        while self._recent and (
+            len(self._recent) > self.max_messages
+            # Always keep the newest message, even if it alone is over budget
+            or (
+                self.max_tokens is not None
+                and self._total_tokens() > self.max_tokens
+                and len(self._recent) > 1
+            )
+        ):
+            message, tokens = self._recent.popleft()
+            self._recent_tokens -= tokens
+            evicted.append(message)
+        self._evicted += len(evicted)
+        return evicted
+
+    def _total_tokens(self) -> int:
+        return self._system_tokens + self._summary_tokens + self._recent_tokens
+
+    def _schedule(self, evicted: list[Any]) -> None:
+        if not evicted or self.summarizer is None:
+            return
+        if not self.background:
+            with self._lock:
+                self._pending.extend(evicted)
+            self._summarize_pending()
+            return
+        for message in evicted:
+            # Blocks while max_pending messages are already waiting
+            self._pending_space.acquire()
+            with self._lock:
+                self._pending.append(message)
+        if self.executor is not None:
+            # A summary already running picks these up when it finishes
+            self.executor.submit(self._summarize_pending)
+            return
+        if self._worker is None:
+            self._start_worker()
+        self._wakeup.put(True)
+
+    def _start_worker(self) -> None:
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run_worker, name="memory-summarizer", daemon=True
+                )
+                self._worker.start()
+
+    def _run_worker(self) -> None:
+        while self._wakeup.get():
+            self._summarize_pending()
+
+    def _summarize_pending(self) -> None:
+        with self._lock:
+            if not self._pending or self._summarizing:
+                return
+            batch = list(self._pending)
+            summary = self._summary
+            self._summarizing = True
+        try:
+            new_summary = self.summarizer(summary, batch)
+        except BaseException as e:
+            new_summary, error = summary, e
+        else:
+            error = None
+        with self._lock:
+            for _ in batch:
+                self._pending.popleft()
+            if error is None:
+                self._summary = new_summary
+                self._summary_tokens = self._count_summary(new_summary)
+                self._summarized += len(batch)
+            else:
+                self._error = error
+            self._summarizing = False
+            self._idle.notify_all()
+            resubmit = (
+                self.background and self.executor is not None and bool(self._pending)
+            )
+        if self.background:
+            for _ in batch:
+                self._pending_space.release()
+        if resubmit:
+            self.executor.submit(self._summarize_pending)
+
+    def _count_summary(self, summary: str) -> int:
+        return self.count_tokens(summary_message(summary)["content"]) if summary else 0
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every evicted message has been summarized.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            bool: True if the summary is up to date
+
+        Raises:
+            Exception: The summarizer's error, if a background summary failed
+        """
+        with self._lock:
+            done = self._idle.wait_for(
+                lambda: not self._pending and not self._summarizing, timeout
+            )
+            self._raise_error()
+            return done
+
+    def close(self) -> None:
+        """Finish pending summaries and stop the background thread."""
+        if self.executor is not None and self.background:
+            self.wait()
+        worker, self._worker = self._worker, None
+        if worker is not None:
+            self._wakeup.put(True)
+            self._wakeup.put(False)
+            worker.join()
+
+    def __enter__(self) -> "ConversationMemory":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    # Reading
+
+    @property
+    def summary(self) -> str:
+        """Summary of the evicted messages summarized so far."""
+        return self._summary
+
+    @property
+    def token_count(self) -> int:
+        """Tokens in system messages, summary and recent messages."""
+        return self._total_tokens()
+
+    def __len__(self) -> int:
+        return len(self._recent)
+
+    def messages(self) -> list[Any]:
+        """
+        Return the context to send to a model.
+
+        Returns:
+            list: System messages, then the summary as a system message (if
+            any), then the recent messages, oldest first
+        """
+        with self._lock:
+            summary = [summary_message(self._summary)] if self._summary else []
+            return self._system + summary + [message for message, _ in self._recent]
+
+    def render(self) -> str:
+        """Return the context as a "role: content" transcript, one message per line."""
+        return "\n".join(
+            f"{message_role(m)}: {message_content(m)}" for m in self.messages()
+        )
+
+    def stats(self) -> MemoryStats:
+        """Return a snapshot of the memory's counters."""
+        with self._lock:
+            return MemoryStats(
+                messages=len(self._recent),
+                tokens=self._total_tokens(),
+                evicted=self._evicted,
+                summarized=self._summarized,
+                pending=len(self._pending),
+            )
+
+    # Persistence
+
+    def snapshot(self) -> MemorySnapshot:
+        """
+        Capture the memory's contents, e.g. to store in graph state.
+
+        The snapshot's size is bounded by max_messages and max_pending, not
+        by the conversation's length.
+        """
+        with self._lock:
+            return MemorySnapshot(
+                system=list(self._system),
+                summary=self._summary,
+                pending=list(self._pending),
+                messages=[message for message, _ in self._recent],
+            )
+
+    @classmethod
+    def from_snapshot(
+        cls, snapshot: MemorySnapshot, **options: Any
+    ) -> "ConversationMemory":
+        """
+        Rebuild a memory from snapshot(); unsummarized messages are summarized again.
+
+        Args:
+            snapshot: Result of snapshot()
+            **options: ConversationMemory options
+
+        Returns:
+            ConversationMemory: The restored memory
+        """
+        memory = cls(**options)
+        with memory._lock:
+            memory._summary = snapshot["summary"]
+            memory._summary_tokens = memory._count_summary(memory._summary)
+        memory.extend(snapshot["system"])
+        memory._schedule(list(snapshot["pending"]))
+        memory.extend(snapshot["messages"])
+        return memory
+
+
+class ChatState(TypedDict, total=False):
+    """
+    State for the memory chat graph.
+
+    Attributes:
+        message: Latest user message
+        response: Latest assistant response
+        memory: Snapshot of the thread's conversation memory
+    """
+
+    message: str
+    response: str
+    memory: MemorySnapshot
+
+
+# Summarizer pool shared by memory chat graphs that are not given an executor
+_summary_pool: Optional[ThreadPoolExecutor] = None
+_summary_pool_lock = threading.Lock()
+
+
+def get_summary_pool() -> ThreadPoolExecutor:
+    """
+    Return the process-wide summarizer pool, creating it on first use.
+
+    Returns:
+        ThreadPoolExecutor: Pool of DEFAULT_SUMMARY_WORKERS threads
+    """
+    global _summary_pool
+    with _summary_pool_lock:
+        if _summary_pool is None:
+            _summary_pool = ThreadPoolExecutor(
+                DEFAULT_SUMMARY_WORKERS, thread_name_prefix="memory-summarizer"
+            )
+        return _summary_pool
+
+
+def close_summary_pool() -> None:
+    """Shut down the process-wide summarizer pool, waiting for running work."""
+    global _summary_pool
+    with _summary_pool_lock:
+        pool, _summary_pool = _summary_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True)
+
+
+def _batch_key(summary: str, batch: list[Any]) -> str:
+    payload = json.dumps([summary, batch], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class _SummaryResults:
+    """
+    Background summaries kept until a later turn folds them into its memory.
+
+    Turns snapshot their memory without waiting for the summarizer, so the
+    checkpoint still lists the evicted messages as pending. The summary is
+    recorded here under (previous summary, batch) and applied by the next
+    turn that restores a snapshot with that summary and pending batch. A
+    batch already being summarized is not summarized twice.
+    """
+
+    def __init__(self, summarizer: Summarizer, maxsize: int):
+        self.summarizer = summarizer
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._results: "OrderedDict[str, Future]" = OrderedDict()
+
+    def __call__(self, summary: str, batch: list[Any]) -> str:
+        key = _batch_key(summary, batch)
+        with self._lock:
+            future = self._results.get(key)
+            running = future is not None
+            if not running:
+                future = self._results[key] = Future()
+                while len(self._results) > self.maxsize:
+                    self._results.popitem(last=False)
+        if running:
+            return future.result()
+        try:
+            new_summary = self.summarizer(summary, batch)
+        except BaseException as e:
+            # Forget the failure so a later turn tries again
+            with self._lock:
+                self._results.pop(key, None)
+            future.set_exception(e)
+            raise
+        future.set_result(new_summary)
+        return new_summary
+
+    def catch_up(self, snapshot: MemorySnapshot) -> MemorySnapshot:
+        """Return the snapshot with finished summaries of pending messages applied."""
+        summary, pending = snapshot["summary"], list(snapshot["pending"])
+        applied = True
+        while pending and applied:
+            applied = False
+            # Batches start at the oldest pending message; try the longest first
+            for size in range(len(pending), 0, -1):
+                with self._lock:
+                    future = self._results.get(_batch_key(summary, pending[:size]))
+                if future is not None and future.done() and future.exception() is None:
+                    summary, pending = future.result(), pending[size:]
+                    applied = True
+                    break
+        return MemorySnapshot(
+            system=snapshot["system"],
+            summary=summary,
+            pending=pending,
+            messages=snapshot["messages"],
+        )
+
+
+def create_memory_chat(
+    llm: Any = None,
+    checkpointer: Any = None,
+    executor: Optional[Executor] = None,
+    **memory_options: Any,
+) -> Any:
+    """
+    Create a chat graph whose conversation memory lives in the graph state.
+
+    Each turn rebuilds a ConversationMemory from the thread's checkpointed
+    snapshot, so the graph keeps nothing per thread in process (memory
+    stays constant however many conversations it serves) and resuming from
+    any checkpoint, including an older one, sees that checkpoint's memory.
+    Evicted messages are summarized in the background on a shared
+    executor: a turn never waits for the summarizer, its checkpoint lists
+    the messages as pending, and a later turn folds in the finished summary.
+
+    Args:
+        llm: Model with a generate(prompt) method (defaults to the offline FakeLLM)
+        checkpointer: Checkpoint saver, e.g. SqliteCheckpointer
+        executor: Executor for background summaries; defaults to the
+            process-wide pool from get_summary_pool(). The caller owns it.
+        **memory_options: ConversationMemory options; summarizer defaults to
+            llm_summarizer(llm) and max_tokens to DEFAULT_CHAT_MAX_TOKENS
+
+    Returns:
+        Compiled graph application; invoke it with a thread_id in configurable
+    """
+    if llm is None:
+        from src.modules.introduction.utils.fake_llm import FakeLLM
+
+        llm = FakeLLM()
+    memory_options.setdefault("summarizer", llm_summarizer(llm))
+    memory_options.setdefault("max_tokens", DEFAULT_CHAT_MAX_TOKENS)
+    memory_options["executor"] = (
+        executor if executor is not None else get_summary_pool()
+    )
+    results = None
+    if memory_options["summarizer"] is not None:
+        results = _SummaryResults(memory_options["summarizer"], DEFAULT_SUMMARY_RESULTS)
+        memory_options["summarizer"] = results
+
+    def respond(state: ChatState) -> dict[str, Any]:
+        snapshot = state.get("memory")
+        if snapshot and results is not None:
+            snapshot = results.catch_up(snapshot)
+        memory = (
+            ConversationMemory.from_snapshot(snapshot, **memory_options)
+            if snapshot
+            else ConversationMemory(**memory_options)
+        )
+        memory.append({"role": "user", "content": state["message"]})
+        response = llm.generate(memory.render())
+        memory.append({"role": "assistant", "content": response})
+        return {"response": response, "memory": memory.snapshot()}
+
+    graph = StateGraph(ChatState)
+    graph.add_node("respond", respond)
+    graph.add_edge(START, "respond")
+    graph.add_edge("respond", END)
+    return graph.compile(checkpointer=checkpointer)
@@ -3,4 +3,31 @@ Lesson 2: Simple Graph
 
 This lesson demonstrates creating a simple graph with basic nodes and edges.
 The implementation is in the parent directory as simple_graph.py
-""" 
\ No newline at end of file
+"""
+
+from src.modules.introduction.utils.lazy import lazy_exports
+
+__getattr__, __dir__, __all__ = lazy_exports(
+    __name__,
+    {
+        name: f".simple_graph:{name}"
+        for name in [
+            "GraphState",
+            "BatchGraphState",
+            "CompactGraphState",
+            "generate_response",
+            "process_message",
+            "process_message_delta",
+            "aprocess_message",
+            "process_messages",
+            "respond_to_messages",
+            "build_simple_graph",
+            "create_simple_graph",
+            "create_async_simple_graph",
+            "create_batch_graph",
+            "create_compact_graph",
+            "invoke_batch",
+            "ainvoke_many",
+        ]
+    },
+)
@@ -6,7 +6,16 @@ created in simple_graph.py. It shows various ways to interact with the
 compiled graph application.
 """
 
-from simple_graph import create_simple_graph, GraphState
+import asyncio
+import time
+
+from simple_graph import (
+    GraphState,
+    ainvoke_many,
+    create_async_simple_graph,
+    create_simple_graph,
+    invoke_batch,
+)
 
 
 def basic_usage_example():
@@ -95,6 +104,107 @@ def streaming_example():
     print()
 
 
+def batch_example(total_messages: int = 2000):
+    """
+    Demonstrate batch invocation and compare its throughput with a
+    sequential invoke loop.
+
+    Args:
+        total_messages: Number of messages to push through the graph
+    """
+    print("📦 Batch Invocation Example")
+    print("=" * 40)
+
+    app = create_simple_graph()
+
+    messages = [
+        "Hello there!",
+        "Help me with something",
+        "This is a regular message",
+        "",
+    ]
+    states: list[GraphState] = [
+        {"message": messages[i % len(messages)], "response": ""}
+        for i in range(total_messages)
+    ]
+
+    # Sequential baseline: one invoke per message
+    start = time.perf_counter()
+    sequential_results = [app.invoke(state) for state in states]
+    sequential_time = time.perf_counter() - start
+    print(f"Sequential loop: {total_messages / sequential_time:,.0f} msg/s")
+
+    # Batch runs on thread and process pools
+    for executor in ("thread", "process"):
+        start = time.perf_counter()
+        results = invoke_batch(
+            states,
+            app=app if executor == "thread" else None,
+            executor=executor,
+            chunk_size=128,
+        )
+        elapsed = time.perf_counter() - start
+        assert results == sequential_results
+        print(
+            f"Batch ({executor} pool): {total_messages / elapsed:,.0f} msg/s "
+            f"({sequential_time / elapsed:.2f}x vs sequential)"
+        )
+
+    print()
+
+
+def async_example(total_messages: int = 2000):
+    """
+    Demonstrate async streaming and concurrent ainvoke fan-out, and compare
+    throughput with the threaded sync batch path.
+
+    Args:
+        total_messages: Number of messages to push through the graph
+    """
+    print("⚡ Async Example")
+    print("=" * 40)
+
+    app = create_async_simple_graph()
+
+    async def stream_one():
+        async for chunk in app.astream(
+            {"message": "Hello, async world!", "response": ""}
+        ):
+            print(f"  → {chunk['process_message']['response']}")
+
+    asyncio.run(stream_one())
+
+    messages = [
+        "Hello there!",
+        "Help me with something",
+        "This is a regular message",
+        "",
+    ]
+    states: list[GraphState] = [
+        {"message": messages[i % len(messages)], "response": ""}
+        for i in range(total_messages)
+    ]
+
+    # Threaded sync path
+    sync_app = create_simple_graph()
+    start = time.perf_counter()
+    threaded_results = invoke_batch(states, app=sync_app, chunk_size=128)
+    threaded_time = time.perf_counter() - start
+    print(f"Threaded invoke_batch: {total_messages / threaded_time:,.0f} msg/s")
+
+    # Async path with bounded concurrency
+    start = time.perf_counter()
+    async_results = asyncio.run(ainvoke_many(states, app=app, concurrency=256))
+    async_time = time.perf_counter() - start
+    assert async_results == threaded_results
+    print(
+        f"Async ainvoke_many: {total_messages / async_time:,.0f} msg/s "
+        f"({threaded_time / async_time:.2f}x vs threaded)"
+    )
+
+    print()
+
+
 def error_handling_example():
     """
     Demonstrate error handling with the graph application.
@@ -134,6 +244,8 @@ def main():
     basic_usage_example()
     multiple_messages_example()
     streaming_example()
+    batch_example()
+    async_example()
     error_handling_example()
     
     print("🎉 All examples completed!")
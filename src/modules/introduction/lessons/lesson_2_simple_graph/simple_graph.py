@@ -10,9 +10,23 @@ This module demonstrates the fundamental concepts of LangGraph:
 This serves as the foundation for more complex LangGraph applications.
 """
 
-from typing import TypedDict
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Iterable, Iterator, Literal, Optional, Sequence, TypedDict
+
 from langgraph.graph import StateGraph
 
+from src.modules.introduction.graphs.cache import compile_cached
+
+# Default number of states handed to a worker in a single task
+DEFAULT_CHUNK_SIZE = 64
+
+# Default number of concurrent ainvoke calls allowed by ainvoke_many
+DEFAULT_CONCURRENCY = 256
+
 
 class GraphState(TypedDict):
     """
@@ -26,6 +40,37 @@ class GraphState(TypedDict):
     response: str
 
 
+class BatchGraphState(TypedDict):
+    """
+    Column-oriented state schema for processing many messages at once.
+
+    Attributes:
+        messages: The input messages, one per row
+        responses: The responses, aligned with messages
+    """
+
+    messages: list[str]
+    responses: list[str]
+
+
+@dataclass(slots=True)
+class CompactGraphState:
+    """
+    Compact, slotted alternative to GraphState for high-volume runs.
+
+    Instances have no per-object __dict__, so each state costs a fixed
+    two-pointer object instead of a hash table. LangGraph accepts dataclass
+    schemas directly; nodes read attributes and return only changed fields.
+
+    Attributes:
+        message: The input message from the user
+        response: The response generated by the graph
+    """
+
+    message: str = ""
+    response: str = ""
+
+
 def create_state_schema() -> type[GraphState]:
     """
     Create and return the state schema for the graph.
@@ -54,21 +99,117 @@ def process_message(state: GraphState) -> GraphState:
     # Extract the message from the current state
     message = state.get("message", "")
     
+    # Return updated state
+    return {"message": message, "response": generate_response(message)}
+
+
+def generate_response(message: str) -> str:
+    """
+    Generate the response for a single message.
+
+    Args:
+        message: The input message
+
+    Returns:
+        str: The response text
+    """
     # Simple processing logic (placeholder for future LLM integration)
     if not message:
-        response = "No message provided."
-    elif message.lower().startswith("hello"):
-        response = f"Hello! I received your message: '{message}'"
-    elif message.lower().startswith("help"):
-        response = "I'm here to help! What would you like to know?"
-    else:
-        response = f"I processed your message: '{message}'. This is a simple response."
-    
-    # Return updated state
-    return {
-        "message": message,
-        "response": response
-    }
+        return "No message provided."
+
+    lowered = message.lower()
+    if lowered.startswith("hello"):
+        return f"Hello! I received your message: '{message}'"
+    if lowered.startswith("help"):
+        return "I'm here to help! What would you like to know?"
+    return f"I processed your message: '{message}'. This is a simple response."
+
+
+def process_message_delta(state: CompactGraphState) -> dict:
+    """
+    Node function for CompactGraphState that returns only the changed field.
+
+    The message is unchanged by this node, so it is not copied into the
+    update; LangGraph merges the delta into the existing state.
+
+    Args:
+        state: The current compact graph state
+
+    Returns:
+        dict: Update containing only the response field
+    """
+    return {"response": generate_response(state.message)}
+
+
+async def aprocess_message(state: GraphState) -> GraphState:
+    """
+    Async variant of process_message.
+
+    LangGraph runs sync nodes in a thread pool when the graph is invoked
+    with ainvoke/astream. Registering a coroutine node instead keeps the
+    whole run on the event loop, and gives future I/O-bound nodes (such as
+    LLM calls) a place to await.
+
+    Args:
+        state: The current graph state containing message and response
+
+    Returns:
+        dict: Updated state with the response field populated
+    """
+    return process_message(state)
+
+
+def _as_message_list(messages: Sequence[Any]) -> list[Any]:
+    """
+    Convert a column of messages into a plain Python list.
+
+    Accepts lists and tuples as well as NumPy arrays (``tolist``) and
+    Arrow arrays (``to_pylist``) without importing either library.
+
+    Args:
+        messages: Column of messages
+
+    Returns:
+        list: The messages as Python objects
+    """
+    if hasattr(messages, "to_pylist"):
+        return messages.to_pylist()
+    if hasattr(messages, "tolist"):
+        return messages.tolist()
+    return list(messages)
+
+
+def respond_to_messages(messages: Sequence[Any]) -> list[str]:
+    """
+    Generate responses for a whole column of messages in a single pass.
+
+    Produces exactly the same responses as process_message, since both go
+    through generate_response(), but builds a flat list of strings instead
+    of one state dict per message.
+
+    Args:
+        messages: List, tuple, NumPy array or Arrow array of messages
+
+    Returns:
+        list: One response per message, in input order
+    """
+    return list(map(generate_response, _as_message_list(messages)))
+
+
+def process_messages(state: BatchGraphState) -> dict:
+    """
+    Bulk node function that processes every message in a batch state.
+
+    Only the responses column is returned; the messages column is left
+    untouched so the graph does not copy it.
+
+    Args:
+        state: The current batch state containing the messages column
+
+    Returns:
+        dict: Update with the responses column populated
+    """
+    return {"responses": respond_to_messages(state.get("messages", []))}
 
 
 def test_node_function():
@@ -146,18 +287,15 @@ def test_state_schema():
         return False
 
 
-def create_simple_graph():
+def build_simple_graph() -> StateGraph:
     """
-    Create a simple graph with a single node that processes messages.
+    Build the uncompiled simple graph with a single message processing node.
     
-    This function demonstrates:
-    - Creating a StateGraph with state schema
-    - Adding nodes to the graph
-    - Setting entry and finish points
-    - Compiling the graph into a runnable application
+    Useful when the caller wants to control compilation, for example to
+    reuse an already compiled application from a graph cache.
     
     Returns:
-        Compiled graph application ready for invocation
+        StateGraph: The graph definition, ready to be compiled
     """
     # Create state schema
     state_schema = create_state_schema()
@@ -174,12 +312,223 @@ def create_simple_graph():
     # Set the finish point (where execution ends)
     graph.set_finish_point("process_message")
     
-    # Compile the graph into a runnable application
-    app = graph.compile()
+    return graph
+
+
+def create_simple_graph():
+    """
+    Create a simple graph with a single node that processes messages.
+
+    This function demonstrates:
+    - Creating a StateGraph with state schema
+    - Adding nodes to the graph
+    - Setting entry and finish points
+    - Compiling the graph into a runnable application
+
+    Repeated calls return the same cached application, so hot request
+    paths do not pay the compile cost again.
+
+    Returns:
+        Compiled graph application ready for invocation
+    """
+    # Compile the graph into a runnable application, reusing the compiled
+    # application from the process-wide cache on later calls
+    app = compile_cached(build_simple_graph())
     
     return app
 
 
+def create_async_simple_graph():
+    """
+    Create the simple graph with the async node, for use with ainvoke/astream.
+
+    Returns:
+        Compiled graph application whose node runs on the event loop
+    """
+    graph = StateGraph(create_state_schema())
+    graph.add_node("process_message", aprocess_message)
+    graph.set_entry_point("process_message")
+    graph.set_finish_point("process_message")
+    return compile_cached(graph)
+
+
+async def ainvoke_many(
+    states: Iterable[GraphState],
+    app=None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> list[GraphState]:
+    """
+    Run many states through the graph concurrently on the event loop.
+
+    At most concurrency ainvoke calls are in flight at any time; the rest
+    wait on a semaphore.
+
+    Args:
+        states: Iterable of initial states to invoke
+        app: Compiled application to use (defaults to create_async_simple_graph())
+        concurrency: Maximum number of concurrent ainvoke calls
+
+    Returns:
+        list: Final states, in the same order as the input states
+
+    Raises:
+        ValueError: If concurrency is less than 1
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+    if app is None:
+        app = create_async_simple_graph()
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def invoke_one(state: GraphState) -> GraphState:
+        async with semaphore:
+            return await app.ainvoke(state)
+
+    # gather returns results in argument order
+    return await asyncio.gather(*(invoke_one(state) for state in states))
+
+
+def _chunked(
+    states: Iterable[GraphState], chunk_size: int
+) -> Iterator[list[GraphState]]:
+    """
+    Split an iterable of states into lists of at most chunk_size states.
+
+    Args:
+        states: Iterable of graph states
+        chunk_size: Maximum number of states per chunk
+
+    Yields:
+        list: Consecutive chunks of states, preserving input order
+    """
+    iterator = iter(states)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+# Compiled application owned by a process pool worker (one per process)
+_worker_app = None
+
+
+def _invoke_chunk_in_worker(chunk: list[GraphState]) -> list[GraphState]:
+    """
+    Invoke a chunk of states inside a process pool worker.
+
+    The compiled graph cannot be pickled, so every worker process compiles
+    the simple graph once on first use and reuses it for all later chunks.
+
+    Args:
+        chunk: States to invoke, in order
+
+    Returns:
+        list: Final states, in the same order as the chunk
+    """
+    global _worker_app
+    if _worker_app is None:
+        _worker_app = create_simple_graph()
+    return [_worker_app.invoke(state) for state in chunk]
+
+
+def invoke_batch(
+    states: Iterable[GraphState],
+    app=None,
+    executor: Literal["thread", "process"] = "thread",
+    max_workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> list[GraphState]:
+    """
+    Run many states through the simple graph in parallel.
+
+    The input is split into chunks of chunk_size states and each chunk is
+    invoked by a pool worker. With the thread executor every worker shares
+    one compiled application; with the process executor each worker process
+    compiles its own application once and reuses it.
+
+    Args:
+        states: Iterable of initial states to invoke
+        app: Compiled application to share between threads (thread executor
+            only; defaults to create_simple_graph())
+        executor: "thread" or "process"
+        max_workers: Pool size (defaults to the number of CPUs)
+        chunk_size: Number of states handed to a worker per task
+
+    Returns:
+        list: Final states, in the same order as the input states
+
+    Raises:
+        ValueError: If executor or chunk_size is invalid, or if an app is
+            passed together with the process executor
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    chunks = _chunked(states, chunk_size)
+
+    if executor == "thread":
+        shared_app = app if app is not None else create_simple_graph()
+
+        def invoke_chunk(chunk: list[GraphState]) -> list[GraphState]:
+            return [shared_app.invoke(state) for state in chunk]
+
+        pool = ThreadPoolExecutor(max_workers=max_workers)
+        task = invoke_chunk
+    elif executor == "process":
+        if app is not None:
+            raise ValueError(
+                "Compiled apps cannot be shared with worker processes; "
+                "omit app when using the process executor"
+            )
+        pool = ProcessPoolExecutor(max_workers=max_workers)
+        task = _invoke_chunk_in_worker
+    else:
+        raise ValueError(
+            f"Unknown executor '{executor}', expected 'thread' or 'process'"
+        )
+
+    # Executor.map yields results in submission order, so output order
+    # always matches input order regardless of which worker finishes first
+    with pool:
+        return [
+            result
+            for chunk_results in pool.map(task, chunks)
+            for result in chunk_results
+        ]
+
+
+def create_batch_graph():
+    """
+    Create a graph whose single node processes a whole column of messages.
+
+    Returns:
+        Compiled graph application operating on BatchGraphState
+    """
+    graph = StateGraph(BatchGraphState)
+    graph.add_node("process_messages", process_messages)
+    graph.set_entry_point("process_messages")
+    graph.set_finish_point("process_messages")
+    return compile_cached(graph)
+
+
+def create_compact_graph():
+    """
+    Create the simple graph over CompactGraphState with the delta node.
+
+    The compiled application accepts CompactGraphState instances (or plain
+    dicts) as input and returns the final state as a dict.
+
+    Returns:
+        Compiled graph application operating on CompactGraphState
+    """
+    graph = StateGraph(CompactGraphState)
+    graph.add_node("process_message", process_message_delta)
+    graph.set_entry_point("process_message")
+    graph.set_finish_point("process_message")
+    return compile_cached(graph)
+
+
 def test_graph_structure():
     """
     Test function to verify the graph structure is correct.
@@ -261,6 +610,135 @@ def test_complete_application():
         return False
 
 
+def test_batch_invocation():
+    """
+    Test that batch invocation matches sequential invocation.
+
+    Returns:
+        bool: True if all tests pass, False otherwise
+    """
+    try:
+        app = create_simple_graph()
+        states = [
+            {"message": message, "response": ""}
+            for message in ["", "Hello there!", "Help me", "Random message"] * 5
+        ]
+
+        # Test 1: Sequential baseline
+        expected = [app.invoke(state) for state in states]
+
+        # Test 2: Thread pool with a shared app and small chunks
+        assert invoke_batch(states, app=app, max_workers=4, chunk_size=3) == expected
+
+        # Test 3: Process pool
+        assert invoke_batch(states, executor="process", max_workers=2) == expected
+
+        # Test 4: Empty input
+        assert invoke_batch([], app=app) == []
+
+        print("✅ Batch invocation tests passed!")
+        return True
+
+    except Exception as e:
+        print(f"❌ Batch invocation test failed: {e}")
+        return False
+
+
+def test_bulk_processing():
+    """
+    Test that the bulk node gives the same responses as the single-message node.
+
+    Returns:
+        bool: True if all tests pass, False otherwise
+    """
+    try:
+        messages = ["", "Hello there!", "HELP me", "Random message", "hel", "helping"]
+        expected = [
+            process_message({"message": m, "response": ""})["response"]
+            for m in messages
+        ]
+
+        # Test 1: Bulk responses match the single-message node
+        assert respond_to_messages(messages) == expected
+
+        # Test 2: Bulk graph returns aligned columns
+        result = create_batch_graph().invoke({"messages": messages, "responses": []})
+        assert result["messages"] == messages
+        assert result["responses"] == expected
+
+        print("✅ Bulk processing tests passed!")
+        return True
+
+    except Exception as e:
+        print(f"❌ Bulk processing test failed: {e}")
+        return False
+
+
+def test_async_invocation():
+    """
+    Test that the async graph matches the sync graph.
+
+    Returns:
+        bool: True if all tests pass, False otherwise
+    """
+    try:
+        states = [
+            {"message": message, "response": ""}
+            for message in ["", "Hello there!", "Help me", "Random message"] * 5
+        ]
+        expected = [process_message(state) for state in states]
+
+        # Test 1: Bounded concurrent ainvoke calls keep input order
+        assert asyncio.run(ainvoke_many(states, concurrency=3)) == expected
+
+        # Test 2: Async node can be streamed
+        async def collect_chunks():
+            app = create_async_simple_graph()
+            return [chunk async for chunk in app.astream(states[1])]
+
+        chunks = asyncio.run(collect_chunks())
+        assert chunks == [{"process_message": expected[1]}]
+
+        print("✅ Async invocation tests passed!")
+        return True
+
+    except Exception as e:
+        print(f"❌ Async invocation test failed: {e}")
+        return False
+
+
+def test_compact_state():
+    """
+    Test that the compact state graph matches the dict-based graph.
+
+    Returns:
+        bool: True if all tests pass, False otherwise
+    """
+    try:
+        app = create_compact_graph()
+
+        for message in ["", "Hello there!", "Help me", "Random message"]:
+            expected = process_message({"message": message, "response": ""})
+
+            # Test 1: Compact state input gives the same final state
+            assert app.invoke(CompactGraphState(message=message)) == expected
+
+            # Test 2: Node returns only the changed field
+            assert process_message_delta(CompactGraphState(message=message)) == {
+                "response": expected["response"]
+            }
+
+        # Test 3: Slotted instances have no __dict__
+        assert not hasattr(CompactGraphState(), "__dict__")
+
+        print("✅ Compact state tests passed!")
+        return True
+
+    except Exception as e:
+        print(f"❌ Compact state test failed: {e}")
+        return False
+
+
 def run_all_tests():
     """
     Run all tests for the simple graph application.
@@ -275,7 +753,11 @@ def run_all_tests():
         ("State Schema", test_state_schema),
         ("Node Function", test_node_function),
         ("Graph Structure", test_graph_structure),
-        ("Complete Application", test_complete_application)
+        ("Complete Application", test_complete_application),
+        ("Batch Invocation", test_batch_invocation),
+        ("Bulk Processing", test_bulk_processing),
+        ("Async Invocation", test_async_invocation),
+        ("Compact State", test_compact_state),
     ]
     
     all_passed = True
@@ -3,4 +3,19 @@ Nodes Package
 
 This package contains reusable node functions and patterns
 for LangGraph applications.
-""" 
\ No newline at end of file
+"""
+
+from src.modules.introduction.utils.lazy import lazy_exports
+
+__getattr__, __dir__, __all__ = lazy_exports(
+    __name__,
+    {
+        "MicroBatcher": ".microbatch:MicroBatcher",
+        "NodeCache": ".memoize:NodeCache",
+        "NodeProfiler": ".instrumentation:NodeProfiler",
+        "batched_node": ".microbatch:batched_node",
+        "default_profiler": ".instrumentation:default_profiler",
+        "instrument": ".instrumentation:instrument",
+        "memoize_node": ".memoize:memoize_node",
+    },
+)
@@ -0,0 +1,362 @@
+"""
+Node Instrumentation
+
+This module provides a wrapper that records per-invocation latency and
+memory statistics for LangGraph node functions. Wrap a node when it is
+registered and enable the profiler to start collecting:
+
+    from src.modules.introduction.nodes.instrumentation import default_profiler, instrument
+
+    graph.add_node("process_message", instrument(process_message))
+    default_profiler.enable()
+    app.invoke(state)
+    print(default_profiler.format_summary())
+
+Each invocation records wall time, CPU time and (optionally) the tracemalloc
+peak into a fixed-size ring buffer. When the profiler is disabled the wrapper
+only checks a flag before calling the node. The tracemalloc peak is shared by
+the whole process, so memory figures are only reliable when nodes run one at a
+time (for example with max_concurrency=1).
+
+Dumps written with NodeProfiler.dump() can be summarised from the command line:
+
+    python -m src.modules.introduction.nodes.instrumentation profile.json
+"""
+
+import functools
+import inspect
+import json
+import sys
+import threading
+import time
+import tracemalloc
+from collections import deque
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable, NamedTuple, Optional, Union
+
+# Default number of invocation records kept by a profiler
+DEFAULT_CAPACITY = 10_000
+
+
+class NodeTiming(NamedTuple):
+    """A single recorded node invocation."""
+
+    node: str
+    wall_ns: int
+    cpu_ns: int
+    peak_bytes: int
+
+
+@dataclass
+class NodeStats:
+    """
+    Aggregated statistics for one node.
+
+    Attributes:
+        node: Node name
+        calls: Number of recorded invocations
+        wall_total_ms: Total wall time in milliseconds
+        wall_p50_us: Median wall time in microseconds
+        wall_p95_us: 95th percentile wall time in microseconds
+        wall_p99_us: 99th percentile wall time in microseconds
+        cpu_total_ms: Total CPU time in milliseconds
+        peak_max_kib: Largest tracemalloc peak seen, in KiB
+        histogram: Wall time histogram, keyed by bucket upper bound in microseconds
+    """
+
+    node: str
+    calls: int
+    wall_total_ms: float
+    wall_p50_us: float
+    wall_p95_us: float
+    wall_p99_us: float
+    cpu_total_ms: float
+    peak_max_kib: float
+    histogram: dict[str, int]
+
+
+def _percentile(ordered: list[int], pct: float) -> int:
+    """Nearest-rank percentile of an already sorted list."""
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _aggregate(node: str, timings: list[NodeTiming]) -> NodeStats:
+    """
+    Aggregate the records of one node.
+
+    Args:
+        node: Node name
+        timings: Records for that node
+
+    Returns:
+        NodeStats: Aggregated statistics
+    """
+    walls = sorted(timing.wall_ns for timing in timings)
+
+    # Power-of-two buckets in microseconds: "<=1us", "<=2us", "<=4us", ...
+    histogram: dict[str, int] = {}
+    for wall_ns in walls:
+        wall_us = -(-wall_ns // 1000)
+        bucket = 1 << (wall_us - 1).bit_length() if wall_us > 1 else 1
+        key = f"<={bucket}us"
+        histogram[key] = histogram.get(key, 0) + 1
+
+    return NodeStats(
+        node=node,
+        calls=len(timings),
+        wall_total_ms=sum(walls) / 1e6,
+        wall_p50_us=_percentile(walls, 50) / 1000,
+        wall_p95_us=_percentile(walls, 95) / 1000,
+        wall_p99_us=_percentile(walls, 99) / 1000,
+        cpu_total_ms=sum(timing.cpu_ns for timing in timings) / 1e6,
+        peak_max_kib=max(timing.peak_bytes for timing in timings) / 1024,
+        histogram=histogram,
+    )
+
+
+def format_stats(stats: Iterable[NodeStats]) -> str:
+    """
+    Format aggregated node statistics as a text table.
+
+    Args:
+        stats: Statistics to format
+
+    Returns:
+        str: The formatted table
+    """
+    lines = [
+        f"{'node':<30} {'calls':>8} {'total ms':>10} {'p50 us':>10} "
+        f"{'p95 us':>10} {'p99 us':>10} {'cpu ms':>10} {'peak KiB':>10}"
+    ]
+    for stat in sorted(stats, key=lambda s: s.wall_total_ms, reverse=True):
+        lines.append(
+            f"{stat.node:<30} {stat.calls:>8} {stat.wall_total_ms:>10.2f} "
+            f"{stat.wall_p50_us:>10.1f} {stat.wall_p95_us:>10.1f} "
+            f"{stat.wall_p99_us:>10.1f} {stat.cpu_total_ms:>10.2f} "
+            f"{stat.peak_max_kib:>10.1f}"
+        )
+    return "\n".join(lines)
+
+
+class NodeProfiler:
+    """
+    Collects per-node timing records into a bounded ring buffer.
+
+    Attributes:
+        enabled: Whether instrumented nodes currently record
+        trace_memory: Whether to record the tracemalloc peak per invocation;
+            peaks are only reliable when nodes run one at a time
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, trace_memory: bool = False):
+        if capacity < 1:
+            raise ValueError(f"capacity must be at least 1, got {capacity}")
+        self.enabled = False
+        self.trace_memory = trace_memory
+        # deque.append is atomic, so concurrent nodes can record without a lock
+        self._records: deque[NodeTiming] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self._started_tracemalloc = False
+
+    def enable(self, trace_memory: Optional[bool] = None) -> None:
+        """
+        Start recording node invocations.
+
+        Args:
+            trace_memory: Override whether tracemalloc peaks are recorded
+        """
+        with self._lock:
+            if trace_memory is not None:
+                self.trace_memory = trace_memory
+            if self.trace_memory and not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracemalloc = True
+            self.enabled = True
+
+    def disable(self) -> None:
+        """Stop recording; records collected so far are kept."""
+        with self._lock:
+            self.enabled = False
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+                self._started_tracemalloc = False
+
+    def clear(self) -> None:
+        """Drop all recorded invocations."""
+        self._records.clear()
+
+    def records(self) -> list[NodeTiming]:
+        """Return a snapshot of the recorded invocations, oldest first."""
+        return list(self._records)
+
+    def instrument(
+        self, func: Callable[..., Any], name: Optional[str] = None
+    ) -> Callable[..., Any]:
+        """
+        Wrap a node function so its invocations are recorded.
+
+        The wrapper keeps the node's name and signature, so LangGraph still
+        passes config and other injected arguments through to it.
+
+        Args:
+            func: Sync or async node function
+            name: Name to record under (defaults to the function name)
+
+        Returns:
+            Callable: The instrumented node function
+        """
+        node_name = name or getattr(func, "__name__", repr(func))
+        records = self._records
+        profiler = self
+
+        def start() -> tuple[int, int, int]:
+            # tracemalloc keeps one process-wide peak and reset_peak() clears
+            # it for every thread. With concurrent nodes, other nodes'
+            # allocations inflate this peak and their resets can hide part of
+            # it, so the value is neither an upper nor a lower bound.
+            base = -1
+            if profiler.trace_memory and tracemalloc.is_tracing():
+                tracemalloc.reset_peak()
+                base = tracemalloc.get_traced_memory()[0]
+            return time.perf_counter_ns(), time.thread_time_ns(), base
+
+        def finish(wall_start: int, cpu_start: int, base: int) -> None:
+            wall = time.perf_counter_ns() - wall_start
+            cpu = time.thread_time_ns() - cpu_start
+            peak = 0
+            if base >= 0 and tracemalloc.is_tracing():
+                peak = max(0, tracemalloc.get_traced_memory()[1] - base)
+            records.append(NodeTiming(node_name, wall, cpu, peak))
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                if not profiler.enabled:
+                    return await func(*args, **kwargs)
+                # CPU time is per thread, so for coroutines it also covers
+                # other tasks interleaved on the event loop
+                marks = start()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    finish(*marks)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not profiler.enabled:
+                return func(*args, **kwargs)
+            marks = start()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                finish(*marks)
+
+        return wrapper
+
+    def stats(self) -> list[NodeStats]:
+        """
+        Aggregate the recorded invocations per node.
+
+        Returns:
+            list: One NodeStats per node, in first-seen order
+        """
+        by_node: dict[str, list[NodeTiming]] = {}
+        for record in self.records():
+            by_node.setdefault(record.node, []).append(record)
+        return [_aggregate(node, timings) for node, timings in by_node.items()]
+
+    def format_summary(self) -> str:
+        """Format the aggregated statistics as a text table."""
+        return format_stats(self.stats())
+
+    def dump(self, path: Union[str, Path]) -> None:
+        """
+        Write the aggregated statistics to a JSON file.
+
+        Args:
+            path: Destination file
+        """
+        with open(path, "w") as fp:
+            json.dump([asdict(stat) for stat in self.stats()], fp, indent=2)
+            fp.write("\n")
+
+
+def load_stats(path: Union[str, Path]) -> list[NodeStats]:
+    """
+    Load statistics written by NodeProfiler.dump().
+
+    Args:
+        path: JSON file written by dump()
+
+    Returns:
+        list: The stored NodeStats
+    """
+    with open(path) as fp:
+        return [NodeStats(**item) for item in json.load(fp)]
+
+
+# Process-wide profiler used by instrument()
+default_profiler = NodeProfiler()
+
+
+def instrument(
+    func: Optional[Callable[..., Any]] = None,
+    *,
+    name: Optional[str] = None,
+    profiler: Optional[NodeProfiler] = None,
+) -> Any:
+    """
+    Instrument a node function, usable directly or as a decorator.
+
+    Args:
+        func: Node function to wrap
+        name: Name to record under (defaults to the function name)
+        profiler: Profiler to record into (defaults to default_profiler)
+
+    Returns:
+        The instrumented function, or a decorator when func is omitted
+    """
+    target = profiler if profiler is not None else default_profiler
+    if func is None:
+        return lambda f: target.instrument(f, name)
+    return target.instrument(func, name)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Print the summary table and histograms for one or more profile dumps.
+
+    Args:
+        argv: Paths of JSON files written by NodeProfiler.dump()
+
+    Returns:
+        int: Process exit code
+    """
+    paths = sys.argv[1:] if argv is None else argv
+    if not paths:
+        print(
+            "usage: python -m src.modules.introduction.nodes.instrumentation"
+            " PROFILE.json [...]"
+        )
+        return 2
+
+    for path in paths:
+        stats = load_stats(path)
+        print(f"📋 {path}")
+        print(format_stats(stats))
+        for stat in stats:
+            print(f"\n{stat.node} wall time histogram:")
+            width = max(stat.histogram.values())
+            for bucket, count in stat.histogram.items():
+                print(f"  {bucket:>12} {count:>8} {'#' * max(1, 40 * count // width)}")
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
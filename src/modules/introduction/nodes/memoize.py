@@ -0,0 +1,324 @@
+"""
+Node Memoization
+
+This module provides a decorator that caches the updates returned by
+deterministic node functions, so repeated inputs skip node execution:
+
+    from src.modules.introduction.nodes.memoize import memoize_node
+
+    cached_process_message = memoize_node(
+        process_message, maxsize=10_000, key_fields=("message",)
+    )
+    graph.add_node("process_message", cached_process_message)
+    ...
+    print(cached_process_message.cache.info())
+
+Entries are evicted least-recently-used once maxsize entries or max_bytes
+bytes are exceeded, and expire after ttl seconds if a ttl is set. The same
+decorator works for async nodes, such as LLM calls, where a hit saves a
+network round trip.
+"""
+
+import copy
+import dataclasses
+import functools
+import inspect
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, NamedTuple, Optional, Sequence
+
+# Default maximum number of cached node results
+DEFAULT_MAXSIZE = 1024
+
+
+class NodeCacheInfo(NamedTuple):
+    """Statistics reported by NodeCache.info()."""
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    uncacheable: int
+    currsize: int
+    current_bytes: int
+
+
+def _freeze(value: Any) -> Hashable:
+    """
+    Convert a state value into a hashable cache key component.
+
+    Scalars and containers are tagged with their type, since 1, 1.0 and
+    True (or a list and a tuple with the same items) compare equal but may
+    well produce different node results.
+
+    Raises:
+        TypeError: If the value cannot be made hashable
+    """
+    if isinstance(value, (str, bytes, int, float, bool, type(None))):
+        return type(value), value
+    if isinstance(value, dict):
+        return dict, frozenset(
+            (_freeze(key), _freeze(item)) for key, item in value.items()
+        )
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return type(value), frozenset(_freeze(item) for item in value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return (type(value),) + tuple(
+            (field.name, _freeze(getattr(value, field.name)))
+            for field in dataclasses.fields(value)
+        )
+    hash(value)
+    return value
+
+
+def _get_field(state: Any, name: str) -> Any:
+    """Read a field from a dict-like or attribute-based state."""
+    if isinstance(state, dict):
+        return state.get(name)
+    return getattr(state, name, None)
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Estimate the memory held by a cached value, in bytes.
+
+    Follows dicts, lists, tuples and sets one level at a time; other objects
+    are counted with sys.getsizeof.
+
+    Args:
+        value: Cached node result
+
+    Returns:
+        int: Approximate size in bytes
+    """
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(
+            estimate_size(key) + estimate_size(item) for key, item in value.items()
+        )
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(item) for item in value)
+    return size
+
+
+class NodeCache:
+    """
+    Thread-safe LRU cache with optional TTL and byte budget.
+
+    Attributes:
+        maxsize: Maximum number of entries
+        ttl: Seconds an entry stays valid, or None for no expiry
+        max_bytes: Maximum estimated bytes held, or None for no limit
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_MAXSIZE,
+        ttl: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        sizeof: Callable[[Any], int] = estimate_size,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._clock = clock
+        # key -> (value, expires_at, size)
+        self._entries: "OrderedDict[Hashable, tuple[Any, float, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._uncacheable = 0
+
+    def get(self, key: Hashable) -> tuple[bool, Any]:
+        """
+        Look up a key.
+
+        Returns:
+            tuple: (found, value)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at, size = entry
+                if expires_at >= self._clock():
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return True, value
+                del self._entries[key]
+                self._bytes -= size
+                self._expirations += 1
+            self._misses += 1
+            return False, None
+
+    def put(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> bool:
+        """
+        Store a value, evicting least-recently-used entries as needed.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Seconds this entry stays valid, overriding the cache's ttl
+
+        Returns:
+            bool: False if the value alone exceeds max_bytes and was not stored
+        """
+        size = self._sizeof(value) if self.max_bytes is not None else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            return False
+        ttl = ttl if ttl is not None else self.ttl
+        expires_at = self._clock() + ttl if ttl is not None else float("inf")
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[2]
+            self._entries[key] = (value, expires_at, size)
+            self._bytes += size
+            while len(self._entries) > self.maxsize or (
+                self.max_bytes is not None and self._bytes > self.max_bytes
+            ):
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._evictions += 1
+        return True
+
+    def record_uncacheable(self) -> None:
+        """Count a call whose input could not be turned into a key."""
+        with self._lock:
+            self._uncacheable += 1
+
+    def clear(self) -> None:
+        """Drop all entries; statistics are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def info(self) -> NodeCacheInfo:
+        """Return hit, miss and eviction statistics."""
+        with self._lock:
+            return NodeCacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self._expirations,
+                self._uncacheable,
+                len(self._entries),
+                self._bytes,
+            )
+
+
+def memoize_node(
+    func: Optional[Callable[..., Any]] = None,
+    *,
+    maxsize: int = DEFAULT_MAXSIZE,
+    ttl: Optional[float] = None,
+    max_bytes: Optional[int] = None,
+    key_fields: Optional[Sequence[str]] = None,
+    pure: bool = True,
+    cache: Optional[NodeCache] = None,
+) -> Any:
+    """
+    Cache a node's updates keyed on its input state.
+
+    The key is the node function's identity plus its state argument;
+    injected arguments such as config are passed through untouched. Nodes
+    can therefore share one cache, including closures built by the same
+    factory. A node marked pure=False is never cached, which lets
+    configuration switch memoization off per node without changing the
+    graph wiring.
+
+    Args:
+        func: Sync or async node function
+        maxsize: Maximum cached entries
+        ttl: Seconds before an entry expires, or None
+        max_bytes: Maximum estimated bytes held by the cache, or None
+        key_fields: State fields the node depends on (defaults to the whole state)
+        pure: Whether the node is deterministic and side-effect free
+        cache: Cache instance to use (e.g. one budget shared between nodes)
+
+    Returns:
+        The memoized node, or a decorator when func is omitted; the node's
+        cache is available as the wrapper's ``cache`` attribute
+    """
+    if func is None:
+        return functools.partial(
+            memoize_node,
+            maxsize=maxsize,
+            ttl=ttl,
+            max_bytes=max_bytes,
+            key_fields=key_fields,
+            pure=pure,
+            cache=cache,
+        )
+
+    node_cache = cache if cache is not None else NodeCache(maxsize, ttl, max_bytes)
+    fields = tuple(key_fields) if key_fields is not None else None
+    # Keys hold the function itself (hashed by identity), which tells apart
+    # closures with the same qualified name and keeps the identity from
+    # being reused while a shared cache still has entries for it
+    node_id = func
+
+    def make_key(state: Any) -> Optional[Hashable]:
+        try:
+            if fields is not None:
+                return node_id, tuple(
+                    _freeze(_get_field(state, name)) for name in fields
+                )
+            return node_id, _freeze(state)
+        except TypeError:
+            node_cache.record_uncacheable()
+            return None
+
+    def copy_result(result: Any) -> Any:
+        # Hand out deep copies so callers cannot mutate the cached update,
+        # including lists and dicts nested inside it
+        return copy.deepcopy(result)
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(state: Any, *args: Any, **kwargs: Any) -> Any:
+            if not pure:
+                return await func(state, *args, **kwargs)
+            key = make_key(state)
+            if key is not None:
+                found, value = node_cache.get(key)
+                if found:
+                    return copy_result(value)
+            result = await func(state, *args, **kwargs)
+            if key is not None:
+                node_cache.put(key, copy_result(result))
+            return result
+
+        async_wrapper.cache = node_cache  # type: ignore[attr-defined]
+        async_wrapper.pure = pure  # type: ignore[attr-defined]
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(state: Any, *args: Any, **kwargs: Any) -> Any:
+        if not pure:
+            return func(state, *args, **kwargs)
+        key = make_key(state)
+        if key is not None:
+            found, value = node_cache.get(key)
+            if found:
+                return copy_result(value)
+        result = func(state, *args, **kwargs)
+        if key is not None:
+            node_cache.put(key, copy_result(result))
+        return result
+
+    wrapper.cache = node_cache  # type: ignore[attr-defined]
+    wrapper.pure = pure  # type: ignore[attr-defined]
+    return wrapper
@@ -0,0 +1,289 @@
+"""
+Micro-Batching
+
+Gathers single-item calls from many concurrent graph runs into batched
+model or embedding calls. Calls arriving within max_wait seconds of the
+first one (or until max_batch_size items are waiting) are sent as one batch,
+identical items in a batch are coalesced into one slot, and each result is
+fanned back to the caller that submitted it.
+
+Example:
+    from src.modules.introduction.nodes.microbatch import MicroBatcher, batched_node
+    from src.modules.introduction.utils.fake_llm import FakeLLM
+
+    llm = FakeLLM(latency=0.05)
+    batcher = MicroBatcher(llm.generate_batch, max_batch_size=32, max_wait=0.005)
+    graph.add_node("llm", batched_node(batcher, is_async=True))
+"""
+
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Hashable, Optional, Sequence
+
+# Default number of items per batch
+DEFAULT_MAX_BATCH_SIZE = 32
+
+# Default seconds to wait for more items after the first arrives
+DEFAULT_MAX_WAIT = 0.005
+
+# Queue sentinel that stops the collector thread
+_STOP = object()
+
+
+@dataclass
+class BatcherStats:
+    """
+    Counters for a MicroBatcher.
+
+    Attributes:
+        items: Items submitted
+        batches: Batched calls made
+        coalesced: Items answered by an identical item in the same batch
+        largest_batch: Most unique items sent in one call
+    """
+
+    items: int = 0
+    batches: int = 0
+    coalesced: int = 0
+    largest_batch: int = 0
+
+    @property
+    def mean_batch_size(self) -> float:
+        """Mean items per batched call, counting coalesced items."""
+        return self.items / self.batches if self.batches else 0.0
+
+
+def _coalesce_key(item: Any) -> Optional[Hashable]:
+    try:
+        hash(item)
+    except TypeError:
+        return None
+    return item
+
+
+class MicroBatcher:
+    """
+    Collects submitted items into batches for a batched function.
+
+    The batch function takes a list of items and returns a list of results
+    of the same length and order. It runs on a background thread, at most
+    max_concurrency batches at a time; while that many are in flight, new
+    items keep accumulating into the next batch.
+
+    Attributes:
+        max_batch_size: Maximum unique items per batch
+        max_wait: Seconds to wait for more items after the first arrives
+        max_concurrency: Maximum batches in flight
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[list[Any]], Sequence[Any]],
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait: float = DEFAULT_MAX_WAIT,
+        max_concurrency: int = 1,
+        coalesce: bool = True,
+    ):
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be at least 1, got {max_batch_size}")
+        if max_concurrency < 1:
+            raise ValueError(
+                f"max_concurrency must be at least 1, got {max_concurrency}"
+            )
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.max_concurrency = max_concurrency
+        self.coalesce = coalesce
+        self._queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._stats = BatcherStats()
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._slots = threading.Semaphore(max_concurrency)
+        self._closed = False
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("MicroBatcher is closed")
+            if self._thread is None:
+                if self.max_concurrency > 1:
+                    self._executor = ThreadPoolExecutor(
+                        self.max_concurrency, thread_name_prefix="microbatch"
+                    )
+                self._thread = threading.Thread(
+                    target=self._collect, name="microbatch-collector", daemon=True
+                )
+                self._thread.start()
+
+    def submit_future(self, item: Any) -> Future:
+        """
+        Queue an item and return a future for its result.
+
+        Args:
+            item: Input for the batch function
+
+        Returns:
+            Future: Resolves to the item's result
+        """
+        if self._thread is None or self._closed:
+            self._start()
+        future: Future = Future()
+        # Under the lock, so no item can be queued behind close()'s _STOP
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("MicroBatcher is closed")
+            self._queue.put((item, future))
+        return future
+
+    def submit(self, item: Any) -> Any:
+        """Submit an item and block until its result is ready."""
+        return self.submit_future(item).result()
+
+    async def asubmit(self, item: Any) -> Any:
+        """Submit an item and await its result without blocking the event loop."""
+        return await asyncio.wrap_future(self.submit_future(item))
+
+    def _collect(self) -> None:
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is _STOP:
+                break
+            batch = [first]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    entry = (
+                        self._queue.get(timeout=remaining)
+                        if remaining > 0
+                        else self._queue.get_nowait()
+                    )
+                except queue.Empty:
+                    break
+                if entry is _STOP:
+                    stopping = True
+                    break
+                batch.append(entry)
+
+            # Blocks while max_concurrency batches are in flight, so later
+            # items keep queueing up for a fuller next batch
+            self._slots.acquire()
+            if self._executor is not None:
+                self._executor.submit(self._run_batch, batch)
+            else:
+                self._run_batch(batch)
+
+    def _run_batch(self, batch: list[tuple[Any, Future]]) -> None:
+        try:
+            # Drop callers that gave up (e.g. a cancelled asubmit); the rest
+            # can no longer be cancelled, so setting their results is safe
+            batch = [
+                entry for entry in batch if entry[1].set_running_or_notify_cancel()
+            ]
+            if not batch:
+                return
+            unique: list[Any] = []
+            slots: list[int] = []
+            positions: dict[Hashable, int] = {}
+            for item, _ in batch:
+                key = _coalesce_key(item) if self.coalesce else None
+                if key is not None and key in positions:
+                    slots.append(positions[key])
+                    continue
+                if key is not None:
+                    positions[key] = len(unique)
+                slots.append(len(unique))
+                unique.append(item)
+
+            with self._lock:
+                self._stats.items += len(batch)
+                self._stats.batches += 1
+                self._stats.coalesced += len(batch) - len(unique)
+                self._stats.largest_batch = max(self._stats.largest_batch, len(unique))
+
+            try:
+                results = list(self.batch_fn(unique))
+                if len(results) != len(unique):
+                    raise ValueError(
+                        f"batch function returned {len(results)} results "
+                        f"for {len(unique)} items"
+                    )
+            except BaseException as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                return
+            for (_, future), slot in zip(batch, slots):
+                future.set_result(results[slot])
+        finally:
+            self._slots.release()
+
+    def stats(self) -> BatcherStats:
+        """Return a snapshot of the batcher's counters."""
+        with self._lock:
+            return replace(self._stats)
+
+    def close(self) -> None:
+        """Flush queued items and stop the background threads."""
+        with self._lock:
+            self._closed = True
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        # Fail anything the collector did not get to, rather than leave it hanging
+        while True:
+            try:
+                entry = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if entry is not _STOP and entry[1].set_running_or_notify_cancel():
+                entry[1].set_exception(
+                    RuntimeError("MicroBatcher closed before the item was batched")
+                )
+
+    def __enter__(self) -> "MicroBatcher":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def batched_node(
+    batcher: MicroBatcher,
+    input_key: str = "message",
+    output_key: str = "response",
+    is_async: bool = False,
+) -> Callable[[Any], Any]:
+    """
+    Build a node that sends one state field through a micro-batcher.
+
+    Args:
+        batcher: Batcher shared by every run of the graph
+        input_key: State field passed to the batch function
+        output_key: State field the result is written to
+        is_async: Build a coroutine node for ainvoke/astream
+
+    Returns:
+        Node function returning {output_key: result}
+    """
+    if is_async:
+
+        async def abatched(state: Any) -> dict[str, Any]:
+            return {output_key: await batcher.asubmit(state[input_key])}
+
+        return abatched
+
+    def batched(state: Any) -> dict[str, Any]:
+        return {output_key: batcher.submit(state[input_key])}
+
+    return batched
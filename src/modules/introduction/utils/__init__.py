@@ -3,4 +3,20 @@ Utils Package
 
 This package contains utility functions and helpers
 for LangGraph applications.
-""" 
\ No newline at end of file
+"""
+
+from .lazy import lazy_exports
+
+__getattr__, __dir__, _lazy_names = lazy_exports(
+    __name__,
+    {
+        "CachedLLM": ".llm_cache:CachedLLM",
+        "FakeLLM": ".fake_llm:FakeLLM",
+        "KeywordMatcher": ".keyword_matcher:KeywordMatcher",
+        "LLMClient": ".llm_client:LLMClient",
+        "LLMResponseCache": ".llm_cache:LLMResponseCache",
+        "get_shared_client": ".llm_client:get_shared_client",
+    },
+)
+
+__all__ = ["lazy_exports", *_lazy_names]
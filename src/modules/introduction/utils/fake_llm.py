@@ -0,0 +1,128 @@
+"""
+Fake LLM
+
+A deterministic, offline stand-in for the Gemini model used by Lessons 4-7.
+Responses depend only on the model name, prompt and parameters, so tests and
+benchmarks can exercise caching, batching and streaming without network
+access or an API key.
+
+Example:
+    from src.modules.introduction.utils.fake_llm import FakeLLM
+
+    llm = FakeLLM(latency=0.05)
+    print(llm.generate("Hello there!", temperature=0.0))
+"""
+
+import asyncio
+import hashlib
+import threading
+import time
+from typing import Any, AsyncIterator, Iterator, Optional
+
+
+class FakeLLM:
+    """
+    Deterministic fake language model.
+
+    Attributes:
+        model_name: Name reported to caches and metrics
+        latency: Seconds each call sleeps, simulating a network round trip
+        responses: Fixed responses by prompt; other prompts get a generated reply
+        calls: Number of generate calls made so far
+    """
+
+    def __init__(
+        self,
+        model_name: str = "fake-llm",
+        latency: float = 0.0,
+        responses: Optional[dict[str, str]] = None,
+    ):
+        self.model_name = model_name
+        self.latency = latency
+        self.responses = dict(responses or {})
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def _reply(self, prompt: str, params: dict[str, Any]) -> str:
+        with self._lock:
+            self.calls += 1
+        if prompt in self.responses:
+            return self.responses[prompt]
+        digest = hashlib.sha256(
+            repr((self.model_name, prompt, sorted(params.items()))).encode()
+        ).hexdigest()
+        return f"Echo from {self.model_name}: {prompt} [{digest[:8]}]"
+
+    def generate(self, prompt: str, **params: Any) -> str:
+        """
+        Generate a response for a prompt.
+
+        Args:
+            prompt: Prompt text
+            **params: Generation parameters (part of the deterministic output)
+
+        Returns:
+            str: The response text
+        """
+        if self.latency:
+            time.sleep(self.latency)
+        return self._reply(prompt, params)
+
+    async def agenerate(self, prompt: str, **params: Any) -> str:
+        """Async version of generate() that awaits the simulated latency."""
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self._reply(prompt, params)
+
+    def generate_batch(self, prompts: list[str], **params: Any) -> list[str]:
+        """
+        Generate responses for several prompts in one simulated round trip.
+
+        Args:
+            prompts: Prompt texts
+            **params: Generation parameters
+
+        Returns:
+            list: One response per prompt, in order
+        """
+        if self.latency:
+            time.sleep(self.latency)
+        return [self._reply(prompt, params) for prompt in prompts]
+
+    def stream(
+        self, prompt: str, token_latency: float = 0.0, **params: Any
+    ) -> Iterator[str]:
+        """
+        Yield the response word by word.
+
+        Args:
+            prompt: Prompt text
+            token_latency: Seconds to sleep before each token after the first
+            **params: Generation parameters
+
+        Yields:
+            str: Response tokens; joining them gives generate()'s result
+        """
+        if self.latency:
+            time.sleep(self.latency)
+        for index, token in enumerate(self._reply(prompt, params).split(" ")):
+            if index:
+                if token_latency:
+                    time.sleep(token_latency)
+                yield " " + token
+            else:
+                yield token
+
+    async def astream(
+        self, prompt: str, token_latency: float = 0.0, **params: Any
+    ) -> AsyncIterator[str]:
+        """Async version of stream()."""
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        for index, token in enumerate(self._reply(prompt, params).split(" ")):
+            if index:
+                if token_latency:
+                    await asyncio.sleep(token_latency)
+                yield " " + token
+            else:
+                yield token
@@ -0,0 +1,231 @@
+"""
+JSONL Streaming Pipeline
+
+Streams newline-delimited messages through a compiled graph with bounded
+memory. Input lines are read lazily, grouped into micro-batches, invoked on
+a worker pool and written out in input order as soon as each batch
+completes. At most max_pending batches are in flight, so reading stalls
+(backpressure) while the workers or the output catch up, and a
+multi-gigabyte input never has to fit in RAM.
+
+Each input line is either a JSON object with a "message" field or a bare
+JSON string; each output line is the final graph state as a JSON object.
+
+Example:
+    import sys
+    from src.modules.introduction.utils.jsonl_pipeline import run_jsonl_pipeline
+
+    stats = run_jsonl_pipeline(sys.stdin, sys.stdout, batch_size=256)
+"""
+
+import json
+import sys
+import time
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Optional, TextIO, Union
+
+# Default number of states per micro-batch
+DEFAULT_BATCH_SIZE = 64
+
+# Default number of micro-batches allowed in flight per worker
+DEFAULT_PENDING_PER_WORKER = 2
+
+
+@dataclass
+class PipelineStats:
+    """
+    Summary of a pipeline run.
+
+    Attributes:
+        records: Number of states processed
+        batches: Number of micro-batches processed
+        seconds: Wall time of the run
+    """
+
+    records: int = 0
+    batches: int = 0
+    seconds: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Records processed per second."""
+        return self.records / self.seconds if self.seconds else 0.0
+
+
+def read_jsonl(lines: Iterable[str]) -> Iterator[dict[str, Any]]:
+    """
+    Lazily parse JSONL lines into initial graph states.
+
+    Args:
+        lines: Text lines, e.g. an open file or sys.stdin
+
+    Yields:
+        dict: State with "message" and an empty "response"
+
+    Raises:
+        ValueError: If a line is not a JSON object or string
+    """
+    for line_number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Line {line_number}: invalid JSON: {e}") from None
+        if isinstance(record, str):
+            yield {"message": record, "response": ""}
+        elif isinstance(record, dict):
+            yield {"response": "", **record}
+        else:
+            raise ValueError(
+                f"Line {line_number}: expected an object or string, "
+                f"got {type(record).__name__}"
+            )
+
+
+def micro_batches(items: Iterable[Any], batch_size: int) -> Iterator[list[Any]]:
+    """
+    Group an iterable into lists of at most batch_size items.
+
+    Args:
+        items: Items to group
+        batch_size: Maximum items per batch
+
+    Yields:
+        list: Consecutive batches, preserving order
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+    iterator = iter(items)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
+
+
+def write_jsonl(records: Iterable[dict[str, Any]], output: TextIO) -> int:
+    """
+    Write records as JSON lines.
+
+    Args:
+        records: Records to write
+        output: Text stream to write to
+
+    Returns:
+        int: Number of records written
+    """
+    count = 0
+    for record in records:
+        output.write(json.dumps(record, ensure_ascii=False))
+        output.write("\n")
+        count += 1
+    return count
+
+
+def run_jsonl_pipeline(
+    input_stream: Iterable[str],
+    output_stream: TextIO,
+    app: Any = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_workers: int = 1,
+    max_pending: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    process_batch: Optional[
+        Callable[[list[dict[str, Any]]], list[dict[str, Any]]]
+    ] = None,
+) -> PipelineStats:
+    """
+    Stream JSONL messages through a graph and write the results incrementally.
+
+    Args:
+        input_stream: JSONL text lines
+        output_stream: Text stream for the resulting states
+        app: Compiled graph (defaults to the Lesson 2 simple graph)
+        batch_size: States per micro-batch
+        max_workers: Worker threads when no executor is given
+        max_pending: Micro-batches allowed in flight before reading pauses
+            (defaults to two per worker)
+        executor: Executor to run batches on, e.g. a ProcessPoolExecutor;
+            it is not shut down by the pipeline
+        process_batch: Function run on each batch (defaults to invoking app
+            on every state); must be picklable when using a process pool
+
+    Returns:
+        PipelineStats: Counts and timing for the run
+    """
+    if max_pending is None:
+        max_pending = DEFAULT_PENDING_PER_WORKER * max_workers
+    if max_pending < 1:
+        raise ValueError(f"max_pending must be at least 1, got {max_pending}")
+
+    if process_batch is None:
+        if app is None:
+            from src.modules.introduction.lessons.lesson_2_simple_graph.simple_graph import (
+                create_simple_graph,
+            )
+
+            app = create_simple_graph()
+
+        def process_batch(batch: list[dict[str, Any]]) -> list[dict[str, Any]]:
+            return [app.invoke(state) for state in batch]
+
+    stats = PipelineStats()
+    start = time.perf_counter()
+    pending: deque[Future] = deque()
+
+    def drain_oldest() -> None:
+        # Writing strictly in submission order keeps output aligned with input
+        results = pending.popleft().result()
+        stats.records += write_jsonl(results, output_stream)
+        stats.batches += 1
+        output_stream.flush()
+
+    with ExitStack() as stack:
+        if executor is None:
+            executor = stack.enter_context(ThreadPoolExecutor(max_workers=max_workers))
+        try:
+            for batch in micro_batches(read_jsonl(input_stream), batch_size):
+                while len(pending) >= max_pending:
+                    drain_oldest()
+                pending.append(executor.submit(process_batch, batch))
+            while pending:
+                drain_oldest()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    stats.seconds = time.perf_counter() - start
+    return stats
+
+
+def run_jsonl_file(
+    input_path: Union[str, Path],
+    output_path: Union[str, Path],
+    **kwargs: Any,
+) -> PipelineStats:
+    """
+    Run the pipeline between two files; "-" means stdin or stdout.
+
+    Args:
+        input_path: JSONL input file, or "-"
+        output_path: JSONL output file, or "-"
+        **kwargs: Options passed to run_jsonl_pipeline()
+
+    Returns:
+        PipelineStats: Counts and timing for the run
+    """
+    with ExitStack() as stack:
+        input_stream = (
+            sys.stdin
+            if str(input_path) == "-"
+            else stack.enter_context(open(input_path, encoding="utf-8"))
+        )
+        output_stream = (
+            sys.stdout
+            if str(output_path) == "-"
+            else stack.enter_context(open(output_path, "w", encoding="utf-8"))
+        )
+        return run_jsonl_pipeline(input_stream, output_stream, **kwargs)
@@ -0,0 +1,208 @@
+"""
+Keyword Matcher
+
+Multi-pattern keyword matching for message routing. Every keyword is
+inserted into a trie, and the trie is compiled into a single regular
+expression (e.g. "hel(?:lo|p)" for "hello" and "help"), so each message is
+scanned in one pass by the C regex engine. At each position only the
+branches for the next character are tried, which keeps the cost flat as
+keywords are added, unlike testing `keyword in text` once per keyword.
+
+Example:
+    from src.modules.introduction.utils.keyword_matcher import KeywordMatcher
+
+    matcher = KeywordMatcher({
+        "urgent": "urgent", "emergency": "urgent", "down": "urgent",
+        "error": "technical", "bug": "technical",
+        "refund": "billing", "payment": "billing",
+    })
+    matcher.labels("Payment page is down!")                      # {"billing", "urgent"}
+    matcher.classify("Payment page is down!",
+                     ["urgent", "technical", "billing"], "general")  # "urgent"
+"""
+
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator, Mapping, Optional, Sequence, Union
+
+
+@dataclass(frozen=True)
+class KeywordMatch:
+    """
+    A keyword occurrence in a text.
+
+    Attributes:
+        start: Index of the first character
+        end: Index one past the last character
+        keyword: The matched keyword, as given to the matcher
+        label: The keyword's label
+    """
+
+    start: int
+    end: int
+    keyword: str
+    label: str
+
+
+def _trie_pattern(node: dict[str, Any]) -> str:
+    """Write a trie node as a regex; "" marks the end of a keyword."""
+    branches = [
+        re.escape(char) + _trie_pattern(child)
+        for char, child in sorted(node.items())
+        if char
+    ]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    if "" in node:
+        # Greedy optional group: the longest keyword is tried first
+        return "(?:" + body + ")?"
+    return body
+
+
+class KeywordMatcher:
+    """
+    Single-pass matcher for a set of labelled keywords.
+
+    Attributes:
+        ignore_case: Whether matching is case-insensitive
+        whole_words: Whether matches must not touch letters, digits or "_"
+    """
+
+    def __init__(
+        self,
+        keywords: Union[Mapping[str, str], Iterable[str]],
+        ignore_case: bool = True,
+        whole_words: bool = False,
+    ):
+        if not isinstance(keywords, Mapping):
+            keywords = {keyword: keyword for keyword in keywords}
+        if not keywords:
+            raise ValueError("KeywordMatcher needs at least one keyword")
+        self.ignore_case = ignore_case
+        self.whole_words = whole_words
+
+        # Normalised keyword -> (keyword, label)
+        self._entries: dict[str, tuple[str, str]] = {}
+        trie: dict[str, Any] = {}
+        for keyword, label in keywords.items():
+            if not keyword:
+                raise ValueError("Keywords must be non-empty")
+            normalized = self._normalize(keyword)
+            self._entries.setdefault(normalized, (keyword, label))
+            node = trie
+            for char in normalized:
+                node = node.setdefault(char, {})
+            node[""] = {}
+
+        # The regex reports the longest keyword starting at each position;
+        # shorter keywords starting there are exactly its keyword prefixes
+        self._prefixes: dict[str, tuple[str, ...]] = {
+            normalized: tuple(
+                normalized[:length]
+                for length in range(len(normalized), 0, -1)
+                if normalized[:length] in self._entries
+            )
+            for normalized in self._entries
+        }
+
+        # The lookahead finds overlapping occurrences at every position; the
+        # leading character class lets the regex engine skip ahead quickly
+        first_chars = "".join(re.escape(char) for char in sorted(trie))
+        start_guard = r"(?<!\w)" if whole_words else ""
+        self._source = f"{start_guard}(?=[{first_chars}])(?=({_trie_pattern(trie)}))"
+        self._pattern = re.compile(self._source)
+        self._folding_pattern: Optional[re.Pattern] = None
+
+    def _normalize(self, text: str) -> str:
+        return text.lower() if self.ignore_case else text
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _bounded_end(text: str, end: int) -> bool:
+        if end >= len(text):
+            return True
+        after = text[end]
+        return not (after.isalnum() or after == "_")
+
+    def _scan(self, text: str) -> Iterator[tuple[int, str]]:
+        """Yield (start, normalised keyword) for every occurrence."""
+        entries = self._entries
+        subject, pattern = text, self._pattern
+        if self.ignore_case:
+            lowered = text.lower()
+            if len(lowered) == len(text):
+                # Matching lowercased text is much faster than re.IGNORECASE
+                subject = lowered
+            else:
+                # A few characters lowercase to several, which would shift
+                # positions; fall back to case-insensitive matching
+                if self._folding_pattern is None:
+                    self._folding_pattern = re.compile(self._source, re.IGNORECASE)
+                pattern = self._folding_pattern
+        for match in pattern.finditer(subject):
+            start = match.start()
+            longest = self._normalize(match.group(1))
+            if longest not in entries:
+                continue
+            for keyword in self._prefixes[longest]:
+                if not self.whole_words or self._bounded_end(
+                    text, start + len(keyword)
+                ):
+                    yield start, keyword
+
+    def find_all(self, text: str) -> list[KeywordMatch]:
+        """
+        Find every keyword occurrence, including overlapping ones.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            list: Matches ordered by start position, longest first
+        """
+        matches = []
+        for start, normalized in self._scan(text):
+            keyword, label = self._entries[normalized]
+            matches.append(KeywordMatch(start, start + len(normalized), keyword, label))
+        return matches
+
+    def labels(self, text: str) -> set[str]:
+        """Return the labels of every keyword found in text."""
+        entries = self._entries
+        return {entries[normalized][1] for _, normalized in self._scan(text)}
+
+    def count(self, text: str) -> Counter:
+        """Return how many keyword occurrences each label has in text."""
+        entries = self._entries
+        return Counter(entries[normalized][1] for _, normalized in self._scan(text))
+
+    def contains_any(self, text: str) -> bool:
+        """Return whether any keyword occurs in text, stopping at the first."""
+        return next(self._scan(text), None) is not None
+
+    def classify(
+        self, text: str, priority: Sequence[str], default: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Route text to the highest-priority label it contains.
+
+        This replaces chains like `if any(w in text for w in urgent_words):
+        ... elif any(w in text for w in billing_words): ...` with one scan.
+
+        Args:
+            text: Text to classify
+            priority: Labels from highest to lowest priority
+            default: Result when no prioritised label is found
+
+        Returns:
+            str: The chosen label, or default
+        """
+        found = self.labels(text)
+        for label in priority:
+            if label in found:
+                return label
+        return default
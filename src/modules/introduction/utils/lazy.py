@@ -0,0 +1,55 @@
+"""
+Lazy Exports
+
+Helpers for PEP 562 lazy attributes on packages. A package declares what it
+re-exports as a mapping of attribute name to "module" or "module:attribute"
+(module paths may be relative to the package), and the target is only
+imported the first time the attribute is accessed. This keeps heavy
+dependencies such as langgraph, langchain and google.generativeai out of
+package import time.
+
+Example (in a package __init__.py):
+    from src.modules.introduction.utils.lazy import lazy_exports
+
+    __getattr__, __dir__, __all__ = lazy_exports(__name__, {
+        "create_simple_graph": ".simple_graph:create_simple_graph",
+    })
+"""
+
+import importlib
+import sys
+from typing import Any, Callable
+
+
+def lazy_exports(
+    package: str,
+    exports: dict[str, str],
+) -> tuple[Callable[[str], Any], Callable[[], list[str]], list[str]]:
+    """
+    Build the module-level __getattr__, __dir__ and __all__ for a package.
+
+    Resolved attributes are stored in the package globals, so each target is
+    imported at most once and later lookups bypass __getattr__ entirely.
+
+    Args:
+        package: The package's __name__
+        exports: Mapping of attribute name to "module" or "module:attribute"
+
+    Returns:
+        tuple: (__getattr__, __dir__, __all__) for the package
+    """
+
+    def __getattr__(name: str) -> Any:
+        target = exports.get(name)
+        if target is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        module_name, _, attribute = target.partition(":")
+        module = importlib.import_module(module_name, package)
+        value = getattr(module, attribute) if attribute else module
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__, list(exports)
@@ -0,0 +1,453 @@
+"""
+LLM Response Cache
+
+A persistent, content-addressed cache for model calls. Responses are stored
+in SQLite (WAL mode, one connection per thread, so readers never block each
+other) under a SHA-256 key of the model name, prompt and generation
+parameters. The cache can be size-bounded, evicting least-recently-used
+responses, and run in one of four modes:
+
+    read_write  serve hits, call the model on a miss and store the result
+    replay      serve hits only; a miss raises CacheMissError instead of
+                calling the model, so reruns and tests make zero network calls
+    refresh     always call the model and overwrite the stored result
+    off         bypass the cache entirely
+
+Example:
+    from src.modules.introduction.utils.fake_llm import FakeLLM
+    from src.modules.introduction.utils.llm_cache import CachedLLM, LLMResponseCache
+
+    llm = CachedLLM(FakeLLM(), LLMResponseCache(".llm_cache.sqlite3"))
+    llm.generate("Hello there!", temperature=0.0)   # calls the model
+    llm.generate("Hello there!", temperature=0.0)   # served from disk
+"""
+
+import hashlib
+import itertools
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+# Cache modes, see the module docstring
+MODES = ("read_write", "replay", "refresh", "off")
+
+# Environment variables read by cache_from_env()
+CACHE_PATH_ENV = "LLM_CACHE_PATH"
+CACHE_MODE_ENV = "LLM_CACHE_MODE"
+CACHE_MAX_BYTES_ENV = "LLM_CACHE_MAX_BYTES"
+
+# Access times are buffered in memory and written in batches of this size
+TOUCH_FLUSH_SIZE = 256
+
+# Number of least-recently-used rows read per eviction query
+EVICT_BATCH_SIZE = 64
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    response TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access);
+CREATE TABLE IF NOT EXISTS usage (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    bytes INTEGER NOT NULL
+);
+INSERT INTO usage
+    SELECT 0, (SELECT COALESCE(SUM(size), 0) FROM responses)
+    WHERE NOT EXISTS (SELECT 1 FROM usage);
+"""
+
+# Distinguishes in-memory databases created by this process
+_memory_ids = itertools.count()
+
+
+class CacheMissError(LookupError):
+    """Raised in replay mode when a response is not in the cache."""
+
+
+@dataclass
+class CacheStats:
+    """
+    Counters for an LLMResponseCache.
+
+    Attributes:
+        hits: Lookups served from the cache
+        misses: Lookups not found in the cache
+        writes: Responses stored
+        evictions: Responses removed to respect max_bytes
+    """
+
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def cache_key(model: str, prompt: Any, params: Optional[dict[str, Any]] = None) -> str:
+    """
+    Compute the content address of a model call.
+
+    Args:
+        model: Model name
+        prompt: Prompt text or JSON-serialisable message list
+        params: Generation parameters such as temperature
+
+    Returns:
+        str: Hex SHA-256 digest, independent of parameter order
+    """
+    payload = json.dumps(
+        {"model": model, "prompt": prompt, "params": params or {}},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    SQLite-backed response cache, safe to share between threads and processes.
+
+    Attributes:
+        path: Database file, or None for a private in-memory database
+        max_bytes: Maximum total response size, or None for no limit
+        mode: One of MODES
+        stats: Hit, miss, write and eviction counters for this instance
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path, None] = None,
+        max_bytes: Optional[int] = None,
+        mode: str = "read_write",
+    ):
+        if mode not in MODES:
+            raise ValueError(f"mode must be one of {MODES}, got {mode!r}")
+        self.path = Path(path) if path is not None else None
+        self.max_bytes = max_bytes
+        self.mode = mode
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        # Every per-thread connection, so close() can close them all
+        self._connections: list[sqlite3.Connection] = []
+        self._touched: dict[str, float] = {}
+
+        if self.path is None:
+            # A named shared-cache database lets every thread see the same data;
+            # _keeper holds it open for the lifetime of the cache
+            name = f"llm_cache_{os.getpid()}_{next(_memory_ids)}"
+            self._uri = f"file:{name}?mode=memory&cache=shared"
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._uri = self.path.resolve().as_uri()
+        self._keeper = self._connect()
+        with self._keeper:
+            self._keeper.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self._uri, uri=True, timeout=30, check_same_thread=False
+        )
+        if self.path is not None:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            if self.path is None:
+                connection = self._keeper
+            else:
+                connection = self._connect()
+                # Called with self._lock held or not; list.append is atomic
+                self._connections.append(connection)
+            self._local.connection = connection
+        return connection
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a response by key.
+
+        Args:
+            key: Key from cache_key()
+
+        Returns:
+            str: The cached response, or None on a miss
+        """
+        if self.path is None:
+            with self._lock:
+                row = self._connection.execute(
+                    "SELECT response FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+        else:
+            row = self._connection.execute(
+                "SELECT response FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+        with self._lock:
+            if row is None:
+                self.stats.misses += 1
+                return None
+            self.stats.hits += 1
+            self._touched[key] = time.time()
+            flush = len(self._touched) >= TOUCH_FLUSH_SIZE
+        if flush:
+            self.flush()
+        return row[0]
+
+    def put(self, key: str, model: str, response: str) -> None:
+        """
+        Store a response, evicting old entries if max_bytes is exceeded.
+
+        Args:
+            key: Key from cache_key()
+            model: Model name, stored for inspection
+            response: Response text
+        """
+        now = time.time()
+        size = len(response.encode("utf-8"))
+        with self._lock:
+            connection = self._connection
+            with connection:
+                # The running total lives in the database, so every process
+                # sharing the file sees the same figure
+                connection.execute(
+                    "UPDATE usage SET bytes = bytes + ?"
+                    " - COALESCE((SELECT size FROM responses WHERE key = ?), 0)",
+                    (size, key),
+                )
+                connection.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, model, response, size, now, now),
+                )
+            self.stats.writes += 1
+        self.flush()
+        if self.max_bytes is not None:
+            self._evict()
+
+    def flush(self) -> None:
+        """Write buffered access times, used for least-recently-used eviction."""
+        with self._lock:
+            if not self._touched:
+                return
+            touched, self._touched = self._touched, {}
+            connection = self._connection
+            with connection:
+                connection.executemany(
+                    "UPDATE responses SET last_access = MAX(last_access, ?)"
+                    " WHERE key = ?",
+                    [(accessed, key) for key, accessed in touched.items()],
+                )
+
+    def _evict(self) -> None:
+        with self._lock:
+            connection = self._connection
+            total = connection.execute("SELECT bytes FROM usage").fetchone()[0]
+            if total <= self.max_bytes:
+                return
+            removed = freed = 0
+            with connection:
+                # Take the write lock before re-reading the total, so processes
+                # evicting at the same time do not both count the same rows
+                connection.execute("BEGIN IMMEDIATE")
+                total = connection.execute("SELECT bytes FROM usage").fetchone()[0]
+                while total > self.max_bytes:
+                    rows = connection.execute(
+                        "SELECT key, size FROM responses ORDER BY last_access LIMIT ?",
+                        (EVICT_BATCH_SIZE,),
+                    ).fetchall()
+                    batch_removed = 0
+                    for key, size in rows:
+                        if total <= self.max_bytes:
+                            break
+                        cursor = connection.execute(
+                            "DELETE FROM responses WHERE key = ?", (key,)
+                        )
+                        if cursor.rowcount == 1:
+                            total -= size
+                            freed += size
+                            batch_removed += 1
+                    if not batch_removed:
+                        break
+                    removed += batch_removed
+                connection.execute("UPDATE usage SET bytes = bytes - ?", (freed,))
+            self.stats.evictions += removed
+
+    def cached_call(
+        self,
+        model: str,
+        prompt: Any,
+        params: Optional[dict[str, Any]],
+        call: Callable[[], str],
+    ) -> str:
+        """
+        Return the cached response for a call, invoking call() as the mode allows.
+
+        Args:
+            model: Model name
+            prompt: Prompt text or message list
+            params: Generation parameters
+            call: Zero-argument function that performs the real model call
+
+        Returns:
+            str: The response text
+
+        Raises:
+            CacheMissError: In replay mode, if the response is not cached
+        """
+        key, cached = self.lookup(model, prompt, params)
+        if cached is not None:
+            return cached
+        response = call()
+        if key is not None:
+            self.put(key, model, response)
+        return response
+
+    def lookup(
+        self, model: str, prompt: Any, params: Optional[dict[str, Any]]
+    ) -> tuple[Optional[str], Optional[str]]:
+        """
+        Apply the cache mode to a call before the model is invoked.
+
+        Args:
+            model: Model name
+            prompt: Prompt text or message list
+            params: Generation parameters
+
+        Returns:
+            tuple: (key, cached response); the response is None when the model
+                must be called, and the key is None when the result should not
+                be stored (mode "off")
+
+        Raises:
+            CacheMissError: In replay mode, if the response is not cached
+        """
+        if self.mode == "off":
+            return None, None
+        key = cache_key(model, prompt, params)
+        if self.mode == "refresh":
+            return key, None
+        cached = self.get(key)
+        if cached is None and self.mode == "replay":
+            raise CacheMissError(
+                f"No cached response for model '{model}' "
+                f"(key {key[:12]}) in replay mode"
+            )
+        return key, cached
+
+    def total_bytes(self) -> int:
+        """Return the total size of the stored responses."""
+        with self._lock:
+            return self._connection.execute("SELECT bytes FROM usage").fetchone()[0]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM responses"
+            ).fetchone()[0]
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return (
+                self._connection.execute(
+                    "SELECT 1 FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                is not None
+            )
+
+    def clear(self) -> None:
+        """Delete every stored response."""
+        with self._lock:
+            self._touched.clear()
+            connection = self._connection
+            with connection:
+                connection.execute("DELETE FROM responses")
+                connection.execute("UPDATE usage SET bytes = 0")
+
+    def close(self) -> None:
+        """Flush access times and close every thread's connection and the keeper."""
+        self.flush()
+        with self._lock:
+            connections, self._connections = self._connections, []
+            for connection in connections:
+                connection.close()
+        self._local.connection = None
+        self._keeper.close()
+
+    def __enter__(self) -> "LLMResponseCache":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def cache_from_env() -> LLMResponseCache:
+    """
+    Build a cache from LLM_CACHE_PATH, LLM_CACHE_MODE and LLM_CACHE_MAX_BYTES.
+
+    Returns:
+        LLMResponseCache: On-disk cache if LLM_CACHE_PATH is set, else in-memory
+    """
+    max_bytes = os.getenv(CACHE_MAX_BYTES_ENV)
+    return LLMResponseCache(
+        os.getenv(CACHE_PATH_ENV) or None,
+        max_bytes=int(max_bytes) if max_bytes else None,
+        mode=os.getenv(CACHE_MODE_ENV, "read_write"),
+    )
+
+
+class CachedLLM:
+    """
+    Wraps a model object so its calls go through an LLMResponseCache.
+
+    The wrapped model needs a model_name attribute and generate(prompt,
+    **params) and/or agenerate(prompt, **params) methods, as FakeLLM and the
+    shared LLM client provide.
+    """
+
+    def __init__(self, llm: Any, cache: Optional[LLMResponseCache] = None):
+        self.llm = llm
+        self.cache = cache if cache is not None else cache_from_env()
+
+    @property
+    def model_name(self) -> str:
+        """Name of the wrapped model."""
+        return self.llm.model_name
+
+    def generate(self, prompt: Any, **params: Any) -> str:
+        """Generate a response, served from the cache when possible."""
+        return self.cache.cached_call(
+            self.llm.model_name,
+            prompt,
+            params,
+            lambda: self.llm.generate(prompt, **params),
+        )
+
+    async def agenerate(self, prompt: Any, **params: Any) -> str:
+        """Async version of generate(); the lookup itself is synchronous."""
+        key, cached = self.cache.lookup(self.llm.model_name, prompt, params)
+        if cached is not None:
+            return cached
+        response = await self.llm.agenerate(prompt, **params)
+        if key is not None:
+            self.cache.put(key, self.llm.model_name, response)
+        return response
@@ -0,0 +1,443 @@
+"""
+Shared LLM Client
+
+One Gemini REST client shared by every node in Lessons 4-7, instead of a
+client per node. It keeps a pool of persistent HTTP connections, limits
+requests and tokens per minute with token buckets, and coalesces
+concurrent identical calls: while a request for a (prompt, params) pair is in
+flight, callers asking for the same pair wait for its result instead of
+sending a duplicate request.
+
+Example:
+    from src.modules.introduction.utils.llm_client import get_shared_client
+
+    client = get_shared_client(requests_per_minute=60, tokens_per_minute=100_000)
+    print(client.generate("Hello there!", temperature=0.0))
+    print(client.metrics())
+
+The client exposes model_name, generate() and agenerate(), so it can be
+wrapped with utils.llm_cache.CachedLLM.
+"""
+
+import asyncio
+import http.client
+import json
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Optional
+from urllib.parse import quote, urlsplit
+
+# Gemini REST endpoint and default model
+DEFAULT_BASE_URL = "https://generativelanguage.googleapis.com/v1beta"
+DEFAULT_MODEL = "gemini-1.5-flash"
+
+# Default number of pooled HTTP connections
+DEFAULT_POOL_SIZE = 8
+
+# Rough characters-per-token ratio used to estimate prompt tokens
+CHARS_PER_TOKEN = 4
+
+
+class LLMClientError(RuntimeError):
+    """Raised when the model API returns an error or an unexpected response."""
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass
+class ClientMetrics:
+    """
+    Counters for an LLMClient.
+
+    Attributes:
+        requests: HTTP requests sent
+        coalesced: Calls answered by another caller's in-flight request
+        errors: Requests that failed
+        reconnects: Stale pooled connections replaced during a request
+        tokens: Tokens reported by the API (or estimated)
+        rate_limited_seconds: Time spent waiting on the rate limiter
+        request_seconds: Total time spent in HTTP requests
+    """
+
+    requests: int = 0
+    coalesced: int = 0
+    errors: int = 0
+    reconnects: int = 0
+    tokens: int = 0
+    rate_limited_seconds: float = 0.0
+    request_seconds: float = 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        """Mean seconds per HTTP request."""
+        return self.request_seconds / self.requests if self.requests else 0.0
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket refilled continuously at a per-minute rate.
+
+    Attributes:
+        rate_per_minute: Tokens added per minute
+        capacity: Maximum tokens held (the allowed burst)
+    """
+
+    def __init__(
+        self,
+        rate_per_minute: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if rate_per_minute <= 0:
+            raise ValueError(f"rate_per_minute must be positive, got {rate_per_minute}")
+        self.rate_per_minute = rate_per_minute
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(
+            self.capacity,
+            self._tokens + (now - self._updated) * self.rate_per_minute / 60,
+        )
+        self._updated = now
+
+    def try_acquire(self, amount: float = 1) -> float:
+        """
+        Take tokens if available.
+
+        Args:
+            amount: Tokens to take (capped at capacity so large requests can proceed)
+
+        Returns:
+            float: 0 if the tokens were taken, else seconds until they will be available
+        """
+        amount = min(amount, self.capacity)
+        with self._lock:
+            self._refill()
+            if self._tokens >= amount:
+                self._tokens -= amount
+                return 0.0
+            return (amount - self._tokens) * 60 / self.rate_per_minute
+
+    def acquire(self, amount: float = 1) -> float:
+        """
+        Block until tokens are available and take them.
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        waited = 0.0
+        while (delay := self.try_acquire(amount)) > 0:
+            self._sleep(delay)
+            waited += delay
+        return waited
+
+
+class ConnectionPool:
+    """
+    Pool of persistent HTTP(S) connections to one host.
+
+    Connections are created lazily up to maxsize; callers block when all are
+    checked out.
+    """
+
+    def __init__(
+        self, base_url: str, maxsize: int = DEFAULT_POOL_SIZE, timeout: float = 60.0
+    ):
+        parts = urlsplit(base_url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported URL scheme in {base_url!r}")
+        self.scheme = parts.scheme
+        self.host = parts.hostname
+        self.port = parts.port
+        self.path_prefix = parts.path.rstrip("/")
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self._idle: "queue.LifoQueue[http.client.HTTPConnection]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(maxsize)
+        self.created = 0
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        self.created += 1
+        connection_class = (
+            http.client.HTTPSConnection
+            if self.scheme == "https"
+            else http.client.HTTPConnection
+        )
+        return connection_class(self.host, self.port, timeout=self.timeout)
+
+    def request(
+        self, method: str, path: str, body: bytes, headers: dict[str, str]
+    ) -> tuple[int, bytes, bool]:
+        """
+        Send a request on a pooled connection.
+
+        A request that fails because the server closed an idle connection is
+        retried once on a fresh connection.
+
+        Returns:
+            tuple: (status, response body, whether a stale connection was replaced)
+        """
+        self._slots.acquire()
+        try:
+            try:
+                connection = self._idle.get_nowait()
+                reused = True
+            except queue.Empty:
+                connection = self._new_connection()
+                reused = False
+
+            reconnected = False
+            while True:
+                try:
+                    connection.request(
+                        method, self.path_prefix + path, body=body, headers=headers
+                    )
+                    response = connection.getresponse()
+                    data = response.read()
+                    break
+                except (
+                    http.client.RemoteDisconnected,
+                    ConnectionResetError,
+                    BrokenPipeError,
+                ):
+                    connection.close()
+                    if not reused:
+                        raise
+                    connection, reused, reconnected = (
+                        self._new_connection(),
+                        False,
+                        True,
+                    )
+                except Exception:
+                    connection.close()
+                    raise
+
+            if response.will_close:
+                connection.close()
+            else:
+                self._idle.put(connection)
+            return response.status, data, reconnected
+        finally:
+            self._slots.release()
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+class LLMClient:
+    """
+    Gemini generateContent client with pooling, rate limiting and coalescing.
+
+    Attributes:
+        model_name: Model used for every call
+        pool: Underlying connection pool
+    """
+
+    def __init__(
+        self,
+        model: str = DEFAULT_MODEL,
+        api_key: Optional[str] = None,
+        base_url: str = DEFAULT_BASE_URL,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        timeout: float = 60.0,
+    ):
+        self.model_name = model
+        self.api_key = (
+            api_key if api_key is not None else os.getenv("GOOGLE_API_KEY", "")
+        )
+        self.pool = ConnectionPool(base_url, pool_size, timeout)
+        self.request_limiter = (
+            TokenBucket(requests_per_minute) if requests_per_minute else None
+        )
+        self.token_limiter = (
+            TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        )
+        self._metrics = ClientMetrics()
+        self._lock = threading.Lock()
+        self._in_flight: dict[str, Future] = {}
+
+    def _record(self, **increments: Any) -> None:
+        with self._lock:
+            for name, value in increments.items():
+                setattr(self._metrics, name, getattr(self._metrics, name) + value)
+
+    def metrics(self) -> ClientMetrics:
+        """Return a snapshot of the client's counters."""
+        with self._lock:
+            return replace(self._metrics)
+
+    @staticmethod
+    def estimate_tokens(prompt: str, params: dict[str, Any]) -> int:
+        """Estimate the tokens a call will use, for the tokens-per-minute limiter."""
+        return (
+            len(prompt) // CHARS_PER_TOKEN + 1 + int(params.get("max_output_tokens", 0))
+        )
+
+    def _post(self, prompt: str, params: dict[str, Any]) -> str:
+        waited = 0.0
+        if self.request_limiter is not None:
+            waited += self.request_limiter.acquire()
+        if self.token_limiter is not None:
+            waited += self.token_limiter.acquire(self.estimate_tokens(prompt, params))
+
+        body = json.dumps(
+            {
+                "contents": [{"role": "user", "parts": [{"text": prompt}]}],
+                "generationConfig": params,
+            }
+        ).encode("utf-8")
+        headers = {"Content-Type": "application/json", "x-goog-api-key": self.api_key}
+        path = f"/models/{quote(self.model_name)}:generateContent"
+
+        start = time.perf_counter()
+        try:
+            status, data, reconnected = self.pool.request("POST", path, body, headers)
+        except (OSError, http.client.HTTPException) as e:
+            self._record(
+                requests=1,
+                errors=1,
+                rate_limited_seconds=waited,
+                request_seconds=time.perf_counter() - start,
+            )
+            raise LLMClientError(f"Request to {self.model_name} failed: {e}") from e
+        elapsed = time.perf_counter() - start
+
+        if status != 200:
+            self._record(
+                requests=1,
+                errors=1,
+                rate_limited_seconds=waited,
+                request_seconds=elapsed,
+            )
+            raise LLMClientError(
+                f"{self.model_name} returned HTTP {status}: {data[:200]!r}", status
+            )
+        try:
+            payload = json.loads(data)
+            text = "".join(
+                part.get("text", "")
+                for part in payload["candidates"][0]["content"]["parts"]
+            )
+        except (ValueError, KeyError, IndexError) as e:
+            self._record(
+                requests=1,
+                errors=1,
+                rate_limited_seconds=waited,
+                request_seconds=elapsed,
+            )
+            raise LLMClientError(
+                f"Unexpected response from {self.model_name}: {data[:200]!r}"
+            ) from e
+
+        tokens = payload.get("usageMetadata", {}).get(
+            "totalTokenCount"
+        ) or self.estimate_tokens(prompt, params)
+        self._record(
+            requests=1,
+            reconnects=int(reconnected),
+            tokens=tokens,
+            rate_limited_seconds=waited,
+            request_seconds=elapsed,
+        )
+        return text
+
+    def generate(self, prompt: str, **params: Any) -> str:
+        """
+        Generate a response, sharing the request with identical in-flight calls.
+
+        Args:
+            prompt: Prompt text
+            **params: Gemini generationConfig fields, e.g. temperature
+
+        Returns:
+            str: The response text
+
+        Raises:
+            LLMClientError: If the request fails
+        """
+        key = json.dumps([prompt, params], sort_keys=True, default=str)
+        with self._lock:
+            future = self._in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = self._in_flight[key] = Future()
+            else:
+                self._metrics.coalesced += 1
+        if not owner:
+            return future.result()
+
+        try:
+            result = self._post(prompt, params)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+    async def agenerate(self, prompt: str, **params: Any) -> str:
+        """Async version of generate(), run on the default executor."""
+        return await asyncio.to_thread(self.generate, prompt, **params)
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self.pool.close()
+
+
+# Clients shared across nodes, keyed by model and endpoint
+_shared_clients: dict[tuple[str, str], LLMClient] = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_client(
+    model: str = DEFAULT_MODEL, base_url: str = DEFAULT_BASE_URL, **kwargs: Any
+) -> LLMClient:
+    """
+    Return the process-wide client for a model, creating it on first use.
+
+    Args:
+        model: Model name
+        base_url: API endpoint
+        **kwargs: LLMClient options, applied only when the client is created
+
+    Returns:
+        LLMClient: The shared client
+    """
+    with _shared_lock:
+        client = _shared_clients.get((model, base_url))
+        if client is None:
+            client = _shared_clients[(model, base_url)] = LLMClient(
+                model, base_url=base_url, **kwargs
+            )
+        return client
+
+
+def close_shared_clients() -> None:
+    """Close and forget every shared client."""
+    with _shared_lock:
+        for client in _shared_clients.values():
+            client.close()
+        _shared_clients.clear()
@@ -51,6 +51,17 @@ def expected_responses():
     ]
 
 
+@pytest.fixture(scope="session")
+def simple_graph_app():
+    """Provide the Lesson 2 simple graph, compiled once via the graph cache."""
+    from src.modules.introduction.graphs.cache import compile_cached
+    from src.modules.introduction.lessons.lesson_2_simple_graph.simple_graph import (
+        build_simple_graph,
+    )
+
+    return compile_cached(build_simple_graph())
+
+
 @pytest.fixture(scope="function")
 def clean_environment():
     """Ensure clean environment for each test."""
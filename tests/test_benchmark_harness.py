@@ -0,0 +1,68 @@
+"""
+Tests for the benchmark harness and graph overhead benchmark helpers.
+"""
+
+import pytest
+
+from benchmarks.harness import (
+    BenchmarkResult,
+    find_regressions,
+    load_baselines,
+    measure,
+    percentile,
+    save_baselines,
+)
+
+
+def make_result(name="bench", p50=100.0, peak=10.0):
+    """Build a result with the given p50 latency and peak allocation."""
+    return BenchmarkResult(name, 10, p50, p50, p50, p50, peak, 0)
+
+
+def test_percentile_interpolates():
+    """Test percentile() on a known distribution."""
+    samples = list(range(1, 101))
+    assert percentile(samples, 0) == 1
+    assert percentile(samples, 50) == 50.5
+    assert percentile(samples, 100) == 100
+    assert percentile([7.0], 99) == 7.0
+    with pytest.raises(ValueError):
+        percentile([], 50)
+
+
+def test_measure_reports_ordered_percentiles():
+    """Test that measure() returns consistent statistics."""
+    result = measure(
+        "alloc", lambda: [0] * 10_000, iterations=20, warmup=2, alloc_repeats=2
+    )
+    assert result.iterations == 20
+    assert 0 < result.p50_us <= result.p95_us <= result.p99_us
+    assert result.peak_alloc_kib >= 10_000 * 8 / 1024
+
+
+def test_baselines_round_trip(tmp_path):
+    """Test saving and loading baselines for several suites."""
+    path = tmp_path / "baselines.json"
+    assert load_baselines(path) == {}
+    save_baselines("a", [make_result("x")], path)
+    save_baselines("b", [make_result("y")], path)
+
+    baselines = load_baselines(path)
+    assert set(baselines) == {"a", "b"}
+    assert baselines["a"]["x"]["p50_us"] == 100.0
+
+
+def test_find_regressions():
+    """Test regression detection on latency and allocations."""
+    baseline = {"fast": {"p50_us": 100.0, "peak_alloc_kib": 10.0}}
+
+    assert find_regressions([make_result("fast", 140.0)], baseline, tolerance=0.5) == []
+    assert (
+        len(find_regressions([make_result("fast", 200.0)], baseline, tolerance=0.5))
+        == 1
+    )
+    assert (
+        len(find_regressions([make_result("fast", peak=30.0)], baseline, tolerance=0.5))
+        == 1
+    )
+    assert find_regressions([make_result("new", 1e9)], baseline) == []
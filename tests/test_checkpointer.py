@@ -0,0 +1,205 @@
+"""
+Tests for the SQLite checkpointer in the agent memory lesson.
+"""
+
+import asyncio
+import importlib
+import operator
+from typing import Annotated, TypedDict
+
+import pytest
+from langgraph.graph import END, START, StateGraph
+from langgraph.types import Command, interrupt
+
+checkpointer = importlib.import_module(
+    "src.modules.introduction.lessons.lesson-7-agent-memory.checkpointer"
+)
+SqliteCheckpointer = checkpointer.SqliteCheckpointer
+
+
+class MemoryState(TypedDict, total=False):
+    messages: Annotated[list, operator.add]
+    profile: dict
+    turns: int
+
+
+def build_graph(ask_user: bool = False):
+    """Two parallel nodes writing to a shared list, plus an optional interrupt."""
+
+    def reply(state: MemoryState) -> dict:
+        return {
+            "messages": [f"reply {state.get('turns', 0)}"],
+            "turns": state.get("turns", 0) + 1,
+        }
+
+    def log(state: MemoryState) -> dict:
+        return {"messages": ["logged"]}
+
+    def confirm(state: MemoryState) -> dict:
+        return {"messages": [interrupt("confirm?")]}
+
+    graph = StateGraph(MemoryState)
+    graph.add_node("reply", reply)
+    graph.add_node("log", log)
+    graph.add_edge(START, "reply")
+    graph.add_edge(START, "log")
+    if ask_user:
+        graph.add_node("confirm", confirm)
+        graph.add_edge(["reply", "log"], "confirm")
+        graph.add_edge("confirm", END)
+    else:
+        graph.add_edge(["reply", "log"], END)
+    return graph
+
+
+CONFIG = {"configurable": {"thread_id": "sam"}}
+
+
+@pytest.mark.parametrize("store_deltas", [True, False])
+def test_state_survives_reopening(tmp_path, store_deltas):
+    """Test that a conversation resumes from a new saver on the same file."""
+    path = tmp_path / "memory.sqlite3"
+    with SqliteCheckpointer(path, store_deltas=store_deltas) as saver:
+        app = build_graph().compile(checkpointer=saver)
+        app.invoke({"messages": ["hi"], "profile": {"name": "Sam"}}, CONFIG)
+
+    with SqliteCheckpointer(path, store_deltas=store_deltas) as saver:
+        app = build_graph().compile(checkpointer=saver)
+        state = app.invoke({"messages": ["again"]}, CONFIG)
+        history = list(app.get_state_history(CONFIG))
+
+    assert state["profile"] == {"name": "Sam"}
+    assert state["turns"] == 2
+    assert state["messages"][0] == "hi" and state["messages"][3] == "again"
+    assert sorted(state["messages"][1:3]) == ["logged", "reply 0"]
+    assert len(history) == 6
+
+
+def test_deltas_store_unchanged_channels_once():
+    """Test that delta storage does not copy unchanged channels."""
+    delta, snapshot = SqliteCheckpointer(), SqliteCheckpointer(store_deltas=False)
+    for saver in (delta, snapshot):
+        app = build_graph().compile(checkpointer=saver)
+        app.invoke({"messages": ["hi"], "profile": {"bio": "x" * 5000}}, CONFIG)
+        for _ in range(3):
+            app.invoke({"messages": ["more"]}, CONFIG)
+
+    delta_stats, snapshot_stats = delta.stats(), snapshot.stats()
+    assert delta_stats.checkpoints == snapshot_stats.checkpoints
+    assert snapshot_stats.blobs == 0
+    assert delta_stats.payload_bytes * 3 < snapshot_stats.payload_bytes
+    assert (
+        build_graph().compile(checkpointer=delta).get_state(CONFIG).values
+        == build_graph().compile(checkpointer=snapshot).get_state(CONFIG).values
+    )
+
+
+def test_writes_are_committed_once_per_superstep():
+    """Test that parallel task writes share the checkpoint's transaction."""
+    batched, unbatched = SqliteCheckpointer(), SqliteCheckpointer(batch_writes=False)
+    for saver in (batched, unbatched):
+        build_graph().compile(checkpointer=saver).invoke({"messages": ["hi"]}, CONFIG)
+
+    assert batched.stats().commits == batched.stats().checkpoints
+    assert unbatched.stats().commits > unbatched.stats().checkpoints
+
+
+def test_interrupt_writes_are_persisted(tmp_path):
+    """Test that an interrupted run can be resumed from another saver."""
+    path = tmp_path / "memory.sqlite3"
+    saver = SqliteCheckpointer(path)
+    app = build_graph(ask_user=True).compile(checkpointer=saver)
+    app.invoke({"messages": ["hi"]}, CONFIG)
+    assert app.get_state(CONFIG).next == ("confirm",)
+
+    # The first saver is left open: interrupt writes must not wait for close()
+    with SqliteCheckpointer(path) as other:
+        state = (
+            build_graph(ask_user=True)
+            .compile(checkpointer=other)
+            .invoke(Command(resume="yes"), CONFIG)
+        )
+    saver.close()
+
+    assert state["messages"][-1] == "yes"
+
+
+class CounterState(TypedDict):
+    x: int
+
+
+def build_counter_graph():
+    """Single node incrementing x, for time-travel tests."""
+    graph = StateGraph(CounterState)
+    graph.add_node("inc", lambda state: {"x": state["x"] + 1})
+    graph.add_edge(START, "inc")
+    graph.add_edge("inc", END)
+    return graph
+
+
+@pytest.mark.parametrize("store_deltas", [True, False])
+def test_forking_keeps_original_branch(store_deltas):
+    """Test that forking from an older checkpoint keeps the original history."""
+    saver = SqliteCheckpointer(store_deltas=store_deltas)
+    app = build_counter_graph().compile(checkpointer=saver)
+    app.invoke({"x": 0}, CONFIG)
+    original = [(s.config, s.values) for s in app.get_state_history(CONFIG)]
+
+    # Fork from the input checkpoint ({"x": 0}) and run the fork
+    first = original[-2][0]
+    fork = app.update_state(first, {"x": 100})
+    assert app.invoke(None, fork)["x"] == 101
+
+    assert [app.get_state(config).values for config, _ in original] == [
+        values for _, values in original
+    ]
+    assert [s.values.get("x") for s in app.get_state_history(CONFIG)][:2] == [101, 100]
+
+
+def test_list_filters_and_latest():
+    """Test list() ordering, limit, before and metadata filters."""
+    saver = SqliteCheckpointer()
+    app = build_graph().compile(checkpointer=saver)
+    app.invoke({"messages": ["hi"]}, CONFIG)
+    app.invoke({"messages": ["hi"]}, {"configurable": {"thread_id": "other"}})
+
+    checkpoints = list(saver.list(CONFIG))
+    ids = [c.config["configurable"]["checkpoint_id"] for c in checkpoints]
+    assert ids == sorted(ids, reverse=True)
+    assert saver.get_tuple(CONFIG).config == checkpoints[0].config
+    assert checkpoints[0].parent_config == checkpoints[1].config
+
+    assert len(list(saver.list(CONFIG, limit=2))) == 2
+    assert [c.config for c in saver.list(CONFIG, before=checkpoints[1].config)] == [
+        c.config for c in checkpoints[2:]
+    ]
+    assert [
+        c.metadata["source"] for c in saver.list(CONFIG, filter={"source": "input"})
+    ] == ["input"]
+    assert len(list(saver.list(None))) == 2 * len(checkpoints)
+
+
+def test_delete_thread():
+    """Test that deleting a thread removes only its checkpoints."""
+    saver = SqliteCheckpointer()
+    app = build_graph().compile(checkpointer=saver)
+    app.invoke({"messages": ["hi"]}, CONFIG)
+    app.invoke({"messages": ["hi"]}, {"configurable": {"thread_id": "other"}})
+
+    saver.delete_thread("sam")
+
+    assert saver.get_tuple(CONFIG) is None
+    assert saver.get_tuple({"configurable": {"thread_id": "other"}}) is not None
+
+
+def test_async_graph():
+    """Test the async API through ainvoke."""
+    saver = SqliteCheckpointer()
+    app = build_graph().compile(checkpointer=saver)
+
+    async def run() -> dict:
+        await app.ainvoke({"messages": ["hi"]}, CONFIG)
+        return await app.ainvoke({"messages": ["again"]}, CONFIG)
+
+    assert asyncio.run(run())["turns"] == 2
+    assert len(list(saver.list(CONFIG))) == 6
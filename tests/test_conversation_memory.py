@@ -0,0 +1,247 @@
+"""
+Tests for the bounded conversation memory in the agent memory lesson.
+"""
+
+import importlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+conversation_memory = importlib.import_module(
+    "src.modules.introduction.lessons.lesson-7-agent-memory.conversation_memory"
+)
+checkpointer = importlib.import_module(
+    "src.modules.introduction.lessons.lesson-7-agent-memory.checkpointer"
+)
+ConversationMemory = conversation_memory.ConversationMemory
+
+
+def user(i: int) -> dict:
+    return {"role": "user", "content": f"message {i}"}
+
+
+def recount(memory) -> int:
+    return sum(
+        conversation_memory.estimate_tokens(conversation_memory.message_content(m))
+        for m in memory.messages()
+    )
+
+
+def test_keeps_recent_messages_and_pins_system():
+    """Test eviction by message count with a pinned system message."""
+    memory = ConversationMemory(max_messages=3)
+    memory.append({"role": "system", "content": "Be brief."})
+    memory.extend([user(i) for i in range(10)])
+
+    assert memory.messages() == [
+        {"role": "system", "content": "Be brief."},
+        user(7),
+        user(8),
+        user(9),
+    ]
+    assert len(memory) == 3
+    assert memory.token_count == recount(memory)
+    assert memory.stats().evicted == 7
+
+
+def test_token_budget_eviction():
+    """Test eviction by token budget, always keeping the newest message."""
+    memory = ConversationMemory(max_messages=100, max_tokens=10, count_tokens=len)
+    memory.extend([{"role": "user", "content": "abcd"} for _ in range(5)])
+    assert len(memory) == 2 and memory.token_count == 8
+
+    memory.append({"role": "user", "content": "x" * 50})
+    assert len(memory) == 1 and memory.token_count == 50
+
+
+def test_background_summary_receives_evicted_messages_in_order():
+    """Test that every evicted message reaches the summarizer once, in order."""
+    seen = []
+
+    def summarize(summary, evicted):
+        seen.extend(evicted)
+        return f"{len(seen)} messages"
+
+    with ConversationMemory(max_messages=2, summarizer=summarize) as memory:
+        memory.extend([user(i) for i in range(20)])
+        assert memory.wait(timeout=5)
+
+    assert seen == [user(i) for i in range(18)]
+    assert memory.summary == "18 messages"
+    assert (
+        memory.messages()[0]["content"]
+        == "Summary of earlier conversation: 18 messages"
+    )
+    assert memory.stats().summarized == 18
+    assert memory.token_count == recount(memory)
+
+
+def test_synchronous_summary():
+    """Test summarizing on the caller's thread."""
+    memory = ConversationMemory(
+        max_messages=1,
+        summarizer=lambda s, e: s + "".join(m["content"][-1] for m in e),
+        background=False,
+    )
+    memory.extend([user(i) for i in range(4)])
+    assert memory.summary == "012"
+    assert memory.stats().pending == 0
+
+
+def test_pending_backlog_is_bounded():
+    """Test that append() waits when the summarizer falls behind."""
+    release = threading.Event()
+    largest = []
+
+    def slow(summary, evicted):
+        largest.append(len(evicted))
+        release.wait(5)
+        return summary
+
+    memory = ConversationMemory(max_messages=1, summarizer=slow, max_pending=3)
+    writer = threading.Thread(
+        target=memory.extend, args=([user(i) for i in range(12)],)
+    )
+    writer.start()
+    writer.join(0.2)
+    assert writer.is_alive()
+    assert memory.stats().pending <= 3
+
+    release.set()
+    writer.join(5)
+    memory.close()
+    assert max(largest) <= 3
+    assert memory.stats().summarized == 11
+
+
+def test_summarizer_errors_are_reported():
+    """Test that a failing background summary surfaces on wait()."""
+
+    def broken(summary, evicted):
+        raise RuntimeError("model unavailable")
+
+    memory = ConversationMemory(max_messages=1, summarizer=broken)
+    memory.extend([user(0), user(1)])
+    with pytest.raises(RuntimeError, match="model unavailable"):
+        memory.wait(timeout=5)
+    memory.close()
+
+
+def test_snapshot_round_trip():
+    """Test rebuilding a memory from its snapshot."""
+    memory = ConversationMemory(
+        max_messages=2, summarizer=lambda s, e: f"{s}+{len(e)}", background=False
+    )
+    memory.append({"role": "system", "content": "Be brief."})
+    memory.extend([user(i) for i in range(5)])
+
+    restored = ConversationMemory.from_snapshot(memory.snapshot(), max_messages=2)
+    assert restored.messages() == memory.messages()
+    assert restored.token_count == memory.token_count
+
+
+def test_memory_chat_resumes_from_checkpoint(tmp_path):
+    """Test that the chat graph restores a thread's memory after a restart."""
+    path = tmp_path / "memory.sqlite3"
+    config = {"configurable": {"thread_id": "sam"}}
+    with checkpointer.SqliteCheckpointer(path) as saver:
+        app = conversation_memory.create_memory_chat(checkpointer=saver, max_messages=4)
+        for i in range(6):
+            app.invoke({"message": f"message {i}"}, config)
+        before = app.get_state(config).values["memory"]
+
+    assert len(before["messages"]) <= 4
+    with checkpointer.SqliteCheckpointer(path) as saver:
+        app = conversation_memory.create_memory_chat(checkpointer=saver, max_messages=4)
+        after = app.invoke({"message": "message 6"}, config)["memory"]
+
+    assert after["messages"][-2] == {"role": "user", "content": "message 6"}
+    assert after["summary"] or after["pending"]
+
+
+def test_shared_executor_runs_summaries():
+    """Test background summaries on a shared executor instead of a thread per memory."""
+    with ThreadPoolExecutor(1) as pool:
+        memories = [
+            ConversationMemory(
+                max_messages=2, summarizer=lambda s, e: f"{s}+{len(e)}", executor=pool
+            )
+            for _ in range(5)
+        ]
+        for memory in memories:
+            memory.extend([user(i) for i in range(6)])
+        for memory in memories:
+            memory.close()
+            assert memory.stats().summarized == 4
+            assert memory._worker is None
+
+
+def test_memory_chat_keeps_no_threads_per_conversation():
+    """Test that serving many conversations does not start a thread per conversation."""
+    with ThreadPoolExecutor(2) as pool:
+        before = threading.active_count()
+        for _ in range(3):
+            app = conversation_memory.create_memory_chat(
+                checkpointer=checkpointer.SqliteCheckpointer(),
+                executor=pool,
+                max_messages=2,
+            )
+            for i in range(30):
+                config = {"configurable": {"thread_id": f"user-{i}"}}
+                for turn in range(3):
+                    app.invoke({"message": f"turn {turn}"}, config)
+        assert threading.active_count() - before <= 2
+
+
+def test_memory_chat_does_not_wait_for_summaries():
+    """Test that turns checkpoint pending messages instead of waiting to summarize."""
+    release = threading.Event()
+
+    def slow_summarizer(summary, evicted):
+        release.wait()
+        return f"{summary}+{len(evicted)}"
+
+    with ThreadPoolExecutor(2) as pool:
+        app = conversation_memory.create_memory_chat(
+            checkpointer=checkpointer.SqliteCheckpointer(),
+            executor=pool,
+            summarizer=slow_summarizer,
+            max_messages=2,
+        )
+        config = {"configurable": {"thread_id": "sam"}}
+        for i in range(3):
+            memory = app.invoke({"message": f"message {i}"}, config)["memory"]
+        assert memory["summary"] == "" and memory["pending"]
+
+        release.set()
+        pool.submit(lambda: None).result()
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            memory = app.invoke({"message": "again"}, config)["memory"]
+            if memory["summary"]:
+                break
+            time.sleep(0.01)
+        assert memory["summary"].startswith("+")
+
+
+def test_memory_chat_resumes_from_older_checkpoint():
+    """Test that resuming from an earlier checkpoint uses that checkpoint's memory."""
+    app = conversation_memory.create_memory_chat(
+        checkpointer=checkpointer.SqliteCheckpointer(), max_messages=20
+    )
+    config = {"configurable": {"thread_id": "sam"}}
+    for i in range(4):
+        app.invoke({"message": f"message {i}"}, config)
+
+    # The checkpoint written after the second turn
+    older = [
+        s
+        for s in app.get_state_history(config)
+        if s.values.get("message") == "message 1"
+    ][0]
+    memory = app.invoke({"message": "again"}, older.config)["memory"]
+
+    contents = [m["content"] for m in memory["messages"] if m["role"] == "user"]
+    assert contents == ["message 0", "message 1", "again"]
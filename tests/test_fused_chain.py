@@ -0,0 +1,118 @@
+"""
+Tests for the fused chain builder.
+"""
+
+import operator
+from typing import Annotated, TypedDict
+
+import pytest
+from langchain_core.runnables import RunnableConfig
+
+from src.modules.introduction.graphs.fused_chain import (
+    ChainStep,
+    build_chain,
+    state_reducers,
+)
+
+
+class ChainState(TypedDict, total=False):
+    """State for the chains used in these tests."""
+
+    value: int
+    trace: Annotated[list, operator.add]
+    user: str
+
+
+def make_step(i: int):
+    def step(state: ChainState) -> dict:
+        return {"value": state["value"] * 2 + i, "trace": [i]}
+
+    step.__name__ = f"step_{i}"
+    return step
+
+
+def impure(func):
+    func.pure = False
+    return func
+
+
+def test_state_reducers():
+    """Test that only Annotated fields with a reducer are reported."""
+    assert state_reducers(ChainState) == {"trace": operator.add}
+
+
+def test_fused_matches_unfused():
+    """Test that fusing does not change the result, including reducer fields."""
+    steps = [make_step(i) for i in range(6)]
+    state = {"value": 1, "trace": ["start"]}
+    fused = build_chain(steps, ChainState).compile()
+    unfused = build_chain(steps, ChainState, fuse=False).compile()
+
+    assert fused.invoke(state) == unfused.invoke(state)
+    assert list(fused.get_graph().nodes) == ["__start__", "step_0..step_5", "__end__"]
+    assert len(unfused.get_graph().nodes) == 8
+
+
+def test_impure_steps_are_boundaries():
+    """Test that impure steps stay separate nodes between fused runs."""
+    steps = [make_step(i) for i in range(5)]
+    steps[2] = impure(steps[2])
+    steps[4] = ChainStep("last", steps[4], pure=False)
+    app = build_chain(steps, ChainState).compile()
+
+    assert list(app.get_graph().nodes) == [
+        "__start__",
+        "step_0..step_1",
+        "step_2",
+        "step_3",
+        "last",
+        "__end__",
+    ]
+    assert app.invoke({"value": 0, "trace": []})["trace"] == [0, 1, 2, 3, 4]
+
+
+def test_sub_steps_emit_custom_events():
+    """Test that streaming in custom mode reports every fused sub-step."""
+    steps = [make_step(i) for i in range(3)]
+    app = build_chain(steps, ChainState).compile()
+    events = list(app.stream({"value": 0, "trace": []}, stream_mode="custom"))
+
+    assert [event["step"] for event in events] == ["step_0", "step_1", "step_2"]
+    assert {event["fused_node"] for event in events} == {"step_0..step_2"}
+    assert events[1]["update"] == {"value": 1, "trace": [1]}
+
+    quiet = build_chain(steps, ChainState, emit_events=False).compile()
+    assert list(quiet.stream({"value": 0, "trace": []}, stream_mode="custom")) == []
+
+
+def test_steps_receive_config():
+    """Test that steps taking a config parameter get the run's config."""
+
+    def read_user(state: ChainState, config: RunnableConfig) -> dict:
+        return {"user": config["configurable"]["user"]}
+
+    app = build_chain(
+        [make_step(0), read_user, ("noop", lambda state: None)], ChainState
+    ).compile()
+    result = app.invoke({"value": 0, "trace": []}, {"configurable": {"user": "ada"}})
+    assert result["user"] == "ada"
+
+
+def test_errors_name_the_failing_step():
+    """Test that an exception in a sub-step notes which step raised it."""
+
+    def fail(state: ChainState) -> dict:
+        raise RuntimeError("boom")
+
+    app = build_chain([make_step(0), fail], ChainState).compile()
+    with pytest.raises(RuntimeError) as info:
+        app.invoke({"value": 0, "trace": []})
+    assert any("'fail'" in note for note in info.value.__notes__)
+
+
+def test_invalid_chains():
+    """Test that empty chains and duplicate step names are rejected."""
+    with pytest.raises(ValueError):
+        build_chain([], ChainState)
+    with pytest.raises(ValueError, match="step_0"):
+        build_chain([make_step(0), make_step(0)], ChainState)
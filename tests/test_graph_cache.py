@@ -0,0 +1,176 @@
+"""
+Tests for the compiled graph cache.
+"""
+
+from functools import partial
+from typing import TypedDict
+
+import pytest
+from langgraph.graph import END, START, StateGraph
+from langgraph.types import CachePolicy, RetryPolicy
+
+from src.modules.introduction.graphs.cache import (
+    CompiledGraphCache,
+    compile_cached,
+    get_default_cache,
+    graph_fingerprint,
+)
+from src.modules.introduction.lessons.lesson_2_simple_graph.simple_graph import (
+    build_simple_graph,
+    create_simple_graph,
+    process_message,
+)
+
+
+class CounterState(TypedDict):
+    """State for the synthetic graphs used in these tests."""
+
+    count: int
+
+
+class OtherState(TypedDict):
+    """Alternative node input schema."""
+
+    count: int
+
+
+def increment(state: CounterState) -> dict:
+    return {"count": state["count"] + 1}
+
+
+def double(state: CounterState) -> dict:
+    return {"count": state["count"] * 2}
+
+
+def build_chain(*nodes) -> StateGraph:
+    """Build a linear graph running the given node functions in order."""
+    graph = StateGraph(CounterState)
+    previous = START
+    for i, node in enumerate(nodes):
+        graph.add_node(f"step_{i}", node)
+        graph.add_edge(previous, f"step_{i}")
+        previous = f"step_{i}"
+    graph.add_edge(previous, END)
+    return graph
+
+
+def test_identical_definitions_share_fingerprint():
+    """Test that rebuilding the same graph gives the same fingerprint."""
+    assert graph_fingerprint(build_simple_graph()) == graph_fingerprint(
+        build_simple_graph()
+    )
+    assert graph_fingerprint(build_chain(increment, double)) == graph_fingerprint(
+        build_chain(increment, double)
+    )
+
+
+def test_structural_changes_change_fingerprint():
+    """Test that node functions, edges and compile options are part of the key."""
+    base = graph_fingerprint(build_chain(increment, double))
+    assert graph_fingerprint(build_chain(double, increment)) != base
+    assert graph_fingerprint(build_chain(increment, double, double)) != base
+    assert graph_fingerprint(build_chain(increment, double), debug=True) != base
+
+    branched = build_chain(increment)
+    branched.add_node("other", double)
+    branched.add_conditional_edges("step_0", lambda state: END, ["other", END])
+    assert graph_fingerprint(branched) != graph_fingerprint(build_chain(increment))
+
+
+def add(state: CounterState, n: int) -> dict:
+    return {"count": state["count"] + n}
+
+
+def test_partial_arguments_are_part_of_the_key():
+    """Test that partials of one function with different bound arguments differ."""
+    assert graph_fingerprint(build_chain(partial(add, n=1))) == graph_fingerprint(
+        build_chain(partial(add, n=1))
+    )
+    assert graph_fingerprint(build_chain(partial(add, n=1))) != graph_fingerprint(
+        build_chain(partial(add, n=100))
+    )
+
+    cache = CompiledGraphCache()
+    assert cache.get_or_compile(build_chain(partial(add, n=1))).invoke(
+        {"count": 0}
+    ) == {"count": 1}
+    assert cache.get_or_compile(build_chain(partial(add, n=100))).invoke(
+        {"count": 0}
+    ) == {"count": 100}
+
+
+def test_node_options_are_part_of_the_key():
+    """Test that policies, input schemas, defer and ends change the key."""
+
+    def with_options(**options) -> StateGraph:
+        graph = StateGraph(CounterState)
+        graph.add_node("step", increment, **options)
+        graph.add_edge(START, "step")
+        graph.add_edge("step", END)
+        return graph
+
+    base = graph_fingerprint(with_options())
+    assert graph_fingerprint(with_options()) == base
+    variants = [
+        with_options(retry_policy=RetryPolicy(max_attempts=5)),
+        with_options(cache_policy=CachePolicy(ttl=60)),
+        with_options(input_schema=OtherState),
+        with_options(defer=True),
+        with_options(destinations=("step",)),
+    ]
+    fingerprints = {graph_fingerprint(graph) for graph in variants}
+    assert base not in fingerprints and len(fingerprints) == len(variants)
+
+
+def test_cache_returns_same_app_for_same_definition():
+    """Test that a second build of the same graph is a cache hit."""
+    cache = CompiledGraphCache()
+    first = cache.get_or_compile(build_chain(increment, double))
+    second = cache.get_or_compile(build_chain(increment, double))
+
+    assert first is second
+    assert first.invoke({"count": 1}) == {"count": 4}
+    info = cache.info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+
+def test_cache_evicts_least_recently_used():
+    """Test LRU eviction once maxsize is exceeded."""
+    cache = CompiledGraphCache(maxsize=2)
+    a = cache.get_or_compile(build_chain(increment))
+    cache.get_or_compile(build_chain(double))
+    cache.get_or_compile(build_chain(increment))  # refresh a
+    cache.get_or_compile(build_chain(double, double))  # evicts double
+
+    assert cache.get_or_compile(build_chain(increment)) is a
+    assert graph_fingerprint(build_chain(double)) not in cache
+    assert cache.info().evictions == 1
+
+
+def test_cache_invalidation():
+    """Test invalidating one graph and clearing the cache."""
+    cache = CompiledGraphCache()
+    first = cache.get_or_compile(build_chain(increment))
+    cache.get_or_compile(build_chain(double))
+
+    assert cache.invalidate(build_chain(increment))
+    assert not cache.invalidate(build_chain(increment))
+    assert cache.get_or_compile(build_chain(increment)) is not first
+
+    assert cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_cache_rejects_invalid_maxsize():
+    """Test that maxsize must be positive."""
+    with pytest.raises(ValueError):
+        CompiledGraphCache(maxsize=0)
+
+
+def test_compile_cached_uses_default_cache(simple_graph_app):
+    """Test the process-wide cache behind compile_cached()."""
+    assert compile_cached(build_simple_graph()) is simple_graph_app
+    assert create_simple_graph() is simple_graph_app
+    assert graph_fingerprint(build_simple_graph()) in get_default_cache()
+    result = simple_graph_app.invoke({"message": "Hello there!", "response": ""})
+    assert result == process_message({"message": "Hello there!", "response": ""})
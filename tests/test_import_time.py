@@ -0,0 +1,107 @@
+"""
+Import-Time Budget Tests
+
+Importing the course packages must stay cheap: heavy dependencies are only
+loaded when a lazily exported attribute is first used. These tests run a
+fresh interpreter with ``python -X importtime`` and fail if startup regresses.
+"""
+
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+# Packages whose import must not pull in heavy dependencies
+PACKAGES = [
+    "src.modules.introduction",
+    "src.modules.introduction.lessons",
+    "src.modules.introduction.lessons.lesson_2_simple_graph",
+    "src.modules.introduction.lessons.lesson-3-langgraph-studio",
+    "src.modules.introduction.graphs",
+    "src.modules.introduction.nodes",
+    "src.modules.introduction.utils",
+]
+
+# Top-level modules that dominate cold start when imported
+HEAVY_MODULES = [
+    "langgraph",
+    "langchain",
+    "langchain_core",
+    "google.generativeai",
+    "pydantic",
+]
+
+# Cumulative import time allowed for the course packages, in microseconds
+IMPORT_BUDGET_US = 50_000
+
+
+def run_importtime(code):
+    """
+    Run code in a fresh interpreter with -X importtime.
+
+    Returns:
+        dict: Mapping of module name to its own (self) import time in microseconds
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:") :].split("|")
+        timings[name.strip()] = int(self_us)
+    return timings
+
+
+def test_packages_do_not_import_heavy_dependencies():
+    """Test that importing the packages leaves heavy dependencies unloaded."""
+    code = "import importlib\n" + "\n".join(
+        f"importlib.import_module({name!r})" for name in PACKAGES
+    )
+    timings = run_importtime(code)
+
+    loaded = [module for module in HEAVY_MODULES if module in timings]
+    assert loaded == [], f"Package import loaded heavy dependencies: {loaded}"
+
+
+def test_package_import_time_budget():
+    """Test that the course packages import within the startup budget."""
+    code = "import importlib\n" + "\n".join(
+        f"importlib.import_module({name!r})" for name in PACKAGES
+    )
+    timings = run_importtime(code)
+
+    # Only count modules the bare interpreter does not already import
+    baseline = run_importtime("pass")
+    added = {name: us for name, us in timings.items() if name not in baseline}
+    total = sum(added.values())
+    slowest = sorted(added, key=added.get, reverse=True)[:5]
+    assert total < IMPORT_BUDGET_US, (
+        f"Package imports took {total}us, budget is {IMPORT_BUDGET_US}us "
+        f"(slowest: {slowest})"
+    )
+
+
+def test_lazy_attributes_resolve_on_first_use():
+    """Test that lazily exported attributes resolve to the real objects."""
+    introduction = importlib.import_module("src.modules.introduction")
+    lessons = importlib.import_module("src.modules.introduction.lessons")
+    from src.modules.introduction.lessons.lesson_2_simple_graph import simple_graph
+
+    assert introduction.create_simple_graph is simple_graph.create_simple_graph
+    assert lessons.simple_graph is simple_graph
+    assert lessons.studio.GraphImporter.__name__ == "GraphImporter"
+    assert "create_simple_graph" in dir(introduction)
+    assert "GraphImporter" in lessons.studio.__all__
+
+
+def test_unknown_attribute_raises():
+    """Test that unknown attributes still raise AttributeError."""
+    introduction = importlib.import_module("src.modules.introduction")
+    with pytest.raises(AttributeError, match="does_not_exist"):
+        introduction.does_not_exist
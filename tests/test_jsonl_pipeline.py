@@ -0,0 +1,116 @@
+"""
+Tests for the JSONL streaming pipeline.
+"""
+
+import io
+import json
+
+import pytest
+
+from src.modules.introduction.lessons.lesson_2_simple_graph.simple_graph import (
+    process_message,
+)
+from src.modules.introduction.utils.jsonl_pipeline import (
+    micro_batches,
+    read_jsonl,
+    run_jsonl_file,
+    run_jsonl_pipeline,
+)
+
+
+def to_jsonl(messages):
+    """Encode messages as JSONL object lines."""
+    return [json.dumps({"message": message}) + "\n" for message in messages]
+
+
+def test_read_jsonl_accepts_objects_and_strings():
+    """Test parsing of object lines, string lines and blank lines."""
+    lines = [
+        '{"message": "Hello"}\n',
+        "\n",
+        '"Help me"\n',
+        '{"message": "x", "response": "kept"}\n',
+    ]
+    assert list(read_jsonl(lines)) == [
+        {"message": "Hello", "response": ""},
+        {"message": "Help me", "response": ""},
+        {"message": "x", "response": "kept"},
+    ]
+
+
+@pytest.mark.parametrize("line", ["not json\n", "[1, 2]\n"])
+def test_read_jsonl_rejects_invalid_lines(line):
+    """Test that invalid lines report their line number."""
+    with pytest.raises(ValueError, match="Line 2"):
+        list(read_jsonl(['"ok"\n', line]))
+
+
+def test_micro_batches():
+    """Test batching and validation."""
+    assert list(micro_batches(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    with pytest.raises(ValueError):
+        list(micro_batches([], 0))
+
+
+def test_pipeline_preserves_order(simple_graph_app, sample_messages):
+    """Test that results come out in input order across workers."""
+    messages = sample_messages * 50
+    output = io.StringIO()
+
+    stats = run_jsonl_pipeline(
+        to_jsonl(messages), output, app=simple_graph_app, batch_size=7, max_workers=4
+    )
+
+    results = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert results == [
+        process_message({"message": m, "response": ""}) for m in messages
+    ]
+    assert stats.records == len(messages)
+    assert stats.batches == -(-len(messages) // 7)
+
+
+def test_pipeline_applies_backpressure(simple_graph_app):
+    """Test that reading never runs more than max_pending batches ahead of writing."""
+    batch_size, max_pending = 4, 2
+    read = 0
+    written = 0
+    max_ahead = 0
+
+    def lines():
+        nonlocal read, max_ahead
+        for i in range(200):
+            read += 1
+            max_ahead = max(max_ahead, read - written)
+            yield json.dumps(f"message {i}") + "\n"
+
+    class CountingOutput(io.StringIO):
+        def write(self, text):
+            nonlocal written
+            written += text.count("\n")
+            return super().write(text)
+
+    run_jsonl_pipeline(
+        lines(),
+        CountingOutput(),
+        app=simple_graph_app,
+        batch_size=batch_size,
+        max_workers=2,
+        max_pending=max_pending,
+    )
+
+    assert written == 200
+    assert max_ahead <= (max_pending + 1) * batch_size
+
+
+def test_pipeline_files(tmp_path, simple_graph_app):
+    """Test running between files."""
+    source = tmp_path / "in.jsonl"
+    target = tmp_path / "out.jsonl"
+    source.write_text("".join(to_jsonl(["Hello", "Help"])))
+
+    stats = run_jsonl_file(source, target, app=simple_graph_app, batch_size=1)
+
+    assert stats.records == 2
+    assert [
+        json.loads(line)["message"] for line in target.read_text().splitlines()
+    ] == ["Hello", "Help"]
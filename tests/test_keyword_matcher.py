@@ -0,0 +1,128 @@
+"""
+Tests for the single-pass keyword matcher.
+"""
+
+import importlib
+import random
+import string
+
+import pytest
+
+from src.modules.introduction.utils.keyword_matcher import KeywordMatch, KeywordMatcher
+
+routers = importlib.import_module(
+    "src.modules.introduction.lessons.lesson-5-router.routers"
+)
+
+
+def naive_matches(keywords, text):
+    """Every (start, keyword) occurrence found with str.find."""
+    found = set()
+    lowered = text.lower()
+    for keyword in keywords:
+        start = lowered.find(keyword.lower())
+        while start != -1:
+            found.add((start, keyword))
+            start = lowered.find(keyword.lower(), start + 1)
+    return found
+
+
+def test_overlapping_matches():
+    """Test that nested and overlapping keywords are all reported."""
+    matcher = KeywordMatcher(
+        {"he": "a", "she": "b", "hers": "c", "his": "d", "hell": "e", "hello": "f"}
+    )
+    matches = matcher.find_all("ushers say Hello")
+
+    assert {(m.start, m.keyword) for m in matches} == {
+        (1, "she"),
+        (2, "he"),
+        (2, "hers"),
+        (11, "hello"),
+        (11, "hell"),
+        (11, "he"),
+    }
+    assert KeywordMatch(11, 16, "hello", "f") in matches
+
+
+def test_matches_naive_scan_on_random_text():
+    """Test against a brute-force scan with random keywords and text."""
+    rng = random.Random(5)
+    keywords = {"".join(rng.choices("abc", k=rng.randint(1, 4))) for _ in range(30)}
+    matcher = KeywordMatcher(keywords)
+    for _ in range(50):
+        text = "".join(rng.choices("abcABC ", k=40))
+        assert {(m.start, m.keyword) for m in matcher.find_all(text)} == naive_matches(
+            keywords, text
+        )
+
+
+def test_labels_and_counts():
+    """Test label sets and per-label counts."""
+    matcher = KeywordMatcher(
+        {"refund": "billing", "payment": "billing", "down": "urgent"}
+    )
+    text = "Payment failed, site down, need a refund"
+    assert matcher.labels(text) == {"billing", "urgent"}
+    assert matcher.count(text) == {"billing": 2, "urgent": 1}
+    assert matcher.contains_any(text)
+    assert not matcher.contains_any("all good")
+
+
+def test_case_sensitive_matching():
+    """Test ignore_case=False."""
+    matcher = KeywordMatcher(["API"], ignore_case=False)
+    assert matcher.labels("the API") == {"API"}
+    assert matcher.labels("the api") == set()
+
+
+def test_whole_words():
+    """Test that whole_words rejects matches inside longer words."""
+    matcher = KeywordMatcher(["bug", "bugs", "help"], whole_words=True)
+    found = [
+        (m.start, m.keyword)
+        for m in matcher.find_all("bugsy bug, helpdesk help_me help")
+    ]
+    assert found == [(6, "bug"), (28, "help")]
+
+
+def test_special_characters_are_literal():
+    """Test that regex metacharacters in keywords match literally."""
+    matcher = KeywordMatcher(["c++", "a.b", "[x]"])
+    assert matcher.labels("I write c++ and a.b [x]") == {"c++", "a.b", "[x]"}
+    assert matcher.labels("aXb") == set()
+
+
+def test_unicode_lowercase_that_changes_length():
+    """Test positions when lowercasing changes the text length."""
+    matcher = KeywordMatcher(["down"])
+    assert [m.start for m in matcher.find_all("İ DOWN")] == [2]
+
+
+def test_invalid_keywords():
+    """Test that empty keyword sets and keywords are rejected."""
+    with pytest.raises(ValueError):
+        KeywordMatcher([])
+    with pytest.raises(ValueError):
+        KeywordMatcher([""])
+
+
+def test_classify_request_equivalence():
+    """Test the single-pass classifier against the keyword-by-keyword router."""
+    rng = random.Random(9)
+    vocabulary = [
+        "the",
+        "site",
+        "is",
+        "Down",
+        "payment",
+        "error",
+        "refund",
+        "code",
+        "hello",
+        "BUG",
+        "",
+    ]
+    for _ in range(300):
+        state = {"message": " ".join(rng.choices(vocabulary, k=rng.randint(0, 6)))}
+        assert routers.classify_request_fast(state) == routers.classify_request(state)
@@ -0,0 +1,211 @@
+"""
+Tests for the persistent LLM response cache and the fake model.
+"""
+
+import asyncio
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.modules.introduction.utils.fake_llm import FakeLLM
+from src.modules.introduction.utils.llm_cache import (
+    CachedLLM,
+    CacheMissError,
+    LLMResponseCache,
+    cache_from_env,
+    cache_key,
+)
+
+
+def test_fake_llm_is_deterministic():
+    """Test that the fake model depends only on its inputs."""
+    llm = FakeLLM()
+    assert llm.generate("Hello", temperature=0) == llm.generate("Hello", temperature=0)
+    assert llm.generate("Hello", temperature=0) != llm.generate("Hello", temperature=1)
+    assert "".join(llm.stream("Hello")) == llm.generate("Hello")
+    assert llm.calls == 6
+
+
+def test_cache_key_is_order_independent():
+    """Test that parameter order does not change the key."""
+    assert cache_key("m", "p", {"a": 1, "b": 2}) == cache_key(
+        "m", "p", {"b": 2, "a": 1}
+    )
+    assert cache_key("m", "p", {"a": 1}) != cache_key("other", "p", {"a": 1})
+    assert cache_key("m", "p") == cache_key("m", "p", {})
+
+
+def test_second_call_is_served_from_cache():
+    """Test that a repeated call does not reach the model."""
+    llm = FakeLLM()
+    cached = CachedLLM(llm, LLMResponseCache())
+
+    first = cached.generate("Hello there!", temperature=0.2)
+    second = cached.generate("Hello there!", temperature=0.2)
+
+    assert first == second
+    assert llm.calls == 1
+    assert (cached.cache.stats.hits, cached.cache.stats.misses) == (1, 1)
+
+
+def test_cache_persists_across_instances(tmp_path):
+    """Test that a rerun in replay mode makes no model calls."""
+    path = tmp_path / "cache.sqlite3"
+    with LLMResponseCache(path) as cache:
+        expected = CachedLLM(FakeLLM(), cache).generate("Hello")
+
+    llm = FakeLLM()
+    with LLMResponseCache(path, mode="replay") as cache:
+        assert CachedLLM(llm, cache).generate("Hello") == expected
+        with pytest.raises(CacheMissError):
+            CachedLLM(llm, cache).generate("Never seen")
+    assert llm.calls == 0
+
+
+def test_refresh_and_off_modes():
+    """Test that refresh always calls the model and off never stores."""
+    llm = FakeLLM()
+    refresh = CachedLLM(llm, LLMResponseCache(mode="refresh"))
+    refresh.generate("Hello")
+    refresh.generate("Hello")
+    assert llm.calls == 2
+    assert len(refresh.cache) == 1
+
+    off = CachedLLM(llm, LLMResponseCache(mode="off"))
+    off.generate("Hello")
+    assert len(off.cache) == 0
+
+
+def test_invalid_mode():
+    """Test that unknown modes are rejected."""
+    with pytest.raises(ValueError):
+        LLMResponseCache(mode="sometimes")
+
+
+def test_size_based_eviction_drops_least_recently_used(tmp_path):
+    """Test that max_bytes evicts the least recently used responses."""
+    cache = LLMResponseCache(tmp_path / "cache.sqlite3", max_bytes=250)
+    cache.put("a", "m", "x" * 100)
+    time.sleep(0.01)
+    cache.put("b", "m", "x" * 100)
+    time.sleep(0.01)
+    assert cache.get("a") is not None
+    cache.put("c", "m", "x" * 100)
+
+    assert "a" in cache and "c" in cache and "b" not in cache
+    assert cache.total_bytes() == 200
+    assert cache.stats.evictions == 1
+    cache.close()
+
+
+def test_byte_total_tracks_writes_across_instances(tmp_path):
+    """Test that the running byte total follows overwrites, clears and reopens."""
+    path = tmp_path / "cache.sqlite3"
+    with LLMResponseCache(path) as cache:
+        cache.put("a", "m", "x" * 100)
+        cache.put("a", "m", "x" * 40)
+        cache.put("b", "m", "x" * 10)
+        assert cache.total_bytes() == 50
+
+        with LLMResponseCache(path, max_bytes=60) as other:
+            assert other.total_bytes() == 50
+            other.put("c", "m", "x" * 30)
+            assert other.stats.evictions == 1
+        assert cache.total_bytes() == 40
+
+        cache.clear()
+        assert cache.total_bytes() == 0
+
+
+def test_concurrent_eviction_keeps_byte_total_exact(tmp_path):
+    """Test that caches sharing a file and evicting at once agree on the total."""
+    path = tmp_path / "cache.sqlite3"
+    caches = [LLMResponseCache(path, max_bytes=2_000) for _ in range(4)]
+
+    def write(index: int) -> None:
+        for i in range(100):
+            caches[index].put(f"{index}-{i}", "m", "x" * 50)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(write, range(4)))
+
+    with sqlite3.connect(path) as connection:
+        actual = connection.execute("SELECT SUM(size) FROM responses").fetchone()[0]
+    assert caches[0].total_bytes() == actual <= 2_000
+    for cache in caches:
+        cache.close()
+
+
+def test_close_closes_every_thread_connection(tmp_path):
+    """Test that close() also closes connections opened by other threads."""
+    cache = LLMResponseCache(tmp_path / "cache.sqlite3")
+    cache.put("a", "m", "x")
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        list(pool.map(cache.get, ["a", "a"]))
+    connections = list(cache._connections)
+    assert len(connections) >= 2
+
+    cache.close()
+    for connection in connections:
+        with pytest.raises(sqlite3.ProgrammingError):
+            connection.execute("SELECT 1")
+
+
+def test_concurrent_readers(tmp_path):
+    """Test that many threads can read the same on-disk cache."""
+    cache = LLMResponseCache(tmp_path / "cache.sqlite3")
+    llm = CachedLLM(FakeLLM(), cache)
+    prompts = [f"prompt {i}" for i in range(20)]
+    expected = [llm.generate(prompt) for prompt in prompts]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(llm.generate, prompts * 10))
+
+    assert results == expected * 10
+    assert llm.llm.calls == len(prompts)
+
+
+def test_async_generate_uses_cache():
+    """Test that agenerate shares the cache with generate."""
+    llm = FakeLLM()
+    cached = CachedLLM(llm, LLMResponseCache())
+    expected = cached.generate("Hello")
+    assert asyncio.run(cached.agenerate("Hello")) == expected
+    assert llm.calls == 1
+
+
+def test_async_generate_follows_cache_modes():
+    """Test that agenerate applies replay and off modes like generate."""
+    llm = FakeLLM()
+    with pytest.raises(CacheMissError):
+        asyncio.run(CachedLLM(llm, LLMResponseCache(mode="replay")).agenerate("Hi"))
+    assert llm.calls == 0
+
+    off = CachedLLM(llm, LLMResponseCache(mode="off"))
+    asyncio.run(off.agenerate("Hi"))
+    assert llm.calls == 1 and len(off.cache) == 0
+
+
+def test_cached_latency_is_sub_millisecond(tmp_path):
+    """Test that a cache hit is far cheaper than the simulated model call."""
+    cached = CachedLLM(
+        FakeLLM(latency=0.05), LLMResponseCache(tmp_path / "cache.sqlite3")
+    )
+    cached.generate("Hello")
+
+    start = time.perf_counter()
+    for _ in range(100):
+        cached.generate("Hello")
+    assert (time.perf_counter() - start) / 100 < 0.001
+
+
+def test_cache_from_env(monkeypatch, tmp_path):
+    """Test configuration from environment variables."""
+    monkeypatch.setenv("LLM_CACHE_PATH", str(tmp_path / "env.sqlite3"))
+    monkeypatch.setenv("LLM_CACHE_MODE", "replay")
+    cache = cache_from_env()
+    assert cache.mode == "replay"
+    assert cache.path == tmp_path / "env.sqlite3"
+    cache.close()
@@ -0,0 +1,178 @@
+"""
+Tests for the shared LLM client against a local mock Gemini server.
+"""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.modules.introduction.utils.llm_client import (
+    LLMClient,
+    LLMClientError,
+    TokenBucket,
+    close_shared_clients,
+    get_shared_client,
+)
+
+
+class MockGeminiHandler(BaseHTTPRequestHandler):
+    """Answers generateContent requests by echoing the prompt."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        server = self.server
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        prompt = body["contents"][0]["parts"][0]["text"]
+        with server.lock:
+            server.requests.append((self.path, prompt, body["generationConfig"]))
+            server.client_ports.add(self.client_address[1])
+        time.sleep(server.delay)
+
+        if prompt == "garbage":
+            self.close_connection = True
+            self.wfile.write(b"garbage\r\n\r\n")
+            return
+        if prompt == "fail":
+            payload, status = {"error": {"message": "quota"}}, 429
+        else:
+            payload, status = {
+                "candidates": [{"content": {"parts": [{"text": f"echo: {prompt}"}]}}],
+                "usageMetadata": {"totalTokenCount": 7},
+            }, 200
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        if prompt == "truncated":
+            self.close_connection = True
+            data = data[:10]
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def mock_server():
+    """Run a mock Gemini endpoint on a free local port."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockGeminiHandler)
+    server.lock = threading.Lock()
+    server.requests = []
+    server.client_ports = set()
+    server.delay = 0.0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def make_client(server, **kwargs):
+    return LLMClient(
+        "test-model",
+        api_key="key",
+        base_url=f"http://127.0.0.1:{server.server_port}/v1beta",
+        **kwargs,
+    )
+
+
+def test_generate_parses_response(mock_server):
+    """Test a round trip through the mock server."""
+    client = make_client(mock_server)
+    assert client.generate("Hello", temperature=0.5) == "echo: Hello"
+
+    path, prompt, config = mock_server.requests[0]
+    assert path == "/v1beta/models/test-model:generateContent"
+    assert config == {"temperature": 0.5}
+    assert client.metrics().tokens == 7
+
+
+def test_connections_are_reused(mock_server):
+    """Test that sequential calls share one keep-alive connection."""
+    client = make_client(mock_server, pool_size=2)
+    for i in range(10):
+        client.generate(f"prompt {i}")
+
+    assert client.pool.created == 1
+    assert len(mock_server.client_ports) == 1
+    assert client.metrics().requests == 10
+
+
+def test_pool_is_bounded(mock_server):
+    """Test that concurrent calls never open more than pool_size connections."""
+    mock_server.delay = 0.02
+    client = make_client(mock_server, pool_size=3)
+    with ThreadPoolExecutor(max_workers=10) as pool:
+        list(pool.map(client.generate, [f"prompt {i}" for i in range(30)]))
+    assert client.pool.created <= 3
+
+
+def test_identical_concurrent_prompts_are_coalesced(mock_server):
+    """Test that identical in-flight calls share one request."""
+    mock_server.delay = 0.2
+    client = make_client(mock_server)
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        results = list(pool.map(lambda _: client.generate("same"), range(5)))
+
+    assert results == ["echo: same"] * 5
+    assert len(mock_server.requests) == 1
+    assert client.metrics().coalesced == 4
+
+
+def test_http_errors_raise(mock_server):
+    """Test that API errors surface as LLMClientError with the status."""
+    client = make_client(mock_server)
+    with pytest.raises(LLMClientError) as excinfo:
+        client.generate("fail")
+    assert excinfo.value.status == 429
+    assert client.metrics().errors == 1
+
+
+@pytest.mark.parametrize("prompt", ["truncated", "garbage"])
+def test_protocol_errors_raise(mock_server, prompt):
+    """Test that malformed responses surface as LLMClientError and are counted."""
+    client = make_client(mock_server)
+    with pytest.raises(LLMClientError):
+        client.generate(prompt)
+    assert client.metrics().errors == 1
+    assert client.generate("Hello") == "echo: Hello"
+
+
+def test_token_bucket_waits_for_refill():
+    """Test the bucket against a fake clock."""
+    now = [0.0]
+
+    def sleep(seconds):
+        now[0] += seconds
+
+    bucket = TokenBucket(60, capacity=2, clock=lambda: now[0], sleep=sleep)
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == pytest.approx(1.0)
+    assert bucket.try_acquire() > 0
+
+
+def test_request_limiter_is_applied(mock_server):
+    """Test that the per-minute request limit delays calls."""
+    client = make_client(mock_server, requests_per_minute=600)
+    client.request_limiter = TokenBucket(600, capacity=1)
+    start = time.perf_counter()
+    for i in range(3):
+        client.generate(f"prompt {i}")
+    assert time.perf_counter() - start >= 0.15
+    assert client.metrics().rate_limited_seconds > 0
+
+
+def test_shared_client_is_reused():
+    """Test that get_shared_client returns one client per model."""
+    try:
+        assert get_shared_client("m1") is get_shared_client("m1")
+        assert get_shared_client("m1") is not get_shared_client("m2")
+    finally:
+        close_shared_clients()
@@ -0,0 +1,90 @@
+"""
+Tests for the command-line runner in main.py.
+"""
+
+import json
+import pstats
+
+import pytest
+
+from main import main
+from src.modules.introduction.lessons.lesson_2_simple_graph.simple_graph import (
+    process_message,
+)
+
+
+@pytest.fixture
+def input_file(tmp_path, sample_messages):
+    """Provide a JSONL file of the sample messages."""
+    path = tmp_path / "in.jsonl"
+    path.write_text("".join(json.dumps({"message": m}) + "\n" for m in sample_messages))
+    return path
+
+
+@pytest.mark.parametrize("mode", ["thread", "process", "async"])
+def test_runs_simple_graph_in_every_mode(tmp_path, input_file, sample_messages, mode):
+    """Test that each execution mode produces the same ordered output."""
+    output = tmp_path / "out.jsonl"
+    argv = [
+        "-i",
+        str(input_file),
+        "-o",
+        str(output),
+        "--mode",
+        mode,
+        "--workers",
+        "2",
+        "--batch-size",
+        "2",
+    ]
+    assert main(argv) == 0
+
+    results = [json.loads(line) for line in output.read_text().splitlines()]
+    assert results == [
+        process_message({"message": m, "response": ""}) for m in sample_messages
+    ]
+
+
+def test_profile_and_node_timings(tmp_path, input_file, capsys):
+    """Test the cProfile dump and per-node timing summary."""
+    output = tmp_path / "out.jsonl"
+    profile = tmp_path / "run.pstats"
+    assert (
+        main(
+            [
+                "-i",
+                str(input_file),
+                "-o",
+                str(output),
+                "--profile",
+                str(profile),
+                "--node-timings",
+            ]
+        )
+        == 0
+    )
+
+    assert pstats.Stats(str(profile)).total_calls > 0
+    log = capsys.readouterr().err
+    assert "Per-node timings" in log
+    assert "process_message" in log
+
+
+def test_list_and_errors(capsys):
+    """Test --list and the error paths."""
+    assert main(["--list"]) == 0
+    assert "notebook_graph" in capsys.readouterr().out
+
+    assert main(["--graph", "missing"]) == 1
+    assert main(["--workers", "0"]) == 2
+
+
+def test_unreadable_files(tmp_path, input_file, capsys):
+    """Test that missing input and unwritable output paths exit with a message."""
+    missing = tmp_path / "missing.jsonl"
+    assert main(["--input", str(missing)]) == 1
+    assert f"Cannot open {missing}" in capsys.readouterr().err
+
+    output = tmp_path / "no_such_dir" / "out.jsonl"
+    assert main(["--input", str(input_file), "--output", str(output)]) == 1
+    assert f"Cannot open {output}" in capsys.readouterr().err
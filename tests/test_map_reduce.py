@@ -0,0 +1,148 @@
+"""
+Tests for the map-reduce graph factory.
+"""
+
+import asyncio
+import operator
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.modules.introduction.graphs import map_reduce
+from src.modules.introduction.graphs.map_reduce import (
+    build_map_reduce,
+    create_map_reduce,
+    merge_dicts,
+    split_shards,
+)
+
+
+def test_split_shards():
+    """Test that shards are contiguous, balanced and bounded in number."""
+    assert split_shards(list(range(10)), 3) == [[0, 1, 2, 3], [4, 5, 6], [7, 8, 9]]
+    assert split_shards([1, 2], 8) == [[1], [2]]
+    assert split_shards(list(range(10)), 8, min_shard_size=4) == [
+        [0, 1, 2, 3, 4],
+        [5, 6, 7, 8, 9],
+    ]
+    assert split_shards([], 4) == []
+
+
+def test_merge_dicts_is_deep():
+    """Test that nested dicts are merged rather than replaced."""
+    assert merge_dicts({"a": {"x": 1}, "b": 1}, {"a": {"y": 2}, "b": 2}) == {
+        "a": {"x": 1, "y": 2},
+        "b": 2,
+    }
+
+
+def test_concat_keeps_item_order():
+    """Test that results keep item order when shards finish out of order."""
+
+    def slow_for_small(item: int) -> int:
+        time.sleep(0.01 if item < 5 else 0)
+        return item * 10
+
+    app = create_map_reduce(slow_for_small, max_parallelism=4)
+    result = app.invoke({"items": list(range(20))})
+    assert result == {"items": list(range(20)), "results": [i * 10 for i in range(20)]}
+
+
+@pytest.mark.parametrize("reducer", ["concat", "merge"])
+def test_reducer_only_combines_shards(monkeypatch, reducer):
+    """Test that shards are built in one pass and the reducer only joins shards."""
+    reduce_fn, collect, empty = map_reduce.REDUCERS[reducer]
+    calls = []
+
+    def counting(left, right):
+        calls.append(1)
+        return reduce_fn(left, right)
+
+    monkeypatch.setitem(map_reduce.REDUCERS, reducer, (counting, collect, empty))
+
+    def map_fn(item):
+        return {item: item} if reducer == "merge" else item
+
+    app = create_map_reduce(map_fn, reducer=reducer, max_parallelism=4)
+    result = app.invoke({"items": list(range(1000))})["results"]
+
+    assert len(result) == 1000
+    assert len(calls) == 3
+
+
+def test_merge_and_custom_reducers():
+    """Test the merge reducer and a custom reducer with an initial value."""
+    merged = create_map_reduce(
+        lambda word: {word[0]: {word: len(word)}}, reducer="merge"
+    )
+    assert merged.invoke({"items": ["apple", "avocado", "banana"]})["results"] == {
+        "a": {"apple": 5, "avocado": 7},
+        "b": {"banana": 6},
+    }
+
+    total = create_map_reduce(
+        lambda n: n,
+        reducer=operator.add,
+        initial=0,
+        input_key="numbers",
+        output_key="sum",
+    )
+    assert total.invoke({"numbers": list(range(101))})["sum"] == 5050
+    assert total.invoke({"numbers": []})["sum"] == 0
+
+
+def test_max_parallelism_bounds_branches():
+    """Test that no more than max_parallelism shards run at once."""
+    lock = threading.Lock()
+    running = peak = 0
+
+    def track(item: int) -> int:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.005)
+        with lock:
+            running -= 1
+        return item
+
+    app = create_map_reduce(track, max_parallelism=3)
+    assert app.invoke({"items": list(range(12))})["results"] == list(range(12))
+    assert peak <= 3
+
+
+def test_async_map_function():
+    """Test that coroutine map functions run with ainvoke."""
+
+    async def double(item: int) -> int:
+        await asyncio.sleep(0)
+        return item * 2
+
+    app = create_map_reduce(double, max_parallelism=2)
+    assert asyncio.run(app.ainvoke({"items": [1, 2, 3]}))["results"] == [2, 4, 6]
+
+
+def test_pool_runs_shards():
+    """Test that shards are submitted to the given executor."""
+    with ThreadPoolExecutor(2, thread_name_prefix="shard") as pool:
+        app = create_map_reduce(
+            lambda item: threading.current_thread().name, pool=pool, max_parallelism=2
+        )
+        names = app.invoke({"items": [1, 2, 3, 4]})["results"]
+    assert all(name.startswith("shard") for name in names)
+
+
+def test_invalid_options():
+    """Test validation of reducer names, parallelism and pool use."""
+
+    async def amap(item):
+        return item
+
+    with pytest.raises(ValueError, match="Unknown reducer"):
+        build_map_reduce(str, reducer="sum")
+    with pytest.raises(ValueError):
+        build_map_reduce(str, max_parallelism=0)
+    with ThreadPoolExecutor(1) as pool, pytest.raises(ValueError):
+        build_map_reduce(amap, pool=pool)
@@ -0,0 +1,115 @@
+"""
+Tests for the node instrumentation wrapper.
+"""
+
+import asyncio
+import time
+
+import pytest
+from langgraph.graph import StateGraph
+
+from src.modules.introduction.lessons.lesson_2_simple_graph.simple_graph import (
+    GraphState,
+    aprocess_message,
+    process_message,
+)
+from src.modules.introduction.nodes.instrumentation import (
+    NodeProfiler,
+    instrument,
+    load_stats,
+    main,
+)
+
+
+def build_instrumented_graph(node, profiler):
+    """Build the simple graph with an instrumented node."""
+    graph = StateGraph(GraphState)
+    graph.add_node("process_message", instrument(node, profiler=profiler))
+    graph.set_entry_point("process_message")
+    graph.set_finish_point("process_message")
+    return graph.compile()
+
+
+def test_disabled_profiler_records_nothing():
+    """Test that nothing is recorded until the profiler is enabled."""
+    profiler = NodeProfiler()
+    app = build_instrumented_graph(process_message, profiler)
+
+    app.invoke({"message": "Hello", "response": ""})
+    assert profiler.records() == []
+
+    profiler.enable()
+    result = app.invoke({"message": "Hello", "response": ""})
+    assert result == process_message({"message": "Hello", "response": ""})
+    assert [record.node for record in profiler.records()] == ["process_message"]
+
+
+def test_async_nodes_are_recorded():
+    """Test instrumentation of coroutine nodes."""
+    profiler = NodeProfiler()
+    profiler.enable()
+    app = build_instrumented_graph(aprocess_message, profiler)
+
+    result = asyncio.run(app.ainvoke({"message": "Help me", "response": ""}))
+    assert result["response"].startswith("I'm here to help")
+    assert len(profiler.records()) == 1
+
+
+def test_records_wall_cpu_and_memory():
+    """Test the recorded measurements."""
+    profiler = NodeProfiler(trace_memory=True)
+
+    @instrument(name="busy", profiler=profiler)
+    def busy(state):
+        data = [0] * 50_000
+        time.sleep(0.01)
+        return {"size": len(data)}
+
+    profiler.enable()
+    try:
+        assert busy({}) == {"size": 50_000}
+    finally:
+        profiler.disable()
+
+    (record,) = profiler.records()
+    assert record.node == "busy"
+    assert record.wall_ns >= 10_000_000
+    assert record.cpu_ns < record.wall_ns
+    assert record.peak_bytes >= 50_000 * 8
+
+
+def test_ring_buffer_is_bounded():
+    """Test that the oldest records are dropped at capacity."""
+    profiler = NodeProfiler(capacity=3)
+    profiler.enable()
+    node = profiler.instrument(lambda state: state, name="echo")
+    for i in range(10):
+        node({"i": i})
+    assert len(profiler.records()) == 3
+
+    with pytest.raises(ValueError):
+        NodeProfiler(capacity=0)
+
+
+def test_stats_dump_and_cli(tmp_path, capsys):
+    """Test aggregation, JSON dump and the CLI summary."""
+    profiler = NodeProfiler()
+    profiler.enable()
+    first = profiler.instrument(lambda state: state, name="first")
+    second = profiler.instrument(lambda state: state, name="second")
+    for _ in range(5):
+        first({})
+    second({})
+
+    stats = {stat.node: stat for stat in profiler.stats()}
+    assert stats["first"].calls == 5
+    assert sum(stats["first"].histogram.values()) == 5
+    assert stats["first"].wall_p50_us <= stats["first"].wall_p99_us
+
+    path = tmp_path / "profile.json"
+    profiler.dump(path)
+    assert [stat.node for stat in load_stats(path)] == ["first", "second"]
+
+    assert main([str(path)]) == 0
+    output = capsys.readouterr().out
+    assert "first" in output and "histogram" in output
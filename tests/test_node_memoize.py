@@ -0,0 +1,244 @@
+"""
+Tests for the memoizing node decorator.
+"""
+
+import asyncio
+
+import pytest
+from langgraph.graph import StateGraph
+
+from src.modules.introduction.lessons.lesson_2_simple_graph.simple_graph import (
+    CompactGraphState,
+    GraphState,
+    process_message,
+)
+from src.modules.introduction.nodes.memoize import NodeCache, memoize_node
+
+
+class FakeClock:
+    """Manually advanced clock for TTL tests."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def counting(node):
+    """Wrap a node so the test can count real executions."""
+    calls = []
+
+    def wrapper(state):
+        calls.append(state)
+        return node(state)
+
+    return wrapper, calls
+
+
+def test_repeated_state_skips_node():
+    """Test that a repeated input is served from the cache."""
+    node, calls = counting(process_message)
+    cached = memoize_node(node)
+
+    first = cached({"message": "Hello there!", "response": ""})
+    second = cached({"message": "Hello there!", "response": ""})
+
+    assert (
+        first == second == process_message({"message": "Hello there!", "response": ""})
+    )
+    assert len(calls) == 1
+    info = cached.cache.info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+
+def test_key_fields_ignore_other_state():
+    """Test that only the listed fields form the key."""
+    node, calls = counting(process_message)
+    cached = memoize_node(node, key_fields=("message",))
+
+    cached({"message": "Hello", "response": ""})
+    cached({"message": "Hello", "response": "stale"})
+    assert len(calls) == 1
+
+
+def test_cached_result_cannot_be_mutated():
+    """Test that callers receive copies of the cached update."""
+    cached = memoize_node(process_message)
+    cached({"message": "Hello", "response": ""})["response"] = "changed"
+    assert cached({"message": "Hello", "response": ""})["response"] != "changed"
+
+
+def test_nested_values_are_copied():
+    """Test that nested lists in a cached update are not shared with callers."""
+    cached = memoize_node(lambda state: {"items": [state["n"]]})
+    cached({"n": 1})["items"].append("changed")
+    assert cached({"n": 1}) == {"items": [1]}
+
+
+def node_a(state):
+    return {"r": "A"}
+
+
+def node_b(state):
+    return {"r": "B"}
+
+
+def test_nodes_sharing_a_cache_keep_their_results():
+    """Test that the node's identity is part of the key."""
+    shared = NodeCache()
+    a, b = memoize_node(node_a, cache=shared), memoize_node(node_b, cache=shared)
+    assert a({"m": "x"}) == {"r": "A"}
+    assert b({"m": "x"}) == {"r": "B"}
+
+
+def test_factory_closures_sharing_a_cache_keep_their_results():
+    """Test that closures from one factory are told apart in a shared cache."""
+
+    def make_node(prefix):
+        def node(state):
+            return {"r": prefix + state["m"]}
+
+        return node
+
+    shared = NodeCache()
+    a = memoize_node(make_node("a:"), cache=shared)
+    b = memoize_node(make_node("b:"), cache=shared)
+    assert a({"m": "x"}) == {"r": "a:x"}
+    assert b({"m": "x"}) == {"r": "b:x"}
+
+
+def test_lists_and_tuples_get_different_keys():
+    """Test that a list and a tuple with the same items are cached separately."""
+    cached = memoize_node(lambda state: {"kind": type(state["m"]).__name__})
+    assert cached({"m": [1, 2]})["kind"] == "list"
+    assert cached({"m": (1, 2)})["kind"] == "tuple"
+
+
+def test_equal_scalars_of_different_types_get_different_keys():
+    """Test that 1, 1.0 and True are not served each other's results."""
+    cached = memoize_node(lambda state: {"kind": type(state["m"]).__name__})
+    assert [cached({"m": value})["kind"] for value in (1, True, 1.0, 1)] == [
+        "int",
+        "bool",
+        "float",
+        "int",
+    ]
+
+
+def test_lru_eviction():
+    """Test that the least recently used entry is evicted at maxsize."""
+    node, calls = counting(process_message)
+    cached = memoize_node(node, maxsize=2)
+
+    for message in ("a", "b", "a", "c", "a", "b"):
+        cached({"message": message, "response": ""})
+
+    # "b" was evicted by "c"; "a" stayed hot
+    assert len(calls) == 4
+    assert cached.cache.info().evictions == 2
+
+
+def test_ttl_expiry():
+    """Test that entries expire after the ttl."""
+    clock = FakeClock()
+    node, calls = counting(process_message)
+    cached = memoize_node(node, cache=NodeCache(ttl=10, clock=clock))
+
+    cached({"message": "Hello", "response": ""})
+    clock.now = 5
+    cached({"message": "Hello", "response": ""})
+    clock.now = 20
+    cached({"message": "Hello", "response": ""})
+
+    assert len(calls) == 2
+    assert cached.cache.info().expirations == 1
+
+
+def test_byte_budget():
+    """Test that the byte limit evicts entries and rejects oversized values."""
+    cache = NodeCache(max_bytes=1000, sizeof=len)
+    cache.put("a", "x" * 600)
+    cache.put("b", "x" * 600)
+    assert cache.get("a") == (False, None)
+    assert cache.info().current_bytes == 600
+
+    assert cache.put("c", "x" * 2000) is False
+    assert cache.get("c") == (False, None)
+
+
+def test_impure_node_is_never_cached():
+    """Test that pure=False bypasses the cache."""
+    node, calls = counting(process_message)
+    cached = memoize_node(node, pure=False)
+
+    cached({"message": "Hello", "response": ""})
+    cached({"message": "Hello", "response": ""})
+    assert len(calls) == 2
+    assert cached.pure is False
+    assert cached.cache.info().currsize == 0
+
+
+def test_unhashable_state_falls_through():
+    """Test that states that cannot be keyed still run the node."""
+    cached = memoize_node(lambda state: {"response": "ok"})
+    assert cached(
+        {"message": object.__new__(type("Opaque", (), {"__hash__": None}))}
+    ) == {"response": "ok"}
+    assert cached.cache.info().uncacheable == 1
+
+
+def test_dataclass_state_key():
+    """Test that slotted dataclass states are keyed by their fields."""
+    calls = []
+
+    @memoize_node
+    def node(state):
+        calls.append(state)
+        return {"response": state.message.upper()}
+
+    node(CompactGraphState("hi"))
+    node(CompactGraphState("hi"))
+    node(CompactGraphState("ho"))
+    assert len(calls) == 2
+
+
+def test_async_node():
+    """Test that coroutine nodes are memoized."""
+    calls = []
+
+    @memoize_node(maxsize=8)
+    async def node(state):
+        calls.append(state)
+        await asyncio.sleep(0)
+        return {"response": state["message"]}
+
+    async def run():
+        return [await node({"message": "Hello"}) for _ in range(3)]
+
+    assert asyncio.run(run()) == [{"response": "Hello"}] * 3
+    assert len(calls) == 1
+
+
+def test_memoized_node_in_graph():
+    """Test a memoized node inside a compiled graph."""
+    node, calls = counting(process_message)
+    cached = memoize_node(node, key_fields=("message",))
+
+    graph = StateGraph(GraphState)
+    graph.add_node("process_message", cached)
+    graph.set_entry_point("process_message")
+    graph.set_finish_point("process_message")
+    app = graph.compile()
+
+    results = [
+        app.invoke({"message": "Hello there!", "response": ""}) for _ in range(5)
+    ]
+    assert all(result == results[0] for result in results)
+    assert len(calls) == 1
+
+
+def test_invalid_maxsize():
+    """Test that a non-positive maxsize is rejected."""
+    with pytest.raises(ValueError):
+        NodeCache(maxsize=0)
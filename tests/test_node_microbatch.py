@@ -0,0 +1,179 @@
+"""
+Tests for the micro-batcher.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from langgraph.graph import StateGraph
+
+from src.modules.introduction.lessons.lesson_2_simple_graph.simple_graph import (
+    GraphState,
+)
+from src.modules.introduction.nodes.microbatch import MicroBatcher, batched_node
+from src.modules.introduction.utils.fake_llm import FakeLLM
+
+
+def test_concurrent_calls_share_batches():
+    """Test that concurrent submissions are grouped and results fanned back."""
+    calls = []
+
+    def batch_fn(items):
+        calls.append(list(items))
+        return [item * 2 for item in items]
+
+    with MicroBatcher(batch_fn, max_batch_size=16, max_wait=0.05) as batcher:
+        with ThreadPoolExecutor(max_workers=32) as pool:
+            results = list(pool.map(batcher.submit, range(32)))
+
+    assert results == [i * 2 for i in range(32)]
+    assert len(calls) < 32
+    assert all(len(batch) <= 16 for batch in calls)
+    assert batcher.stats().items == 32
+
+
+def test_identical_items_are_coalesced():
+    """Test that duplicates in a batch are sent once."""
+    seen = []
+
+    def batch_fn(items):
+        seen.extend(items)
+        return [item.upper() for item in items]
+
+    with MicroBatcher(batch_fn, max_batch_size=8, max_wait=0.05) as batcher:
+        futures = [batcher.submit_future(item) for item in ["a", "b", "a", "a"]]
+        assert [f.result() for f in futures] == ["A", "B", "A", "A"]
+
+    assert sorted(seen) == ["a", "b"]
+    assert batcher.stats().coalesced == 2
+
+
+def test_batch_errors_reach_every_caller():
+    """Test that an exception in the batch function fails each waiting call."""
+
+    def batch_fn(items):
+        raise RuntimeError("model down")
+
+    with MicroBatcher(batch_fn, max_wait=0.01) as batcher:
+        futures = [batcher.submit_future(i) for i in range(3)]
+        for future in futures:
+            with pytest.raises(RuntimeError, match="model down"):
+                future.result()
+
+
+def test_wrong_result_count_is_an_error():
+    """Test that a batch function returning too few results is rejected."""
+    with MicroBatcher(lambda items: items[:1], max_wait=0.01) as batcher:
+        futures = [batcher.submit_future(i) for i in range(3)]
+        with pytest.raises(ValueError):
+            futures[-1].result()
+
+
+def test_concurrency_is_bounded():
+    """Test that no more than max_concurrency batches run at once."""
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def batch_fn(items):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        threading.Event().wait(0.01)
+        with lock:
+            active -= 1
+        return items
+
+    with MicroBatcher(
+        batch_fn, max_batch_size=2, max_wait=0, max_concurrency=3
+    ) as batcher:
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            assert list(pool.map(batcher.submit, range(40))) == list(range(40))
+    assert 1 <= peak <= 3
+
+
+def test_closed_batcher_rejects_items():
+    """Test that submitting after close raises."""
+    batcher = MicroBatcher(lambda items: items)
+    assert batcher.submit(1) == 1
+    batcher.close()
+    with pytest.raises(RuntimeError):
+        batcher.submit(2)
+
+
+def test_cancelled_callers_do_not_stop_the_batcher():
+    """Test that a cancelled asubmit (e.g. a wait_for timeout) is harmless."""
+    release = threading.Event()
+
+    def slow(items):
+        release.wait(5)
+        return items
+
+    with MicroBatcher(slow, max_wait=0) as batcher:
+
+        async def timed_out():
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(batcher.asubmit("late"), 0.01)
+
+        asyncio.run(timed_out())
+        release.set()
+        # Would hang if the collector thread had died on the cancelled future
+        assert batcher.submit_future("next").result(timeout=5) == "next"
+
+
+def test_close_resolves_queued_items():
+    """Test that items queued when close() is called still get their results."""
+    release = threading.Event()
+
+    def slow(items):
+        release.wait(5)
+        return items
+
+    batcher = MicroBatcher(slow, max_batch_size=1, max_wait=0)
+    futures = [batcher.submit_future(i) for i in range(3)]
+    closer = threading.Thread(target=batcher.close)
+    closer.start()
+    release.set()
+    closer.join(5)
+    assert [future.result(timeout=5) for future in futures] == [0, 1, 2]
+
+
+def test_invalid_arguments():
+    """Test argument validation."""
+    with pytest.raises(ValueError):
+        MicroBatcher(list, max_batch_size=0)
+    with pytest.raises(ValueError):
+        MicroBatcher(list, max_concurrency=0)
+
+
+def test_batched_async_node_in_graph():
+    """Test concurrent ainvoke runs sharing a batched LLM node."""
+    llm = FakeLLM()
+    graph = StateGraph(GraphState)
+    with MicroBatcher(llm.generate_batch, max_batch_size=64, max_wait=0.02) as batcher:
+        graph.add_node("call_llm", batched_node(batcher, is_async=True))
+        graph.set_entry_point("call_llm")
+        graph.set_finish_point("call_llm")
+        app = graph.compile()
+
+        async def run():
+            return await asyncio.gather(
+                *(app.ainvoke({"message": f"m{i}", "response": ""}) for i in range(20))
+            )
+
+        results = asyncio.run(run())
+
+    assert [r["response"] for r in results] == [
+        FakeLLM().generate(f"m{i}") for i in range(20)
+    ]
+    assert batcher.stats().batches < 20
+
+
+def test_batched_sync_node():
+    """Test the synchronous node form."""
+    with MicroBatcher(lambda items: [i.upper() for i in items], max_wait=0) as batcher:
+        node = batched_node(batcher, input_key="text", output_key="upper")
+        assert node({"text": "hi"}) == {"upper": "HI"}
@@ -0,0 +1,191 @@
+"""
+Tests for the compiled router engine in Lesson 5.
+"""
+
+import importlib
+import random
+
+import pytest
+
+router_engine = importlib.import_module(
+    "src.modules.introduction.lessons.lesson-5-router.router_engine"
+)
+routers = importlib.import_module(
+    "src.modules.introduction.lessons.lesson-5-router.routers"
+)
+
+EMPTY = router_engine.EMPTY
+Prefix = router_engine.Prefix
+Range = router_engine.Range
+Rule = router_engine.Rule
+compile_router = router_engine.compile_router
+
+
+def random_emails(count, seed=7):
+    rng = random.Random(seed)
+    return [
+        {
+            "spam_score": rng.choice([0, 1, 2, 2.5, 3, 10]),
+            "priority": rng.choice(["high", "normal", "low"]),
+            "classification": rng.choice(
+                ["sales", "support", "hr", "general", "other"]
+            ),
+        }
+        for _ in range(count)
+    ]
+
+
+MESSAGES = [
+    "",
+    "Hello there!",
+    "HELP me",
+    "help",
+    "hell no",
+    "he",
+    "Hi",
+    "hello",
+    "regular message",
+]
+
+
+def test_email_router_matches_naive_router():
+    """Test that the compiled router agrees with the if/elif version."""
+    states = random_emails(500)
+    expected = [routers.route_email(state) for state in states]
+    assert [routers.EMAIL_ROUTER(state) for state in states] == expected
+    assert routers.EMAIL_ROUTER.route_many(states) == expected
+
+
+def test_message_router_matches_naive_router():
+    """Test prefix routing against the if/elif version."""
+    states = [{"message": message} for message in MESSAGES] + [{}]
+    expected = [routers.route_message(state) for state in states]
+    assert [routers.MESSAGE_ROUTER(state) for state in states] == expected
+    assert routers.MESSAGE_ROUTER.route_many(states) == expected
+
+
+def test_first_matching_rule_wins():
+    """Test if/elif ordering of overlapping rules."""
+    router = compile_router(
+        [
+            Rule("both", a=1, b=1),
+            Rule("a", a=1),
+            Rule("b", b={1, 2}),
+        ],
+        default="none",
+    )
+
+    assert router({"a": 1, "b": 1}) == "both"
+    assert router({"a": 1, "b": 3}) == "a"
+    assert router({"a": 0, "b": 2}) == "b"
+    assert router({}) == "none"
+    assert router.targets == ["both", "a", "b", "none"]
+
+
+def test_range_bounds():
+    """Test inclusive and exclusive numeric bounds and missing values."""
+    router = compile_router(
+        [
+            Rule("low", score=Range(lt=0.5)),
+            Rule("mid", score=Range(ge=0.5, le=0.8)),
+            Rule("high", score=Range(gt=0.8)),
+        ],
+        default="missing",
+    )
+
+    scores = [-1, 0.49, 0.5, 0.6, 0.8, 0.81, 5, None, "n/a"]
+    assert [router({"score": s}) for s in scores] == [
+        "low",
+        "low",
+        "mid",
+        "mid",
+        "mid",
+        "high",
+        "high",
+        "missing",
+        "missing",
+    ]
+
+
+def test_overlapping_prefixes():
+    """Test that shorter and longer prefixes on one field route correctly."""
+    router = compile_router(
+        [
+            Rule("hello", text=Prefix("hello")),
+            Rule("he", text=Prefix("he")),
+        ],
+        default="other",
+    )
+
+    assert router({"text": "Hello world"}) == "hello"
+    assert router({"text": "hey"}) == "he"
+    assert router({"text": "hi"}) == "other"
+
+
+def test_route_columns():
+    """Test routing columnar input."""
+    columns = {
+        "spam_score": [5, 0, 0],
+        "priority": ["normal", "high", "normal"],
+        "classification": ["sales", "sales", "support"],
+    }
+    assert routers.EMAIL_ROUTER.route_columns(columns) == [
+        "spam",
+        "high_priority",
+        "normal_priority",
+    ]
+
+
+def test_objects_with_attributes():
+    """Test routing states that are objects rather than dicts."""
+
+    class Email:
+        spam_score = 0
+        priority = "normal"
+        classification = "hr"
+
+    assert routers.EMAIL_ROUTER(Email()) == "low_priority"
+    assert routers.EMAIL_ROUTER.route_many([Email()]) == ["low_priority"]
+
+
+def test_mixed_condition_kinds_rejected():
+    """Test that one field cannot mix exact values and ranges."""
+    with pytest.raises(ValueError):
+        compile_router([Rule("a", x=1), Rule("b", x=Range(gt=2))], default="c")
+
+
+def test_table_size_limit():
+    """Test that oversized decision tables are refused."""
+    rules = [Rule(f"r{i}", **{f"f{j}": i for j in range(4)}) for i in range(50)]
+    with pytest.raises(ValueError, match="Decision table"):
+        compile_router(rules, default="none", max_table_size=1000)
+
+
+def test_router_as_conditional_edge():
+    """Test the compiled router inside a graph."""
+    app = routers.create_email_routing_graph()
+    result = app.invoke({"spam_score": 0, "priority": "high", "classification": "hr"})
+    assert result["route"] == "high_priority"
+
+
+def test_naive_router_agrees_with_compiled_router():
+    """Test the reference if/elif router against the decision table."""
+    rules = routers.build_ticket_rules(10) + [
+        Rule("greeting", note=Prefix("hi")),
+        Rule("blank", note=EMPTY),
+        Rule("text", note=Prefix("")),
+    ]
+    naive = router_engine.naive_router(rules, "triage")
+    compiled = compile_router(rules, "triage")
+    rng = random.Random(3)
+    states = [
+        {
+            "product": f"product_{rng.randrange(12)}",
+            "tier": rng.choice(["free", "pro", "enterprise", "trial"]),
+            "severity": rng.choice([1, 8.5, 9, 10, None]),
+            "note": rng.choice(["", "Hi!", "hello", None, 0, 7, ["hi"]]),
+        }
+        for _ in range(300)
+    ]
+    assert [naive(state) for state in states] == compiled.route_many(states)
+    assert compiled.route_many(states) == [compiled(state) for state in states]
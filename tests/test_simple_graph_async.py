@@ -0,0 +1,74 @@
+"""
+Tests for the async variant of the Lesson 2 simple graph.
+"""
+
+import asyncio
+
+import pytest
+
+from src.modules.introduction.lessons.lesson_2_simple_graph.simple_graph import (
+    ainvoke_many,
+    aprocess_message,
+    create_async_simple_graph,
+    process_message,
+)
+
+
+@pytest.fixture(scope="module")
+def async_app():
+    """Provide one compiled async simple graph for the module."""
+    return create_async_simple_graph()
+
+
+def test_async_node_matches_sync_node(sample_messages):
+    """Test that aprocess_message returns the same state as process_message."""
+    for message in sample_messages:
+        state = {"message": message, "response": ""}
+        assert asyncio.run(aprocess_message(state)) == process_message(state)
+
+
+def test_ainvoke_many_preserves_order(async_app, sample_messages):
+    """Test that concurrent ainvoke calls return results in input order."""
+    states = [{"message": message, "response": ""} for message in sample_messages * 20]
+    results = asyncio.run(ainvoke_many(states, app=async_app, concurrency=4))
+    assert results == [process_message(state) for state in states]
+
+
+def test_ainvoke_many_bounds_concurrency(sample_messages):
+    """Test that no more than `concurrency` calls are in flight."""
+    in_flight = 0
+    peak = 0
+
+    class SlowApp:
+        async def ainvoke(self, state):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return state
+
+    states = [{"message": message, "response": ""} for message in sample_messages * 10]
+    results = asyncio.run(ainvoke_many(states, app=SlowApp(), concurrency=3))
+
+    assert results == states
+    assert peak == 3
+
+
+def test_ainvoke_many_rejects_invalid_concurrency():
+    """Test argument validation."""
+    with pytest.raises(ValueError):
+        asyncio.run(ainvoke_many([], concurrency=0))
+
+
+def test_async_graph_streams(async_app):
+    """Test astream on the async graph."""
+
+    async def collect():
+        state = {"message": "Help me", "response": ""}
+        return [chunk async for chunk in async_app.astream(state)]
+
+    chunks = asyncio.run(collect())
+    assert chunks == [
+        {"process_message": process_message({"message": "Help me", "response": ""})}
+    ]
@@ -0,0 +1,54 @@
+"""
+Tests for batch invocation of the Lesson 2 simple graph.
+"""
+
+import pytest
+
+from src.modules.introduction.lessons.lesson_2_simple_graph.simple_graph import (
+    invoke_batch,
+)
+
+
+@pytest.fixture(scope="module")
+def app(simple_graph_app):
+    """Provide the shared compiled simple graph."""
+    return simple_graph_app
+
+
+@pytest.fixture(scope="module")
+def states(sample_messages):
+    """Provide enough states to span several chunks."""
+    return [{"message": message, "response": ""} for message in sample_messages * 10]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64])
+def test_thread_batch_matches_sequential(app, states, chunk_size):
+    """Test that threaded batches return sequential results in input order."""
+    expected = [app.invoke(state) for state in states]
+    assert (
+        invoke_batch(states, app=app, max_workers=4, chunk_size=chunk_size) == expected
+    )
+
+
+def test_process_batch_matches_sequential(app, states):
+    """Test that process pool batches return sequential results in input order."""
+    expected = [app.invoke(state) for state in states]
+    assert (
+        invoke_batch(iter(states), executor="process", max_workers=2, chunk_size=8)
+        == expected
+    )
+
+
+def test_batch_accepts_empty_input(app):
+    """Test that an empty batch returns an empty list."""
+    assert invoke_batch([], app=app) == []
+
+
+def test_batch_rejects_invalid_arguments(app):
+    """Test argument validation."""
+    with pytest.raises(ValueError):
+        invoke_batch([], executor="fiber")
+    with pytest.raises(ValueError):
+        invoke_batch([], chunk_size=0)
+    with pytest.raises(ValueError):
+        invoke_batch([], app=app, executor="process")
@@ -0,0 +1,73 @@
+"""
+Tests for the column-oriented bulk variant of the Lesson 2 node.
+
+The bulk node must produce exactly the same responses as process_message.
+"""
+
+import pytest
+
+from src.modules.introduction.lessons.lesson_2_simple_graph.simple_graph import (
+    create_batch_graph,
+    process_message,
+    process_messages,
+    respond_to_messages,
+)
+
+EDGE_CASE_MESSAGES = [
+    "",
+    None,
+    "Hello",
+    "hello",
+    "HELLO there",
+    "hElLo, world!",
+    "Help",
+    "help me please",
+    "HELPING hand",
+    "hel",
+    "hell",
+    "helo",
+    " hello",
+    "Héllo",
+    "İstanbul",
+    "Random message",
+    "'quoted' message",
+]
+
+
+def single_message_responses(messages):
+    """Run each message through the single-message node."""
+    return [
+        process_message({"message": m, "response": ""})["response"] for m in messages
+    ]
+
+
+def test_bulk_matches_single_message_node(sample_messages):
+    """Test that the bulk responses are identical to process_message."""
+    messages = EDGE_CASE_MESSAGES + sample_messages
+    assert respond_to_messages(messages) == single_message_responses(messages)
+
+
+def test_bulk_node_returns_only_responses():
+    """Test that the bulk node does not copy the messages column."""
+    update = process_messages({"messages": ["Hello"], "responses": []})
+    assert list(update) == ["responses"]
+
+
+def test_bulk_graph_matches_single_message_node(sample_messages):
+    """Test the compiled bulk graph end to end."""
+    result = create_batch_graph().invoke({"messages": sample_messages, "responses": []})
+    assert result["responses"] == single_message_responses(sample_messages)
+
+
+def test_bulk_accepts_numpy_arrays(sample_messages):
+    """Test that NumPy string arrays are accepted."""
+    np = pytest.importorskip("numpy")
+    column = np.array(sample_messages)
+    assert respond_to_messages(column) == single_message_responses(sample_messages)
+
+
+def test_bulk_accepts_arrow_arrays(sample_messages):
+    """Test that Arrow string arrays are accepted."""
+    pa = pytest.importorskip("pyarrow")
+    column = pa.array(sample_messages)
+    assert respond_to_messages(column) == single_message_responses(sample_messages)
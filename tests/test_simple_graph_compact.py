@@ -0,0 +1,52 @@
+"""
+Tests for the compact slotted state variant of the Lesson 2 simple graph.
+"""
+
+import pytest
+
+from src.modules.introduction.lessons.lesson_2_simple_graph.simple_graph import (
+    CompactGraphState,
+    create_compact_graph,
+    generate_response,
+    process_message,
+    process_message_delta,
+)
+
+
+@pytest.fixture(scope="module")
+def compact_app():
+    """Provide one compiled compact-state graph for the module."""
+    return create_compact_graph()
+
+
+def test_compact_graph_matches_dict_graph(
+    compact_app, simple_graph_app, sample_messages
+):
+    """Test that both state representations give the same final state."""
+    for message in sample_messages:
+        expected = simple_graph_app.invoke({"message": message, "response": ""})
+        assert compact_app.invoke(CompactGraphState(message=message)) == expected
+        assert compact_app.invoke({"message": message}) == expected
+
+
+def test_delta_node_returns_only_response(sample_messages):
+    """Test that the delta node does not echo the unchanged message."""
+    for message in sample_messages:
+        update = process_message_delta(CompactGraphState(message=message))
+        assert update == {"response": process_message({"message": message})["response"]}
+
+
+def test_compact_state_is_slotted():
+    """Test that compact states carry no per-instance __dict__."""
+    state = CompactGraphState("Hello")
+    assert not hasattr(state, "__dict__")
+    with pytest.raises(AttributeError):
+        state.extra = "value"
+
+
+def test_generate_response_branches():
+    """Test the shared single-message response logic."""
+    assert generate_response("") == "No message provided."
+    assert generate_response("HELLO") == "Hello! I received your message: 'HELLO'"
+    assert generate_response("help") == "I'm here to help! What would you like to know?"
+    assert generate_response("other").startswith("I processed your message")
@@ -0,0 +1,138 @@
+"""
+Tests for the token-streaming chain in Lesson 4.
+"""
+
+import asyncio
+import importlib
+import time
+
+import pytest
+
+from src.modules.introduction.utils.fake_llm import FakeLLM
+
+streaming_chain = importlib.import_module(
+    "src.modules.introduction.lessons.lesson-4-chain.streaming_chain"
+)
+
+
+class EndlessLLM(FakeLLM):
+    """Fake model that would stream forever unless cancelled."""
+
+    def __init__(self):
+        super().__init__()
+        self.produced = 0
+
+    def stream(self, prompt, **params):
+        while True:
+            self.produced += 1
+            yield f" t{self.produced}"
+
+    async def astream(self, prompt, **params):
+        while True:
+            self.produced += 1
+            await asyncio.sleep(0)
+            yield f" t{self.produced}"
+
+
+def test_lesson_package_exports():
+    """Test that the chain lesson exposes the streaming API lazily."""
+    from src.modules.introduction.lessons import chain
+
+    assert chain.TokenStream is streaming_chain.TokenStream
+
+
+def test_invoke_returns_full_response():
+    """Test that invoke still produces the complete response."""
+    llm = FakeLLM()
+    app = streaming_chain.create_streaming_chain(llm)
+    result = app.invoke({"message": "Hello"})
+
+    assert result["response"] == llm.generate(result["prompt"])
+    assert "Hello" in result["prompt"]
+
+
+def test_tokens_stream_through_app_stream():
+    """Test that tokens arrive as separate custom stream chunks."""
+    app = streaming_chain.create_streaming_chain(FakeLLM())
+    chunks = [
+        chunk
+        for mode, chunk in app.stream({"message": "Hello"}, stream_mode=["custom"])
+    ]
+
+    assert len(chunks) > 1
+    assert all(chunk["node"] == "llm" for chunk in chunks)
+
+
+def test_token_stream_collects_final_state():
+    """Test that TokenStream yields every token and keeps the final state."""
+    app = streaming_chain.create_streaming_chain(FakeLLM())
+    tokens = streaming_chain.TokenStream(app, {"message": "Hello"}, max_buffered=2)
+
+    text = "".join(tokens)
+    assert text == tokens.final_state["response"]
+    assert not tokens.cancelled
+
+
+def test_first_token_arrives_before_generation_finishes():
+    """Test that streaming delivers the first token early."""
+    llm = FakeLLM()
+    app = streaming_chain.create_streaming_chain(llm, token_latency=0.02)
+
+    start = time.perf_counter()
+    with streaming_chain.TokenStream(app, {"message": "Hello"}) as tokens:
+        next(iter(tokens))
+        first = time.perf_counter() - start
+    assert first < 0.05
+
+
+def test_closing_stream_cancels_node():
+    """Test that a disconnected consumer stops generation within the buffer bound."""
+    llm = EndlessLLM()
+    app = streaming_chain.create_streaming_chain(llm)
+
+    with streaming_chain.TokenStream(
+        app, {"message": "Hello"}, max_buffered=4
+    ) as tokens:
+        for index, _ in enumerate(tokens):
+            if index == 9:
+                break
+
+    assert tokens.cancelled
+    produced = llm.produced
+    assert produced <= 10 + 4 + 1
+    time.sleep(0.05)
+    assert llm.produced == produced
+
+
+def test_async_token_stream_and_cancellation():
+    """Test the async stream, including cancellation."""
+
+    async def run():
+        app = streaming_chain.create_streaming_chain(FakeLLM(), is_async=True)
+        stream = streaming_chain.AsyncTokenStream(app, {"message": "Hello"})
+        text = "".join([token async for token in stream])
+        assert text == stream.final_state["response"]
+
+        llm = EndlessLLM()
+        endless = streaming_chain.create_streaming_chain(llm, is_async=True)
+        async with streaming_chain.AsyncTokenStream(
+            endless, {"message": "Hello"}, max_buffered=4
+        ) as stream:
+            count = 0
+            async for _ in stream:
+                count += 1
+                if count == 5:
+                    break
+        produced = llm.produced
+        await asyncio.sleep(0.01)
+        return stream.cancelled, produced, llm.produced
+
+    cancelled, produced, later = asyncio.run(run())
+    assert cancelled
+    assert produced == later
+
+
+def test_invalid_buffer_size():
+    """Test that a non-positive buffer is rejected."""
+    with pytest.raises(ValueError):
+        streaming_chain.StreamControl(0)
@@ -0,0 +1,212 @@
+"""
+Tests for the Lesson 3 Studio importer, exporter and integration helpers.
+"""
+
+import importlib
+import json
+import shutil
+
+import pytest
+from langgraph.graph import END, START, StateGraph
+
+from src.modules.introduction.lessons.lesson_2_simple_graph.simple_graph import (
+    GraphState,
+    build_simple_graph,
+    process_message,
+)
+
+studio = importlib.import_module(
+    "src.modules.introduction.lessons.lesson-3-langgraph-studio"
+)
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    """Provide a writable copy of studio_config.json."""
+    path = tmp_path / "studio_config.json"
+    shutil.copy("studio_config.json", path)
+    return path
+
+
+def test_package_exports():
+    """Test that the lesson package exposes its four entry points."""
+    assert set(studio.__all__) == {
+        "StudioIntegration",
+        "StudioSetup",
+        "GraphImporter",
+        "GraphExporter",
+    }
+
+
+def test_import_simple_graph(config_path):
+    """Test that simple_graph compiles to the Lesson 2 behaviour."""
+    app = studio.GraphImporter(config_path).compile("simple_graph")
+    state = {"message": "Hello there!", "response": ""}
+    assert app.invoke(state) == process_message(state)
+
+
+def test_import_notebook_graph(config_path):
+    """Test the decide_mood conditional edge of notebook_graph."""
+    app = studio.GraphImporter(config_path).compile("notebook_graph")
+    for _ in range(10):
+        response = app.invoke({"message": "Hi", "response": ""})["response"]
+        assert response in {"Hi I am feeling Good", "Hi I am feeling Worse"}
+
+
+def test_specs_are_parsed_lazily(config_path):
+    """Test that loading the config does not parse or compile any graph."""
+    importer = studio.GraphImporter(config_path)
+    assert importer.load() == {"simple_graph", "notebook_graph"}
+    assert importer._specs == {}
+    assert importer.compiled_names() == []
+
+    importer.compile("simple_graph")
+    assert list(importer._specs) == ["simple_graph"]
+    assert importer.compiled_names() == ["simple_graph"]
+
+
+def test_reload_recompiles_only_changed_graphs(config_path):
+    """Test that reload keeps compiled apps whose descriptor is unchanged."""
+    importer = studio.GraphImporter(config_path)
+    simple = importer.compile("simple_graph")
+    notebook = importer.compile("notebook_graph")
+
+    assert importer.reload() == set()
+    assert importer.compile("notebook_graph") is notebook
+
+    config = json.loads(config_path.read_text())
+    config["graphs"]["notebook_graph"]["description"] = "Changed"
+    config_path.write_text(json.dumps(config))
+
+    # The descriptor changed but the graph did not: the process-wide
+    # compiled graph cache hands back the same application
+    assert importer.reload() == {"notebook_graph"}
+    assert importer.compiled_names() == ["simple_graph"]
+    assert importer.compile("simple_graph") is simple
+    assert importer.compile("notebook_graph") is notebook
+
+    config["nodes"] = {
+        "node_2": "src.modules.introduction.lessons.lesson-3-langgraph-studio.studio_nodes:node_3"
+    }
+    config_path.write_text(json.dumps(config))
+
+    assert importer.reload() == {"notebook_graph"}
+    assert importer.compile("notebook_graph") is not notebook
+
+
+def test_importers_share_compiled_graphs(config_path):
+    """Test that separate importers of one config reuse the compiled application."""
+    first = studio.GraphImporter(config_path).compile("simple_graph")
+    assert studio.GraphImporter(config_path).compile("simple_graph") is first
+
+
+def test_explicit_edges_and_resolution(config_path):
+    """Test explicit conditional edges, plain edges and import-path resolution."""
+    config = json.loads(config_path.read_text())
+    config["nodes"] = {"route": "tests.test_studio_integration:route"}
+    config["state_schemas"]["ChainState"] = {"fields": ["message", "response"]}
+    config["graphs"]["chain"] = {
+        "name": "chain",
+        "state_schema": "ChainState",
+        "entry_point": "node_1",
+        "finish_points": ["node_2", "node_3"],
+        "nodes": ["node_1", "process_message", "node_2", "node_3"],
+        "edges": [["node_1", "process_message"]],
+        "conditional_edges": [
+            {
+                "source": "process_message",
+                "router": "route",
+                "targets": ["node_2", "node_3"],
+            }
+        ],
+    }
+    config_path.write_text(json.dumps(config))
+
+    app = studio.GraphImporter(config_path).compile("chain")
+    result = app.invoke({"message": "Help", "response": ""})
+    assert result["response"] == "I'm here to help! What would you like to know? Good"
+
+
+def route(state):
+    """Router referenced by import path in test_explicit_edges_and_resolution."""
+    return "node_2" if state["response"].startswith("I'm here") else "node_3"
+
+
+def test_invalid_descriptor_is_rejected(config_path):
+    """Test that descriptors referencing unknown nodes fail to parse."""
+    config = json.loads(config_path.read_text())
+    config["graphs"]["simple_graph"]["finish_points"] = ["missing"]
+    config_path.write_text(json.dumps(config))
+
+    with pytest.raises(ValueError):
+        studio.GraphImporter(config_path).compile("simple_graph")
+    with pytest.raises(KeyError):
+        studio.GraphImporter(config_path).compile("no_such_graph")
+
+
+def test_export_round_trips_config(config_path):
+    """Test that exporting imported graphs reproduces their descriptors."""
+    config = json.loads(config_path.read_text())
+    importer = studio.GraphImporter(config_path)
+    exporter = studio.GraphExporter(config_path)
+
+    for name, descriptor in config["graphs"].items():
+        app = importer.compile(name)
+        assert exporter.export(app, name, descriptor["description"]) == descriptor
+
+
+def test_integration_export_and_visualize(config_path):
+    """Test exporting a code-built graph into the config and loading it back."""
+    integration = studio.StudioIntegration(config_path)
+    integration.export_graph(build_simple_graph(), "exported", "Exported from code")
+
+    assert "exported" in integration.graph_names()
+    assert "exported" in json.loads(config_path.read_text())["graphs"]
+    result = integration.get_graph("exported").invoke(
+        {"message": "Help", "response": ""}
+    )
+    assert result["response"].startswith("I'm here to help")
+    assert "node_1" in integration.visualize("notebook_graph")
+
+
+def test_studio_setup(tmp_path, clean_environment, monkeypatch):
+    """Test environment checks and langgraph.json generation."""
+    monkeypatch.delenv("GOOGLE_API_KEY", raising=False)
+    setup = studio.StudioSetup(tmp_path)
+    assert setup.check_environment()["missing_required"] == ["GOOGLE_API_KEY"]
+
+    path = setup.write_langgraph_config({"simple_graph": "./graphs.py:simple_graph"})
+    assert json.loads(path.read_text()) == {
+        "dependencies": ["."],
+        "graphs": {"simple_graph": "./graphs.py:simple_graph"},
+        "env": ".env",
+    }
+
+
+def shout(state):
+    """Node registered under a different name in test_export_writes_import_paths."""
+    return {"response": state["message"].upper()}
+
+
+def test_export_writes_import_paths(config_path):
+    """Test that graphs round-trip when node names differ from function names."""
+    graph = StateGraph(GraphState)
+    graph.add_node("loud", shout)
+    graph.add_edge(START, "loud")
+    graph.add_edge("loud", END)
+    studio.GraphExporter(config_path).write(graph, "loud_graph")
+
+    config = json.loads(config_path.read_text())
+    assert config["nodes"]["loud"] == "tests.test_studio_integration:shout"
+    importer = studio.GraphImporter(config_path)
+    assert (
+        importer.compile("loud_graph").invoke({"message": "hi", "response": ""})[
+            "response"
+        ]
+        == "HI"
+    )
+
+    # Repointing a name in the nodes map changes the descriptor hash
+    config["nodes"]["loud"] = "tests.test_studio_integration:route"
+    config_path.write_text(json.dumps(config))
+    assert importer.reload() == {"loud_graph"}
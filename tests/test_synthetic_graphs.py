@@ -0,0 +1,73 @@
+"""
+Tests for the synthetic graph generators.
+"""
+
+import pytest
+
+from src.modules.introduction.graphs.synthetic import (
+    SHAPES,
+    build_dag,
+    build_synthetic,
+    build_tree,
+    expected_count,
+    recursion_limit,
+)
+
+
+@pytest.mark.parametrize("shape", sorted(SHAPES))
+@pytest.mark.parametrize("n", [1, 2, 7])
+def test_shapes_run_expected_nodes(shape, n):
+    """Test that every shape compiles, runs within its recursion limit, and
+    executes the expected number of nodes."""
+    app = build_synthetic(shape, n).compile()
+    result = app.invoke({"count": 0}, {"recursion_limit": recursion_limit(shape, n)})
+    assert result["count"] == expected_count(shape, n)
+
+
+@pytest.mark.parametrize(
+    "shape,n,nodes",
+    [
+        ("linear", 5, 5),
+        ("fan_out", 5, 7),
+        ("tree", 3, 15),
+        ("agent_loop", 5, 2),
+        ("dag", 5, 5),
+    ],
+)
+def test_node_counts(shape, n, nodes):
+    """Test the number of nodes each generator adds."""
+    assert len(build_synthetic(shape, n).nodes) == nodes
+
+
+def test_tree_routes_by_bits():
+    """Test that tree routers follow the bits of the route field."""
+    app = build_tree(3).compile()
+    seen = []
+    for chunk in app.stream({"count": 0, "route": 0b101}, stream_mode="updates"):
+        seen += list(chunk)
+    assert seen == ["node", "node_1", "node_1_0", "node_1_0_1"]
+
+
+@pytest.mark.parametrize("num_nodes,num_edges", [(1, 0), (5, 4), (5, 10), (20, 40)])
+def test_dag_edge_counts(num_nodes, num_edges):
+    """Test that DAGs have the requested number of edges and run."""
+    graph = build_dag(num_nodes, num_edges)
+    assert len(graph.nodes) == num_nodes
+    # Plus the START and END edges
+    assert len(graph.edges) == num_edges + 2
+    assert graph.compile().invoke({"count": 0})["count"] >= num_nodes
+
+
+def test_invalid_arguments():
+    """Test validation of shape names and sizes."""
+    with pytest.raises(ValueError, match="Unknown shape"):
+        build_synthetic("star", 3)
+    for shape in ("linear", "fan_out", "agent_loop", "dag"):
+        with pytest.raises(ValueError):
+            build_synthetic(shape, 0)
+    with pytest.raises(ValueError):
+        build_tree(-1)
+    with pytest.raises(ValueError):
+        build_dag(5, 3)
+    with pytest.raises(ValueError):
+        build_dag(5, 11)
@@ -0,0 +1,202 @@
+"""
+Tests for the tool result cache in the agent lesson.
+"""
+
+import asyncio
+import importlib
+import threading
+
+tool_cache = importlib.import_module(
+    "src.modules.introduction.lessons.lesson-6-agent.tool_cache"
+)
+tool_executor = importlib.import_module(
+    "src.modules.introduction.lessons.lesson-6-agent.tool_executor"
+)
+ToolCache = tool_cache.ToolCache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingTool:
+    """Callable tool that counts its calls."""
+
+    def __init__(self, name: str):
+        self.__name__ = name
+        self.calls = 0
+
+    def __call__(self, **args) -> dict:
+        self.calls += 1
+        return {"tool": self.__name__, "args": args}
+
+
+def test_keys_ignore_argument_order_and_container_types():
+    """Test argument canonicalization."""
+    key = tool_cache.tool_call_key
+    assert key("search", {"q": "x", "tags": ("a", "b")}) == key(
+        "search", {"tags": ["a", "b"], "q": "x"}
+    )
+    assert key("search", {"ids": {3, 1, 2}}) == key("search", {"ids": {2, 3, 1}})
+    assert key("search", {"q": "x"}) != key("lookup", {"q": "x"})
+    assert key("search", {"q": "x"}) != key("search", {"q": "y"})
+
+
+def test_per_tool_ttl():
+    """Test that each tool's results expire after its own TTL."""
+    clock = Clock()
+    cache = ToolCache(default_ttl=100, ttls={"weather": 10}, clock=clock)
+    weather, search = CountingTool("weather"), CountingTool("search")
+
+    for _ in range(2):
+        cache.call("weather", {"city": "Paris"}, weather)
+        cache.call("search", {"q": "x"}, search)
+    clock.now += 50
+    cache.call("weather", {"city": "Paris"}, weather)
+    cache.call("search", {"q": "x"}, search)
+
+    assert (weather.calls, search.calls) == (2, 1)
+    assert cache.metrics()["search"].hit_rate == 2 / 3
+
+
+def test_side_effecting_tools_are_never_cached():
+    """Test both ways of marking side-effecting tools."""
+
+    @tool_cache.side_effecting
+    def send_email(to: str) -> str:
+        send_email.sent += 1
+        return "sent"
+
+    send_email.sent = 0
+    order = CountingTool("place_order")
+
+    cache = ToolCache(side_effecting=["place_order"])
+    for _ in range(3):
+        cache.call("send_email", {"to": "sam"}, send_email)
+        cache.call("place_order", {"item": 1}, order)
+
+    assert (send_email.sent, order.calls) == (3, 3)
+    assert cache.total_stats().bypassed == 6
+    assert cache.total_stats().writes == 0
+
+
+def test_sqlite_tier_is_shared(tmp_path):
+    """Test that a second cache on the same file serves stored results."""
+    path = tmp_path / "tools.sqlite3"
+    tool = CountingTool("search")
+    with ToolCache(path) as first:
+        first.call("search", {"q": "x"}, tool)
+    with ToolCache(path) as second:
+        assert second.call("search", {"q": "x"}, tool) == {
+            "tool": "search",
+            "args": {"q": "x"},
+        }
+        second.call("search", {"q": "x"}, tool)
+        stats = second.metrics()["search"]
+
+    assert tool.calls == 1
+    assert (stats.disk_hits, stats.memory_hits, stats.misses) == (1, 1, 0)
+
+
+def test_sqlite_tier_respects_ttl(tmp_path):
+    """Test that expired results in SQLite are not served."""
+    clock = Clock()
+    tool = CountingTool("search")
+    with ToolCache(tmp_path / "tools.sqlite3", default_ttl=5, clock=clock) as cache:
+        cache.call("search", {"q": "x"}, tool)
+    clock.now += 10
+    with ToolCache(tmp_path / "tools.sqlite3", default_ttl=5, clock=clock) as cache:
+        cache.call("search", {"q": "x"}, tool)
+    assert tool.calls == 2
+
+
+def test_sqlite_tier_purges_expired_and_excess_rows(tmp_path):
+    """Test that put() periodically drops expired rows and rows over max_rows."""
+    clock = Clock()
+    path = tmp_path / "tools.sqlite3"
+    with ToolCache(path, maxsize=1, clock=clock, purge_interval=4) as cache:
+        cache.put("search", "old", "x")
+        cache.put("search", "kept", "x")
+        cache.ttls["search"] = 5
+        clock.now += 1
+        cache.put("search", "a", "x")
+        clock.now += 10
+        cache.put("search", "b", "x")
+        rows = cache._conn.execute("SELECT key FROM tool_results").fetchall()
+        assert sorted(key for key, in rows) == ["b", "kept", "old"]
+
+    with ToolCache(path, clock=clock, max_rows=2, purge_interval=100) as cache:
+        assert cache.purge() == 1
+        rows = cache._conn.execute("SELECT key FROM tool_results").fetchall()
+        assert sorted(key for key, in rows) == ["b", "kept"]
+
+
+def test_async_executor_reads_sqlite_off_the_event_loop(tmp_path):
+    """Test that arun() does SQLite cache lookups and writes in worker threads."""
+    search = CountingTool("search")
+    threads = []
+    with ToolCache(tmp_path / "tools.sqlite3") as cache:
+        get, put = cache.get, cache.put
+
+        def recording(method):
+            def wrapper(*args):
+                threads.append(threading.current_thread())
+                return method(*args)
+
+            return wrapper
+
+        cache.get, cache.put = recording(get), recording(put)
+        calls = [{"name": "search", "args": {"q": "x"}, "id": str(i)} for i in range(3)]
+        with tool_executor.ToolExecutor([search], cache=cache) as executor:
+            results = asyncio.run(executor.arun(calls))
+
+    assert search.calls == 1
+    assert [r.cached for r in results] == [False, False, False]
+    assert threads and threading.main_thread() not in threads
+
+
+def test_executor_uses_cache_and_runs_identical_calls_once():
+    """Test caching and in-turn deduplication in ToolExecutor."""
+    search, send = CountingTool("search"), tool_cache.side_effecting(
+        CountingTool("send")
+    )
+    cache = ToolCache()
+    calls = [
+        {"name": "search", "args": {"q": "x"}, "id": "1"},
+        {"name": "search", "args": {"q": "x"}, "id": "2"},
+        {"name": "send", "args": {"to": "sam"}, "id": "3"},
+        {"name": "send", "args": {"to": "sam"}, "id": "4"},
+    ]
+    with tool_executor.ToolExecutor([search, send], cache=cache) as executor:
+        first = executor.run(calls)
+        second = executor.run(calls)
+        third = asyncio.run(executor.arun(calls))
+
+    assert search.calls == 1
+    assert send.calls == 6
+    assert [r.call_id for r in first] == ["1", "2", "3", "4"]
+    assert [r.cached for r in second] == [True, True, False, False]
+    assert [r.cached for r in third] == [True, True, False, False]
+    assert first[1].content == first[0].content
+
+
+def test_failed_calls_are_not_cached():
+    """Test that errors are retried on the next turn."""
+    attempts = []
+
+    def flaky(q: str) -> str:
+        attempts.append(q)
+        if len(attempts) == 1:
+            raise RuntimeError("temporary")
+        return "ok"
+
+    with tool_executor.ToolExecutor([flaky], cache=ToolCache()) as executor:
+        call = [{"name": "flaky", "args": {"q": "x"}, "id": "1"}]
+        assert executor.run(call)[0].error is not None
+        assert executor.run(call)[0].content == "ok"
+        assert executor.run(call)[0].cached
+    assert len(attempts) == 2
@@ -0,0 +1,155 @@
+"""
+Tests for the parallel tool executor in the agent lesson.
+"""
+
+import asyncio
+import importlib
+import threading
+import time
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+
+tool_executor = importlib.import_module(
+    "src.modules.introduction.lessons.lesson-6-agent.tool_executor"
+)
+ToolExecutor = tool_executor.ToolExecutor
+
+
+def sleeper(seconds: float, value: str) -> str:
+    time.sleep(seconds)
+    return value
+
+
+async def async_sleeper(seconds: float, value: str) -> str:
+    await asyncio.sleep(seconds)
+    return value
+
+
+def fail() -> str:
+    raise ValueError("boom")
+
+
+def calls(*specs) -> list[dict]:
+    return [
+        {"name": name, "args": args, "id": f"call_{i}"}
+        for i, (name, args) in enumerate(specs)
+    ]
+
+
+def test_runs_calls_concurrently_in_call_order():
+    """Test that results keep call order while calls overlap."""
+    with ToolExecutor([sleeper], max_workers=4) as executor:
+        start = time.perf_counter()
+        results = executor.run(
+            calls(
+                *[
+                    ("sleeper", {"seconds": s, "value": str(i)})
+                    for i, s in enumerate([0.15, 0.05, 0.1, 0.0])
+                ]
+            )
+        )
+        elapsed = time.perf_counter() - start
+
+    assert [r.content for r in results] == ["0", "1", "2", "3"]
+    assert [r.call_id for r in results] == ["call_0", "call_1", "call_2", "call_3"]
+    assert elapsed < 0.3
+    assert results[3].elapsed < results[0].elapsed
+
+
+def test_pool_is_bounded():
+    """Test that no more than max_workers tools run at once."""
+    lock, running, peak = threading.Lock(), [0], [0]
+
+    def tracked() -> str:
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.02)
+        with lock:
+            running[0] -= 1
+        return "ok"
+
+    with ToolExecutor([tracked], max_workers=2) as executor:
+        executor.run(calls(*[("tracked", {})] * 6))
+    assert peak[0] == 2
+
+
+def test_timeouts_errors_and_unknown_tools():
+    """Test per-tool timeouts and error results."""
+    with ToolExecutor(
+        {"slow": sleeper, "fast": sleeper, "fail": fail}, timeouts={"slow": 0.05}
+    ) as executor:
+        start = time.perf_counter()
+        results = executor.run(
+            calls(
+                ("slow", {"seconds": 0.5, "value": "late"}),
+                ("fast", {"seconds": 0.0, "value": "ok"}),
+                ("fail", {}),
+                ("missing", {}),
+            )
+        )
+        waited = time.perf_counter() - start
+
+    assert waited < 0.4
+    assert "timed out" in results[0].error
+    assert results[1].content == "ok" and results[1].error is None
+    assert "boom" in results[2].error
+    assert "unknown tool" in results[3].error
+    assert results[0].to_message().status == "error"
+
+
+def test_rejects_timeouts_for_unknown_tools():
+    """Test that timeouts must name known tools."""
+    with pytest.raises(ValueError):
+        ToolExecutor([sleeper], timeouts={"other": 1.0})
+
+
+def test_async_execution():
+    """Test arun() with coroutine and sync tools, timeouts and ordering."""
+    executor = ToolExecutor([async_sleeper, sleeper], timeouts={"async_sleeper": 0.5})
+    results = asyncio.run(
+        executor.arun(
+            calls(
+                ("async_sleeper", {"seconds": 0.1, "value": "a"}),
+                ("sleeper", {"seconds": 0.0, "value": "b"}),
+                ("async_sleeper", {"seconds": 2.0, "value": "c"}),
+            )
+        )
+    )
+    executor.close()
+
+    assert [r.content for r in results] == ["a", "b", None]
+    assert "timed out" in results[2].error
+
+
+@pytest.mark.parametrize("is_async", [False, True])
+def test_tool_agent_loop(is_async):
+    """Test the agent graph with a scripted model that calls two tools."""
+
+    def call_model(state):
+        if isinstance(state["messages"][-1], HumanMessage):
+            return {
+                "messages": [
+                    AIMessage(
+                        content="",
+                        tool_calls=calls(
+                            ("sleeper", {"seconds": 0.02, "value": "Sunny in Paris"}),
+                            ("sleeper", {"seconds": 0.0, "value": "Rainy in Rome"}),
+                        ),
+                    )
+                ]
+            }
+        return {
+            "messages": [
+                AIMessage(content=" / ".join(m.content for m in state["messages"][-2:]))
+            ]
+        }
+
+    with ToolExecutor([sleeper]) as executor:
+        app = tool_executor.create_tool_agent(call_model, executor, is_async=is_async)
+        inputs = {"messages": [HumanMessage("Weather in Paris and Rome?")]}
+        state = asyncio.run(app.ainvoke(inputs)) if is_async else app.invoke(inputs)
+
+    assert state["messages"][-1].content == "Sunny in Paris / Rainy in Rome"
+    assert [m.tool_call_id for m in state["messages"][2:4]] == ["call_0", "call_1"]